@@ -0,0 +1,261 @@
+"""
+Archivo histórico de órdenes cerradas del Sistema de Gestión de Mantenimiento
+Archivo: Archivado_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Las órdenes completadas o canceladas hace más de DIAS_ARCHIVO días salen de
+ordenes_trabajo (y del archivo de datos que se carga al iniciar) y pasan a
+segmentos comprimidos en la carpeta CARPETA_ARCHIVO, junto a los datos:
+
+    archivo_ordenes/ordenes_AAAA-MM.jsonl.gz   una orden JSON por línea, por mes de cierre
+    archivo_ordenes/indice.json                por segmento: cantidad, fechas de cierre,
+                                               rango de IDs y conteos por estado, tipo
+                                               y prioridad
+
+Cada archivado agrega un miembro gzip al final del segmento del mes (los
+lectores de gzip leen los miembros concatenados). Lo ya archivado solo se
+descomprime para descartar repetidas cuando algún ID nuevo cae dentro del
+rango de IDs del segmento según el índice. Los reportes y búsquedas leen los segmentos
+solo cuando se piden (ordenes_archivadas, orden_archivada,
+buscar_ordenes_archivadas); los totales salen del índice sin abrirlos.
+
+Los IDs archivados no se reutilizan: gm guarda el mayor en
+id_maximo_archivado y los IDs nuevos de órdenes empiezan por encima.
+"""
+
+import os
+import json
+import gzip
+from collections import Counter
+from datetime import datetime, timedelta
+
+import Gestion_Mantenimiento as gm
+import Metricas_Mantenimiento as metricas
+
+CARPETA_ARCHIVO = "archivo_ordenes"
+ARCHIVO_INDICE = "indice.json"
+VARIABLE_ENTORNO = "GM_DIAS_ARCHIVO"
+# Antigüedad (días desde el cierre) a partir de la que una orden cerrada se archiva
+DIAS_ARCHIVO = 365
+# La tendencia del backlog mira 90 días atrás: las órdenes cerradas en ese lapso no se archivan
+DIAS_MINIMOS = 90
+ESTADOS_CERRADOS = ("Completada", "Cancelada")
+NIVEL_COMPRESION = 6
+
+_indice = None
+_firma_indice = None
+
+
+def carpeta():
+    return os.path.join(os.path.dirname(gm.ARCHIVO_DATOS), CARPETA_ARCHIVO)
+
+
+def dias_politica():
+    """Días de la política de archivado (GM_DIAS_ARCHIVO o DIAS_ARCHIVO); 0 la desactiva"""
+    try:
+        return int(os.environ.get(VARIABLE_ENTORNO, DIAS_ARCHIVO))
+    except ValueError:
+        return DIAS_ARCHIVO
+
+
+def fecha_cierre(orden):
+    """Fecha de cierre de la orden (la de creación si no tiene fecha_finalizacion)"""
+    return gm.parsear_fecha(orden.get('fecha_finalizacion')) or gm.parsear_fecha(orden.get('fecha_creacion'))
+
+
+# ==================== ÍNDICE ====================
+
+def _ruta_indice():
+    return os.path.join(carpeta(), ARCHIVO_INDICE)
+
+
+def indice():
+    """{"segmentos": {"AAAA-MM": {...}}}; se relee solo si el archivo cambió (otra instancia archivó)"""
+    global _indice, _firma_indice
+    try:
+        estado = os.stat(_ruta_indice())
+    except OSError:
+        _indice, _firma_indice = {"segmentos": {}}, None
+        return _indice
+    firma = (estado.st_mtime_ns, estado.st_size)
+    if firma != _firma_indice:
+        with open(_ruta_indice(), 'r', encoding='utf-8') as archivo:
+            _indice = json.load(archivo)
+        _firma_indice = firma
+    return _indice
+
+
+def totales():
+    """Totales del archivo leídos del índice (sin abrir los segmentos)"""
+    resultado = {"segmentos": 0, "ordenes": 0, "bytes": 0,
+                 "por_estado": Counter(), "por_tipo": Counter(), "por_prioridad": Counter()}
+    for segmento in indice()["segmentos"].values():
+        resultado["segmentos"] += 1
+        resultado["ordenes"] += segmento["ordenes"]
+        resultado["bytes"] += segmento["bytes"]
+        for campo in ("por_estado", "por_tipo", "por_prioridad"):
+            resultado[campo].update(segmento[campo])
+    for campo in ("por_estado", "por_tipo", "por_prioridad"):
+        resultado[campo] = dict(resultado[campo])
+    return resultado
+
+
+def _mes(valor):
+    """'AAAA-MM' de una fecha (datetime, date o texto 'AAAA-MM-DD...'), None si no hay"""
+    if valor is None:
+        return None
+    return valor.strftime("%Y-%m") if hasattr(valor, "strftime") else str(valor)[:7]
+
+
+def segmentos(desde=None, hasta=None):
+    """Claves de los segmentos con cierres entre 'desde' y 'hasta' (incluidos), en orden"""
+    desde, hasta = _mes(desde), _mes(hasta)
+    return [clave for clave in sorted(indice()["segmentos"])
+            if (desde is None or clave >= desde) and (hasta is None or clave <= hasta)]
+
+
+# ==================== LECTURA ====================
+
+def leer_segmento(clave):
+    """Órdenes de un segmento (lista vacía si no existe)"""
+    ruta = os.path.join(carpeta(), indice()["segmentos"][clave]["archivo"])
+    try:
+        with open(ruta, 'rb') as archivo:
+            contenido = gzip.decompress(archivo.read())
+    except FileNotFoundError:
+        return []
+    return [json.loads(linea) for linea in contenido.splitlines() if linea]
+
+
+def ordenes_archivadas(desde=None, hasta=None, filtro=None):
+    """Recorre las órdenes archivadas cerradas entre 'desde' y 'hasta' (por mes), segmento a segmento.
+
+    Cada ID aparece una vez y se omiten las que siguen en ordenes_trabajo
+    (p. ej. si otra instancia las modificó antes de recargar).
+    """
+    vistas = set()
+    for clave in segmentos(desde, hasta):
+        for orden in leer_segmento(clave):
+            if orden['id'] in vistas or gm.orden_por_id(orden['id']) is not None:
+                continue
+            vistas.add(orden['id'])
+            if filtro is None or filtro(orden):
+                yield orden
+
+
+def orden_archivada(id_orden):
+    """Orden archivada con ese ID (None si no está); solo abre los segmentos cuyo rango de IDs lo incluye"""
+    for clave, segmento in sorted(indice()["segmentos"].items(), reverse=True):
+        if segmento["id_min"] <= id_orden <= segmento["id_max"]:
+            for orden in leer_segmento(clave):
+                if orden['id'] == id_orden:
+                    return orden
+    return None
+
+
+def buscar_ordenes_archivadas(termino="", desde=None, hasta=None, limite=None):
+    """Órdenes archivadas que contienen 'termino' en algún campo de texto (o el ID exacto)"""
+    termino = termino.strip().casefold()
+    if termino.isdigit():
+        orden = orden_archivada(int(termino))
+        if orden is not None:
+            return [orden]
+
+    def coincide(orden):
+        return any(termino in valor.casefold() for valor in orden.values() if isinstance(valor, str))
+
+    encontradas = []
+    for orden in ordenes_archivadas(desde, hasta, coincide if termino else None):
+        encontradas.append(orden)
+        if limite is not None and len(encontradas) >= limite:
+            break
+    return encontradas
+
+
+# ==================== ARCHIVADO ====================
+
+def candidatas(dias=None, ahora=None):
+    """Órdenes cerradas cuyo cierre tiene más de 'dias' días"""
+    dias = dias_politica() if dias is None else dias
+    limite = (ahora or datetime.now()) - timedelta(days=dias)
+    resultado = []
+    for orden in gm.ordenes_trabajo:
+        if orden.get('estado') in ESTADOS_CERRADOS:
+            cierre = fecha_cierre(orden)
+            if cierre is not None and cierre < limite:
+                resultado.append(orden)
+    return resultado
+
+
+def _escribir_binario(ruta, contenido):
+    temporal = ruta + ".tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(contenido)
+    os.replace(temporal, ruta)
+
+
+def _agregar_a_segmento(clave, ordenes, datos_indice):
+    """Agrega las órdenes (las que aún no estén) al segmento del mes y actualiza su entrada del índice"""
+    segmento = datos_indice["segmentos"].get(clave)
+    ruta = os.path.join(carpeta(), f"ordenes_{clave}.jsonl.gz")
+    anterior = b""
+    if segmento is not None and os.path.exists(ruta):
+        with open(ruta, 'rb') as archivo:
+            anterior = archivo.read()
+        # Las que ya se archivaron (otra instancia, o un archivado que no alcanzó a guardar los datos);
+        # si ningún ID cae en el rango del segmento, no hace falta descomprimirlo
+        if any(segmento["id_min"] <= orden['id'] <= segmento["id_max"] for orden in ordenes):
+            ya = {orden['id'] for orden in leer_segmento(clave)}
+            ordenes = [orden for orden in ordenes if orden['id'] not in ya]
+    if not ordenes:
+        return 0
+
+    lineas = "".join(json.dumps(orden, ensure_ascii=False) + "\n" for orden in ordenes)
+    contenido = anterior + gzip.compress(lineas.encode("utf-8"), compresslevel=NIVEL_COMPRESION)
+    _escribir_binario(ruta, contenido)
+
+    if segmento is None:
+        segmento = datos_indice["segmentos"][clave] = {
+            "archivo": os.path.basename(ruta), "ordenes": 0, "bytes": 0, "desde": None, "hasta": None,
+            "id_min": None, "id_max": None, "por_estado": {}, "por_tipo": {}, "por_prioridad": {}}
+    cierres = [fecha_cierre(orden).strftime(gm.FORMATO_FECHA) for orden in ordenes]
+    ids = [orden['id'] for orden in ordenes]
+    segmento["ordenes"] += len(ordenes)
+    segmento["bytes"] = len(contenido)
+    segmento["desde"] = min(filter(None, (segmento["desde"], *cierres)))
+    segmento["hasta"] = max(filter(None, (segmento["hasta"], *cierres)))
+    segmento["id_min"] = min(ids) if segmento["id_min"] is None else min(segmento["id_min"], *ids)
+    segmento["id_max"] = max(ids) if segmento["id_max"] is None else max(segmento["id_max"], *ids)
+    for campo, clave_campo in (("por_estado", "estado"), ("por_tipo", "tipo"), ("por_prioridad", "prioridad")):
+        conteo = Counter(segmento[campo])
+        conteo.update(str(orden.get(clave_campo)) for orden in ordenes)
+        segmento[campo] = dict(conteo)
+    return len(ordenes)
+
+
+@metricas.medido
+def archivar_ordenes(dias=None, ahora=None):
+    """Pasa al archivo las órdenes cerradas hace más de 'dias' días y las quita de ordenes_trabajo.
+
+    Primero se escriben los segmentos y el índice y después se guardan los
+    datos sin esas órdenes: si algo falla en medio, las órdenes quedan en
+    los dos lados (las consultas no las repiten) pero no se pierden.
+    Devuelve {"archivadas": n, "segmentos": [claves tocadas]}.
+    """
+    dias = dias_politica() if dias is None else dias
+    if dias < DIAS_MINIMOS:
+        raise ValueError(f"Las órdenes cerradas hace menos de {DIAS_MINIMOS} días no se archivan")
+    with gm.bloqueo_datos():
+        ordenes = candidatas(dias, ahora)
+        if not ordenes:
+            return {"archivadas": 0, "segmentos": []}
+        por_mes = {}
+        for orden in ordenes:
+            por_mes.setdefault(_mes(fecha_cierre(orden)), []).append(orden)
+
+        os.makedirs(carpeta(), exist_ok=True)
+        datos_indice = json.loads(json.dumps(indice()))     # copia: el caché solo cambia si se escribe
+        archivadas = sum(_agregar_a_segmento(clave, grupo, datos_indice) for clave, grupo in sorted(por_mes.items()))
+        gm._escribir_atomico(_ruta_indice(), lambda archivo: json.dump(datos_indice, archivo, ensure_ascii=False))
+        gm.retirar_ordenes_archivadas(ordenes, max(orden['id'] for orden in ordenes))
+    return {"archivadas": archivadas, "segmentos": sorted(por_mes)}
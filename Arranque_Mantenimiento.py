@@ -0,0 +1,197 @@
+"""
+Perfil de arranque del Sistema de Gestión de Mantenimiento
+Archivo: Arranque_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Mide cuánto tarda cada fase del arranque de la interfaz hasta que la ventana
+queda dibujada:
+
+    antes de Python   desde que se creó el proceso (en el ejecutable onefile de
+                      PyInstaller, desde que arrancó el cargador que descomprime)
+    importaciones     módulos importados por Interfaz_Mantenimiento
+    ventana, estilos, pestaña ..., carga de datos, listas
+    primer pintado    hasta que el bucle de eventos queda ocioso por primera vez
+
+Debe importarse antes que todo lo demás (es lo primero que importa la
+interfaz) para que el reloj empiece con el programa.
+
+Con GM_PERFIL_ARRANQUE=1 el perfil se guarda en ARCHIVO_PERFIL en la carpeta
+de datos (o en la ruta que indique la variable); con GM_SALIR_TRAS_ARRANQUE=1
+la ventana se cierra sola después del primer pintado, para que el benchmark
+(benchmarks/bench_arranque.py) pueda medir el arranque y compararlo con el
+presupuesto.
+"""
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+_INICIO = time.perf_counter()
+
+VARIABLE_ENTORNO = "GM_PERFIL_ARRANQUE"
+VARIABLE_SALIR = "GM_SALIR_TRAS_ARRANQUE"
+ARCHIVO_PERFIL = "arranque_mantenimiento.json"
+# Presupuesto (segundos) desde que se crea el proceso hasta el primer pintado
+PRESUPUESTO_S = 3.0
+# ...y de las importaciones, que son lo que más crece con el ejecutable onefile
+PRESUPUESTO_IMPORTACIONES_S = 0.5
+
+_fases = []             # (nombre, inicio, fin) en segundos desde _INICIO
+_ultima_marca = 0.0
+terminado = False
+
+
+def _segundos_desde_creacion(pid):
+    """Segundos desde que se creó el proceso 'pid' (None si el sistema no lo informa)"""
+    try:
+        if sys.platform.startswith("linux"):
+            with open(f"/proc/{pid}/stat", encoding="ascii") as archivo:
+                # El nombre del proceso va entre paréntesis y puede tener espacios
+                campos = archivo.read().rsplit(")", 1)[1].split()
+            with open("/proc/uptime", encoding="ascii") as archivo:
+                encendido = float(archivo.read().split()[0])
+            return encendido - int(campos[19]) / os.sysconf("SC_CLK_TCK")
+        if os.name == "nt":
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            proceso = kernel32.OpenProcess(0x1000, False, pid)    # PROCESS_QUERY_LIMITED_INFORMATION
+            if not proceso:
+                return None
+            try:
+                creacion, salida, kernel, usuario, ahora = (wintypes.FILETIME() for _ in range(5))
+                if not kernel32.GetProcessTimes(proceso, ctypes.byref(creacion), ctypes.byref(salida),
+                                                ctypes.byref(kernel), ctypes.byref(usuario)):
+                    return None
+                kernel32.GetSystemTimeAsFileTime(ctypes.byref(ahora))
+            finally:
+                kernel32.CloseHandle(proceso)
+            centenas = lambda t: (t.dwHighDateTime << 32) | t.dwLowDateTime   # unidades de 100 ns
+            return (centenas(ahora) - centenas(creacion)) / 1e7
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return None
+
+
+def _antes_de_python():
+    # En el ejecutable onefile el proceso padre es el cargador que descomprime en _MEIxxxx
+    onefile = getattr(sys, "frozen", False) and os.path.basename(getattr(sys, "_MEIPASS", "")).startswith("_MEI")
+    segundos = _segundos_desde_creacion(os.getppid() if onefile else os.getpid())
+    if segundos is None:
+        return None
+    return max(segundos - (time.perf_counter() - _INICIO), 0.0)
+
+
+_previo = _antes_de_python()
+
+
+def _ahora():
+    return time.perf_counter() - _INICIO
+
+
+def marcar(nombre):
+    """Cierra una fase que empezó donde terminó la anterior (p. ej. las importaciones)"""
+    global _ultima_marca
+    if terminado:
+        return
+    ahora = _ahora()
+    _fases.append((nombre, _ultima_marca, ahora))
+    _ultima_marca = ahora
+
+
+@contextmanager
+def _medir_fase(nombre):
+    global _ultima_marca
+    inicio = _ahora()
+    try:
+        yield
+    finally:
+        _ultima_marca = _ahora()
+        _fases.append((nombre, inicio, _ultima_marca))
+
+
+def fase(nombre):
+    """Administrador de contexto que mide una fase: with arranque.fase("estilos"): ..."""
+    return nullcontext() if terminado else _medir_fase(nombre)
+
+
+def perfil():
+    """{"fases": [...], "total_s": ..., "presupuesto_s": ..., ...} con los tiempos en segundos"""
+    fases = [{"nombre": nombre, "inicio_s": round(inicio, 4), "segundos": round(fin - inicio, 4)}
+             for nombre, inicio, fin in _fases]
+    if _previo is not None:
+        fases.insert(0, {"nombre": "antes de Python", "inicio_s": round(-_previo, 4),
+                         "segundos": round(_previo, 4)})
+    total = (_previo or 0.0) + (_fases[-1][2] if _fases else 0.0)
+    importaciones = sum(fin - inicio for nombre, inicio, fin in _fases if nombre == "importaciones")
+    return {
+        "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "ejecutable": bool(getattr(sys, "frozen", False)),
+        "terminado": terminado,
+        "fases": fases,
+        "total_s": round(total, 4),
+        "presupuesto_s": PRESUPUESTO_S,
+        "importaciones_s": round(importaciones, 4),
+        "presupuesto_importaciones_s": PRESUPUESTO_IMPORTACIONES_S,
+        "dentro_del_presupuesto": total <= PRESUPUESTO_S and importaciones <= PRESUPUESTO_IMPORTACIONES_S,
+    }
+
+
+def ruta_volcado():
+    valor = os.environ.get(VARIABLE_ENTORNO, "")
+    if valor not in ("", "0", "1"):
+        return valor
+    import Gestion_Mantenimiento as gm
+    return os.path.join(os.path.dirname(gm.ARCHIVO_DATOS), ARCHIVO_PERFIL)
+
+
+def volcar(ruta=None):
+    """Escribe el perfil en un archivo JSON (por defecto en la carpeta de datos); devuelve la ruta"""
+    ruta = ruta or ruta_volcado()
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(perfil(), archivo, indent=2, ensure_ascii=False)
+    return ruta
+
+
+def legible():
+    """Texto con una línea por fase, para el panel de diagnóstico"""
+    datos = perfil()
+    lineas = [f"{f['nombre']:<28} {f['segundos'] * 1000:>9.1f} ms" for f in datos["fases"]]
+    estado = "dentro del presupuesto" if datos["dentro_del_presupuesto"] else "FUERA DEL PRESUPUESTO"
+    lineas.append(f"{'total hasta el primer pintado':<28} {datos['total_s'] * 1000:>9.1f} ms "
+                  f"(presupuesto {PRESUPUESTO_S * 1000:.0f} ms, importaciones "
+                  f"{PRESUPUESTO_IMPORTACIONES_S * 1000:.0f} ms: {estado})")
+    return "\n".join(lineas)
+
+
+def al_primer_pintado(root, despues=None):
+    """Programa el cierre del perfil cuando el bucle de eventos quede ocioso por primera vez.
+
+    Los redibujos de la ventana también son tareas ociosas de Tk y se
+    programaron antes (al crear los widgets), así que corren primero.
+    'despues' se llama a continuación: ahí va el trabajo que puede esperar a
+    que la ventana ya se vea.
+    """
+    def terminar():
+        global terminado
+        marcar("primer pintado")
+        terminado = True
+        import Metricas_Mantenimiento as metricas
+        if metricas.activas:
+            for nombre, inicio, fin in _fases:
+                metricas.registrar(f"arranque.{nombre}", fin - inicio)
+        if os.environ.get(VARIABLE_ENTORNO, "") not in ("", "0"):
+            try:
+                volcar()
+            except OSError as e:
+                print(f"No se pudo guardar el perfil de arranque: {e}")
+        if despues:
+            despues()
+        if os.environ.get(VARIABLE_SALIR, "") not in ("", "0"):
+            root.destroy()
+
+    root.after_idle(terminar)
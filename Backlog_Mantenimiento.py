@@ -0,0 +1,126 @@
+"""
+Antigüedad del backlog del Sistema de Gestión de Mantenimiento
+Archivo: Backlog_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+El backlog son las órdenes abiertas (Pendiente, En progreso o Pausada). Este
+módulo mantiene dos estructuras agregadas, actualizadas con
+gm.registrar_indice_ordenes cada vez que se crea, modifica o elimina una orden:
+
+  • por prioridad, cuántas órdenes abiertas se crearon cada día; con eso el
+    histograma de antigüedad (días desde fecha_creacion) se arma recorriendo
+    días distintos, no órdenes, y se puede refrescar en vivo;
+  • la variación diaria del backlog (+1 el día de creación, -1 el día de
+    cierre según fecha_finalizacion); su suma acumulada reconstruye el tamaño
+    del backlog en cualquier fecha pasada.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import date, timedelta
+from itertools import accumulate
+
+import Gestion_Mantenimiento as gm
+
+ESTADOS_ABIERTOS = ("Pendiente", "En progreso", "Pausada")
+
+# Cubetas de antigüedad: límite superior en días (None = sin límite) y etiqueta
+CUBETAS_ANTIGUEDAD = (
+    (7, "0-7 días"),
+    (30, "8-30 días"),
+    (90, "31-90 días"),
+    (180, "91-180 días"),
+    (None, "Más de 180 días"),
+)
+_LIMITES = [limite for limite, _ in CUBETAS_ANTIGUEDAD[:-1]]
+
+# Prioridad -> Counter(día de creación (ordinal) -> órdenes abiertas)
+_abiertas_por_dia = {}
+# Día (ordinal) -> variación del tamaño del backlog ese día
+_variacion_diaria = Counter()
+
+
+def _dia(texto):
+    """Ordinal del día de una fecha 'AAAA-MM-DD ...' (None si no es válida)"""
+    try:
+        return date.fromisoformat(texto[:10]).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def _sumar(contador, clave, delta):
+    contador[clave] += delta
+    if contador[clave] == 0:
+        del contador[clave]
+
+
+def _actualizar(orden, delta):
+    creada = _dia(orden.get('fecha_creacion'))
+    if creada is None:
+        return
+    if orden.get('estado') in ESTADOS_ABIERTOS:
+        _sumar(_abiertas_por_dia.setdefault(orden.get('prioridad') or "Media", Counter()),
+               creada, delta)
+        _sumar(_variacion_diaria, creada, delta)
+        return
+    cerrada = _dia(orden.get('fecha_finalizacion'))
+    if cerrada is None:
+        # Cerrada sin fecha conocida: no se puede ubicar en la tendencia
+        return
+    _sumar(_variacion_diaria, creada, delta)
+    _sumar(_variacion_diaria, max(cerrada, creada), -delta)
+
+
+def _reiniciar():
+    _abiertas_por_dia.clear()
+    _variacion_diaria.clear()
+
+
+gm.registrar_indice_ordenes(_actualizar, _reiniciar)
+
+
+def _cubeta(dias):
+    return CUBETAS_ANTIGUEDAD[bisect_left(_LIMITES, dias)][1]
+
+
+def histograma_antiguedad(hoy=None):
+    """Órdenes abiertas por cubeta de antigüedad y prioridad.
+
+    Devuelve {etiqueta de la cubeta: {prioridad: cantidad}} con todas las
+    cubetas y prioridades, aunque estén en cero.
+    """
+    hoy = (hoy or date.today()).toordinal()
+    resultado = {etiqueta: dict.fromkeys(gm.RANGO_PRIORIDAD, 0) for _, etiqueta in CUBETAS_ANTIGUEDAD}
+    for prioridad, por_dia in _abiertas_por_dia.items():
+        for dia, cantidad in por_dia.items():
+            cubeta = resultado[_cubeta(max(hoy - dia, 0))]
+            cubeta[prioridad] = cubeta.get(prioridad, 0) + cantidad
+    return resultado
+
+
+def tamano_backlog():
+    """Cantidad de órdenes abiertas por prioridad"""
+    return {prioridad: sum(por_dia.values()) for prioridad, por_dia in _abiertas_por_dia.items()}
+
+
+def tendencia_backlog(desde, hasta=None, paso=1):
+    """Tamaño del backlog al final de cada día entre 'desde' y 'hasta' (date).
+
+    Devuelve [(date, tamaño)] cada 'paso' días; 'hasta' es hoy si no se indica.
+    """
+    hasta = hasta or date.today()
+    dias = sorted(_variacion_diaria)
+    acumulado = list(accumulate(_variacion_diaria[d] for d in dias))
+    serie = []
+    actual = desde
+    while actual <= hasta:
+        posicion = bisect_right(dias, actual.toordinal())
+        serie.append((actual, acumulado[posicion - 1] if posicion else 0))
+        actual += timedelta(days=paso)
+    return serie
+
+
+def tendencia_ultimos_dias(dias, paso=1):
+    """Tendencia del backlog de los últimos 'dias' días hasta hoy"""
+    hoy = date.today()
+    return tendencia_backlog(hoy - timedelta(days=dias - 1), hoy, paso)
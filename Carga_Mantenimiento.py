@@ -0,0 +1,265 @@
+"""
+Carga de trabajo de los técnicos del Sistema de Gestión de Mantenimiento
+Archivo: Carga_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+El campo 'estado' de un técnico solo dice si está "Disponible" u "Ocupado" en
+este momento. Este módulo calcula la carga real a partir de las fechas de las
+órdenes: cada orden asignada es un intervalo [fecha_inicio, fecha_finalizacion]
+(abierto hasta ahora si la orden sigue en curso) y, para cualquier ventana de
+tiempo, se obtiene por técnico:
+
+  • órdenes activas ahora (asignadas y sin cerrar),
+  • órdenes trabajadas en la ventana (intervalos que se cruzan con ella),
+  • horas trabajadas en la ventana (intervalos recortados a la ventana),
+  • utilización: horas trabajadas / horas hábiles de la ventana.
+
+Los intervalos de cada técnico se guardan en un índice con los inicios y los
+fines ordenados y sus sumas acumuladas, de modo que una consulta cuesta
+O(log n) por técnico sin importar cuántos años de órdenes haya. El índice se
+mantiene al día con gm.registrar_indice_ordenes: un cambio en una orden solo
+marca a su técnico para reconstruir su índice en la siguiente consulta.
+
+Las órdenes archivadas (Archivado_Mantenimiento) ya no están en
+ordenes_trabajo: si la ventana llega a meses con órdenes archivadas, sus
+intervalos se leen de esos segmentos y se suman. Ese índice aparte se
+guarda hasta que cambie el archivo, así las ventanas recientes no abren
+ningún segmento.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+import Gestion_Mantenimiento as gm
+import Archivado_Mantenimiento as archivado
+
+# Jornada usada para calcular la capacidad (horas por día hábil, lunes a viernes)
+HORAS_JORNADA = 8
+ESTADOS_ABIERTOS = ("Pendiente", "En progreso", "Pausada")
+
+# Ventanas predefinidas: nombre -> días hacia atrás desde ahora
+VENTANAS = {
+    "Últimos 7 días": 7,
+    "Últimos 30 días": 30,
+    "Últimos 90 días": 90,
+    "Último año": 365,
+}
+
+
+def _segundos(texto):
+    # fromisoformat es mucho más rápido que strptime para el formato AAAA-MM-DD HH:MM:SS
+    try:
+        return datetime.fromisoformat(texto).timestamp()
+    except (TypeError, ValueError):
+        fecha = gm.parsear_fecha(texto)
+        return fecha.timestamp() if fecha else None
+
+
+def dias_habiles(desde, hasta):
+    """Días de lunes a viernes entre dos fechas (fracciones en los extremos incluidas)"""
+    if hasta <= desde:
+        return 0.0
+    inicio_dia = datetime(desde.year, desde.month, desde.day)
+    dias = 0.0
+    # Días completos intermedios por semanas enteras y el resto uno a uno
+    primero = inicio_dia + timedelta(days=1)
+    ultimo = datetime(hasta.year, hasta.month, hasta.day)
+    if primero < ultimo:
+        total = (ultimo - primero).days
+        semanas, resto = divmod(total, 7)
+        dias += semanas * 5
+        dias += sum(1 for i in range(resto) if (primero + timedelta(days=i)).weekday() < 5)
+    # Fracciones del primer y último día
+    if inicio_dia == ultimo:
+        if desde.weekday() < 5:
+            dias += (hasta - desde).total_seconds() / 86400
+        return dias
+    if desde.weekday() < 5:
+        dias += (primero - desde).total_seconds() / 86400
+    if hasta.weekday() < 5:
+        dias += (hasta - ultimo).total_seconds() / 86400
+    return dias
+
+
+class IndiceIntervalos:
+    """Intervalos cerrados de un técnico, ordenados por inicio y por fin.
+
+    Los intervalos abiertos (órdenes en curso) se guardan aparte porque su fin
+    es "ahora" y cambia con cada consulta; suelen ser pocos por técnico.
+    """
+
+    def __init__(self, cerrados, abiertos):
+        self.inicios = sorted(inicio for inicio, _ in cerrados)
+        self.fines = sorted(fin for _, fin in cerrados)
+        self.suma_inicios = [0.0, *accumulate(self.inicios)]
+        self.suma_fines = [0.0, *accumulate(self.fines)]
+        self.abiertos = sorted(abiertos)
+
+    def consultar(self, a, b, ahora):
+        """(intervalos que se cruzan con [a, b), segundos trabajados dentro de [a, b))"""
+        n = len(self.inicios)
+        # Cerrados que se cruzan: empiezan antes de b y no terminan antes de a
+        ini_antes_b = bisect_left(self.inicios, b)
+        fin_hasta_a = bisect_right(self.fines, a)
+        cruzan = ini_antes_b - fin_hasta_a
+
+        # Σ min(fin, b) - Σ max(inicio, a) sobre los que se cruzan, con sumas acumuladas
+        fin_antes_b = bisect_left(self.fines, b)
+        ini_hasta_a = bisect_right(self.inicios, a)
+        suma_min_fin = (self.suma_fines[fin_antes_b] - self.suma_fines[fin_hasta_a]
+                        + b * (n - fin_antes_b) - b * (n - ini_antes_b))
+        suma_max_ini = (a * ini_hasta_a + self.suma_inicios[ini_antes_b] - self.suma_inicios[ini_hasta_a]
+                        - a * fin_hasta_a)
+        segundos = suma_min_fin - suma_max_ini
+
+        fin_abiertos = min(b, ahora)
+        for inicio in self.abiertos[:bisect_left(self.abiertos, b)]:
+            if fin_abiertos > a:
+                cruzan += 1
+                segundos += max(fin_abiertos - max(inicio, a), 0.0)
+        return cruzan, segundos
+
+
+# ==================== ÍNDICE INCREMENTAL POR TÉCNICO ====================
+
+# Técnico -> {id(orden): orden} de las órdenes que tiene asignadas
+_ordenes_por_tecnico = {}
+# Técnico -> IndiceIntervalos ya construido (se borra cuando cambia alguna orden suya)
+_indices = {}
+# Técnico -> cantidad de órdenes abiertas asignadas
+_activas = Counter()
+
+
+def _actualizar(orden, delta):
+    tecnico = orden.get('tecnico_asignado')
+    if not tecnico or orden.get('estado') == "Cancelada":
+        return
+    ordenes = _ordenes_por_tecnico.setdefault(tecnico, {})
+    if delta > 0:
+        ordenes[id(orden)] = orden
+    else:
+        ordenes.pop(id(orden), None)
+        if not ordenes:
+            del _ordenes_por_tecnico[tecnico]
+    if orden.get('estado') in ESTADOS_ABIERTOS:
+        _activas[tecnico] += delta
+        if _activas[tecnico] <= 0:
+            del _activas[tecnico]
+    _indices.pop(tecnico, None)
+
+
+def _reiniciar():
+    _ordenes_por_tecnico.clear()
+    _indices.clear()
+    _activas.clear()
+
+
+gm.registrar_indice_ordenes(_actualizar, _reiniciar)
+
+
+def _indice(tecnico):
+    indice = _indices.get(tecnico)
+    if indice is None:
+        cerrados, abiertos = [], []
+        for orden in _ordenes_por_tecnico.get(tecnico, {}).values():
+            inicio = _segundos(orden.get('fecha_inicio'))
+            if inicio is None:
+                continue
+            if orden['estado'] in ESTADOS_ABIERTOS:
+                abiertos.append(inicio)
+                continue
+            fin = _segundos(orden.get('fecha_finalizacion'))
+            if fin is not None and fin >= inicio:
+                cerrados.append((inicio, fin))
+        indice = _indices[tecnico] = IndiceIntervalos(cerrados, abiertos)
+    return indice
+
+
+# Índices de las órdenes archivadas: firma de los segmentos leídos -> {técnico: IndiceIntervalos}
+_archivadas = {"firma": None, "indices": {}}
+
+
+def _indices_archivados(desde):
+    """IndiceIntervalos por técnico de las órdenes archivadas que cerraron desde el mes de 'desde'"""
+    segmentos = archivado.indice()["segmentos"]
+    claves = archivado.segmentos(desde)
+    if not claves:
+        return {}
+    firma = tuple((clave, segmentos[clave]["ordenes"]) for clave in claves)
+    if firma != _archivadas["firma"]:
+        cerrados = {}
+        for orden in archivado.ordenes_archivadas(desde):
+            tecnico = orden.get('tecnico_asignado')
+            if not tecnico or orden.get('estado') == "Cancelada":
+                continue
+            inicio = _segundos(orden.get('fecha_inicio'))
+            fin = _segundos(orden.get('fecha_finalizacion'))
+            if inicio is not None and fin is not None and fin >= inicio:
+                cerrados.setdefault(tecnico, []).append((inicio, fin))
+        _archivadas["indices"] = {tecnico: IndiceIntervalos(intervalos, [])
+                                  for tecnico, intervalos in cerrados.items()}
+        _archivadas["firma"] = firma
+    return _archivadas["indices"]
+
+
+def ordenes_activas(tecnico):
+    """Cantidad de órdenes abiertas asignadas ahora al técnico"""
+    return _activas.get(tecnico, 0)
+
+
+def carga_tecnicos(desde, hasta=None):
+    """Carga de cada técnico en la ventana [desde, hasta) (datetime; 'hasta' = ahora).
+
+    Devuelve una fila por técnico registrado (y por nombre asignado en órdenes
+    que ya no esté registrado): {tecnico, especialidad, estado, activas,
+    ordenes, horas, utilizacion}. La utilización es un valor entre 0 y 1 (o
+    mayor si hubo horas extra u órdenes en paralelo). Incluye las órdenes
+    archivadas que se cruzan con la ventana.
+    """
+    ahora = datetime.now()
+    hasta = hasta or ahora
+    a, b = desde.timestamp(), hasta.timestamp()
+    capacidad = dias_habiles(desde, hasta) * HORAS_JORNADA
+
+    archivados = _indices_archivados(desde)
+    registrados = {t['nombre']: t for t in gm.tecnicos}
+    nombres = list(registrados) + [n for n in {**_ordenes_por_tecnico, **archivados} if n not in registrados]
+    filas = []
+    for nombre in nombres:
+        cruzan, segundos = _indice(nombre).consultar(a, b, ahora.timestamp())
+        if nombre in archivados:
+            cruzan_archivo, segundos_archivo = archivados[nombre].consultar(a, b, ahora.timestamp())
+            cruzan += cruzan_archivo
+            segundos += segundos_archivo
+        horas = segundos / 3600
+        tecnico = registrados.get(nombre, {})
+        filas.append({
+            "tecnico": nombre,
+            "especialidad": tecnico.get('especialidad', ""),
+            "estado": tecnico.get('estado', "No registrado"),
+            "activas": ordenes_activas(nombre),
+            "ordenes": cruzan,
+            "horas": round(horas, 2),
+            "utilizacion": round(horas / capacidad, 4) if capacidad else None,
+        })
+    return filas
+
+
+def ventana_predefinida(nombre, ahora=None):
+    """(desde, hasta) de una de las VENTANAS"""
+    ahora = ahora or datetime.now()
+    return ahora - timedelta(days=VENTANAS[nombre]), ahora
+
+
+def ventana_personalizada(desde, hasta):
+    """(desde, hasta) a partir de textos 'AAAA-MM-DD'; 'hasta' incluye el día completo.
+
+    Lanza ValueError si alguna fecha no es válida o si 'hasta' es anterior a 'desde'.
+    """
+    inicio = datetime.strptime(desde.strip(), "%Y-%m-%d")
+    fin = datetime.strptime(hasta.strip(), "%Y-%m-%d") + timedelta(days=1)
+    if fin <= inicio:
+        raise ValueError("'hasta' debe ser posterior a 'desde'")
+    return inicio, fin
@@ -0,0 +1,438 @@
+"""
+Línea de comandos por lotes del Sistema de Gestión de Mantenimiento
+Archivo: Comandos_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Operaciones sin menú ni pausas, para usarlas desde cron o scripts:
+
+    python Gestion_Mantenimiento.py registrar-equipo --nombre "Compresor 3" --prioridad Alta
+    python Gestion_Mantenimiento.py registrar-tecnico --nombre "Ana Gómez" --especialidad Mecánica
+    python Gestion_Mantenimiento.py crear-orden --equipo 3 --descripcion "Fuga de aceite" --tipo Correctivo
+    python Gestion_Mantenimiento.py asignar 15 16 --tecnico "Ana Gómez"
+    python Gestion_Mantenimiento.py asignar --automatico
+    python Gestion_Mantenimiento.py completar 15 --observaciones "Cambio de sello"
+    python Gestion_Mantenimiento.py listar ordenes --filtro estado=Pendiente --limite 20
+    python Gestion_Mantenimiento.py listar ordenes --archivadas --buscar compresor
+    python Gestion_Mantenimiento.py archivar --dias 365
+    python Gestion_Mantenimiento.py exportar csv carpeta_destino
+    python Gestion_Mantenimiento.py programar --asignar
+    python Gestion_Mantenimiento.py lote < operaciones.jsonl
+    python Gestion_Mantenimiento.py memoria --rastrear
+
+'lote' lee de la entrada estándar una operación JSON por línea, con el nombre
+del subcomando en "op" y sus datos con los nombres de campo de gm, p. ej.
+{"op": "crear-orden", "equipo_id": 3, "descripcion": "Fuga", "tipo": "Correctivo"}
+o {"op": "completar", "ordenes": [15, 16]}. Todas se aplican en una sola
+transacción: si alguna falla no se guarda nada (salvo con --continuar, que
+guarda las correctas), y un error inesperado (p. ej. el bloqueo de datos
+ocupado) tampoco guarda el lote a medias.
+
+La salida es JSON en la salida estándar (una línea por resultado); los
+mensajes de gm van a la salida de errores. Código de salida: 0 si todo salió
+bien, 1 si alguna operación falló o no se pudo guardar, 2 si el comando está
+mal escrito.
+"""
+
+import os
+import sys
+import json
+import argparse
+from contextlib import ExitStack, redirect_stdout
+from datetime import date, datetime
+
+import Gestion_Mantenimiento as gm
+
+# Nombre en la línea de comandos -> colección de gm
+RECURSOS = {
+    "equipos": "equipos",
+    "ordenes": "ordenes_trabajo",
+    "tecnicos": "tecnicos",
+    "planes": "planes_mantenimiento",
+    "planes_recurrentes": "planes_recurrentes",
+    "historial": "historial_mantenimiento",
+}
+
+
+class Contexto:
+    """Estado compartido por las operaciones de una ejecución.
+
+    Tiene los atributos que los normalizadores de gm esperan de un lote de
+    importación ('equipos' por ID y 'ahora') y reparte los IDs nuevos sin
+    recorrer las colecciones en cada operación. 'bloqueos' retiene hasta
+    el final del lote los bloqueos de datos que alguna operación necesite
+    mantener hasta guardar.
+    """
+
+    def __init__(self):
+        self.ahora = datetime.now().strftime(gm.FORMATO_FECHA)
+        self.equipos = {e['id']: e for e in gm.equipos}
+        self.bloqueos = ExitStack()
+        self._siguientes = {}
+
+    def siguiente_id(self, coleccion):
+        if coleccion not in self._siguientes:
+            self._siguientes[coleccion] = gm.siguiente_id(coleccion)
+        valor = self._siguientes[coleccion]
+        self._siguientes[coleccion] += 1
+        return valor
+
+    def olvidar_ids(self, coleccion):
+        """Otra función de gm creó registros: el siguiente ID se vuelve a calcular"""
+        self._siguientes.pop(coleccion, None)
+
+
+# ==================== OPERACIONES ====================
+# Cada operación recibe (contexto, datos) y devuelve un resultado serializable;
+# lanza ValueError si los datos no son válidos.
+
+def _crear(contexto, coleccion, datos):
+    return {"id": contexto.siguiente_id(coleccion), **gm.NORMALIZADORES[coleccion](datos, contexto)}
+
+
+def _tecnico(nombre):
+    tecnico = next((t for t in gm.tecnicos if t['nombre'] == nombre), None)
+    if tecnico is None:
+        raise ValueError(f"El técnico '{nombre}' no existe")
+    return tecnico
+
+
+def _ids_ordenes(datos):
+    ids = datos.get("ordenes")
+    if ids is None:
+        ids = [datos["orden"]] if datos.get("orden") is not None else []
+    ids = [gm._entero(i, "orden") for i in ids]
+    faltantes = [i for i in ids if gm.orden_por_id(i) is None]
+    if faltantes:
+        raise ValueError(f"No existen las órdenes: {', '.join(map(str, faltantes))}")
+    return ids
+
+
+def registrar_equipo(contexto, datos):
+    equipo = _crear(contexto, "equipos", datos)
+    gm.equipos.append(equipo)
+    contexto.equipos[equipo['id']] = equipo
+    gm.guardar_datos()
+    return equipo
+
+
+def registrar_tecnico(contexto, datos):
+    tecnico = _crear(contexto, "tecnicos", datos)
+    gm.tecnicos.append(tecnico)
+    gm.guardar_datos()
+    return tecnico
+
+
+def crear_orden(contexto, datos):
+    tecnico = _tecnico(datos["tecnico_asignado"]) if datos.get("tecnico_asignado") else None
+    orden = _crear(contexto, "ordenes_trabajo", {**datos, "tecnico_asignado": None})
+    gm.agregar_orden(orden)
+    if tecnico:
+        gm.asignar_tecnico_ordenes([orden['id']], tecnico)
+    gm.guardar_datos()
+    return orden
+
+
+def asignar(contexto, datos):
+    if datos.get("automatico"):
+        import Despacho_Mantenimiento as despacho
+        ids = _ids_ordenes(datos) or None
+        propuesta = despacho.proponer_asignacion(ids)
+        despacho.aplicar_asignacion(propuesta['propuestas'])
+        return {
+            "asignadas": [{"orden": p['orden']['id'], "tecnico": p['tecnico']['nombre']}
+                          for p in propuesta['propuestas']],
+            "sin_asignar": [o['id'] for o in propuesta['sin_asignar']],
+            "metodo": propuesta['metodo'],
+        }
+    if not datos.get("tecnico"):
+        raise ValueError("Indique el técnico o use la asignación automática")
+    tecnico = _tecnico(datos["tecnico"])
+    ids = _ids_ordenes(datos)
+    if not ids:
+        raise ValueError("Indique al menos una orden")
+    gm.asignar_tecnico_ordenes(ids, tecnico)
+    return {"asignadas": [{"orden": i, "tecnico": tecnico['nombre']} for i in ids]}
+
+
+def completar(contexto, datos):
+    ids = _ids_ordenes(datos)
+    if not ids:
+        raise ValueError("Indique al menos una orden")
+    completadas = gm.completar_ordenes(ids, gm._texto(datos.get("observaciones")))
+    return {"completadas": [o['id'] for o in completadas],
+            "ya_completadas": sorted(set(ids) - {o['id'] for o in completadas})}
+
+
+def programar(contexto, datos):
+    """Tareas periódicas: emite las órdenes de los planes que vencen y, si se pide, las asigna"""
+    import Planificacion_Mantenimiento as planificacion
+    hasta = date.fromisoformat(datos["hasta"]) if datos.get("hasta") else None
+    # Lo emitido se guarda con el resto del lote: el bloqueo se retiene hasta entonces,
+    # para que otra instancia no emita los mismos planes
+    contexto.bloqueos.enter_context(gm.bloqueo_datos())
+    creadas = planificacion.emitir_ordenes(hasta)
+    contexto.olvidar_ids("ordenes_trabajo")
+    resultado = {"ordenes_creadas": [o['id'] for o in creadas]}
+    if datos.get("asignar") and creadas:
+        resultado["asignacion"] = asignar(contexto, {"automatico": True,
+                                                     "ordenes": resultado["ordenes_creadas"]})
+    return resultado
+
+
+OPERACIONES = {
+    "registrar-equipo": registrar_equipo,
+    "registrar-tecnico": registrar_tecnico,
+    "crear-orden": crear_orden,
+    "asignar": asignar,
+    "completar": completar,
+    "programar": programar,
+}
+
+
+def aplicar_operaciones(operaciones, continuar=False, escribir=None):
+    """Aplica [(número, datos con "op")] en una sola transacción.
+
+    'escribir(resultado)' recibe un diccionario por operación. Sin
+    'continuar' la primera falla detiene el lote y no se guarda nada.
+    Devuelve el resumen {"aplicadas", "fallidas", "guardado"}.
+    """
+    contexto = Contexto()
+    aplicadas = fallidas = 0
+    with contexto.bloqueos, gm.transaccion():
+        try:
+            for numero, datos in operaciones:
+                try:
+                    if isinstance(datos, ValueError):
+                        raise datos
+                    if not isinstance(datos, dict):
+                        raise ValueError("Cada línea debe ser un objeto JSON")
+                    funcion = OPERACIONES.get(datos.get("op"))
+                    if funcion is None:
+                        raise ValueError(f"Operación desconocida: {datos.get('op')!r} "
+                                         f"(use {', '.join(OPERACIONES)})")
+                    resultado = {"linea": numero, "ok": True,
+                                 "resultado": funcion(contexto, {k: v for k, v in datos.items() if k != "op"})}
+                    aplicadas += 1
+                except (ValueError, KeyError, TypeError) as e:
+                    mensaje = f"Falta el campo {e}" if isinstance(e, KeyError) else str(e)
+                    resultado = {"linea": numero, "ok": False, "error": mensaje}
+                    fallidas += 1
+                if escribir:
+                    escribir(resultado)
+                if fallidas and not continuar:
+                    break
+        except BaseException:
+            # Un error inesperado: al cerrar la transacción gm guardaría el lote a medias
+            gm.descartar_guardado_pendiente()
+            raise
+
+        if fallidas and not continuar:
+            gm.descartar_guardado_pendiente()
+            guardado = False
+        else:
+            guardado = gm.guardar_pendiente()
+    return {"aplicadas": aplicadas, "fallidas": fallidas, "guardado": guardado}
+
+
+def _leer_lineas(entrada):
+    for numero, linea in enumerate(entrada, start=1):
+        if not linea.strip():
+            continue
+        try:
+            yield numero, json.loads(linea)
+        except ValueError as e:
+            yield numero, ValueError(f"JSON inválido: {e}")
+
+
+# ==================== CONSULTAS ====================
+
+def _clave(valor):
+    return "" if valor is None else str(valor)
+
+
+def listar(recurso, filtros=(), buscar="", limite=None, desde=0, archivadas=False):
+    """Registros de un recurso que cumplen los filtros ["campo=valor"] y contienen 'buscar'.
+
+    Con archivadas=True (solo órdenes) se recorre el archivo histórico en lugar de ordenes_trabajo.
+    """
+    coleccion = RECURSOS[recurso]
+    if archivadas and coleccion != "ordenes_trabajo":
+        raise ValueError("Solo las órdenes tienen archivo histórico")
+    condiciones = []
+    for filtro in filtros:
+        campo, separador, valor = filtro.partition("=")
+        if not separador:
+            raise ValueError(f"Filtro inválido (use campo=valor): {filtro}")
+        condiciones.append((campo.strip(), valor.strip()))
+    buscar = buscar.lower()
+
+    if archivadas:
+        import Archivado_Mantenimiento as archivado
+        registros = archivado.ordenes_archivadas()
+    else:
+        registros = getattr(gm, coleccion)
+    encontrados = 0
+    for registro in registros:
+        if any(_clave(registro.get(campo)) != valor for campo, valor in condiciones):
+            continue
+        if buscar and not any(buscar in str(v).lower() for v in registro.values() if isinstance(v, str)):
+            continue
+        encontrados += 1
+        if encontrados <= desde:
+            continue
+        yield registro
+        if limite is not None and encontrados - desde >= limite:
+            return
+
+
+def exportar(formato, destino, colecciones=None):
+    """Exporta con Exportacion_Mantenimiento; 'destino' es un archivo .xlsx o una carpeta"""
+    import Exportacion_Mantenimiento as exportacion
+    datos = exportacion.instantanea([RECURSOS[r] for r in colecciones] if colecciones else None)
+    filas = sum(len(registros) for registros in datos.values())
+    if formato == "excel":
+        exportacion.exportar_excel(destino, datos)
+        return {"formato": formato, "rutas": [destino], "filas": filas}
+    if formato == "parquet" and not exportacion.parquet_disponible():
+        raise ValueError("Exportar a Parquet requiere pyarrow (pip install pyarrow)")
+    os.makedirs(destino, exist_ok=True)
+    funcion = exportacion.exportar_parquet if formato == "parquet" else exportacion.exportar_csv
+    return {"formato": formato, "rutas": funcion(destino, datos), "filas": filas}
+
+
+# ==================== LÍNEA DE COMANDOS ====================
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog="Gestion_Mantenimiento.py",
+        description="Operaciones por lotes del sistema de gestión de mantenimiento (salida JSON). "
+                    "Sin argumentos se abre el menú interactivo; con --serve, la API REST.")
+    sub = parser.add_subparsers(dest="comando", required=True, metavar="comando")
+
+    p = sub.add_parser("registrar-equipo", help="registra un equipo")
+    p.add_argument("--nombre", required=True)
+    p.add_argument("--ubicacion")
+    p.add_argument("--descripcion")
+    p.add_argument("--marca")
+    p.add_argument("--modelo")
+    p.add_argument("--numero-serie", dest="numero_serie")
+    p.add_argument("--prioridad", help=", ".join(gm.RANGO_PRIORIDAD))
+
+    p = sub.add_parser("registrar-tecnico", help="registra un técnico")
+    p.add_argument("--nombre", required=True)
+    p.add_argument("--especialidad")
+    p.add_argument("--telefono")
+
+    p = sub.add_parser("crear-orden", help="crea una orden de trabajo")
+    p.add_argument("--equipo", dest="equipo_id", required=True, help="ID del equipo")
+    p.add_argument("--descripcion", required=True)
+    p.add_argument("--tipo", required=True, help=", ".join(gm.TIPOS_MANTENIMIENTO))
+    p.add_argument("--prioridad", help=", ".join(gm.RANGO_PRIORIDAD))
+    p.add_argument("--tecnico", dest="tecnico_asignado", help="nombre del técnico a asignar")
+    p.add_argument("--observaciones")
+
+    p = sub.add_parser("asignar", help="asigna un técnico a órdenes (o automáticamente)")
+    p.add_argument("ordenes", nargs="*", type=int, help="IDs de las órdenes")
+    grupo = p.add_mutually_exclusive_group(required=True)
+    grupo.add_argument("--tecnico", help="nombre del técnico")
+    grupo.add_argument("--automatico", action="store_true",
+                       help="reparte las órdenes pendientes sin técnico (todas si no se indican IDs)")
+
+    p = sub.add_parser("completar", help="completa órdenes de trabajo")
+    p.add_argument("ordenes", nargs="+", type=int, help="IDs de las órdenes")
+    p.add_argument("--observaciones")
+
+    p = sub.add_parser("programar", help="emite las órdenes de los planes que vencen")
+    p.add_argument("--hasta", help="último día a emitir (AAAA-MM-DD); por defecto hoy + "
+                                   "la anticipación de la planificación")
+    p.add_argument("--asignar", action="store_true", help="asigna automáticamente las órdenes emitidas")
+
+    p = sub.add_parser("listar", help="lista registros (una línea JSON por registro)")
+    p.add_argument("recurso", choices=list(RECURSOS))
+    p.add_argument("--filtro", action="append", default=[], metavar="CAMPO=VALOR",
+                   help="se puede repetir; el valor vacío coincide con campos sin valor")
+    p.add_argument("--buscar", default="", help="texto contenido en algún campo")
+    p.add_argument("--limite", type=int)
+    p.add_argument("--desde", type=int, default=0, help="registros a saltar (paginación)")
+    p.add_argument("--archivadas", action="store_true", help="órdenes del archivo histórico (solo 'ordenes')")
+
+    p = sub.add_parser("archivar", help="pasa al archivo histórico las órdenes cerradas antiguas")
+    p.add_argument("--dias", type=int, help="antigüedad mínima del cierre en días (por defecto la política)")
+
+    p = sub.add_parser("exportar", help="exporta los datos a Excel, CSV o Parquet")
+    p.add_argument("formato", choices=["excel", "csv", "parquet"])
+    p.add_argument("destino", help="archivo .xlsx (excel) o carpeta (csv, parquet)")
+    p.add_argument("--recurso", action="append", choices=list(RECURSOS), dest="recursos",
+                   help="se puede repetir; por defecto todos")
+
+    p = sub.add_parser("memoria", help="tamaño en memoria de cada colección e índice (diagnóstico)")
+    p.add_argument("--rastrear", action="store_true",
+                   help="rastrea la carga con tracemalloc e informa las líneas que más memoria asignan")
+    p.add_argument("--top", type=int, default=15, help="cantidad de líneas a mostrar con --rastrear")
+
+    p = sub.add_parser("lote", help="aplica operaciones JSON (una por línea) leídas de la entrada estándar")
+    p.add_argument("--continuar", action="store_true",
+                   help="sigue tras una operación fallida y guarda las correctas")
+    return parser
+
+
+def _datos_comando(args):
+    """Datos de la operación a partir de los argumentos (sin los que no se indicaron)"""
+    datos = {k: v for k, v in vars(args).items() if k != "comando" and v is not None}
+    datos["op"] = args.comando
+    return datos
+
+
+def ejecutar(argv=None):
+    """Punto de entrada de 'python Gestion_Mantenimiento.py <comando>'; devuelve el código de salida"""
+    args = crear_parser().parse_args(argv)
+    salida = sys.stdout
+
+    def escribir(objeto):
+        salida.write(json.dumps(objeto, ensure_ascii=False, default=str) + "\n")
+        salida.flush()
+
+    # Todo lo que gm imprima va a la salida de errores: la estándar queda solo con JSON
+    with redirect_stdout(sys.stderr):
+        if args.comando == "memoria":
+            import Memoria_Mantenimiento as memoria
+            if args.rastrear:
+                memoria.iniciar_rastreo()
+            gm.cargar_datos()
+            escribir(memoria.serializable(memoria.informe(cantidad=args.top)))
+            return 0
+        gm.cargar_datos()
+        try:
+            if args.comando == "listar":
+                for registro in listar(args.recurso, args.filtro, args.buscar, args.limite, args.desde,
+                                       args.archivadas):
+                    escribir(registro)
+                return 0
+            if args.comando == "archivar":
+                import Archivado_Mantenimiento as archivado
+                escribir({"ok": True, **archivado.archivar_ordenes(args.dias)})
+                return 0
+            if args.comando == "exportar":
+                escribir(exportar(args.formato, args.destino, args.recursos))
+                return 0
+        except (ValueError, OSError, ImportError) as e:
+            escribir({"ok": False, "error": str(e)})
+            return 1
+
+        if args.comando == "lote":
+            resumen = aplicar_operaciones(_leer_lineas(sys.stdin), args.continuar, escribir)
+            escribir({"resumen": resumen})
+            return 0 if resumen["fallidas"] == 0 and resumen["guardado"] else 1
+
+        resultados = []
+        resumen = aplicar_operaciones([(1, _datos_comando(args))], escribir=resultados.append)
+        resultado = resultados[0]
+        resultado.pop("linea")
+        if resultado["ok"] and not resumen["guardado"]:
+            resultado = {"ok": False, "error": "No se pudieron guardar los datos"}
+        escribir(resultado)
+        return 0 if resultado["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(ejecutar())
@@ -0,0 +1,215 @@
+"""
+Deshacer y rehacer del Sistema de Gestión de Mantenimiento
+Archivo: Deshacer_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Las eliminaciones de la interfaz (equipos, órdenes y técnicos) se hacen con
+comandos que saben aplicarse y revertirse:
+
+    comando = deshacer.eliminar_tecnico(tecnico)
+    cambios = deshacer.ejecutar(comando)      # aplica, guarda y lo apila
+    comando, cambios = deshacer.deshacer()    # lo revierte y guarda
+    comando, cambios = deshacer.rehacer()
+
+Cada comando guarda solo lo que cambia: los registros quitados con su
+posición en la lista y los campos modificados con su valor anterior, así la
+pila no copia los datos. Aplicarlo o revertirlo sí cuesta en proporción a la
+colección: quitar y reinsertar en una lista mueve los registros siguientes, y
+se guarda como cualquier otra modificación, reescribiendo el archivo de
+datos completo. Lo que crece con el cambio y no con los datos es el registro
+de cambios de gm, que anota solo esos registros: las demás instancias los
+aplican sin recargar.
+
+Los campos se ubican por ID al aplicar o revertir (una recarga de los datos
+reemplaza los diccionarios). La pila es de la sesión, en memoria, y
+conserva las últimas LIMITE_PILA acciones; ejecutar una acción nueva
+vacía la de rehacer.
+
+aplicar() y revertir() devuelven {coleccion: (agregados, modificados,
+eliminados)}, lo mismo que gm.aplicar_eventos(), para que la interfaz
+actualice solo esas filas.
+"""
+
+from collections import deque
+
+import Gestion_Mantenimiento as gm
+
+LIMITE_PILA = 50
+
+_deshacer = deque(maxlen=LIMITE_PILA)
+_rehacer = []
+
+
+def _sumar(total, cambios):
+    """Acumula en 'total' los registros tocados por un comando"""
+    for coleccion, tocados in cambios.items():
+        if coleccion in total:
+            for acumulados, nuevos in zip(total[coleccion], tocados):
+                acumulados.extend(nuevos)
+        else:
+            total[coleccion] = tuple(list(lista) for lista in tocados)
+    return total
+
+
+class Comando:
+    """Acción con su inversa; 'descripcion' se muestra en los botones de deshacer y rehacer"""
+
+    descripcion = ""
+
+    def aplicar(self):
+        raise NotImplementedError
+
+    def revertir(self):
+        raise NotImplementedError
+
+
+class QuitarRegistros(Comando):
+    """Quita registros de una colección; al revertir vuelven a su posición"""
+
+    def __init__(self, coleccion, ids, descripcion=""):
+        self.coleccion = coleccion
+        self.ids = list(ids)
+        self.descripcion = descripcion
+        self.quitados = []
+
+    def aplicar(self):
+        self.quitados = gm.quitar_registros(self.coleccion, self.ids)
+        return {self.coleccion: ([], [], [registro for _, registro in self.quitados])}
+
+    def revertir(self):
+        gm.reinsertar_registros(self.coleccion, self.quitados)
+        return {self.coleccion: ([registro for _, registro in self.quitados], [], [])}
+
+
+class CambiarCampos(Comando):
+    """Cambia campos de registros: [(id, campo, valor anterior, valor nuevo)]"""
+
+    def __init__(self, coleccion, cambios, descripcion=""):
+        self.coleccion = coleccion
+        self.cambios = list(cambios)
+        self.descripcion = descripcion
+
+    def _poner(self, nuevo):
+        tocados = {}
+        for id_registro, campo, anterior, valor in self.cambios:
+            registro = gm.registro_por_id(self.coleccion, id_registro)
+            if registro is None:
+                continue
+            if self.coleccion == "ordenes_trabajo":
+                with gm.modificando_orden(registro):
+                    registro[campo] = valor if nuevo else anterior
+            else:
+                registro[campo] = valor if nuevo else anterior
+            tocados[id(registro)] = registro
+        return {self.coleccion: ([], list(tocados.values()), [])}
+
+    def aplicar(self):
+        return self._poner(True)
+
+    def revertir(self):
+        return self._poner(False)
+
+
+class Compuesto(Comando):
+    """Varios comandos como una sola acción; se revierten en orden inverso"""
+
+    def __init__(self, descripcion, comandos):
+        self.descripcion = descripcion
+        self.comandos = [comando for comando in comandos if comando is not None]
+
+    def aplicar(self):
+        total = {}
+        for comando in self.comandos:
+            _sumar(total, comando.aplicar())
+        return total
+
+    def revertir(self):
+        total = {}
+        for comando in reversed(self.comandos):
+            _sumar(total, comando.revertir())
+        return total
+
+
+# ==================== ACCIONES ====================
+# En los compuestos la eliminación va al final: al deshacer se revierte
+# primero y, si sus IDs ya se ocuparon, falla antes de tocar nada.
+
+def eliminar_equipo(equipo):
+    return Compuesto(f"eliminar el equipo '{equipo['nombre']}'",
+                     [QuitarRegistros("equipos", [equipo['id']])])
+
+
+def eliminar_ordenes(ids):
+    """Elimina las órdenes y deja disponibles a sus técnicos (como gm.eliminar_ordenes)"""
+    ordenes = gm.ordenes_por_ids(ids)
+    nombres = {o['tecnico_asignado'] for o in ordenes if o.get('tecnico_asignado')}
+    liberar = [(t['id'], 'estado', t['estado'], "Disponible") for t in gm.tecnicos
+               if t['nombre'] in nombres and t.get('estado') != "Disponible"]
+    descripcion = (f"eliminar la orden #{ordenes[0]['id']}" if len(ordenes) == 1
+                   else f"eliminar {len(ordenes)} órdenes")
+    return Compuesto(descripcion, [CambiarCampos("tecnicos", liberar) if liberar else None,
+                                   QuitarRegistros("ordenes_trabajo", [o['id'] for o in ordenes])])
+
+
+def eliminar_tecnico(tecnico):
+    """Elimina el técnico y lo desasigna de sus órdenes"""
+    desasignar = [(o['id'], 'tecnico_asignado', tecnico['nombre'], None) for o in gm.ordenes_trabajo
+                  if o.get('tecnico_asignado') == tecnico['nombre']]
+    return Compuesto(f"eliminar el técnico '{tecnico['nombre']}'",
+                     [CambiarCampos("ordenes_trabajo", desasignar) if desasignar else None,
+                      QuitarRegistros("tecnicos", [tecnico['id']])])
+
+
+# ==================== PILA ====================
+
+def ejecutar(comando):
+    """Aplica el comando, guarda y lo apila para poder deshacerlo; devuelve los registros tocados"""
+    with gm.transaccion():
+        cambios = comando.aplicar()
+        gm.guardar_datos()
+    _deshacer.append(comando)
+    _rehacer.clear()
+    return cambios
+
+
+def deshacer():
+    """Revierte la última acción y guarda; devuelve (comando, registros tocados) o (None, None).
+
+    Si no se puede revertir (ValueError: p. ej. otra instancia ya ocupó el
+    ID de un registro eliminado) la acción sale de la pila y el error sigue.
+    """
+    if not _deshacer:
+        return None, None
+    comando = _deshacer.pop()
+    with gm.transaccion():
+        cambios = comando.revertir()
+        gm.guardar_datos()
+    _rehacer.append(comando)
+    return comando, cambios
+
+
+def rehacer():
+    """Vuelve a aplicar la última acción deshecha; devuelve (comando, registros tocados) o (None, None)"""
+    if not _rehacer:
+        return None, None
+    comando = _rehacer.pop()
+    with gm.transaccion():
+        cambios = comando.aplicar()
+        gm.guardar_datos()
+    _deshacer.append(comando)
+    return comando, cambios
+
+
+def proximo_deshacer():
+    """Descripción de la acción que se desharía (None si no hay)"""
+    return _deshacer[-1].descripcion if _deshacer else None
+
+
+def proximo_rehacer():
+    return _rehacer[-1].descripcion if _rehacer else None
+
+
+def olvidar():
+    """Vacía las dos pilas"""
+    _deshacer.clear()
+    _rehacer.clear()
@@ -0,0 +1,387 @@
+"""
+Despacho de órdenes del Sistema de Gestión de Mantenimiento
+Archivo: Despacho_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Propone a qué técnico asignar cada orden pendiente sin técnico. El costo de
+asignar una orden a un técnico suma:
+
+  • una penalización si la especialidad del técnico no coincide con la orden
+    (palabras de la especialidad presentes en la descripción, el tipo o el
+    equipo); los técnicos "General" o sin especialidad reciben la mitad,
+  • la carga del técnico (órdenes abiertas que ya tiene más las que se le
+    van proponiendo en este mismo lote),
+  • menos un bono por prioridad, mucho mayor que lo anterior, para que si
+    no alcanzan los cupos queden sin asignar las órdenes menos urgentes.
+
+Cada técnico ofrece CAPACIDAD_TECNICO cupos (menos sus órdenes abiertas) y
+cada cupo cuesta más que el anterior. Con numpy el lote se resuelve como una
+asignación de costo mínimo (método húngaro); para lotes muy grandes, o sin
+numpy, se usa una vía rápida voraz con montículos (heapq) por especialidad.
+
+También mantiene la cola de despacho: las órdenes pendientes (y pausadas)
+ordenadas por prioridad de la orden, criticidad del equipo (equipos.prioridad)
+y antigüedad, en un montículo que se actualiza en O(log n) con
+gm.registrar_indice_ordenes cada vez que se crea, modifica o elimina una orden.
+"""
+
+import heapq
+import itertools
+import re
+import time
+import unicodedata
+
+import Gestion_Mantenimiento as gm
+import Carga_Mantenimiento as carga
+
+# Órdenes abiertas que un técnico puede tener a la vez
+CAPACIDAD_TECNICO = 5
+
+PENALIZACION_ESPECIALIDAD = 10.0
+PESO_CARGA = 2.0
+BONO_PRIORIDAD = {"Alta": 100.0, "Media": 60.0, "Baja": 30.0}
+
+# Por encima de esta cantidad de celdas (órdenes × cupos) se usa la vía voraz
+LIMITE_OPTIMO = 20_000
+
+ESPECIALIDADES_GENERALES = {"", "general", "generalista", "todas", "multiple"}
+
+
+def _sin_tildes(texto):
+    return unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode().lower()
+
+
+def _raices(texto):
+    """Raíces de las palabras (5 primeras letras) para comparar 'eléctrico' con 'eléctrica'"""
+    return {palabra[:5] for palabra in re.findall(r"[a-z0-9]+", _sin_tildes(texto or ""))
+            if len(palabra) >= 4}
+
+
+def _es_general(tecnico):
+    return _sin_tildes(tecnico.get('especialidad') or "").strip() in ESPECIALIDADES_GENERALES
+
+
+def _penalizacion(raices_tecnico, general, raices_orden):
+    if general:
+        return PENALIZACION_ESPECIALIDAD / 2
+    return 0.0 if raices_tecnico & raices_orden else PENALIZACION_ESPECIALIDAD
+
+
+def ordenes_por_asignar(ids=None):
+    """Órdenes pendientes sin técnico (de la lista de IDs si se indica)"""
+    ordenes = gm.ordenes_por_ids(ids) if ids else gm.ordenes_trabajo
+    return [o for o in ordenes if o['estado'] == "Pendiente" and not o.get('tecnico_asignado')]
+
+
+def _preparar(ordenes):
+    equipos = {e['id']: e for e in gm.equipos}
+    raices_ordenes = []
+    for o in ordenes:
+        equipo = equipos.get(o['equipo_id'], {})
+        raices_ordenes.append(_raices(" ".join(filter(None, (
+            o.get('descripcion'), o.get('tipo'), o.get('equipo_nombre'), equipo.get('descripcion'))))))
+    tecnicos = list(gm.tecnicos)
+    raices_tecnicos = [_raices(t.get('especialidad')) for t in tecnicos]
+    generales = [_es_general(t) for t in tecnicos]
+    activas = [carga.ordenes_activas(t['nombre']) for t in tecnicos]
+    return raices_ordenes, tecnicos, raices_tecnicos, generales, activas
+
+
+def _resolver_optimo(ordenes, raices_ordenes, tecnicos, raices_tecnicos, generales, activas):
+    """Asignación de costo mínimo órdenes × cupos; devuelve {índice de orden: índice de técnico}"""
+    import numpy as np
+
+    cupos = [(t, j) for t in range(len(tecnicos))
+             for j in range(min(max(CAPACIDAD_TECNICO - activas[t], 0), len(ordenes)))]
+    if not cupos:
+        return {}
+    cupo_tecnico = np.array([t for t, _ in cupos])
+    costo_cupo = PESO_CARGA * np.array([activas[t] + j for t, j in cupos], dtype=np.float64)
+
+    penalizacion = np.array([[_penalizacion(raices_tecnicos[t], generales[t], r)
+                              for t in range(len(tecnicos))] for r in raices_ordenes])
+    bono = np.array([BONO_PRIORIDAD.get(o.get('prioridad'), 0.0) for o in ordenes])
+    costo = penalizacion[:, cupo_tecnico] + costo_cupo[None, :] - bono[:, None]
+
+    # El método húngaro necesita filas <= columnas: si hay más órdenes que cupos se transpone
+    if costo.shape[0] <= costo.shape[1]:
+        pares = _asignacion_minima(costo)
+    else:
+        pares = [(fila, col) for col, fila in _asignacion_minima(costo.T)]
+    return {fila: int(cupo_tecnico[col]) for fila, col in pares}
+
+
+def _asignacion_minima(costo):
+    """Método húngaro (caminos de aumento más cortos) con potenciales.
+
+    'costo' es una matriz n × m con n <= m; devuelve [(fila, columna)] con una
+    columna distinta por fila y costo total mínimo. Cada paso interno opera
+    sobre filas completas de numpy, así que el ciclo de Python es O(n · pasos).
+    """
+    import numpy as np
+
+    n, m = costo.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    fila_de = np.zeros(m + 1, dtype=np.int64)      # fila (base 1) asignada a cada columna
+    camino = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        fila_de[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        usado = np.zeros(m + 1, dtype=bool)
+        while True:
+            usado[j0] = True
+            i0 = fila_de[j0]
+            libres = ~usado[1:]
+            reducido = costo[i0 - 1] - u[i0] - v[1:]
+            mejora = libres & (reducido < minv[1:])
+            minv[1:][mejora] = reducido[mejora]
+            camino[1:][mejora] = j0
+            candidatos = np.where(libres, minv[1:], np.inf)
+            j1 = int(np.argmin(candidatos)) + 1
+            delta = candidatos[j1 - 1]
+            u[fila_de[usado]] += delta
+            v[usado] -= delta
+            minv[1:][libres] -= delta
+            j0 = j1
+            if fila_de[j0] == 0:
+                break
+        while j0:
+            j1 = camino[j0]
+            fila_de[j0] = fila_de[j1]
+            j0 = j1
+    return [(int(fila_de[j]) - 1, j - 1) for j in range(1, m + 1) if fila_de[j]]
+
+
+def _resolver_voraz(ordenes, raices_ordenes, tecnicos, raices_tecnicos, generales, activas):
+    """Vía rápida: órdenes por prioridad y antigüedad, técnicos en montículos por carga.
+
+    Como la penalización de especialidad es fija, el mejor técnico para una
+    orden es el de menor carga entre los de su especialidad o el de menor
+    carga en general; ambos se obtienen de montículos (con borrado perezoso).
+    """
+    carga_actual = list(activas)
+    general = []
+    por_raiz = {}
+    for t, raices in enumerate(raices_tecnicos):
+        if carga_actual[t] >= CAPACIDAD_TECNICO:
+            continue
+        entrada = (carga_actual[t], t)
+        general.append(entrada)
+        for raiz in raices:
+            por_raiz.setdefault(raiz, []).append(entrada)
+    heapq.heapify(general)
+    for monticulo in por_raiz.values():
+        heapq.heapify(monticulo)
+
+    def mejor(monticulo):
+        # Descarta entradas viejas (la carga del técnico cambió desde que se insertaron)
+        while monticulo and (monticulo[0][0] != carga_actual[monticulo[0][1]]
+                             or carga_actual[monticulo[0][1]] >= CAPACIDAD_TECNICO):
+            heapq.heappop(monticulo)
+        return monticulo[0][1] if monticulo else None
+
+    orden_proceso = sorted(range(len(ordenes)), key=lambda i: (
+        -BONO_PRIORIDAD.get(ordenes[i].get('prioridad'), 0.0), ordenes[i].get('fecha_creacion') or ""))
+    asignacion = {}
+    for i in orden_proceso:
+        candidatos = {mejor(general)}
+        for raiz in raices_ordenes[i]:
+            if raiz in por_raiz:
+                candidatos.add(mejor(por_raiz[raiz]))
+        candidatos.discard(None)
+        if not candidatos:
+            break
+        t = min(candidatos, key=lambda t: (
+            _penalizacion(raices_tecnicos[t], generales[t], raices_ordenes[i])
+            + PESO_CARGA * carga_actual[t], t))
+        asignacion[i] = t
+        carga_actual[t] += 1
+        if carga_actual[t] < CAPACIDAD_TECNICO:
+            entrada = (carga_actual[t], t)
+            heapq.heappush(general, entrada)
+            for raiz in raices_tecnicos[t]:
+                heapq.heappush(por_raiz[raiz], entrada)
+    return asignacion
+
+
+def proponer_asignacion(ids=None, metodo=None):
+    """Calcula (sin aplicar) la asignación de las órdenes pendientes sin técnico.
+
+    'metodo' puede ser "optimo", "voraz" o None (elige según el tamaño del
+    lote y si numpy está instalado). Devuelve {"propuestas": [{orden, tecnico,
+    coincide_especialidad, carga}], "sin_asignar": [órdenes], "metodo",
+    "segundos"}.
+    """
+    inicio = time.perf_counter()
+    ordenes = ordenes_por_asignar(ids)
+    datos = _preparar(ordenes)
+    tecnicos, activas = datos[1], datos[4]
+    total_cupos = sum(min(max(CAPACIDAD_TECNICO - a, 0), len(ordenes)) for a in activas)
+
+    if metodo is None:
+        try:
+            import numpy  # noqa: F401
+            metodo = "optimo" if len(ordenes) * total_cupos <= LIMITE_OPTIMO else "voraz"
+        except ImportError:
+            metodo = "voraz"
+    resolver = _resolver_optimo if metodo == "optimo" else _resolver_voraz
+    asignacion = resolver(ordenes, *datos) if ordenes and tecnicos else {}
+
+    raices_ordenes, _, raices_tecnicos, generales, _ = datos
+    carga_propuesta = list(activas)
+    propuestas = []
+    for i in sorted(asignacion, key=lambda i: ordenes[i]['id']):
+        t = asignacion[i]
+        carga_propuesta[t] += 1
+        propuestas.append({
+            "orden": ordenes[i],
+            "tecnico": tecnicos[t],
+            "coincide_especialidad": not generales[t] and bool(raices_tecnicos[t] & raices_ordenes[i]),
+            "carga": carga_propuesta[t],
+        })
+    return {
+        "propuestas": propuestas,
+        "sin_asignar": [o for i, o in enumerate(ordenes) if i not in asignacion],
+        "metodo": metodo,
+        "segundos": time.perf_counter() - inicio,
+    }
+
+
+def aplicar_asignacion(propuestas):
+    """Asigna los técnicos propuestos con una sola escritura; devuelve cuántas órdenes cambiaron"""
+    por_tecnico = {}
+    for p in propuestas:
+        por_tecnico.setdefault(id(p['tecnico']), (p['tecnico'], []))[1].append(p['orden']['id'])
+    with gm.transaccion():
+        for tecnico, ids in por_tecnico.values():
+            gm.asignar_tecnico_ordenes(ids, tecnico)
+    return sum(len(ids) for _, ids in por_tecnico.values())
+
+
+# ==================== COLA DE DESPACHO ====================
+
+ESTADOS_EN_COLA = ("Pendiente", "Pausada")
+
+# Montículo de entradas [prioridad orden, criticidad equipo, fecha_creacion,
+# secuencia, orden]; una entrada con orden None fue retirada
+_cola = []
+# id(orden) -> (su entrada vigente en _cola, id de su equipo)
+_en_cola = {}
+_secuencia = itertools.count()
+# id(equipo) -> [equipo, criticidad con la que se encolaron sus órdenes, {id(orden): orden}]
+_por_equipo = {}
+# gm.revision_datos con la que se revisó por última vez la criticidad de los equipos
+_revision_revisada = None
+# Caché id de equipo -> equipo para ubicar la criticidad al encolar, y la
+# (lista, tamaño) de gm.equipos con la que se construyó
+_equipos_por_id = {}
+_version_equipos = None
+
+
+def _equipo(equipo_id):
+    global _version_equipos
+    equipo = _equipos_por_id.get(equipo_id)
+    version = (id(gm.equipos), len(gm.equipos))
+    if equipo is None and version != _version_equipos:
+        # Equipo nuevo o datos recargados: se reconstruye la caché (pasa pocas veces)
+        _equipos_por_id.clear()
+        _equipos_por_id.update((e['id'], e) for e in gm.equipos)
+        _version_equipos = version
+        equipo = _equipos_por_id.get(equipo_id)
+    return equipo
+
+
+def _criticidad(equipo):
+    return gm.RANGO_PRIORIDAD.get((equipo or {}).get('prioridad'), 1)
+
+
+def _encolar(orden, clave_equipo, criticidad):
+    entrada = [gm.RANGO_PRIORIDAD.get(orden.get('prioridad'), 1), criticidad,
+               orden.get('fecha_creacion') or "~", next(_secuencia), orden]
+    _en_cola[id(orden)] = (entrada, clave_equipo)
+    heapq.heappush(_cola, entrada)
+
+
+def _retirar(orden):
+    entrada, clave_equipo = _en_cola.pop(id(orden))
+    entrada[4] = None
+    # Si la mayoría de las entradas están retiradas se compacta el montículo
+    if len(_cola) > 64 and len(_cola) > 2 * len(_en_cola):
+        _cola[:] = [e for e in _cola if e[4] is not None]
+        heapq.heapify(_cola)
+    return clave_equipo
+
+
+def _actualizar_cola(orden, delta):
+    if delta < 0:
+        if id(orden) in _en_cola:
+            clave_equipo = _retirar(orden)
+            ordenes = _por_equipo[clave_equipo][2]
+            del ordenes[id(orden)]
+            if not ordenes:
+                del _por_equipo[clave_equipo]
+        return
+    if orden.get('estado') not in ESTADOS_EN_COLA:
+        return
+    equipo = _equipo(orden.get('equipo_id'))
+    grupo = _por_equipo.get(id(equipo))
+    if grupo is None:
+        grupo = _por_equipo[id(equipo)] = [equipo, _criticidad(equipo), {}]
+    grupo[2][id(orden)] = orden
+    _encolar(orden, id(equipo), grupo[1])
+
+
+def _reiniciar_cola():
+    global _revision_revisada, _version_equipos
+    _cola.clear()
+    _en_cola.clear()
+    _por_equipo.clear()
+    _equipos_por_id.clear()
+    _revision_revisada = _version_equipos = None
+
+
+gm.registrar_indice_ordenes(_actualizar_cola, _reiniciar_cola)
+
+
+def _revisar_criticidad():
+    """Reubica las órdenes de los equipos cuya prioridad cambió desde que se encolaron.
+
+    Editar un equipo no pasa por los índices de órdenes, pero siempre termina
+    en guardar_datos (que cambia gm.revision_datos); por eso la revisión,
+    O(equipos con órdenes en cola), solo se hace cuando cambió la revisión.
+    """
+    global _revision_revisada
+    if _revision_revisada == gm.revision_datos:
+        return
+    for clave_equipo, grupo in _por_equipo.items():
+        criticidad = _criticidad(grupo[0])
+        if criticidad != grupo[1]:
+            grupo[1] = criticidad
+            for orden in grupo[2].values():
+                _retirar(orden)
+                _encolar(orden, clave_equipo, criticidad)
+    _revision_revisada = gm.revision_datos
+
+
+def siguientes_ordenes(n=10):
+    """Las próximas 'n' órdenes a atender, de la más urgente a la menos urgente.
+
+    Saca del montículo solo las entradas necesarias y las vuelve a insertar:
+    O((n + retiradas) log N).
+    """
+    _revisar_criticidad()
+    resultado = []
+    while _cola and len(resultado) < n:
+        entrada = heapq.heappop(_cola)
+        if entrada[4] is not None:
+            resultado.append(entrada)
+    for entrada in resultado:
+        heapq.heappush(_cola, entrada)
+    return [entrada[4] for entrada in resultado]
+
+
+def tamano_cola():
+    """Cantidad de órdenes en la cola de despacho"""
+    return len(_en_cola)
@@ -0,0 +1,233 @@
+"""
+Exportación de datos del Sistema de Gestión de Mantenimiento
+Archivo: Exportacion_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Escribe las colecciones de Gestion_Mantenimiento.py a Excel, CSV o Parquet fila
+por fila, en bloques, sin armar tablas intermedias en memoria, e importa
+archivos CSV/Parquet validándolos por bloques con una sola escritura final.
+Las funciones no tocan la interfaz: reciben un callback de progreso y un evento
+de cancelación para que puedan ejecutarse en un hilo de trabajo.
+"""
+
+import os
+import csv
+import importlib.util
+
+import Gestion_Mantenimiento as gm
+
+# Colecciones exportables: nombre en gm -> (título de la hoja, columnas en orden)
+COLECCIONES = {
+    "historial_mantenimiento": ("Historial", [
+        "orden_id", "equipo_nombre", "tipo", "fecha", "tecnico", "observaciones"]),
+    "ordenes_trabajo": ("Ordenes", [
+        "id", "equipo_id", "equipo_nombre", "descripcion", "tipo", "prioridad", "estado",
+        "tecnico_asignado", "fecha_creacion", "fecha_inicio", "fecha_finalizacion", "observaciones"]),
+    "equipos": ("Equipos", [
+        "id", "nombre", "ubicacion", "descripcion", "marca", "modelo", "numero_serie",
+        "prioridad", "estado", "fecha_registro"]),
+    "planes_mantenimiento": ("Planes", [
+        "id", "equipo_id", "equipo_nombre", "tipo", "descripcion", "mes", "anio",
+        "estado", "fecha_creacion"]),
+    "planes_recurrentes": ("Recurrentes", [
+        "id", "equipo_id", "equipo_nombre", "tipo", "descripcion", "frecuencia", "intervalo",
+        "uso_diario", "fecha_inicio", "fecha_fin", "emitida_hasta", "estado", "fecha_creacion"]),
+    "tecnicos": ("Tecnicos", [
+        "id", "nombre", "especialidad", "telefono", "estado"]),
+}
+
+# Columnas numéricas (el resto se exporta como texto)
+COLUMNAS_ENTERAS = {"id", "equipo_id", "orden_id", "mes", "anio", "intervalo"}
+
+# Filas escritas entre cada aviso de progreso / revisión de cancelación
+TAMANO_BLOQUE = 2000
+
+FORMATOS = {".csv": "CSV", ".parquet": "Parquet"}
+
+
+def parquet_disponible():
+    """Indica si pyarrow está instalado (necesario solo para Parquet)"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+class OperacionCancelada(Exception):
+    """Se lanza cuando el usuario cancela una exportación o importación en curso"""
+
+
+def instantanea(colecciones=None):
+    """Copia superficial de las listas de gm para exportarlas desde otro hilo"""
+    colecciones = colecciones or list(COLECCIONES)
+    return {nombre: list(getattr(gm, nombre)) for nombre in colecciones}
+
+
+def filas_coleccion(nombre, registros):
+    """Generador de filas (tuplas) en el orden de columnas de la colección"""
+    columnas = COLECCIONES[nombre][1]
+    for registro in registros:
+        yield tuple(registro.get(col) for col in columnas)
+
+
+def en_bloques(filas, tamano=TAMANO_BLOQUE):
+    """Agrupa un iterable de filas en listas de 'tamano' elementos"""
+    bloque = []
+    for fila in filas:
+        bloque.append(fila)
+        if len(bloque) >= tamano:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+def exportar_excel(ruta, datos, progreso=None, cancelar=None):
+    """Exporta las colecciones de 'datos' a un libro .xlsx (una hoja por colección).
+
+    Usa el modo write_only de openpyxl, que va volcando las filas a disco en vez
+    de mantener el libro completo en memoria. 'progreso(hechas, total)' se llama
+    tras cada bloque y 'cancelar' (threading.Event) se revisa entre bloques.
+    Devuelve la cantidad de filas escritas.
+    """
+    from openpyxl import Workbook
+
+    total = sum(len(registros) for registros in datos.values())
+    hechas = 0
+    libro = Workbook(write_only=True)
+
+    try:
+        for nombre, registros in datos.items():
+            titulo, columnas = COLECCIONES[nombre]
+            hoja = libro.create_sheet(title=titulo)
+            hoja.append(columnas)
+            for bloque in en_bloques(filas_coleccion(nombre, registros)):
+                if cancelar is not None and cancelar.is_set():
+                    raise OperacionCancelada()
+                for fila in bloque:
+                    hoja.append(fila)
+                hechas += len(bloque)
+                if progreso:
+                    progreso(hechas, total)
+    except BaseException:
+        # Cerrar las hojas para liberar sus archivos temporales; no se guarda nada
+        for hoja in libro.worksheets:
+            hoja.close()
+        raise
+
+    libro.save(ruta)
+    return hechas
+
+
+# ==================== CSV Y PARQUET ====================
+
+def _revisar_cancelacion(cancelar):
+    if cancelar is not None and cancelar.is_set():
+        raise OperacionCancelada()
+
+
+def _exportar_archivos(carpeta, datos, extension, escribir, progreso, cancelar):
+    """Escribe un archivo por colección; si algo falla borra los archivos parciales"""
+    total = sum(len(registros) for registros in datos.values())
+    hechas = 0
+    rutas = []
+    try:
+        for nombre, registros in datos.items():
+            ruta = os.path.join(carpeta, nombre + extension)
+            rutas.append(ruta)
+            for bloques in escribir(ruta, nombre, registros):
+                _revisar_cancelacion(cancelar)
+                hechas += bloques
+                if progreso:
+                    progreso(hechas, total)
+    except BaseException:
+        for ruta in rutas:
+            if os.path.exists(ruta):
+                os.remove(ruta)
+        raise
+    return rutas
+
+
+def _escribir_csv(ruta, nombre, registros):
+    columnas = COLECCIONES[nombre][1]
+    # utf-8-sig para que Excel reconozca las tildes al abrir el CSV
+    with open(ruta, "w", newline="", encoding="utf-8-sig") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(columnas)
+        for bloque in en_bloques(filas_coleccion(nombre, registros)):
+            escritor.writerows(bloque)
+            yield len(bloque)
+
+
+def _esquema_parquet(nombre):
+    import pyarrow as pa
+    return pa.schema([(col, pa.int64() if col in COLUMNAS_ENTERAS else pa.string())
+                      for col in COLECCIONES[nombre][1]])
+
+
+def _escribir_parquet(ruta, nombre, registros):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    esquema = _esquema_parquet(nombre)
+    columnas = COLECCIONES[nombre][1]
+    with pq.ParquetWriter(ruta, esquema) as escritor:
+        for bloque in en_bloques(filas_coleccion(nombre, registros)):
+            arreglos = []
+            for i, col in enumerate(columnas):
+                valores = [fila[i] for fila in bloque]
+                if col not in COLUMNAS_ENTERAS:
+                    valores = [None if v is None else str(v) for v in valores]
+                arreglos.append(pa.array(valores, type=esquema.field(col).type))
+            escritor.write_batch(pa.record_batch(arreglos, schema=esquema))
+            yield len(bloque)
+
+
+def exportar_csv(carpeta, datos, progreso=None, cancelar=None):
+    """Exporta cada colección de 'datos' a <carpeta>/<coleccion>.csv; devuelve las rutas"""
+    return _exportar_archivos(carpeta, datos, ".csv", _escribir_csv, progreso, cancelar)
+
+
+def exportar_parquet(carpeta, datos, progreso=None, cancelar=None):
+    """Exporta cada colección de 'datos' a <carpeta>/<coleccion>.parquet (requiere pyarrow)"""
+    return _exportar_archivos(carpeta, datos, ".parquet", _escribir_parquet, progreso, cancelar)
+
+
+def contar_filas(ruta):
+    """Cantidad aproximada de filas de datos de un archivo CSV/Parquet (para el progreso)"""
+    if ruta.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(ruta).metadata.num_rows
+    with open(ruta, "rb") as archivo:
+        return max(sum(1 for _ in archivo) - 1, 0)
+
+
+def leer_filas(ruta):
+    """Generador de filas (diccionarios) de un archivo CSV o Parquet"""
+    if ruta.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for lote in pq.ParquetFile(ruta).iter_batches(batch_size=TAMANO_BLOQUE):
+            yield from lote.to_pylist()
+    else:
+        with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+            yield from csv.DictReader(archivo)
+
+
+def validar_archivo(ruta, coleccion, progreso=None, cancelar=None):
+    """Lee y valida un archivo por bloques sin modificar los datos.
+
+    Devuelve un gm.LoteImportacion listo para confirmar(); puede ejecutarse en
+    un hilo de trabajo, la confirmación debe hacerse en el hilo principal.
+    """
+    lote = gm.LoteImportacion(coleccion)
+    total = contar_filas(ruta)
+    for bloque in en_bloques(leer_filas(ruta)):
+        _revisar_cancelacion(cancelar)
+        lote.validar(bloque)
+        if progreso:
+            progreso(lote.filas_leidas, max(total, lote.filas_leidas))
+    return lote
+
+
+def importar_archivo(ruta, coleccion, progreso=None, cancelar=None):
+    """Valida e inserta un archivo completo con una sola escritura; devuelve el resumen"""
+    lote = validar_archivo(ruta, coleccion, progreso, cancelar)
+    lote.confirmar()
+    return lote.resumen()
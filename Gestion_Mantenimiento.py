@@ -1,648 +1,2185 @@
-"""
-Mi proyecto consiste en el desarrollo de un software de gestion de mantenimiento
-como parte de una materia que estoy cursando en mi carrera. Actualmente, mi universidad
-no cuenta con este tipo de herramienta, ya que suelen ser costosas y se consideran un 
-gasto innecesario para una sola asignatura de corta duracion.
-
-Sin embargo, quienes nos interesamos en la materia vemos necesario contar, al menos
-con un ejemplo practico. Por ello, he creado una version inicial muy basica, que funciona
-como borrador. Mi objetivo es seguir mejorandola hasta convertirla en una aplicacion mas profesional
-y completa, capaz de ejecutarse de manera independiente y sin depender de la consola
-
-Juan Esteban Jaramillo Gonzalez
-"""
-
-import os
-import sys
-import json
-from datetime import datetime
-
-# Forzar salida UTF-8 en consola Windows para evitar UnicodeEncodeError al imprimir emojis
-if os.name == "nt":
-    try:
-        sys.stdout.reconfigure(encoding="utf-8")
-        sys.stderr.reconfigure(encoding="utf-8")
-    except Exception:
-        # Fallback: asegurar variable de entorno (toma efecto si se reinicia el intérprete)
-        os.environ.setdefault("PYTHONIOENCODING", "utf-8")
-
-# Estructuras de datos globales
-equipos = []
-ordenes_trabajo = []
-tecnicos = []
-historial_mantenimiento = []
-planes_mantenimiento = []
-
-def get_base_path():
-    if getattr(sys, 'frozen', False):
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.abspath(__file__))
-
-DATA_DIR = os.path.join(os.getenv('APPDATA') or get_base_path(), "Gestion_Mantenimiento")
-os.makedirs(DATA_DIR, exist_ok=True)
-
-ARCHIVO_DATOS = os.path.join(DATA_DIR, "datos_mantenimiento.json")
-
-# ==================== PERSISTENCIA DE DATOS ====================
-
-def guardar_datos():
-    """Guarda todos los datos en un archivo JSON"""
-    datos = {
-        "equipos": equipos,
-        "ordenes_trabajo": ordenes_trabajo,
-        "tecnicos": tecnicos,
-        "historial_mantenimiento": historial_mantenimiento,
-        "planes_mantenimiento": planes_mantenimiento
-    }
-    
-    try:
-        with open(ARCHIVO_DATOS, 'w', encoding='utf-8') as archivo:
-            json.dump(datos, archivo, indent=4, ensure_ascii=False)
-        return True
-    except Exception as e:
-        print(f"Error al guardar datos: {e}")
-        return False
-
-def cargar_datos():
-    """Carga todos los datos desde el archivo JSON"""
-    global equipos, ordenes_trabajo, tecnicos, historial_mantenimiento, planes_mantenimiento
-    
-    if not os.path.exists(ARCHIVO_DATOS):
-        print("No se encontró archivo de datos. Se iniciará con datos vacíos.")
-        return False
-    
-    try:
-        with open(ARCHIVO_DATOS, 'r', encoding='utf-8') as archivo:
-            datos = json.load(archivo)
-            
-        equipos = datos.get("equipos", [])
-        ordenes_trabajo = datos.get("ordenes_trabajo", [])
-        tecnicos = datos.get("tecnicos", [])
-        historial_mantenimiento = datos.get("historial_mantenimiento", [])
-        planes_mantenimiento = datos.get("planes_mantenimiento", [])
-        
-        print("Datos cargados correctamente.")
-        return True
-    except Exception as e:
-        print(f"Error al cargar datos: {e}")
-        return False
-
-# ==================== FUNCIONES DE GESTIÓN ====================
-
-def menu_principal():
-    print("\n" + "="*60)
-    print("   SISTEMA DE GESTIÓN DE MANTENIMIENTO - VERSIÓN 2.0")
-    print("="*60)
-    print("📦 EQUIPOS")
-    print("  1. Registrar equipo")
-    print("  2. Listar equipos")
-    print("  3. Buscar equipo")
-    print("  4. Editar equipo")
-    print("  5. Eliminar equipo")
-    print("\n🔧 ÓRDENAS DE TRABAJO")
-    print("  6. Crear orden de trabajo")
-    print("  7. Ver órdenes de trabajo")
-    print("  8. Actualizar estado de orden")
-    print("  9. Asignar técnico a orden")
-    print("  10. Completar orden de trabajo")
-    print("\n👷 TÉCNICOS")
-    print("  11. Registrar técnico")
-    print("  12. Listar técnicos")
-    print("\n📅 PLANIFICACIÓN")
-    print("  13. Crear plan de mantenimiento")
-    print("  14. Ver planes de mantenimiento")
-    print("  15. Ver carga de trabajo mensual")
-    print("\n📊 REPORTES")
-    print("  16. Historial de mantenimiento")
-    print("  17. Estadísticas generales")
-    print("  18. Órdenes por estado")
-    print("\n💾 DATOS")
-    print("  19. Guardar datos")
-    print("  20. Cargar datos")
-    print("\n  0. Salir")
-    print("="*60)
-
-def registrar_equipo():
-    print("\n--- REGISTRAR EQUIPO ---")
-    nombre = input("Nombre del equipo: ").strip()
-    if not nombre:
-        print("⚠ El nombre no puede estar vacío.")
-        return
-
-    ubicacion = input("Ubicación: ").strip()
-    descripcion = input("Descripción: ").strip()
-    marca = input("Marca: ").strip()
-    modelo = input("Modelo: ").strip()
-    numero_serie = input("Número de serie: ").strip()
-
-    while True:
-        prioridad = input("Prioridad (Alta/Media/Baja): ").strip().capitalize()
-        if prioridad in ["Alta", "Media", "Baja"]:
-            break
-        print("⚠ Prioridad inválida. Use: Alta, Media o Baja")
-
-    equipo = {
-        "id": len(equipos) + 1,
-        "nombre": nombre,
-        "ubicacion": ubicacion,
-        "descripcion": descripcion,
-        "marca": marca,
-        "modelo": modelo,
-        "numero_serie": numero_serie,
-        "prioridad": prioridad,
-        "estado": "Operativo",
-        "fecha_registro": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
-
-    equipos.append(equipo)
-    print(f"✔ Equipo '{nombre}' registrado correctamente con ID: {equipo['id']}")
-    guardar_datos()
-
-def listar_equipos():
-    print("\n--- LISTA DE EQUIPOS ---")
-    if len(equipos) == 0:
-        print("No hay equipos registrados.")
-        return
-    
-    print(f"{'ID':<5} {'Nombre':<20} {'Ubicación':<15} {'Estado':<12} {'Prioridad':<10}")
-    print("-" * 70)
-    for eq in equipos:
-        print(f"{eq['id']:<5} {eq['nombre']:<20} {eq['ubicacion']:<15} {eq['estado']:<12} {eq['prioridad']:<10}")
-
-def buscar_equipo():
-    print("\n--- BUSCAR EQUIPO ---")
-    termino = input("Ingrese nombre o ubicación del equipo: ").strip().lower()
-
-    resultados = [eq for eq in equipos if termino in eq['nombre'].lower() or termino in eq['ubicacion'].lower()]
-
-    if len(resultados) == 0:
-        print("⚠ No se encontraron equipos con ese criterio.")
-        return
-    
-    print(f"\nSe encontraron {len(resultados)} resultado(s):")
-    for eq in resultados:
-        print(f"\nID: {eq['id']}")
-        print(f"Nombre: {eq['nombre']}")
-        print(f"Ubicación: {eq['ubicacion']}")
-        print(f"Marca: {eq['marca']} - Modelo: {eq['modelo']}")
-        print(f"Estado: {eq['estado']} | Prioridad: {eq['prioridad']}")
-
-def editar_equipo():
-    print("\n--- EDITAR EQUIPO ---")
-    if len(equipos) == 0:
-        print("⚠ No hay equipos registrados.")
-        return
-    
-    listar_equipos()
-    try:
-        id_eq = int(input("\nSeleccione ID del equipo a editar: "))
-        equipo = next((e for e in equipos if e["id"] == id_eq), None)
-
-        if not equipo:
-            print("⚠ Equipo no encontrado.")
-            return
-
-        print(f"\nEditando equipo: {equipo['nombre']}")
-        print("(Deje en blanco para mantener el valor actual)")
-
-        nombre = input(f"Nombre [{equipo['nombre']}]: ").strip()
-        ubicacion = input(f"Ubicación [{equipo['ubicacion']}]: ").strip()
-        estado = input(f"Estado [{equipo['estado']}]: ").strip()
-        
-        if nombre:
-            equipo['nombre'] = nombre
-        if ubicacion:
-            equipo['ubicacion'] = ubicacion
-        if estado:
-            equipo['estado'] = estado
-
-        print("✔ Equipo actualizado correctamente.")
-        guardar_datos()
-    except ValueError:
-        print("⚠ ID inválido.")
-
-def eliminar_equipo():
-    print("\n--- ELIMINAR EQUIPO ---")
-    if len(equipos) == 0:
-        print("⚠ No hay equipos registrados.")
-        return
-    
-    listar_equipos()
-    try:
-        id_eq = int(input("\nSeleccione ID del equipo a eliminar: "))
-        equipo = next((e for e in equipos if e["id"] == id_eq), None)
-        
-        if not equipo:
-            print("⚠ Equipo no encontrado.")
-            return
-
-        confirmacion = input(f"¿Está seguro de eliminar '{equipo['nombre']}'? (s/n): ").lower()
-        if confirmacion == 's':
-            equipos.remove(equipo)
-            print("✔ Equipo eliminado correctamente.")
-            guardar_datos()
-        else:
-            print("Operación cancelada.")
-    except ValueError:
-        print("⚠ ID inválido.")
-
-def crear_ot():
-    print("\n--- CREAR ORDEN DE TRABAJO ---")
-    if len(equipos) == 0:
-        print("⚠ Debes registrar equipos antes de crear órdenes.")
-        return
-
-    listar_equipos()
-    try:
-        id_eq = int(input("\nSeleccione ID del equipo: "))
-        equipo = next((e for e in equipos if e["id"] == id_eq), None)
-        
-        if not equipo:
-            print("⚠ Equipo no encontrado.")
-            return
-        
-        descripcion = input("Descripción del trabajo a realizar: ").strip()
-        if not descripcion:
-            print("⚠ La descripción no puede estar vacía.")
-            return
-        
-        while True:
-            tipo = input("Tipo de mantenimiento (Preventivo/Correctivo/Predictivo): ").strip().capitalize()
-            if tipo in ["Preventivo", "Correctivo", "Predictivo"]:
-                break
-            print("⚠ Tipo inválido.")
-        
-        while True:
-            prioridad = input("Prioridad (Alta/Media/Baja): ").strip().capitalize()
-            if prioridad in ["Alta", "Media", "Baja"]:
-                break
-            print("⚠ Prioridad inválida.")
-        
-        ot = {
-            "id": len(ordenes_trabajo) + 1,
-            "equipo_id": id_eq,
-            "equipo_nombre": equipo['nombre'],
-            "descripcion": descripcion,
-            "tipo": tipo,
-            "prioridad": prioridad,
-            "estado": "Pendiente",
-            "tecnico_asignado": None,
-            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "fecha_inicio": None,
-            "fecha_finalizacion": None,
-            "observaciones": ""
-        }
-
-        ordenes_trabajo.append(ot)
-        print(f"✔ Orden de trabajo #{ot['id']} creada correctamente.")
-        guardar_datos()
-    except ValueError:
-        print("⚠ ID inválido.")
-
-def ver_ordenes():
-    print("\n--- ÓRDENAS DE TRABAJO ---")
-    if len(ordenes_trabajo) == 0:
-        print("No hay órdenes registradas.")
-        return
-
-    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<12} {'Estado':<15} {'Prioridad':<10} {'Técnico':<15}")
-    print("-" * 90)
-    for o in ordenes_trabajo:
-        tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
-        print(f"{o['id']:<5} {o['equipo_nombre']:<20} {o['tipo']:<12} {o['estado']:<15} {o['prioridad']:<10} {tecnico:<15}")
-
-def actualizar_estado_orden():
-    print("\n--- ACTUALIZAR ESTADO DE ORDEN ---")
-    if len(ordenes_trabajo) == 0:
-        print("⚠ No hay órdenes registradas.")
-        return
-    
-    ver_ordenes()
-    try:
-        id_ot = int(input("\nSeleccione ID de la orden: "))
-        orden = next((o for o in ordenes_trabajo if o["id"] == id_ot), None)
-        
-        if not orden:
-            print("⚠ Orden no encontrada.")
-            return
-        
-        print(f"\nEstado actual: {orden['estado']}")
-        print("Estados disponibles: Pendiente, En Progreso, Pausada, Completada, Cancelada")
-        nuevo_estado = input("Nuevo estado: ").strip().capitalize()
-        
-        if nuevo_estado in ["Pendiente", "En progreso", "Pausada", "Completada", "Cancelada"]:
-            orden['estado'] = nuevo_estado
-            
-            if nuevo_estado == "En progreso" and not orden['fecha_inicio']:
-                orden['fecha_inicio'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            print(f"✔ Estado actualizado a: {nuevo_estado}")
-            guardar_datos()
-        else:
-            print("⚠ Estado inválido.")
-    except ValueError:
-        print("⚠ ID inválido.")
-            
-def registrar_tecnico():
-    print("\n--- REGISTRAR TÉCNICO ---")
-    nombre = input("Nombre completo del técnico: ").strip()
-    if not nombre:
-        print("⚠ El nombre no puede estar vacío.")
-        return
-    
-    especialidad = input("Especialidad: ").strip()
-    telefono = input("Teléfono: ").strip()
-    
-    tecnico = {
-        "id": len(tecnicos) + 1,
-        "nombre": nombre,
-        "especialidad": especialidad,
-        "telefono": telefono,
-        "estado": "Disponible"
-    }
-    
-    tecnicos.append(tecnico)
-    print(f"✔ Técnico '{nombre}' registrado correctamente.")
-    guardar_datos()
-
-def listar_tecnicos():
-    print("\n--- LISTA DE TÉCNICOS ---")
-    if len(tecnicos) == 0:
-        print("No hay técnicos registrados.")
-        return
-    
-    print(f"{'ID':<5} {'Nombre':<25} {'Especialidad':<20} {'Estado':<12}")
-    print("-" * 65)
-    for t in tecnicos:
-        print(f"{t['id']:<5} {t['nombre']:<25} {t['especialidad']:<20} {t['estado']:<12}")
-
-def asignar_tecnico():
-    print("\n--- ASIGNAR TÉCNICO A ORDEN ---")
-    if len(ordenes_trabajo) == 0:
-        print("⚠ No hay órdenes registradas.")
-        return
-    
-    if len(tecnicos) == 0:
-        print("⚠ No hay técnicos registrados.")
-        return
-    
-    ver_ordenes()
-    try:
-        id_ot = int(input("\nSeleccione ID de la orden: "))
-        orden = next((o for o in ordenes_trabajo if o["id"] == id_ot), None)
-        
-        if not orden:
-            print("⚠ Orden no encontrada.")
-            return
-        
-        listar_tecnicos()
-        id_tec = int(input("\nSeleccione ID del técnico: "))
-        tecnico = next((t for t in tecnicos if t["id"] == id_tec), None)
-        
-        if not tecnico:
-            print("⚠ Técnico no encontrado.")
-            return
-        
-        orden['tecnico_asignado'] = tecnico['nombre']
-        tecnico['estado'] = "Ocupado"
-        print(f"✔ Técnico {tecnico['nombre']} asignado a la orden #{orden['id']}")
-        guardar_datos()
-    except ValueError:
-        print("⚠ ID inválido.")
-
-def completar_orden():
-    print("\n--- COMPLETAR ORDEN DE TRABAJO ---")
-    if len(ordenes_trabajo) == 0:
-        print("⚠ No hay órdenes registradas.")
-        return
-    
-    ver_ordenes()
-    try:
-        id_ot = int(input("\nSeleccione ID de la orden a completar: "))
-        orden = next((o for o in ordenes_trabajo if o["id"] == id_ot), None)
-        
-        if not orden:
-            print("⚠ Orden no encontrada.")
-            return
-        
-        if orden['estado'] == "Completada":
-            print("⚠ Esta orden ya está completada.")
-            return
-        
-        observaciones = input("Observaciones finales: ").strip()
-        
-        orden['estado'] = "Completada"
-        orden['fecha_finalizacion'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        orden['observaciones'] = observaciones
-        
-        historial_mantenimiento.append({
-            "orden_id": orden['id'],
-            "equipo_nombre": orden['equipo_nombre'],
-            "tipo": orden['tipo'],
-            "fecha": orden['fecha_finalizacion'],
-            "tecnico": orden['tecnico_asignado'],
-            "observaciones": observaciones
-        })
-        
-        if orden['tecnico_asignado']:
-            for t in tecnicos:
-                if t['nombre'] == orden['tecnico_asignado']:
-                    t['estado'] = "Disponible"
-                    break
-        
-        print(f"✔ Orden #{orden['id']} completada exitosamente.")
-        guardar_datos()
-    except ValueError:
-        print("⚠ ID inválido.")
-
-def crear_plan_mantenimiento():
-    print("\n--- CREAR PLAN DE MANTENIMIENTO ---")
-    if len(equipos) == 0:
-        print("⚠ Debes registrar equipos antes de crear planes.")
-        return
-    
-    listar_equipos()
-    try:
-        id_eq = int(input("\nSeleccione ID del equipo: "))
-        equipo = next((e for e in equipos if e["id"] == id_eq), None)
-        
-        if not equipo:
-            print("⚠ Equipo no encontrado.")
-            return
-        
-        while True:
-            tipo = input("Tipo (Preventivo/Correctivo/Predictivo): ").strip().capitalize()
-            if tipo in ["Preventivo", "Correctivo", "Predictivo"]:
-                break
-            print("⚠ Tipo inválido.")
-        
-        descripcion = input("Descripción del plan: ").strip()
-        mes = input("Mes programado (1-12): ").strip()
-        anio = input("Año (YYYY): ").strip()
-        
-        plan = {
-            "id": len(planes_mantenimiento) + 1,
-            "equipo_id": id_eq,
-            "equipo_nombre": equipo['nombre'],
-            "tipo": tipo,
-            "descripcion": descripcion,
-            "mes": int(mes),
-            "anio": int(anio),
-            "estado": "Programado",
-            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        planes_mantenimiento.append(plan)
-        print(f"✔ Plan de mantenimiento #{plan['id']} creado correctamente.")
-        guardar_datos()
-    except ValueError:
-        print("⚠ Entrada inválida.")
-
-def ver_planes():
-    print("\n--- PLANES DE MANTENIMIENTO ---")
-    if len(planes_mantenimiento) == 0:
-        print("No hay planes registrados.")
-        return
-    
-    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<15} {'Mes':<8} {'Año':<8} {'Estado':<12}")
-    print("-" * 80)
-    for p in planes_mantenimiento:
-        print(f"{p['id']:<5} {p['equipo_nombre']:<20} {p['tipo']:<15} {p['mes']:<8} {p['anio']:<8} {p['estado']:<12}")
-
-def ver_carga_mensual():
-    print("\n--- CARGA DE TRABAJO MENSUAL ---")
-    mes = int(input("Ingrese el mes (1-12): "))
-    anio = int(input("Ingrese el año (YYYY): "))
-    
-    planes_mes = [p for p in planes_mantenimiento if p['mes'] == mes and p['anio'] == anio]
-    
-    if len(planes_mes) == 0:
-        print(f"No hay planes programados para {mes}/{anio}")
-        return
-    
-    print(f"\n--- PLANES PROGRAMADOS PARA {mes}/{anio} ---")
-    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<15} {'Descripción':<30}")
-    print("-" * 75)
-    for p in planes_mes:
-        print(f"{p['id']:<5} {p['equipo_nombre']:<20} {p['tipo']:<15} {p['descripcion']:<30}")
-
-def ver_historial():
-    print("\n--- HISTORIAL DE MANTENIMIENTO ---")
-    if len(historial_mantenimiento) == 0:
-        print("No hay registros en el historial.")
-        return
-    
-    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<12} {'Fecha':<20} {'Técnico':<15}")
-    print("-" * 80)
-    for h in historial_mantenimiento:
-        print(f"{h['orden_id']:<5} {h['equipo_nombre']:<20} {h['tipo']:<12} {h['fecha']:<20} {h['tecnico']:<15}")
-
-def estadisticas_generales():
-    print("\n--- ESTADÍSTICAS GENERALES ---")
-    print(f"Total de equipos registrados: {len(equipos)}")
-    print(f"Total de órdenes de trabajo: {len(ordenes_trabajo)}")
-    print(f"Total de técnicos: {len(tecnicos)}")
-    print(f"Mantenimientos completados: {len(historial_mantenimiento)}")
-    print(f"Planes de mantenimiento: {len(planes_mantenimiento)}")
-    
-    if len(ordenes_trabajo) > 0:
-        pendientes = sum(1 for o in ordenes_trabajo if o['estado'] == "Pendiente")
-        en_progreso = sum(1 for o in ordenes_trabajo if o['estado'] == "En progreso")
-        completadas = sum(1 for o in ordenes_trabajo if o['estado'] == "Completada")
-        
-        print(f"\nÓrdenes pendientes: {pendientes}")
-        print(f"Órdenes en progreso: {en_progreso}")
-        print(f"Órdenes completadas: {completadas}")
-
-def ordenes_por_estado():
-    print("\n--- FILTRAR ÓRDENES POR ESTADO ---")
-    if len(ordenes_trabajo) == 0:
-        print("⚠ No hay órdenes registradas.")
-        return
-    
-    print("Estados: Pendiente, En progreso, Pausada, Completada, Cancelada")
-    estado = input("Ingrese el estado a filtrar: ").strip().capitalize()
-    
-    filtradas = [o for o in ordenes_trabajo if o['estado'].lower() == estado.lower()]
-    
-    if len(filtradas) == 0:
-        print(f"No hay órdenes con estado '{estado}'.")
-        return
-    
-    print(f"\n--- ÓRDENES CON ESTADO: {estado.upper()} ---")
-    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<12} {'Prioridad':<10} {'Técnico':<15}")
-    print("-" * 70)
-    for o in filtradas:
-        tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
-        print(f"{o['id']:<5} {o['equipo_nombre']:<20} {o['tipo']:<12} {o['prioridad']:<10} {tecnico:<15}")
-
-def main():
-    # Cargar datos al iniciar
-    cargar_datos()
-    
-    while True:
-        menu_principal()
-        opcion = input("\nSeleccione una opción: ").strip()
-
-        match opcion:
-            case "1":
-                registrar_equipo()
-            case "2":
-                listar_equipos()
-            case "3":
-                buscar_equipo()
-            case "4":
-                editar_equipo()
-            case "5":
-                eliminar_equipo()
-            case "6":
-                crear_ot()
-            case "7":
-                ver_ordenes()
-            case "8":
-                actualizar_estado_orden()
-            case "9":
-                asignar_tecnico()
-            case "10":
-                completar_orden()
-            case "11":
-                registrar_tecnico()
-            case "12":
-                listar_tecnicos()
-            case "13":
-                crear_plan_mantenimiento()
-            case "14":
-                ver_planes()
-            case "15":
-                ver_carga_mensual()
-            case "16":
-                ver_historial()
-            case "17":
-                estadisticas_generales()
-            case "18":
-                ordenes_por_estado()
-            case "19":
-                if guardar_datos():
-                    print("✔ Datos guardados correctamente.")
-                else:
-                    print("⚠ Error al guardar datos.")
-            case "20":
-                if cargar_datos():
-                    print("✔ Datos cargados correctamente.")
-                else:
-                    print("⚠ Error al cargar datos.")
-            case "0":
-                print("\n" + "="*60)
-                print("   Gracias por usar el Sistema de Gestión de Mantenimiento")
-                print("   ¡Hasta pronto! 👋")
-                print("="*60 + "\n")
-                # Guardar automáticamente al salir
-                guardar_datos()
-                break
-            case _:
-                print("⚠ Opción inválida. Por favor, seleccione una opción válida.")
-        
-        input("\nPresione Enter para continuar...")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+"""
+Mi proyecto consiste en el desarrollo de un software de gestion de mantenimiento
+como parte de una materia que estoy cursando en mi carrera. Actualmente, mi universidad
+no cuenta con este tipo de herramienta, ya que suelen ser costosas y se consideran un 
+gasto innecesario para una sola asignatura de corta duracion.
+
+Sin embargo, quienes nos interesamos en la materia vemos necesario contar, al menos
+con un ejemplo practico. Por ello, he creado una version inicial muy basica, que funciona
+como borrador. Mi objetivo es seguir mejorandola hasta convertirla en una aplicacion mas profesional
+y completa, capaz de ejecutarse de manera independiente y sin depender de la consola
+
+Juan Esteban Jaramillo Gonzalez
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+import Metricas_Mantenimiento as metricas
+
+def configurar_consola():
+    """Fuerza salida UTF-8 en la consola de Windows para evitar UnicodeEncodeError al imprimir emojis.
+
+    La llaman los puntos de entrada (no se hace al importar el módulo).
+    """
+    if os.name == "nt":
+        try:
+            sys.stdout.reconfigure(encoding="utf-8")
+            sys.stderr.reconfigure(encoding="utf-8")
+        except Exception:
+            # Fallback: asegurar variable de entorno (toma efecto si se reinicia el intérprete)
+            os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+
+# Bloqueo de archivos entre procesos (consultivo): msvcrt en Windows, fcntl en el resto
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Estructuras de datos globales
+equipos = []
+ordenes_trabajo = []
+tecnicos = []
+historial_mantenimiento = []
+planes_mantenimiento = []
+planes_recurrentes = []
+
+# Revisión de los datos en memoria: aumenta en cada guardado o carga para que las
+# vistas sepan cuándo invalidar lo que tengan en caché (p. ej. ordenamientos)
+revision_datos = 0
+
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+ESTADOS_ORDEN = ["Pendiente", "En progreso", "Pausada", "Completada", "Cancelada"]
+TIPOS_MANTENIMIENTO = ["Preventivo", "Correctivo", "Predictivo"]
+FRECUENCIAS_PLAN = ["dias", "semanas", "meses", "uso"]
+
+# Rango numérico de la prioridad (menor = más urgente) para ordenar sin comparar textos
+RANGO_PRIORIDAD = {"Alta": 0, "Media": 1, "Baja": 2}
+
+def parsear_fecha(texto):
+    """Convierte una fecha guardada como texto en datetime (None si no es válida)"""
+    if not texto:
+        return None
+    try:
+        return datetime.strptime(texto, FORMATO_FECHA)
+    except (TypeError, ValueError):
+        return None
+
+def get_base_path():
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+# La carpeta se crea al escribir por primera vez (ver bloqueo_datos y _escribir_atomico)
+DATA_DIR = os.path.join(os.getenv('APPDATA') or get_base_path(), "Gestion_Mantenimiento")
+
+ARCHIVO_DATOS = os.path.join(DATA_DIR, "datos_mantenimiento.json")
+ARCHIVO_RESUMENES = os.path.join(DATA_DIR, "resumenes_mensuales.json")
+ARCHIVO_VERSION = os.path.join(DATA_DIR, "datos_mantenimiento.version")
+ARCHIVO_BLOQUEO = os.path.join(DATA_DIR, "datos_mantenimiento.lock")
+ARCHIVO_EVENTOS = os.path.join(DATA_DIR, "datos_mantenimiento.eventos")
+
+COLECCIONES_DATOS = ("equipos", "ordenes_trabajo", "tecnicos", "historial_mantenimiento",
+                     "planes_mantenimiento", "planes_recurrentes")
+
+# ==================== PERSISTENCIA DE DATOS ====================
+
+# Transacciones: mientras haya una abierta, guardar_datos() solo marca el cambio
+# y la escritura real se hace una única vez al cerrar la transacción
+_profundidad_transaccion = 0
+_guardado_pendiente = False
+
+@contextmanager
+def transaccion():
+    """Agrupa varias modificaciones en una sola escritura del archivo de datos"""
+    global _profundidad_transaccion
+    _profundidad_transaccion += 1
+    try:
+        yield
+    finally:
+        _profundidad_transaccion -= 1
+        if _profundidad_transaccion == 0 and _guardado_pendiente:
+            guardar_datos()
+
+# ---- Varias instancias sobre el mismo DATA_DIR ----
+# Cada escritura toma un bloqueo de archivo y aumenta la versión de los datos
+# (guardada en el JSON y, para consultarla sin leer todo, en ARCHIVO_VERSION).
+# Si al guardar la versión en disco es la misma que se cargó o guardó por última
+# vez, se escribe directamente; si otra instancia guardó entretanto, se combinan
+# registro por registro los cambios de ambas (ver _combinar_coleccion) usando
+# las huellas de cada registro tomadas en la última sincronización.
+
+ESPERA_BLOQUEO_S = 10
+_candado_local = threading.RLock()
+_bloqueos_tomados = 0
+# Versión en disco con la que se sincronizó esta instancia y huellas de los
+# registros en ese momento: {coleccion: {clave: huella}}
+version_datos = None
+_huellas_base = {}
+# Si el último guardado tuvo que combinar cambios de otra instancia, y los
+# registros en conflicto de esa combinación: [(coleccion, id)]
+ultimo_guardado_combinado = False
+ultimos_conflictos = []
+
+def _tomar_bloqueo(archivo):
+    if os.name == "nt":
+        archivo.seek(0)
+        msvcrt.locking(archivo.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        fcntl.flock(archivo.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+def _soltar_bloqueo(archivo):
+    if os.name == "nt":
+        archivo.seek(0)
+        msvcrt.locking(archivo.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(archivo.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def bloqueo_datos():
+    """Bloqueo exclusivo del archivo de datos entre instancias (reentrante en el mismo proceso).
+
+    Lanza TimeoutError si otra instancia lo retiene más de ESPERA_BLOQUEO_S segundos.
+    """
+    global _bloqueos_tomados
+    with _candado_local:
+        if _bloqueos_tomados:
+            _bloqueos_tomados += 1
+            try:
+                yield
+            finally:
+                _bloqueos_tomados -= 1
+            return
+        os.makedirs(os.path.dirname(ARCHIVO_BLOQUEO), exist_ok=True)
+        archivo = open(ARCHIVO_BLOQUEO, 'a+b')
+        try:
+            limite = time.monotonic() + ESPERA_BLOQUEO_S
+            while True:
+                try:
+                    _tomar_bloqueo(archivo)
+                    break
+                except OSError:
+                    if time.monotonic() > limite:
+                        raise TimeoutError("Otra instancia está usando el archivo de datos")
+                    time.sleep(0.05)
+            _bloqueos_tomados = 1
+            try:
+                yield
+            finally:
+                _bloqueos_tomados = 0
+                _soltar_bloqueo(archivo)
+        finally:
+            archivo.close()
+
+def leer_version_disco():
+    """Versión de los datos en disco según ARCHIVO_VERSION (None si no existe)"""
+    try:
+        with open(ARCHIVO_VERSION, 'r', encoding='utf-8') as archivo:
+            return int(archivo.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def _escribir_atomico(ruta, escribir):
+    """Escribe en un temporal y lo reemplaza, para que nadie lea un archivo a medias"""
+    temporal = ruta + ".tmp"
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(temporal, 'w', encoding='utf-8') as archivo:
+        escribir(archivo)
+    os.replace(temporal, ruta)
+
+def _huella(registro):
+    try:
+        return hash(tuple(registro.items()))
+    except TypeError:
+        # Algún valor no es hashable (listas, dicts): se usa su JSON
+        return hash(json.dumps(registro, sort_keys=True, ensure_ascii=False, default=str))
+
+def _claves_registros(registros):
+    """{clave: (huella, registro)}; la clave es (id, n-ésima aparición) o, sin id, (huella, n)"""
+    resultado = {}
+    vistas = Counter()
+    for registro in registros:
+        huella = _huella(registro)
+        base = registro.get('id', ('sin_id', huella))
+        vistas[base] += 1
+        resultado[(base, vistas[base])] = (huella, registro)
+    return resultado
+
+def _tomar_huellas(claves=None):
+    """Toma como base las huellas actuales ('claves': {coleccion: _claves_registros} ya calculadas)"""
+    global _huellas_base
+    if claves is None:
+        claves = {coleccion: _claves_registros(globals()[coleccion]) for coleccion in COLECCIONES_DATOS}
+    _huellas_base = {coleccion: {clave: huella for clave, (huella, _) in por_clave.items()}
+                     for coleccion, por_clave in claves.items()}
+
+# Campos que referencian el ID de otra colección: coleccion -> [(coleccion que referencia, campo)]
+REFERENCIAS_ID = {
+    "equipos": [("ordenes_trabajo", "equipo_id"), ("planes_mantenimiento", "equipo_id"),
+                ("planes_recurrentes", "equipo_id")],
+    "ordenes_trabajo": [("historial_mantenimiento", "orden_id"), ("planes_mantenimiento", "orden_id")],
+}
+
+def _renumerar_nuevos(coleccion, base, disco):
+    """Da un ID libre a los registros creados aquí cuyo ID también creó otra instancia.
+
+    Actualiza las referencias locales a ese ID (p. ej. orden_id del historial).
+    """
+    locales = _claves_registros(globals()[coleccion])
+    en_disco = _claves_registros(disco)
+    choques = [registro for clave, (huella, registro) in locales.items()
+               if clave not in base and clave in en_disco and en_disco[clave][0] != huella
+               and isinstance(registro.get('id'), int)]
+    if not choques:
+        return
+    siguiente = max((r['id'] for r in (*globals()[coleccion], *disco) if isinstance(r.get('id'), int)),
+                    default=0) + 1
+    if coleccion == "ordenes_trabajo":
+        siguiente = max(siguiente, id_maximo_archivado + 1)
+    cambios = {}
+    for registro in choques:
+        cambios[id(registro)] = (registro['id'], siguiente)
+        registro['id'] = siguiente
+        siguiente += 1
+    for anterior, nuevo in cambios.values():
+        for otra, campo in REFERENCIAS_ID.get(coleccion, []):
+            for registro in globals()[otra]:
+                if registro.get(campo) == anterior and id(registro) not in cambios:
+                    registro[campo] = nuevo
+
+def _combinar_coleccion(coleccion, base, disco):
+    """Combinación a tres bandas de una colección: base (huellas), memoria y disco.
+
+    Un registro cambiado solo de un lado toma ese cambio; si cambió de los dos
+    lados gana el de esta instancia y se anota como conflicto. Un registro
+    borrado de un lado se borra si el otro no lo modificó.
+    """
+    locales = _claves_registros(globals()[coleccion])
+    en_disco = _claves_registros(disco)
+    resultado = {}
+    for clave, (huella_disco, registro_disco) in en_disco.items():
+        huella_base = base.get(clave)
+        if clave in locales:
+            huella_local, registro_local = locales[clave]
+            if huella_local == huella_disco or huella_disco == huella_base:
+                resultado[clave] = registro_local
+            elif huella_local == huella_base:
+                resultado[clave] = registro_disco
+            else:
+                resultado[clave] = registro_local
+                ultimos_conflictos.append((coleccion, registro_local.get('id')))
+        elif huella_base is None:
+            resultado[clave] = registro_disco
+        elif huella_disco != huella_base:
+            # Borrado aquí pero modificado en otra instancia: se conserva
+            resultado[clave] = registro_disco
+            ultimos_conflictos.append((coleccion, registro_disco.get('id')))
+    for clave, (huella_local, registro_local) in locales.items():
+        if clave in en_disco:
+            continue
+        huella_base = base.get(clave)
+        if huella_base is None:
+            resultado[clave] = registro_local
+        elif huella_local != huella_base:
+            # Borrado en otra instancia pero modificado aquí: se conserva
+            resultado[clave] = registro_local
+            ultimos_conflictos.append((coleccion, registro_local.get('id')))
+    return list(resultado.values())
+
+@metricas.medido
+def _combinar_con_disco(datos_disco):
+    """Incorpora a memoria los cambios que otra instancia guardó desde la última sincronización"""
+    global id_maximo_archivado
+    ultimos_conflictos.clear()
+    id_maximo_archivado = max(id_maximo_archivado, datos_disco.get("id_maximo_archivado", 0))
+    for coleccion in ("equipos", "ordenes_trabajo"):
+        _renumerar_nuevos(coleccion, _huellas_base.get(coleccion, {}), datos_disco.get(coleccion, []))
+    historial_antes = len(historial_mantenimiento)
+    for coleccion in COLECCIONES_DATOS:
+        combinados = _combinar_coleccion(coleccion, _huellas_base.get(coleccion, {}),
+                                         datos_disco.get(coleccion, []))
+        # Se reemplaza el contenido sin cambiar la lista (otras vistas pueden tenerla)
+        globals()[coleccion][:] = combinados
+    reconstruir_indices_ordenes()
+    if len(historial_mantenimiento) != historial_antes or ultimos_conflictos:
+        reconstruir_resumenes()
+    if ultimos_conflictos:
+        print(f"Aviso: {len(ultimos_conflictos)} registros se modificaron también en otra instancia; "
+              f"se conservó la versión de esta instancia.")
+
+# ---- Registro de cambios (para ver en vivo lo que guardan otras instancias) ----
+# Cada guardado agrega a ARCHIVO_EVENTOS una línea JSON numerada con la versión
+# que escribió: {"n": versión, "cambios": [...]}, donde cada cambio es
+# {"c": colección, "r": registro} (nuevo o modificado; en el historial, entrada
+# nueva) o {"c": colección, "borrar": id}. Si hay demasiados cambios, o alguno
+# no se puede describir así, la línea es {"n": versión, "recargar": true}.
+# Las interfaces abiertas revisan el tamaño del archivo periódicamente y, si
+# creció, aplican solo las líneas nuevas (aplicar_eventos).
+
+INTERVALO_EVENTOS_MS = 2000
+# Más cambios que estos en un guardado (p. ej. una importación) piden recargar todo
+LIMITE_CAMBIOS_EVENTO = 2000
+# Al superar este tamaño el registro vuelve a empezar (quien se atrase recarga)
+TAMANO_MAXIMO_EVENTOS = 4 * 1024 * 1024
+# (identificador del archivo, bytes ya leídos) del registro de cambios
+_posicion_eventos = (None, 0)
+# El próximo guardado pide a las demás instancias recargar todo (p. ej. tras archivar órdenes)
+_recargar_otras_instancias = False
+
+def _estado_eventos():
+    """(identificador del archivo, tamaño) del registro de cambios; (None, 0) si no existe"""
+    try:
+        estado = os.stat(ARCHIVO_EVENTOS)
+    except OSError:
+        return None, 0
+    return estado.st_ino, estado.st_size
+
+def _cambios_desde_base(claves):
+    """Cambios respecto a la última sincronización, o None si conviene recargar todo"""
+    cambios = []
+    for coleccion, por_clave in claves.items():
+        base = _huellas_base.get(coleccion, {})
+        for clave, (huella, registro) in por_clave.items():
+            if base.get(clave) != huella:
+                if clave[1] > 1:
+                    # ID repetido: no se puede ubicar el registro por su ID
+                    return None
+                cambios.append({"c": coleccion, "r": registro})
+        for clave in base.keys() - por_clave.keys():
+            if clave[1] > 1 or coleccion == "historial_mantenimiento":
+                return None
+            cambios.append({"c": coleccion, "borrar": clave[0]})
+        if len(cambios) > LIMITE_CAMBIOS_EVENTO:
+            return None
+    return cambios
+
+def _anotar_eventos(version, cambios):
+    global _posicion_eventos
+    evento = {"n": version, "cambios": cambios} if cambios is not None else {"n": version, "recargar": True}
+    linea = json.dumps(evento, ensure_ascii=False) + "\n"
+    if _estado_eventos()[1] > TAMANO_MAXIMO_EVENTOS:
+        _escribir_atomico(ARCHIVO_EVENTOS, lambda archivo: archivo.write(linea))
+    else:
+        with open(ARCHIVO_EVENTOS, 'a', encoding='utf-8') as archivo:
+            archivo.write(linea)
+    _posicion_eventos = _estado_eventos()
+
+def _aplicar_cambios(cambios):
+    """Aplica a memoria los cambios de un evento; devuelve {coleccion: (agregados, modificados, eliminados)}"""
+    resultado = {}
+    for coleccion in COLECCIONES_DATOS:
+        propios = [c for c in cambios if c["c"] == coleccion]
+        if not propios:
+            continue
+        lista = globals()[coleccion]
+        base = _huellas_base.setdefault(coleccion, {})
+        agregados, modificados, eliminados = [], [], []
+        resultado[coleccion] = (agregados, modificados, eliminados)
+
+        if coleccion == "historial_mantenimiento":
+            for cambio in propios:
+                entrada = cambio["r"]
+                agregar_historial(entrada, orden_por_id(entrada.get('orden_id')))
+                agregados.append(entrada)
+                huella = _huella(entrada)
+                n = 1
+                while (('sin_id', huella), n) in base:
+                    n += 1
+                base[(('sin_id', huella), n)] = huella
+            continue
+
+        es_orden = coleccion == "ordenes_trabajo"
+        por_id = _ordenes_por_id if es_orden else {r['id']: r for r in lista}
+        borrar = set()
+        for cambio in propios:
+            if "borrar" in cambio:
+                registro = por_id.get(cambio["borrar"])
+                base.pop((cambio["borrar"], 1), None)
+                if registro is None:
+                    continue
+                if es_orden:
+                    _indexar_orden(registro, -1)
+                else:
+                    del por_id[registro['id']]
+                borrar.add(id(registro))
+                eliminados.append(registro)
+                continue
+            nuevo = cambio["r"]
+            actual = por_id.get(nuevo['id'])
+            if actual is None:
+                if es_orden:
+                    agregar_orden(nuevo)
+                else:
+                    lista.append(nuevo)
+                    por_id[nuevo['id']] = nuevo
+                agregados.append(nuevo)
+            else:
+                # Se conserva el mismo diccionario: otras vistas pueden tenerlo
+                if es_orden:
+                    with modificando_orden(actual):
+                        actual.clear()
+                        actual.update(nuevo)
+                else:
+                    actual.clear()
+                    actual.update(nuevo)
+                modificados.append(actual)
+            base[(nuevo['id'], 1)] = _huella(nuevo)
+        if borrar:
+            lista[:] = [r for r in lista if id(r) not in borrar]
+    return resultado
+
+def hay_eventos_nuevos():
+    """True si el registro de cambios cambió desde la última lectura (solo consulta su tamaño)"""
+    return _estado_eventos() != _posicion_eventos
+
+@metricas.medido
+def aplicar_eventos():
+    """Incorpora los cambios que otras instancias guardaron desde la última sincronización.
+
+    Lee solo las líneas nuevas del registro de cambios. Devuelve None si no
+    había nada nuevo (o hay una transacción en curso); si no,
+    {coleccion: (agregados, modificados, eliminados)} con los registros
+    tocados, donde el valor None indica que la colección se recargó completa
+    (línea "recargar", líneas perdidas o registro reiniciado).
+    """
+    if _profundidad_transaccion or _guardado_pendiente or not hay_eventos_nuevos():
+        return None
+    return _aplicar_eventos_nuevos()
+
+def _aplicar_eventos_nuevos():
+    global _posicion_eventos, version_datos, revision_datos
+    with bloqueo_datos():
+        archivo_id, tamano = _estado_eventos()
+        anterior_id, leidos = _posicion_eventos
+        if archivo_id != anterior_id or tamano < leidos:
+            leidos = 0
+        with open(ARCHIVO_EVENTOS, 'rb') as archivo:
+            archivo.seek(leidos)
+            lineas = archivo.read().splitlines()
+        _posicion_eventos = (archivo_id, tamano)
+
+        resultado = {}
+        recargar = False
+        for linea in lineas:
+            try:
+                evento = json.loads(linea)
+            except ValueError:
+                recargar = True
+                break
+            if evento["n"] <= (version_datos or 0):
+                continue
+            if evento["n"] != (version_datos or 0) + 1 or evento.get("recargar"):
+                recargar = True
+                break
+            for coleccion, tocados in _aplicar_cambios(evento["cambios"]).items():
+                if coleccion in resultado:
+                    for acumulados, nuevos in zip(resultado[coleccion], tocados):
+                        acumulados.extend(nuevos)
+                else:
+                    resultado[coleccion] = tocados
+            version_datos = evento["n"]
+        # Un guardado que no alcanzó a anotar su línea también obliga a recargar
+        if recargar or (leer_version_disco() or 0) > (version_datos or 0):
+            cargar_datos()
+            return dict.fromkeys(COLECCIONES_DATOS)
+        if not resultado:
+            return None
+        revision_datos += 1
+        return resultado
+
+def sincronizar():
+    """Trae a memoria lo que otras instancias guardaron, aunque haya cambios propios sin guardar.
+
+    Para decidir algo con el estado más reciente (p. ej. qué planes emitir):
+    se llama con bloqueo_datos() tomado y se guarda antes de soltarlo. Sin
+    cambios propios pendientes aplica el registro de cambios como
+    aplicar_eventos() (también con una transacción abierta, como la del
+    servidor, siempre que no haya una modificación a medias); si los hay,
+    combina con el archivo de datos como lo haría el guardado y los cambios
+    propios siguen pendientes. Devuelve lo mismo que aplicar_eventos().
+    """
+    global version_datos, _posicion_eventos, revision_datos
+    with bloqueo_datos():
+        if not _guardado_pendiente:
+            return _aplicar_eventos_nuevos() if hay_eventos_nuevos() else None
+        if not os.path.exists(ARCHIVO_DATOS) or leer_version_disco() == version_datos:
+            return None
+        datos_disco = _leer_archivo_datos()
+        if datos_disco.get("version", 0) == version_datos:
+            return None
+        _combinar_con_disco(datos_disco)
+        version_datos = datos_disco.get("version", 0)
+        # La base pasa a ser el disco: el próximo guardado anota solo los cambios propios
+        _tomar_huellas({coleccion: _claves_registros(datos_disco.get(coleccion, []))
+                        for coleccion in COLECCIONES_DATOS})
+        _posicion_eventos = _estado_eventos()
+        revision_datos += 1
+        return dict.fromkeys(COLECCIONES_DATOS)
+
+def _leer_archivo_datos():
+    with open(ARCHIVO_DATOS, 'r', encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+@metricas.medido
+def guardar_datos():
+    """Guarda todos los datos en un archivo JSON, combinando los cambios de otras instancias"""
+    global revision_datos, _guardado_pendiente
+    revision_datos += 1
+    if _profundidad_transaccion:
+        _guardado_pendiente = True
+        return True
+    _guardado_pendiente = False
+    return _escribir_datos()
+
+@metricas.medido
+def guardar_pendiente(ejecutar_combinacion=None):
+    """Escribe ya lo que la transacción abierta dejó pendiente, sin cerrarla.
+
+    Para procesos que mantienen una transacción abierta todo el tiempo y
+    agrupan muchas modificaciones en escrituras periódicas (el servidor).
+    'ejecutar_combinacion(funcion)', si se da, corre la combinación con otras
+    instancias (que reemplaza el contenido de las listas) donde no haya
+    lecturas a la vez: el servidor escribe desde otro hilo y la lleva a su
+    bucle de eventos.
+    """
+    global _guardado_pendiente
+    if not _guardado_pendiente:
+        return True
+    _guardado_pendiente = False
+    return _escribir_datos(ejecutar_combinacion)
+
+def descartar_guardado_pendiente():
+    """Olvida la escritura que la transacción abierta dejó pendiente.
+
+    Los cambios siguen en memoria: es para procesos que terminan sin guardar
+    un lote que falló (la línea de comandos por lotes).
+    """
+    global _guardado_pendiente
+    _guardado_pendiente = False
+
+@metricas.medido
+def _escribir_datos(ejecutar_combinacion=None):
+    global version_datos, ultimo_guardado_combinado, _recargar_otras_instancias
+    try:
+        with bloqueo_datos():
+            version_disco = leer_version_disco()
+            if os.path.exists(ARCHIVO_DATOS) and (version_disco is None or version_disco != version_datos):
+                # Otra instancia guardó después de nuestra última sincronización
+                datos_disco = _leer_archivo_datos()
+                version_disco = datos_disco.get("version", 0)
+                ultimo_guardado_combinado = version_disco != version_datos
+                if ultimo_guardado_combinado:
+                    if ejecutar_combinacion:
+                        ejecutar_combinacion(lambda: _combinar_con_disco(datos_disco))
+                    else:
+                        _combinar_con_disco(datos_disco)
+            else:
+                ultimo_guardado_combinado = False
+            version_datos = (version_disco or 0) + 1
+            claves = {coleccion: _claves_registros(globals()[coleccion]) for coleccion in COLECCIONES_DATOS}
+            cambios = None if _recargar_otras_instancias else _cambios_desde_base(claves)
+            datos = {coleccion: globals()[coleccion] for coleccion in COLECCIONES_DATOS}
+            datos["version"] = version_datos
+            datos["id_maximo_archivado"] = id_maximo_archivado
+            _escribir_atomico(ARCHIVO_DATOS,
+                              lambda archivo: json.dump(datos, archivo, indent=4, ensure_ascii=False))
+            _escribir_atomico(ARCHIVO_VERSION, lambda archivo: archivo.write(str(version_datos)))
+            _anotar_eventos(version_datos, cambios)
+            _recargar_otras_instancias = False
+            _tomar_huellas(claves)
+            if _resumenes_modificados:
+                guardar_resumenes()
+        return True
+    except Exception as e:
+        print(f"Error al guardar datos: {e}")
+        return False
+
+@metricas.medido
+def cargar_datos():
+    """Carga todos los datos desde el archivo JSON"""
+    global equipos, ordenes_trabajo, tecnicos, historial_mantenimiento, planes_mantenimiento
+    global planes_recurrentes, revision_datos, version_datos, _posicion_eventos, id_maximo_archivado
+    
+    if not os.path.exists(ARCHIVO_DATOS):
+        print("No se encontró archivo de datos. Se iniciará con datos vacíos.")
+        return False
+    
+    try:
+        with bloqueo_datos():
+            datos = _leer_archivo_datos()
+            
+            equipos = datos.get("equipos", [])
+            ordenes_trabajo = datos.get("ordenes_trabajo", [])
+            tecnicos = datos.get("tecnicos", [])
+            historial_mantenimiento = datos.get("historial_mantenimiento", [])
+            planes_mantenimiento = datos.get("planes_mantenimiento", [])
+            planes_recurrentes = datos.get("planes_recurrentes", [])
+            version_datos = datos.get("version", 0)
+            id_maximo_archivado = datos.get("id_maximo_archivado", 0)
+            # Lo anotado hasta ahora en el registro de cambios ya está en el archivo
+            _posicion_eventos = _estado_eventos()
+            _tomar_huellas()
+            revision_datos += 1
+            reconstruir_indices_ordenes()
+            cargar_resumenes()
+        
+        print("Datos cargados correctamente.")
+        return True
+    except Exception as e:
+        print(f"Error al cargar datos: {e}")
+        return False
+
+# ==================== ÍNDICES INCREMENTALES DE ÓRDENES ====================
+# Un índice es un par de funciones: actualizar(orden, delta) se llama con delta=-1
+# justo antes de modificar o quitar una orden y con delta=+1 justo después de
+# modificarla o agregarla; reiniciar() lo deja vacío antes de una reconstrucción.
+# Así los reportes consultan estructuras ya agregadas en lugar de recorrer
+# ordenes_trabajo completo en cada refresco.
+
+_indices_ordenes = []
+
+def registrar_indice_ordenes(actualizar, reiniciar):
+    """Registra un índice y lo construye con las órdenes actuales"""
+    _indices_ordenes.append((actualizar, reiniciar))
+    reiniciar()
+    for orden in ordenes_trabajo:
+        actualizar(orden, 1)
+
+def _indexar_orden(orden, delta):
+    for actualizar, _ in _indices_ordenes:
+        actualizar(orden, delta)
+
+@metricas.medido
+def reconstruir_indices_ordenes():
+    """Reconstruye desde cero todos los índices de órdenes"""
+    for _, reiniciar in _indices_ordenes:
+        reiniciar()
+    for orden in ordenes_trabajo:
+        _indexar_orden(orden, 1)
+
+@contextmanager
+def modificando_orden(orden):
+    """Mantiene los índices al día mientras se modifican campos de una orden"""
+    _indexar_orden(orden, -1)
+    try:
+        yield orden
+    finally:
+        _indexar_orden(orden, 1)
+
+# Contadores de órdenes por estado, tipo, prioridad y equipo (equipo_id)
+contadores_ordenes = {campo: Counter() for campo in ("estado", "tipo", "prioridad", "equipo")}
+_CAMPOS_CONTADOS = (("estado", "estado"), ("tipo", "tipo"),
+                    ("prioridad", "prioridad"), ("equipo", "equipo_id"))
+
+def _contar_orden(orden, delta):
+    for nombre, campo in _CAMPOS_CONTADOS:
+        contador = contadores_ordenes[nombre]
+        clave = orden.get(campo)
+        contador[clave] += delta
+        if contador[clave] == 0:
+            del contador[clave]
+
+def _reiniciar_contadores():
+    for contador in contadores_ordenes.values():
+        contador.clear()
+
+def verificar_contadores():
+    """Recalcula los contadores desde cero y corrige cualquier diferencia.
+
+    Devuelve un diccionario {campo: (esperado, actual)} con los contadores que
+    no coincidían (vacío si todo estaba bien).
+    """
+    esperados = {nombre: Counter() for nombre in contadores_ordenes}
+    for orden in ordenes_trabajo:
+        for nombre, campo in _CAMPOS_CONTADOS:
+            esperados[nombre][orden.get(campo)] += 1
+
+    diferencias = {}
+    for nombre, esperado in esperados.items():
+        if esperado != contadores_ordenes[nombre]:
+            diferencias[nombre] = (dict(esperado), dict(contadores_ordenes[nombre]))
+            contadores_ordenes[nombre].clear()
+            contadores_ordenes[nombre].update(esperado)
+    return diferencias
+
+registrar_indice_ordenes(_contar_orden, _reiniciar_contadores)
+
+# Órdenes por ID, para buscarlas sin recorrer la lista
+_ordenes_por_id = {}
+
+def _indexar_id(orden, delta):
+    if delta > 0:
+        _ordenes_por_id[orden['id']] = orden
+    elif _ordenes_por_id.get(orden['id']) is orden:
+        del _ordenes_por_id[orden['id']]
+
+registrar_indice_ordenes(_indexar_id, _ordenes_por_id.clear)
+
+def orden_por_id(id_orden):
+    """Orden con ese ID (None si no existe)"""
+    return _ordenes_por_id.get(id_orden)
+
+# Mayor ID de las órdenes pasadas al archivo histórico (Archivado_Mantenimiento):
+# ya no están en ordenes_trabajo, pero sus IDs no se reutilizan
+id_maximo_archivado = 0
+
+# Colección -> mayor ID quitado en esta sesión con quitar_registros (deshacer
+# puede devolverlo): los IDs nuevos empiezan por encima
+_id_maximo_quitado = {}
+
+def piso_ids(coleccion):
+    """Mayor ID que no está en la colección pero tampoco libre: archivado o quitado en esta sesión"""
+    piso = _id_maximo_quitado.get(coleccion, 0)
+    if coleccion == "ordenes_trabajo":
+        piso = max(piso, id_maximo_archivado)
+    return piso
+
+def siguiente_id_orden():
+    """ID libre para una orden nueva (mayor que los de ordenes_trabajo, los archivados y los que se pueden restaurar)"""
+    return max(max((i for i in _ordenes_por_id if isinstance(i, int)), default=0), piso_ids("ordenes_trabajo")) + 1
+
+def siguiente_id(coleccion):
+    """ID libre para un registro nuevo de la colección.
+
+    No se usa la cantidad de registros: después de eliminar uno repetiría un
+    ID existente, o el del eliminado, que deshacer necesita para restaurarlo.
+    """
+    if coleccion == "ordenes_trabajo":
+        return siguiente_id_orden()
+    return max(max((r['id'] for r in globals()[coleccion] if isinstance(r.get('id'), int)), default=0),
+               piso_ids(coleccion)) + 1
+
+def resumen_estadisticas():
+    """Estadísticas generales leídas de los contadores (sin recorrer las órdenes)"""
+    por_estado = contadores_ordenes["estado"]
+    return {
+        "equipos": len(equipos),
+        "ordenes": len(ordenes_trabajo),
+        "tecnicos": len(tecnicos),
+        "historial": len(historial_mantenimiento),
+        "planes": len(planes_mantenimiento),
+        "por_estado": {estado: por_estado.get(estado, 0) for estado in ESTADOS_ORDEN},
+        "por_tipo": dict(contadores_ordenes["tipo"]),
+        "por_prioridad": {p: contadores_ordenes["prioridad"].get(p, 0) for p in RANGO_PRIORIDAD},
+    }
+
+# ==================== RESÚMENES MENSUALES ====================
+# Tablas preagregadas por (año, mes, equipo), (año, mes, técnico) y (año, mes, tipo)
+# con la cantidad de mantenimientos y las horas de trabajo de las órdenes. Se
+# actualizan al agregar cada entrada al historial y se guardan en un archivo
+# aparte junto a los datos, así los reportes mensuales no recorren el historial.
+
+# Dimensión -> campo de la entrada del historial
+DIMENSIONES_RESUMEN = {"equipo": "equipo_nombre", "tecnico": "tecnico", "tipo": "tipo"}
+SIN_ASIGNAR = "Sin asignar"
+
+# Dimensión -> {(anio, mes, clave): [cantidad, horas, cantidad con duración]}
+resumenes_mensuales = {dimension: {} for dimension in DIMENSIONES_RESUMEN}
+_resumenes_modificados = False
+
+def _anio_mes(texto):
+    """(año, mes) de una fecha 'AAAA-MM-DD ...' sin parsearla completa (None si no es válida)"""
+    try:
+        anio, mes = int(texto[:4]), int(texto[5:7])
+    except (TypeError, ValueError):
+        return None
+    return (anio, mes) if 1 <= mes <= 12 else None
+
+def duracion_horas(orden):
+    """Horas entre el inicio y la finalización de una orden (None si faltan fechas)"""
+    if not orden:
+        return None
+    inicio = parsear_fecha(orden.get('fecha_inicio'))
+    fin = parsear_fecha(orden.get('fecha_finalizacion'))
+    if inicio is None or fin is None or fin < inicio:
+        return None
+    return (fin - inicio).total_seconds() / 3600
+
+def _acumular_resumen(entrada, orden=None):
+    global _resumenes_modificados
+    periodo = _anio_mes(entrada.get('fecha'))
+    if periodo is None:
+        return
+    # Las entradas de órdenes archivadas llevan la duración (ver retirar_ordenes_archivadas)
+    horas = duracion_horas(orden) if orden else entrada.get('duracion_horas')
+    for dimension, campo in DIMENSIONES_RESUMEN.items():
+        celda = resumenes_mensuales[dimension].setdefault(
+            (*periodo, entrada.get(campo) or SIN_ASIGNAR), [0, 0.0, 0])
+        celda[0] += 1
+        if horas is not None:
+            celda[1] += horas
+            celda[2] += 1
+    _resumenes_modificados = True
+
+def agregar_historial(entrada, orden=None):
+    """Agrega una entrada al historial y la suma a los resúmenes mensuales.
+
+    'orden' es la orden de la entrada (para la duración); si no se indica, la
+    entrada cuenta en los resúmenes pero sin horas.
+    """
+    historial_mantenimiento.append(entrada)
+    _acumular_resumen(entrada, orden)
+    return entrada
+
+@metricas.medido
+def reconstruir_resumenes():
+    """Recalcula los resúmenes mensuales recorriendo todo el historial"""
+    global _resumenes_modificados
+    for tabla in resumenes_mensuales.values():
+        tabla.clear()
+    por_id = {o['id']: o for o in ordenes_trabajo}
+    for entrada in historial_mantenimiento:
+        _acumular_resumen(entrada, por_id.get(entrada.get('orden_id')))
+    _resumenes_modificados = True
+
+@metricas.medido
+def guardar_resumenes():
+    """Escribe los resúmenes mensuales en su archivo (junto al archivo de datos)"""
+    global _resumenes_modificados
+    datos = {"entradas": len(historial_mantenimiento)}
+    for dimension, tabla in resumenes_mensuales.items():
+        datos[dimension] = [[anio, mes, clave, *celda] for (anio, mes, clave), celda in tabla.items()]
+    try:
+        _escribir_atomico(ARCHIVO_RESUMENES, lambda archivo: json.dump(datos, archivo, ensure_ascii=False))
+        _resumenes_modificados = False
+        return True
+    except Exception as e:
+        print(f"Error al guardar resúmenes mensuales: {e}")
+        return False
+
+@metricas.medido
+def cargar_resumenes():
+    """Lee los resúmenes guardados; si faltan o no cuadran con el historial los reconstruye"""
+    global _resumenes_modificados
+    try:
+        with open(ARCHIVO_RESUMENES, 'r', encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        if datos.get("entradas") != len(historial_mantenimiento):
+            raise ValueError("los resúmenes no corresponden al historial")
+        tablas = {dimension: {(anio, mes, clave): [cantidad, horas, con_duracion]
+                              for anio, mes, clave, cantidad, horas, con_duracion in datos[dimension]}
+                  for dimension in DIMENSIONES_RESUMEN}
+    except (OSError, ValueError, KeyError, TypeError):
+        reconstruir_resumenes()
+        guardar_resumenes()
+        return False
+    for dimension, tabla in tablas.items():
+        resumenes_mensuales[dimension] = tabla
+    _resumenes_modificados = False
+    return True
+
+def resumen_mensual(dimension, anio=None, mes=None):
+    """Filas del resumen de una dimensión ('equipo', 'tecnico' o 'tipo'), ordenadas por período.
+
+    Cada fila: {anio, mes, clave, cantidad, horas, horas_promedio}; 'anio' y
+    'mes' filtran el período si se indican.
+    """
+    filas = []
+    for (a, m, clave), (cantidad, horas, con_duracion) in resumenes_mensuales[dimension].items():
+        if (anio is not None and a != anio) or (mes is not None and m != mes):
+            continue
+        filas.append({
+            "anio": a,
+            "mes": m,
+            "clave": clave,
+            "cantidad": cantidad,
+            "horas": round(horas, 2),
+            "horas_promedio": round(horas / con_duracion, 2) if con_duracion else None,
+        })
+    filas.sort(key=lambda f: (f['anio'], f['mes'], -f['cantidad'], str(f['clave'])))
+    return filas
+
+def tendencia_mensual(dimension="tipo", meses=12, hasta=None):
+    """Serie de los últimos 'meses' meses hasta 'hasta' (año, mes) o el mes actual.
+
+    Devuelve [(anio, mes, {clave: cantidad})] con todos los meses, aunque no
+    tengan mantenimientos.
+    """
+    if hasta is None:
+        hoy = datetime.now()
+        hasta = (hoy.year, hoy.month)
+    indice_final = hasta[0] * 12 + hasta[1] - 1
+    serie = {divmod(i, 12): {} for i in range(indice_final - meses + 1, indice_final + 1)}
+    for (anio, mes, clave), celda in resumenes_mensuales[dimension].items():
+        periodo = (anio, mes - 1)
+        if periodo in serie:
+            serie[periodo][clave] = celda[0]
+    return [(anio, mes0 + 1, cantidades) for (anio, mes0), cantidades in serie.items()]
+
+# ==================== OPERACIONES SOBRE ÓRDENES ====================
+# Estas funciones reciben listas de IDs para poder actuar sobre varias órdenes a la
+# vez (interfaz y consola) con una sola escritura a disco por operación.
+
+def agregar_orden(orden):
+    """Agrega una orden nueva a la lista y a los índices"""
+    ordenes_trabajo.append(orden)
+    _indexar_orden(orden, 1)
+    return orden
+
+def ordenes_por_ids(ids):
+    """Devuelve las órdenes cuyos IDs están en la lista, en el orden recibido"""
+    return [_ordenes_por_id[i] for i in dict.fromkeys(ids) if i in _ordenes_por_id]
+
+def registro_por_id(coleccion, id_registro):
+    """Registro de la colección con ese ID (None si no existe); las órdenes se buscan en su índice"""
+    if coleccion == "ordenes_trabajo":
+        return orden_por_id(id_registro)
+    return next((r for r in globals()[coleccion] if r.get('id') == id_registro), None)
+
+def quitar_registros(coleccion, ids):
+    """Quita de la colección los registros con esos IDs, manteniendo los índices de órdenes.
+
+    Devuelve [(posición, registro)] en orden de posición, para poder
+    devolverlos a su lugar con reinsertar_registros. Recorre la colección
+    una vez, sin importar cuántos registros se quiten.
+    """
+    lista = globals()[coleccion]
+    ids = set(ids)
+    quitados = [(posicion, r) for posicion, r in enumerate(lista) if r.get('id') in ids]
+    if not quitados:
+        return []
+    if coleccion == "ordenes_trabajo":
+        for _, orden in quitados:
+            _indexar_orden(orden, -1)
+    enteros = [r['id'] for _, r in quitados if isinstance(r['id'], int)]
+    if enteros:
+        _id_maximo_quitado[coleccion] = max(_id_maximo_quitado.get(coleccion, 0), *enteros)
+    # Reconstruir la lista una sola vez en lugar de hacer remove() por cada registro
+    lista[:] = [r for r in lista if r.get('id') not in ids]
+    return quitados
+
+def reinsertar_registros(coleccion, quitados):
+    """Devuelve a la colección los registros que quitó quitar_registros, en sus posiciones.
+
+    Lanza ValueError (sin tocar nada) si alguno de sus IDs ya está ocupado.
+    """
+    lista = globals()[coleccion]
+    if coleccion == "ordenes_trabajo":
+        ocupados = [r['id'] for _, r in quitados if orden_por_id(r['id']) is not None]
+    else:
+        ids = {r.get('id') for _, r in quitados}
+        ocupados = [r['id'] for r in lista if r.get('id') in ids]
+    if ocupados:
+        raise ValueError(f"Los IDs {', '.join(map(str, ocupados))} ya están en uso")
+    # En orden de posición: cada una queda donde estaba si la lista no cambió entretanto
+    for posicion, registro in quitados:
+        lista.insert(min(posicion, len(lista)), registro)
+        if coleccion == "ordenes_trabajo":
+            _indexar_orden(registro, 1)
+
+def _liberar_tecnicos(nombres):
+    """Marca como disponibles los técnicos con esos nombres"""
+    if not nombres:
+        return
+    for t in tecnicos:
+        if t['nombre'] in nombres:
+            t['estado'] = "Disponible"
+
+def registrar_historial(orden):
+    """Agrega una orden completada al historial de mantenimiento"""
+    entrada = {
+        "orden_id": orden['id'],
+        "equipo_nombre": orden['equipo_nombre'],
+        "tipo": orden['tipo'],
+        "fecha": orden['fecha_finalizacion'],
+        "tecnico": orden['tecnico_asignado'],
+        "observaciones": orden['observaciones']
+    }
+    return agregar_historial(entrada, orden)
+
+@metricas.medido
+def completar_ordenes(ids, observaciones=""):
+    """Completa las órdenes indicadas y devuelve las que cambiaron de estado"""
+    ordenes = [o for o in ordenes_por_ids(ids) if o['estado'] != "Completada"]
+    if not ordenes:
+        return []
+
+    fecha = datetime.now().strftime(FORMATO_FECHA)
+    liberar = set()
+    with transaccion():
+        for orden in ordenes:
+            with modificando_orden(orden):
+                orden['estado'] = "Completada"
+                orden['fecha_finalizacion'] = fecha
+                orden['observaciones'] = observaciones or ""
+            registrar_historial(orden)
+            if orden['tecnico_asignado']:
+                liberar.add(orden['tecnico_asignado'])
+        _liberar_tecnicos(liberar)
+        guardar_datos()
+    return ordenes
+
+@metricas.medido
+def asignar_tecnico_ordenes(ids, tecnico):
+    """Asigna el técnico a todas las órdenes indicadas"""
+    ordenes = ordenes_por_ids(ids)
+    if not ordenes:
+        return []
+
+    with transaccion():
+        for orden in ordenes:
+            with modificando_orden(orden):
+                orden['tecnico_asignado'] = tecnico['nombre']
+        tecnico['estado'] = "Ocupado"
+        guardar_datos()
+    return ordenes
+
+@metricas.medido
+def cambiar_estado_ordenes(ids, nuevo_estado):
+    """Cambia el estado de todas las órdenes indicadas"""
+    if nuevo_estado not in ESTADOS_ORDEN:
+        raise ValueError(f"Estado inválido: {nuevo_estado}")
+    ordenes = ordenes_por_ids(ids)
+    if not ordenes:
+        return []
+
+    fecha = datetime.now().strftime(FORMATO_FECHA)
+    with transaccion():
+        for orden in ordenes:
+            with modificando_orden(orden):
+                orden['estado'] = nuevo_estado
+                if nuevo_estado == "En progreso" and not orden['fecha_inicio']:
+                    orden['fecha_inicio'] = fecha
+                # La fecha de cierre permite reconstruir la evolución del backlog
+                if nuevo_estado in ("Completada", "Cancelada") and not orden['fecha_finalizacion']:
+                    orden['fecha_finalizacion'] = fecha
+        guardar_datos()
+    return ordenes
+
+@metricas.medido
+def eliminar_ordenes(ids):
+    """Elimina las órdenes indicadas y libera a sus técnicos"""
+    ordenes = ordenes_por_ids(ids)
+    if not ordenes:
+        return []
+
+    with transaccion():
+        _liberar_tecnicos({o['tecnico_asignado'] for o in ordenes if o.get('tecnico_asignado')})
+        quitar_registros("ordenes_trabajo", [o['id'] for o in ordenes])
+        guardar_datos()
+    return ordenes
+
+@metricas.medido
+def retirar_ordenes_archivadas(ordenes, id_maximo):
+    """Quita de ordenes_trabajo las órdenes que se acaban de archivar y guarda.
+
+    A diferencia de eliminar_ordenes no toca a los técnicos (las órdenes ya
+    estaban cerradas). Sus entradas del historial guardan la duración de la
+    orden ('duracion_horas'), para que reconstruir_resumenes no pierda esas
+    horas. Las demás instancias recargan los datos en lugar de aplicar una
+    eliminación por orden.
+    """
+    global id_maximo_archivado, _recargar_otras_instancias
+    quitar = {id(orden) for orden in ordenes}
+    duraciones = {orden['id']: duracion_horas(orden) for orden in ordenes}
+    with transaccion():
+        for entrada in historial_mantenimiento:
+            horas = duraciones.get(entrada.get('orden_id'))
+            if horas is not None:
+                entrada['duracion_horas'] = horas
+        for orden in ordenes:
+            _indexar_orden(orden, -1)
+        ordenes_trabajo[:] = [o for o in ordenes_trabajo if id(o) not in quitar]
+        id_maximo_archivado = max(id_maximo_archivado, id_maximo)
+        _recargar_otras_instancias = True
+        guardar_datos()
+
+# ==================== VALIDACIÓN E IMPORTACIÓN EN LOTE ====================
+# Los registros que llegan de archivos externos (CSV, Parquet, ERP) se validan y
+# completan igual que los que se crean desde el menú, y se insertan todos juntos
+# con una sola escritura a disco.
+
+def _texto(valor, campo="", requerido=False, defecto=""):
+    texto = "" if valor is None else str(valor).strip()
+    if requerido and not texto:
+        raise ValueError(f"'{campo}' es obligatorio")
+    return texto or defecto
+
+def _entero(valor, campo, requerido=True):
+    if valor is None or (isinstance(valor, str) and not valor.strip()):
+        if requerido:
+            raise ValueError(f"'{campo}' es obligatorio")
+        return None
+    try:
+        return int(float(valor)) if isinstance(valor, str) and "." in valor else int(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{campo}' debe ser un número entero: {valor!r}")
+
+def _decimal(valor, campo):
+    try:
+        return float(str(valor).replace(",", "."))
+    except (TypeError, ValueError):
+        raise ValueError(f"'{campo}' debe ser un número: {valor!r}")
+
+def _opcion(valor, opciones, campo, defecto=None):
+    texto = _texto(valor).capitalize()
+    if not texto and defecto is not None:
+        return defecto
+    if texto not in opciones:
+        raise ValueError(f"'{campo}' inválido: {valor!r} (use {', '.join(opciones)})")
+    return texto
+
+def _fecha(valor, campo, defecto=None, requerido=False):
+    texto = _texto(valor, campo, requerido=requerido)
+    if not texto:
+        return defecto
+    if parsear_fecha(texto) is None:
+        raise ValueError(f"'{campo}' debe tener formato AAAA-MM-DD HH:MM:SS: {valor!r}")
+    return texto
+
+def _dia(valor, campo, requerido=False):
+    """Fecha de calendario AAAA-MM-DD (acepta también la fecha con hora)"""
+    texto = _texto(valor, campo, requerido=requerido)[:10]
+    if not texto:
+        return None
+    try:
+        datetime.strptime(texto, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"'{campo}' debe tener formato AAAA-MM-DD: {valor!r}")
+    return texto
+
+def _equipo_referenciado(fila, lote):
+    id_equipo = _entero(fila.get("equipo_id"), "equipo_id")
+    equipo = lote.equipos.get(id_equipo)
+    if equipo is None:
+        raise ValueError(f"El equipo {id_equipo} no existe")
+    return equipo
+
+def _normalizar_equipo(fila, lote):
+    return {
+        "nombre": _texto(fila.get("nombre"), "nombre", requerido=True),
+        "ubicacion": _texto(fila.get("ubicacion")),
+        "descripcion": _texto(fila.get("descripcion")),
+        "marca": _texto(fila.get("marca")),
+        "modelo": _texto(fila.get("modelo")),
+        "numero_serie": _texto(fila.get("numero_serie")),
+        "prioridad": _opcion(fila.get("prioridad"), list(RANGO_PRIORIDAD), "prioridad", "Media"),
+        "estado": _texto(fila.get("estado"), defecto="Operativo"),
+        "fecha_registro": _fecha(fila.get("fecha_registro"), "fecha_registro", lote.ahora)
+    }
+
+def _normalizar_orden(fila, lote):
+    equipo = _equipo_referenciado(fila, lote)
+    return {
+        "equipo_id": equipo['id'],
+        "equipo_nombre": equipo['nombre'],
+        "descripcion": _texto(fila.get("descripcion"), "descripcion", requerido=True),
+        "tipo": _opcion(fila.get("tipo"), TIPOS_MANTENIMIENTO, "tipo"),
+        "prioridad": _opcion(fila.get("prioridad"), list(RANGO_PRIORIDAD), "prioridad", "Media"),
+        "estado": _opcion(fila.get("estado"), ESTADOS_ORDEN, "estado", "Pendiente"),
+        "tecnico_asignado": _texto(fila.get("tecnico_asignado")) or None,
+        "fecha_creacion": _fecha(fila.get("fecha_creacion"), "fecha_creacion", lote.ahora),
+        "fecha_inicio": _fecha(fila.get("fecha_inicio"), "fecha_inicio"),
+        "fecha_finalizacion": _fecha(fila.get("fecha_finalizacion"), "fecha_finalizacion"),
+        "observaciones": _texto(fila.get("observaciones"))
+    }
+
+def _normalizar_tecnico(fila, lote):
+    return {
+        "nombre": _texto(fila.get("nombre"), "nombre", requerido=True),
+        "especialidad": _texto(fila.get("especialidad")),
+        "telefono": _texto(fila.get("telefono")),
+        "estado": _texto(fila.get("estado"), defecto="Disponible")
+    }
+
+def _normalizar_plan(fila, lote):
+    equipo = _equipo_referenciado(fila, lote)
+    mes = _entero(fila.get("mes"), "mes")
+    if mes < 1 or mes > 12:
+        raise ValueError(f"'mes' debe estar entre 1 y 12: {mes}")
+    return {
+        "equipo_id": equipo['id'],
+        "equipo_nombre": equipo['nombre'],
+        "tipo": _opcion(fila.get("tipo"), TIPOS_MANTENIMIENTO, "tipo"),
+        "descripcion": _texto(fila.get("descripcion")),
+        "mes": mes,
+        "anio": _entero(fila.get("anio"), "anio"),
+        "estado": _texto(fila.get("estado"), defecto="Programado"),
+        "fecha_creacion": _fecha(fila.get("fecha_creacion"), "fecha_creacion", lote.ahora)
+    }
+
+def _normalizar_plan_recurrente(fila, lote):
+    equipo = _equipo_referenciado(fila, lote)
+    frecuencia = _texto(fila.get("frecuencia"), "frecuencia", requerido=True).lower()
+    if frecuencia not in FRECUENCIAS_PLAN:
+        raise ValueError(f"'frecuencia' inválida: {frecuencia!r} (use {', '.join(FRECUENCIAS_PLAN)})")
+    intervalo = _entero(fila.get("intervalo"), "intervalo")
+    if intervalo < 1:
+        raise ValueError(f"'intervalo' debe ser mayor que cero: {intervalo}")
+    uso_diario = None
+    if frecuencia == "uso":
+        uso_diario = _decimal(fila.get("uso_diario"), "uso_diario")
+        if uso_diario <= 0:
+            raise ValueError(f"'uso_diario' debe ser mayor que cero: {uso_diario}")
+    fecha_inicio = _dia(fila.get("fecha_inicio"), "fecha_inicio", requerido=True)
+    fecha_fin = _dia(fila.get("fecha_fin"), "fecha_fin")
+    if fecha_fin and fecha_fin < fecha_inicio:
+        raise ValueError("'fecha_fin' es anterior a 'fecha_inicio'")
+    return {
+        "equipo_id": equipo['id'],
+        "equipo_nombre": equipo['nombre'],
+        "tipo": _opcion(fila.get("tipo"), TIPOS_MANTENIMIENTO, "tipo"),
+        "descripcion": _texto(fila.get("descripcion")),
+        "frecuencia": frecuencia,
+        "intervalo": intervalo,
+        "uso_diario": uso_diario,
+        "fecha_inicio": fecha_inicio,
+        "fecha_fin": fecha_fin,
+        "emitida_hasta": _dia(fila.get("emitida_hasta"), "emitida_hasta"),
+        "estado": _texto(fila.get("estado"), defecto="Activo"),
+        "fecha_creacion": _fecha(fila.get("fecha_creacion"), "fecha_creacion", lote.ahora)
+    }
+
+def _normalizar_historial(fila, lote):
+    return {
+        "orden_id": _entero(fila.get("orden_id"), "orden_id"),
+        "equipo_nombre": _texto(fila.get("equipo_nombre"), "equipo_nombre", requerido=True),
+        "tipo": _opcion(fila.get("tipo"), TIPOS_MANTENIMIENTO, "tipo"),
+        "fecha": _fecha(fila.get("fecha"), "fecha", requerido=True),
+        "tecnico": _texto(fila.get("tecnico")) or None,
+        "observaciones": _texto(fila.get("observaciones"))
+    }
+
+# Colección -> función que valida una fila y devuelve el registro completo (sin ID)
+NORMALIZADORES = {
+    "equipos": _normalizar_equipo,
+    "ordenes_trabajo": _normalizar_orden,
+    "tecnicos": _normalizar_tecnico,
+    "planes_mantenimiento": _normalizar_plan,
+    "planes_recurrentes": _normalizar_plan_recurrente,
+    "historial_mantenimiento": _normalizar_historial,
+}
+
+class LoteImportacion:
+    """Valida registros por bloques y los inserta todos con una sola escritura.
+
+    Las filas inválidas no detienen la importación: se anotan en 'errores'
+    como (número de fila, motivo) y el resto se inserta al confirmar.
+    """
+
+    def __init__(self, coleccion):
+        if coleccion not in NORMALIZADORES:
+            raise ValueError(f"Colección desconocida: {coleccion}")
+        self.coleccion = coleccion
+        self.normalizar = NORMALIZADORES[coleccion]
+        self.registros = []
+        self.errores = []
+        self.filas_leidas = 0
+        self.ahora = datetime.now().strftime(FORMATO_FECHA)
+        self.equipos = {e['id']: e for e in equipos}
+        self.con_id = coleccion != "historial_mantenimiento"
+        self.ids_usados = self._ids_actuales()
+        self.piso_ids = self._piso_actual()
+        self.siguiente_id = max(max(self.ids_usados, default=0), self.piso_ids) + 1
+        self.inicio = time.perf_counter()
+        self.segundos = 0.0
+
+    def _ids_actuales(self):
+        return {r['id'] for r in globals()[self.coleccion]} if self.con_id else set()
+
+    def _piso_actual(self):
+        # Los IDs archivados o quitados en esta sesión (que Deshacer puede restaurar) tampoco están libres
+        return piso_ids(self.coleccion)
+
+    def _reasignar_ids_ocupados(self):
+        """Da otro ID a los registros cuyo ID se ocupó mientras se validaba.
+
+        La validación puede correr en otro hilo (la interfaz) mientras llegan
+        registros de otras instancias; al confirmar, en el hilo que modifica
+        gm, se compara con lo que hay en memoria en ese momento.
+        """
+        actuales = self._ids_actuales()
+        piso = self._piso_actual()
+        ocupados = [r for r in self.registros if r['id'] in actuales or r['id'] <= piso]
+        if not ocupados:
+            return
+        self.ids_usados |= actuales
+        self.piso_ids = max(self.piso_ids, piso)
+        self.siguiente_id = max(self.siguiente_id, self.piso_ids + 1)
+        for registro in ocupados:
+            registro['id'] = self._asignar_id(None)
+
+    def _asignar_id(self, valor):
+        """Conserva el ID de origen si está libre; si no, asigna el siguiente disponible"""
+        try:
+            propuesto = _entero(valor, "id", requerido=False)
+        except ValueError:
+            propuesto = None
+        if propuesto is None or propuesto in self.ids_usados or propuesto <= self.piso_ids:
+            while self.siguiente_id in self.ids_usados:
+                self.siguiente_id += 1
+            propuesto = self.siguiente_id
+        self.ids_usados.add(propuesto)
+        return propuesto
+
+    def validar(self, filas):
+        """Valida un bloque de filas (diccionarios) y acumula los registros válidos"""
+        for fila in filas:
+            self.filas_leidas += 1
+            try:
+                registro = self.normalizar(fila, self)
+            except ValueError as e:
+                self.errores.append((self.filas_leidas, str(e)))
+                continue
+            if self.con_id:
+                registro = {"id": self._asignar_id(fila.get("id")), **registro}
+            self.registros.append(registro)
+
+    @metricas.medido
+    def confirmar(self):
+        """Inserta los registros válidos y guarda una sola vez; devuelve cuántos se insertaron"""
+        if self.con_id:
+            self._reasignar_ids_ocupados()
+        with transaccion():
+            if self.coleccion == "ordenes_trabajo":
+                for orden in self.registros:
+                    agregar_orden(orden)
+            elif self.coleccion == "historial_mantenimiento":
+                por_id = {o['id']: o for o in ordenes_trabajo}
+                for entrada in self.registros:
+                    agregar_historial(entrada, por_id.get(entrada['orden_id']))
+            else:
+                globals()[self.coleccion].extend(self.registros)
+            guardar_datos()
+        self.segundos = time.perf_counter() - self.inicio
+        return len(self.registros)
+
+    def resumen(self):
+        """Totales de la importación, incluido el rendimiento en filas por segundo"""
+        segundos = self.segundos or (time.perf_counter() - self.inicio)
+        return {
+            "coleccion": self.coleccion,
+            "leidas": self.filas_leidas,
+            "insertadas": len(self.registros),
+            "rechazadas": len(self.errores),
+            "segundos": round(segundos, 3),
+            "filas_por_segundo": round(self.filas_leidas / segundos) if segundos else 0,
+        }
+
+# ==================== FUNCIONES DE GESTIÓN ====================
+
+def menu_principal():
+    print("\n" + "="*60)
+    print("   SISTEMA DE GESTIÓN DE MANTENIMIENTO - VERSIÓN 2.0")
+    print("="*60)
+    print("📦 EQUIPOS")
+    print("  1. Registrar equipo")
+    print("  2. Listar equipos")
+    print("  3. Buscar equipo")
+    print("  4. Editar equipo")
+    print("  5. Eliminar equipo")
+    print("\n🔧 ÓRDENAS DE TRABAJO")
+    print("  6. Crear orden de trabajo")
+    print("  7. Ver órdenes de trabajo")
+    print("  8. Actualizar estado de orden")
+    print("  9. Asignar técnico a orden")
+    print("  10. Completar orden de trabajo")
+    print("  26. Asignación automática de técnicos")
+    print("  27. Cola de despacho (próximas órdenes)")
+    print("\n👷 TÉCNICOS")
+    print("  11. Registrar técnico")
+    print("  12. Listar técnicos")
+    print("\n📅 PLANIFICACIÓN")
+    print("  13. Crear plan de mantenimiento")
+    print("  14. Ver planes de mantenimiento")
+    print("  15. Ver carga de trabajo mensual")
+    print("  25. Generar órdenes de planes vencidos")
+    print("\n📊 REPORTES")
+    print("  16. Historial de mantenimiento")
+    print("  17. Estadísticas generales")
+    print("  18. Órdenes por estado")
+    print("  21. Indicadores de confiabilidad (MTTR/MTBF)")
+    print("  22. Resumen mensual")
+    print("  23. Carga de trabajo de técnicos")
+    print("  24. Antigüedad del backlog")
+    print("  28. Simulación de capacidad (próximos 12 meses)")
+    print("\n💾 DATOS")
+    print("  19. Guardar datos")
+    print("  20. Cargar datos")
+    print("\n  0. Salir")
+    print("="*60)
+
+def registrar_equipo():
+    print("\n--- REGISTRAR EQUIPO ---")
+    nombre = input("Nombre del equipo: ").strip()
+    if not nombre:
+        print("⚠ El nombre no puede estar vacío.")
+        return
+
+    ubicacion = input("Ubicación: ").strip()
+    descripcion = input("Descripción: ").strip()
+    marca = input("Marca: ").strip()
+    modelo = input("Modelo: ").strip()
+    numero_serie = input("Número de serie: ").strip()
+
+    while True:
+        prioridad = input("Prioridad (Alta/Media/Baja): ").strip().capitalize()
+        if prioridad in ["Alta", "Media", "Baja"]:
+            break
+        print("⚠ Prioridad inválida. Use: Alta, Media o Baja")
+
+    equipo = {
+        "id": siguiente_id("equipos"),
+        "nombre": nombre,
+        "ubicacion": ubicacion,
+        "descripcion": descripcion,
+        "marca": marca,
+        "modelo": modelo,
+        "numero_serie": numero_serie,
+        "prioridad": prioridad,
+        "estado": "Operativo",
+        "fecha_registro": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+    equipos.append(equipo)
+    print(f"✔ Equipo '{nombre}' registrado correctamente con ID: {equipo['id']}")
+    guardar_datos()
+
+def listar_equipos():
+    print("\n--- LISTA DE EQUIPOS ---")
+    if len(equipos) == 0:
+        print("No hay equipos registrados.")
+        return
+    
+    print(f"{'ID':<5} {'Nombre':<20} {'Ubicación':<15} {'Estado':<12} {'Prioridad':<10}")
+    print("-" * 70)
+    for eq in equipos:
+        print(f"{eq['id']:<5} {eq['nombre']:<20} {eq['ubicacion']:<15} {eq['estado']:<12} {eq['prioridad']:<10}")
+
+def buscar_equipos(termino):
+    """Equipos cuyo nombre o ubicación contienen el término (sin distinguir mayúsculas)"""
+    termino = termino.strip().lower()
+    return [eq for eq in equipos if termino in eq['nombre'].lower() or termino in eq['ubicacion'].lower()]
+
+def buscar_equipo():
+    print("\n--- BUSCAR EQUIPO ---")
+    termino = input("Ingrese nombre o ubicación del equipo: ")
+
+    resultados = buscar_equipos(termino)
+
+    if len(resultados) == 0:
+        print("⚠ No se encontraron equipos con ese criterio.")
+        return
+    
+    print(f"\nSe encontraron {len(resultados)} resultado(s):")
+    for eq in resultados:
+        print(f"\nID: {eq['id']}")
+        print(f"Nombre: {eq['nombre']}")
+        print(f"Ubicación: {eq['ubicacion']}")
+        print(f"Marca: {eq['marca']} - Modelo: {eq['modelo']}")
+        print(f"Estado: {eq['estado']} | Prioridad: {eq['prioridad']}")
+
+def editar_equipo():
+    print("\n--- EDITAR EQUIPO ---")
+    if len(equipos) == 0:
+        print("⚠ No hay equipos registrados.")
+        return
+    
+    listar_equipos()
+    try:
+        id_eq = int(input("\nSeleccione ID del equipo a editar: "))
+        equipo = next((e for e in equipos if e["id"] == id_eq), None)
+
+        if not equipo:
+            print("⚠ Equipo no encontrado.")
+            return
+
+        print(f"\nEditando equipo: {equipo['nombre']}")
+        print("(Deje en blanco para mantener el valor actual)")
+
+        nombre = input(f"Nombre [{equipo['nombre']}]: ").strip()
+        ubicacion = input(f"Ubicación [{equipo['ubicacion']}]: ").strip()
+        estado = input(f"Estado [{equipo['estado']}]: ").strip()
+        
+        if nombre:
+            equipo['nombre'] = nombre
+        if ubicacion:
+            equipo['ubicacion'] = ubicacion
+        if estado:
+            equipo['estado'] = estado
+
+        print("✔ Equipo actualizado correctamente.")
+        guardar_datos()
+    except ValueError:
+        print("⚠ ID inválido.")
+
+def eliminar_equipo():
+    print("\n--- ELIMINAR EQUIPO ---")
+    if len(equipos) == 0:
+        print("⚠ No hay equipos registrados.")
+        return
+    
+    listar_equipos()
+    try:
+        id_eq = int(input("\nSeleccione ID del equipo a eliminar: "))
+        equipo = next((e for e in equipos if e["id"] == id_eq), None)
+        
+        if not equipo:
+            print("⚠ Equipo no encontrado.")
+            return
+
+        confirmacion = input(f"¿Está seguro de eliminar '{equipo['nombre']}'? (s/n): ").lower()
+        if confirmacion == 's':
+            equipos.remove(equipo)
+            print("✔ Equipo eliminado correctamente.")
+            guardar_datos()
+        else:
+            print("Operación cancelada.")
+    except ValueError:
+        print("⚠ ID inválido.")
+
+def crear_ot():
+    print("\n--- CREAR ORDEN DE TRABAJO ---")
+    if len(equipos) == 0:
+        print("⚠ Debes registrar equipos antes de crear órdenes.")
+        return
+
+    listar_equipos()
+    try:
+        id_eq = int(input("\nSeleccione ID del equipo: "))
+        equipo = next((e for e in equipos if e["id"] == id_eq), None)
+        
+        if not equipo:
+            print("⚠ Equipo no encontrado.")
+            return
+        
+        descripcion = input("Descripción del trabajo a realizar: ").strip()
+        if not descripcion:
+            print("⚠ La descripción no puede estar vacía.")
+            return
+        
+        while True:
+            tipo = input("Tipo de mantenimiento (Preventivo/Correctivo/Predictivo): ").strip().capitalize()
+            if tipo in ["Preventivo", "Correctivo", "Predictivo"]:
+                break
+            print("⚠ Tipo inválido.")
+        
+        while True:
+            prioridad = input("Prioridad (Alta/Media/Baja): ").strip().capitalize()
+            if prioridad in ["Alta", "Media", "Baja"]:
+                break
+            print("⚠ Prioridad inválida.")
+        
+        ot = {
+            "id": siguiente_id_orden(),
+            "equipo_id": id_eq,
+            "equipo_nombre": equipo['nombre'],
+            "descripcion": descripcion,
+            "tipo": tipo,
+            "prioridad": prioridad,
+            "estado": "Pendiente",
+            "tecnico_asignado": None,
+            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "fecha_inicio": None,
+            "fecha_finalizacion": None,
+            "observaciones": ""
+        }
+
+        agregar_orden(ot)
+        print(f"✔ Orden de trabajo #{ot['id']} creada correctamente.")
+        guardar_datos()
+    except ValueError:
+        print("⚠ ID inválido.")
+
+def ver_ordenes():
+    print("\n--- ÓRDENAS DE TRABAJO ---")
+    if len(ordenes_trabajo) == 0:
+        print("No hay órdenes registradas.")
+        return
+
+    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<12} {'Estado':<15} {'Prioridad':<10} {'Técnico':<15}")
+    print("-" * 90)
+    for o in ordenes_trabajo:
+        tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
+        print(f"{o['id']:<5} {o['equipo_nombre']:<20} {o['tipo']:<12} {o['estado']:<15} {o['prioridad']:<10} {tecnico:<15}")
+
+def actualizar_estado_orden():
+    print("\n--- ACTUALIZAR ESTADO DE ORDEN ---")
+    if len(ordenes_trabajo) == 0:
+        print("⚠ No hay órdenes registradas.")
+        return
+    
+    ver_ordenes()
+    try:
+        id_ot = int(input("\nSeleccione ID de la orden: "))
+        orden = next((o for o in ordenes_trabajo if o["id"] == id_ot), None)
+        
+        if not orden:
+            print("⚠ Orden no encontrada.")
+            return
+        
+        print(f"\nEstado actual: {orden['estado']}")
+        print("Estados disponibles: Pendiente, En Progreso, Pausada, Completada, Cancelada")
+        nuevo_estado = input("Nuevo estado: ").strip().capitalize()
+        
+        if nuevo_estado in ESTADOS_ORDEN:
+            cambiar_estado_ordenes([orden['id']], nuevo_estado)
+            print(f"✔ Estado actualizado a: {nuevo_estado}")
+        else:
+            print("⚠ Estado inválido.")
+    except ValueError:
+        print("⚠ ID inválido.")
+            
+def registrar_tecnico():
+    print("\n--- REGISTRAR TÉCNICO ---")
+    nombre = input("Nombre completo del técnico: ").strip()
+    if not nombre:
+        print("⚠ El nombre no puede estar vacío.")
+        return
+    
+    especialidad = input("Especialidad: ").strip()
+    telefono = input("Teléfono: ").strip()
+    
+    tecnico = {
+        "id": siguiente_id("tecnicos"),
+        "nombre": nombre,
+        "especialidad": especialidad,
+        "telefono": telefono,
+        "estado": "Disponible"
+    }
+    
+    tecnicos.append(tecnico)
+    print(f"✔ Técnico '{nombre}' registrado correctamente.")
+    guardar_datos()
+
+def listar_tecnicos():
+    print("\n--- LISTA DE TÉCNICOS ---")
+    if len(tecnicos) == 0:
+        print("No hay técnicos registrados.")
+        return
+    
+    print(f"{'ID':<5} {'Nombre':<25} {'Especialidad':<20} {'Estado':<12}")
+    print("-" * 65)
+    for t in tecnicos:
+        print(f"{t['id']:<5} {t['nombre']:<25} {t['especialidad']:<20} {t['estado']:<12}")
+
+def asignar_tecnico():
+    print("\n--- ASIGNAR TÉCNICO A ORDEN ---")
+    if len(ordenes_trabajo) == 0:
+        print("⚠ No hay órdenes registradas.")
+        return
+    
+    if len(tecnicos) == 0:
+        print("⚠ No hay técnicos registrados.")
+        return
+    
+    ver_ordenes()
+    try:
+        id_ot = int(input("\nSeleccione ID de la orden: "))
+        orden = next((o for o in ordenes_trabajo if o["id"] == id_ot), None)
+        
+        if not orden:
+            print("⚠ Orden no encontrada.")
+            return
+        
+        listar_tecnicos()
+        id_tec = int(input("\nSeleccione ID del técnico: "))
+        tecnico = next((t for t in tecnicos if t["id"] == id_tec), None)
+        
+        if not tecnico:
+            print("⚠ Técnico no encontrado.")
+            return
+        
+        asignar_tecnico_ordenes([orden['id']], tecnico)
+        print(f"✔ Técnico {tecnico['nombre']} asignado a la orden #{orden['id']}")
+    except ValueError:
+        print("⚠ ID inválido.")
+
+def asignacion_automatica():
+    import Despacho_Mantenimiento as despacho
+    
+    print("\n--- ASIGNACIÓN AUTOMÁTICA DE TÉCNICOS ---")
+    if len(tecnicos) == 0:
+        print("⚠ No hay técnicos registrados.")
+        return
+    
+    resultado = despacho.proponer_asignacion()
+    propuestas = resultado['propuestas']
+    if not propuestas and not resultado['sin_asignar']:
+        print("No hay órdenes pendientes sin técnico.")
+        return
+    
+    print(f"{'ID':<5} {'Equipo':<20} {'Prioridad':<10} {'Técnico':<20} {'Especialidad':<15} {'Carga':<6}")
+    print("-" * 80)
+    for p in propuestas:
+        orden, tecnico = p['orden'], p['tecnico']
+        marca = " ✓" if p['coincide_especialidad'] else ""
+        print(f"{orden['id']:<5} {orden['equipo_nombre']:<20} {orden['prioridad']:<10} "
+              f"{tecnico['nombre']:<20} {tecnico['especialidad'] + marca:<15} "
+              f"{p['carga']}/{despacho.CAPACIDAD_TECNICO}")
+    if resultado['sin_asignar']:
+        print(f"\n{len(resultado['sin_asignar'])} órdenes quedan sin técnico (no hay cupo): "
+              + ", ".join(f"#{o['id']}" for o in resultado['sin_asignar']))
+    if not propuestas:
+        return
+    
+    if input("\n¿Aplicar esta asignación? (s/n): ").strip().lower() == "s":
+        aplicadas = despacho.aplicar_asignacion(propuestas)
+        print(f"✔ {aplicadas} órdenes asignadas.")
+    else:
+        print("Asignación cancelada.")
+
+def ver_cola_despacho():
+    import Despacho_Mantenimiento as despacho
+    
+    print("\n--- COLA DE DESPACHO ---")
+    texto = input("¿Cuántas órdenes mostrar? [10]: ").strip()
+    try:
+        cantidad = int(texto) if texto else 10
+    except ValueError:
+        print("⚠ Cantidad inválida.")
+        return
+    
+    siguientes = despacho.siguientes_ordenes(cantidad)
+    if not siguientes:
+        print("No hay órdenes pendientes.")
+        return
+    
+    criticidad = {e['id']: e.get('prioridad', "—") for e in equipos}
+    print(f"{'#':<4} {'ID':<5} {'Equipo':<20} {'Criticidad':<11} {'Prioridad':<10} "
+          f"{'Estado':<11} {'Creada':<20} {'Técnico':<15}")
+    print("-" * 100)
+    for posicion, o in enumerate(siguientes, 1):
+        print(f"{posicion:<4} {o['id']:<5} {o['equipo_nombre']:<20} "
+              f"{criticidad.get(o['equipo_id'], '—'):<11} {o['prioridad']:<10} {o['estado']:<11} "
+              f"{o['fecha_creacion'] or '—':<20} {o['tecnico_asignado'] or 'Sin asignar':<15}")
+    print(f"\nTotal en cola: {despacho.tamano_cola()} órdenes")
+
+def completar_orden():
+    print("\n--- COMPLETAR ORDEN DE TRABAJO ---")
+    if len(ordenes_trabajo) == 0:
+        print("⚠ No hay órdenes registradas.")
+        return
+    
+    ver_ordenes()
+    try:
+        id_ot = int(input("\nSeleccione ID de la orden a completar: "))
+        orden = next((o for o in ordenes_trabajo if o["id"] == id_ot), None)
+        
+        if not orden:
+            print("⚠ Orden no encontrada.")
+            return
+        
+        if orden['estado'] == "Completada":
+            print("⚠ Esta orden ya está completada.")
+            return
+        
+        observaciones = input("Observaciones finales: ").strip()
+        
+        completar_ordenes([orden['id']], observaciones)
+        print(f"✔ Orden #{orden['id']} completada exitosamente.")
+    except ValueError:
+        print("⚠ ID inválido.")
+
+def crear_plan_mantenimiento():
+    print("\n--- CREAR PLAN DE MANTENIMIENTO ---")
+    if len(equipos) == 0:
+        print("⚠ Debes registrar equipos antes de crear planes.")
+        return
+    
+    listar_equipos()
+    try:
+        id_eq = int(input("\nSeleccione ID del equipo: "))
+        equipo = next((e for e in equipos if e["id"] == id_eq), None)
+        
+        if not equipo:
+            print("⚠ Equipo no encontrado.")
+            return
+        
+        while True:
+            tipo = input("Tipo (Preventivo/Correctivo/Predictivo): ").strip().capitalize()
+            if tipo in ["Preventivo", "Correctivo", "Predictivo"]:
+                break
+            print("⚠ Tipo inválido.")
+        
+        descripcion = input("Descripción del plan: ").strip()
+        
+        if input("¿Se repite? (s/n): ").strip().lower() == "s":
+            crear_plan_recurrente(equipo, tipo, descripcion)
+            return
+        
+        mes = input("Mes programado (1-12): ").strip()
+        anio = input("Año (YYYY): ").strip()
+        
+        plan = {
+            "id": siguiente_id("planes_mantenimiento"),
+            "equipo_id": id_eq,
+            "equipo_nombre": equipo['nombre'],
+            "tipo": tipo,
+            "descripcion": descripcion,
+            "mes": int(mes),
+            "anio": int(anio),
+            "estado": "Programado",
+            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        planes_mantenimiento.append(plan)
+        print(f"✔ Plan de mantenimiento #{plan['id']} creado correctamente.")
+        guardar_datos()
+    except ValueError:
+        print("⚠ Entrada inválida.")
+
+def crear_plan_recurrente(equipo, tipo, descripcion):
+    import Planificacion_Mantenimiento as planificacion
+    
+    print("Frecuencias: " + ", ".join(FRECUENCIAS_PLAN))
+    frecuencia = input("Frecuencia: ").strip().lower()
+    intervalo = input("Cada cuántos (días/semanas/meses/horas de uso): ").strip()
+    uso_diario = input("Horas de uso por día: ").strip() if frecuencia == "uso" else None
+    fecha_inicio = input("Desde (AAAA-MM-DD): ").strip()
+    fecha_fin = input("Hasta (AAAA-MM-DD, Enter = sin fin): ").strip()
+    try:
+        regla = planificacion.crear_regla(equipo, tipo, descripcion, frecuencia, intervalo,
+                                          fecha_inicio, fecha_fin, uso_diario)
+    except ValueError as e:
+        print(f"⚠ {e}")
+        return
+    print(f"✔ Plan recurrente R{regla['id']} creado: {planificacion.describir_regla(regla)}")
+
+def ver_planes():
+    print("\n--- PLANES DE MANTENIMIENTO ---")
+    if len(planes_mantenimiento) == 0 and len(planes_recurrentes) == 0:
+        print("No hay planes registrados.")
+        return
+    
+    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<15} {'Mes':<8} {'Año':<8} {'Estado':<12}")
+    print("-" * 80)
+    for p in planes_mantenimiento:
+        print(f"{p['id']:<5} {p['equipo_nombre']:<20} {p['tipo']:<15} {p['mes']:<8} {p['anio']:<8} {p['estado']:<12}")
+    
+    if planes_recurrentes:
+        import Planificacion_Mantenimiento as planificacion
+        print("\nPlanes recurrentes:")
+        for r in planes_recurrentes:
+            print(f"R{r['id']:<4} {r['equipo_nombre']:<20} {r['tipo']:<15} {planificacion.describir_regla(r)}")
+
+def ver_carga_mensual():
+    print("\n--- CARGA DE TRABAJO MENSUAL ---")
+    mes = int(input("Ingrese el mes (1-12): "))
+    anio = int(input("Ingrese el año (YYYY): "))
+    
+    import Planificacion_Mantenimiento as planificacion
+    planes_mes = [p for p in planes_mantenimiento if p['mes'] == mes and p['anio'] == anio]
+    recurrentes = planificacion.ocurrencias_mes(mes, anio)
+    
+    if len(planes_mes) == 0 and len(recurrentes) == 0:
+        print(f"No hay planes programados para {mes}/{anio}")
+        return
+    
+    print(f"\n--- PLANES PROGRAMADOS PARA {mes}/{anio} ---")
+    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<15} {'Descripción':<30}")
+    print("-" * 75)
+    for p in planes_mes:
+        print(f"{p['id']:<5} {p['equipo_nombre']:<20} {p['tipo']:<15} {p['descripcion']:<30}")
+    for o in recurrentes:
+        print(f"{'R' + str(o['regla_id']):<5} {o['equipo_nombre']:<20} {o['tipo']:<15} "
+              f"{o['descripcion'] + ' (' + o['fecha'].strftime('%d/%m') + ')':<30}")
+
+def generar_ordenes_planes(solo_si_hay=False):
+    import Planificacion_Mantenimiento as planificacion
+    
+    try:
+        creadas = planificacion.emitir_ordenes()
+    except (OSError, TimeoutError) as e:
+        print(f"⚠ No se pudieron emitir las órdenes de los planes: {e}")
+        return
+    if creadas:
+        print(f"✔ Se generaron {len(creadas)} órdenes de trabajo a partir de los planes que vencen "
+              f"en los próximos {planificacion.ANTICIPACION_DIAS} días:")
+        for o in creadas:
+            print(f"  • #{o['id']} {o['equipo_nombre']} - {o['descripcion']} ({o['observaciones']})")
+    elif not solo_si_hay:
+        print("No hay planes pendientes de emitir.")
+
+def ver_historial():
+    print("\n--- HISTORIAL DE MANTENIMIENTO ---")
+    if len(historial_mantenimiento) == 0:
+        print("No hay registros en el historial.")
+        return
+    
+    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<12} {'Fecha':<20} {'Técnico':<15}")
+    print("-" * 80)
+    for h in historial_mantenimiento:
+        print(f"{h['orden_id']:<5} {h['equipo_nombre']:<20} {h['tipo']:<12} {h['fecha']:<20} {h['tecnico']:<15}")
+
+def estadisticas_generales():
+    print("\n--- ESTADÍSTICAS GENERALES ---")
+    resumen = resumen_estadisticas()
+    print(f"Total de equipos registrados: {resumen['equipos']}")
+    print(f"Total de órdenes de trabajo: {resumen['ordenes']}")
+    print(f"Total de técnicos: {resumen['tecnicos']}")
+    print(f"Mantenimientos completados: {resumen['historial']}")
+    print(f"Planes de mantenimiento: {resumen['planes']}")
+    
+    if resumen['ordenes'] > 0:
+        print("\nÓrdenes por estado:")
+        for estado, cantidad in resumen['por_estado'].items():
+            print(f"  • {estado}: {cantidad}")
+        print("\nPor tipo: " + " | ".join(f"{t}: {n}" for t, n in sorted(resumen['por_tipo'].items())))
+        print("Por prioridad: " + " | ".join(f"{p}: {n}" for p, n in resumen['por_prioridad'].items()))
+
+def ver_indicadores_confiabilidad():
+    print("\n--- INDICADORES DE CONFIABILIDAD ---")
+    try:
+        import Indicadores_Mantenimiento as ind
+    except ImportError:
+        print("⚠ Instale numpy para calcular los indicadores: pip install numpy")
+        return
+    
+    resultado = ind.calcular_indicadores(incluir_archivadas=True)
+    resumen = resultado['global']
+    
+    def fmt(valor, sufijo=""):
+        return "—" if valor is None else f"{valor}{sufijo}"
+    
+    print(f"MTTR global: {fmt(resumen['mttr_horas'], ' h')}")
+    print(f"MTBF global: {fmt(resumen['mtbf_horas'], ' h')}")
+    print(f"Disponibilidad: {fmt(resumen['disponibilidad'])}")
+    print(f"Preventivos/Correctivos: {resumen['preventivos']}/{resumen['correctivos']} "
+          f"(relación {fmt(resumen['relacion_prev_corr'])})")
+    
+    filas = [f for f in resultado['equipos'] if f['reparaciones'] or f['fallas'] or f['preventivos']]
+    if not filas:
+        return
+    print(f"\n{'ID':<5} {'Equipo':<20} {'MTTR (h)':<10} {'MTBF (h)':<10} {'Disp.':<8} {'Prev/Corr':<10}")
+    print("-" * 68)
+    for f in filas:
+        print(f"{f['equipo_id']:<5} {f['equipo_nombre']:<20} {fmt(f['mttr_horas']):<10} "
+              f"{fmt(f['mtbf_horas']):<10} {fmt(f['disponibilidad']):<8} {fmt(f['relacion_prev_corr']):<10}")
+    print(f"\nCalculado en {resultado['segundos']:.3f} s")
+
+def ver_resumen_mensual():
+    print("\n--- RESUMEN MENSUAL ---")
+    hoy = datetime.now()
+    try:
+        texto = input(f"Año [{hoy.year}]: ").strip()
+        anio = int(texto) if texto else hoy.year
+        texto = input(f"Mes (1-12) [{hoy.month}]: ").strip()
+        mes = int(texto) if texto else hoy.month
+    except ValueError:
+        print("⚠ Año o mes inválido.")
+        return
+    
+    titulos = {"tipo": "Por tipo", "tecnico": "Por técnico", "equipo": "Por equipo"}
+    hay_datos = False
+    for dimension, titulo in titulos.items():
+        filas = resumen_mensual(dimension, anio, mes)
+        if not filas:
+            continue
+        hay_datos = True
+        print(f"\n{titulo} ({mes:02d}/{anio}):")
+        for f in filas:
+            promedio = "—" if f['horas_promedio'] is None else f"{f['horas_promedio']} h"
+            print(f"  • {f['clave']:<20} {f['cantidad']:>5}  horas: {f['horas']:<10} promedio: {promedio}")
+    if not hay_datos:
+        print(f"⚠ No hay mantenimientos registrados en {mes:02d}/{anio}.")
+    
+    print("\nTendencia de los últimos 12 meses:")
+    serie = tendencia_mensual("tipo", 12, (anio, mes))
+    maximo = max((sum(c.values()) for _, _, c in serie), default=0) or 1
+    for a, m, cantidades in serie:
+        total = sum(cantidades.values())
+        print(f"  {m:02d}/{a}  {'█' * round(30 * total / maximo):<30} {total}")
+
+def ver_carga_tecnicos():
+    print("\n--- CARGA DE TRABAJO DE TÉCNICOS ---")
+    import Carga_Mantenimiento as carga
+    
+    desde = input("Desde (AAAA-MM-DD, Enter = últimos 30 días): ").strip()
+    try:
+        if desde:
+            hasta = input("Hasta (AAAA-MM-DD): ").strip()
+            inicio, fin = carga.ventana_personalizada(desde, hasta)
+        else:
+            inicio, fin = carga.ventana_predefinida("Últimos 30 días")
+    except ValueError:
+        print("⚠ Fechas inválidas.")
+        return
+    
+    filas = carga.carga_tecnicos(inicio, fin)
+    if not filas:
+        print("⚠ No hay técnicos registrados.")
+        return
+    print(f"\nVentana: {inicio:%Y-%m-%d} a {fin:%Y-%m-%d}")
+    print(f"{'Técnico':<25} {'Activas':<8} {'Órdenes':<8} {'Horas':<10} {'Utilización':<12}")
+    print("-" * 65)
+    for f in filas:
+        utilizacion = "—" if f['utilizacion'] is None else f"{f['utilizacion'] * 100:.1f}%"
+        print(f"{f['tecnico']:<25} {f['activas']:<8} {f['ordenes']:<8} {f['horas']:<10} {utilizacion:<12}")
+
+def ver_antiguedad_backlog():
+    print("\n--- ANTIGÜEDAD DEL BACKLOG ---")
+    import Backlog_Mantenimiento as backlog
+    
+    prioridades = list(RANGO_PRIORIDAD)
+    histograma = backlog.histograma_antiguedad()
+    print(f"{'Antigüedad':<18}" + "".join(f"{p:<8}" for p in prioridades) + "Total")
+    print("-" * 50)
+    for cubeta, por_prioridad in histograma.items():
+        print(f"{cubeta:<18}" + "".join(f"{por_prioridad.get(p, 0):<8}" for p in prioridades)
+              + str(sum(por_prioridad.values())))
+    
+    print("\nTamaño del backlog (últimas 12 semanas):")
+    serie = backlog.tendencia_ultimos_dias(78, paso=7)
+    maximo = max((tamano for _, tamano in serie), default=0) or 1
+    for fecha, tamano in serie:
+        print(f"  {fecha:%Y-%m-%d}  {'█' * round(30 * tamano / maximo):<30} {tamano}")
+
+def ver_simulacion_capacidad():
+    print("\n--- SIMULACIÓN DE CAPACIDAD ---")
+    try:
+        import Simulacion_Mantenimiento as sim
+    except ImportError:
+        print("⚠ Instale numpy para ejecutar la simulación: pip install numpy")
+        return
+    
+    texto = input(f"Cantidad de escenarios [{sim.ESCENARIOS}]: ").strip()
+    try:
+        escenarios = int(texto) if texto else sim.ESCENARIOS
+        if escenarios <= 0:
+            raise ValueError
+    except ValueError:
+        print("⚠ Cantidad inválida.")
+        return
+    
+    resultado = sim.simular(escenarios)
+    parametros = resultado['parametros']
+    print(f"{parametros['tecnicos']} técnicos | {parametros['tasa_correctivos_mes']} correctivos/mes | "
+          f"{parametros['planificados']} trabajos planificados | {parametros['abiertas']} órdenes abiertas")
+    print(f"{resultado['escenarios']:,} escenarios en {resultado['segundos']:.2f} s\n")
+    print(f"{'Mes':<9} {'Demanda P10':>12} {'P50':>10} {'P90':>10} {'Capacidad':>11} {'Sobrecarga':>11}")
+    print("-" * 68)
+    for i, (anio, mes) in enumerate(resultado['periodos']):
+        demanda = [resultado['demanda'][p][i] for p in sim.PERCENTILES]
+        print(f"{mes:02d}/{anio:<6} {demanda[0]:>12,.1f} {demanda[1]:>10,.1f} {demanda[2]:>10,.1f} "
+              f"{resultado['capacidad'][50][i]:>11,.1f} {resultado['prob_sobrecarga'][i] * 100:>10.1f}%")
+
+def ordenes_por_estado():
+    print("\n--- FILTRAR ÓRDENES POR ESTADO ---")
+    if len(ordenes_trabajo) == 0:
+        print("⚠ No hay órdenes registradas.")
+        return
+    
+    print("Estados: Pendiente, En progreso, Pausada, Completada, Cancelada")
+    estado = input("Ingrese el estado a filtrar: ").strip().capitalize()
+    
+    filtradas = [o for o in ordenes_trabajo if o['estado'].lower() == estado.lower()]
+    
+    if len(filtradas) == 0:
+        print(f"No hay órdenes con estado '{estado}'.")
+        return
+    
+    print(f"\n--- ÓRDENES CON ESTADO: {estado.upper()} ---")
+    print(f"{'ID':<5} {'Equipo':<20} {'Tipo':<12} {'Prioridad':<10} {'Técnico':<15}")
+    print("-" * 70)
+    for o in filtradas:
+        tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
+        print(f"{o['id']:<5} {o['equipo_nombre']:<20} {o['tipo']:<12} {o['prioridad']:<10} {tecnico:<15}")
+
+def main():
+    # Cargar datos al iniciar
+    cargar_datos()
+    generar_ordenes_planes(solo_si_hay=True)
+    
+    while True:
+        menu_principal()
+        opcion = input("\nSeleccione una opción: ").strip()
+
+        match opcion:
+            case "1":
+                registrar_equipo()
+            case "2":
+                listar_equipos()
+            case "3":
+                buscar_equipo()
+            case "4":
+                editar_equipo()
+            case "5":
+                eliminar_equipo()
+            case "6":
+                crear_ot()
+            case "7":
+                ver_ordenes()
+            case "8":
+                actualizar_estado_orden()
+            case "9":
+                asignar_tecnico()
+            case "10":
+                completar_orden()
+            case "11":
+                registrar_tecnico()
+            case "12":
+                listar_tecnicos()
+            case "13":
+                crear_plan_mantenimiento()
+            case "14":
+                ver_planes()
+            case "15":
+                ver_carga_mensual()
+            case "16":
+                ver_historial()
+            case "17":
+                estadisticas_generales()
+            case "18":
+                ordenes_por_estado()
+            case "21":
+                ver_indicadores_confiabilidad()
+            case "22":
+                ver_resumen_mensual()
+            case "23":
+                ver_carga_tecnicos()
+            case "24":
+                ver_antiguedad_backlog()
+            case "25":
+                generar_ordenes_planes()
+            case "26":
+                asignacion_automatica()
+            case "27":
+                ver_cola_despacho()
+            case "28":
+                ver_simulacion_capacidad()
+            case "19":
+                if guardar_datos():
+                    print("✔ Datos guardados correctamente.")
+                else:
+                    print("⚠ Error al guardar datos.")
+            case "20":
+                if cargar_datos():
+                    print("✔ Datos cargados correctamente.")
+                else:
+                    print("⚠ Error al cargar datos.")
+            case "0":
+                print("\n" + "="*60)
+                print("   Gracias por usar el Sistema de Gestión de Mantenimiento")
+                print("   ¡Hasta pronto! 👋")
+                print("="*60 + "\n")
+                # Guardar automáticamente al salir
+                guardar_datos()
+                break
+            case _:
+                print("⚠ Opción inválida. Por favor, seleccione una opción válida.")
+        
+        input("\nPresione Enter para continuar...")
+
+if __name__ == "__main__":
+    # Los módulos auxiliares hacen 'import Gestion_Mantenimiento': que reciban este
+    # mismo módulo (y sus datos) en lugar de una segunda copia vacía
+    sys.modules.setdefault("Gestion_Mantenimiento", sys.modules[__name__])
+    configurar_consola()
+    if "--serve" in sys.argv[1:]:
+        # Servicio sin interfaz: API REST en lugar del menú de consola
+        import Servidor_Mantenimiento
+        Servidor_Mantenimiento.ejecutar([a for a in sys.argv[1:] if a != "--serve"])
+    elif len(sys.argv) > 1:
+        # Comandos por lotes (sin menú ni pausas) para scripts y tareas programadas
+        import Comandos_Mantenimiento
+        sys.exit(Comandos_Mantenimiento.ejecutar(sys.argv[1:]))
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+Indicadores de confiabilidad del Sistema de Gestión de Mantenimiento
+Archivo: Indicadores_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Calcula por equipo el MTTR, el MTBF, la disponibilidad y la relación entre
+mantenimientos preventivos y correctivos a partir de ordenes_trabajo e
+historial_mantenimiento. Los registros se pasan una sola vez a arreglos de
+numpy y todas las agregaciones por equipo se hacen con operaciones
+vectorizadas (bincount, lexsort, diff), sin recorrer diccionarios por equipo.
+
+Definiciones usadas:
+  • MTTR: promedio de horas entre fecha_inicio y fecha_finalizacion de las
+    órdenes correctivas completadas.
+  • MTBF: promedio de horas entre dos correctivos consecutivos del mismo
+    equipo según la fecha del historial.
+  • Disponibilidad (inherente): MTBF / (MTBF + MTTR).
+  • Relación preventivo/correctivo: preventivos / correctivos del historial.
+
+Requiere numpy (pip install numpy).
+"""
+
+import time
+from itertools import repeat
+from operator import itemgetter
+
+import numpy as np
+
+import Gestion_Mantenimiento as gm
+
+
+# Códigos numéricos para comparar tipos y estados de forma vectorizada
+CODIGOS_TIPO = {tipo: i for i, tipo in enumerate(gm.TIPOS_MANTENIMIENTO)}
+CODIGOS_ESTADO = {estado: i for i, estado in enumerate(gm.ESTADOS_ORDEN)}
+
+
+def _codigos(valores, codigos):
+    """Convierte textos a un arreglo de códigos (-1 si el valor no es conocido)"""
+    return np.fromiter(map(codigos.get, valores, repeat(-1)), dtype=np.int8, count=len(valores))
+
+
+def _enteros(valores, vacio=-1):
+    try:
+        return np.array(valores, dtype=np.int64)
+    except TypeError:
+        # Hay vacíos (None): reemplazarlos antes de convertir
+        return np.array([vacio if v is None else v for v in valores], dtype=np.int64)
+
+
+def _fechas(valores, seleccion=None):
+    """Convierte textos 'AAAA-MM-DD HH:MM:SS' (o vacíos) a un arreglo datetime64[s].
+
+    'seleccion' (máscara booleana) permite convertir solo las filas necesarias.
+    """
+    arreglo = np.array(valores, dtype=object)
+    if seleccion is not None:
+        arreglo = arreglo[seleccion]
+    try:
+        return arreglo.astype("datetime64[s]")
+    except ValueError:
+        # Alguna fecha con formato inesperado: convertir una por una
+        fechas = [gm.parsear_fecha(v) for v in arreglo]
+        return np.array([f or "NaT" for f in fechas], dtype="datetime64[s]")
+
+
+def _horas(delta):
+    return delta.astype("timedelta64[s]").astype(np.float64) / 3600.0
+
+
+def _promedio(sumas, cantidades):
+    """Divide elemento a elemento dejando NaN donde no hay datos"""
+    resultado = np.full(len(sumas), np.nan)
+    hay = cantidades > 0
+    resultado[hay] = sumas[hay] / cantidades[hay]
+    return resultado
+
+
+def _valor(numero, decimales=2):
+    """Número listo para mostrar (None si no está definido)"""
+    return None if np.isnan(numero) else round(float(numero), decimales)
+
+
+def _valores(arreglo, decimales=2):
+    """Versión vectorizada de _valor para una columna completa"""
+    return [None if v != v else v for v in np.round(arreglo, decimales).tolist()]
+
+
+def _columnas(registros, *campos):
+    """Extrae columnas de una lista de diccionarios (map + itemgetter corren en C)"""
+    return [list(map(itemgetter(campo), registros)) for campo in campos]
+
+
+def _equipos_del_historial(historial, h_orden, orden_ids, orden_equipos):
+    """equipo_id de cada entrada del historial (-1 si no se puede determinar).
+
+    Se resuelve por orden_id contra las órdenes con una tabla de búsqueda
+    (o búsqueda binaria si los IDs son muy dispersos) y, si la orden ya no
+    existe, por el nombre del equipo.
+    """
+    resultado = np.full(len(h_orden), -1, dtype=np.int64)
+
+    if len(orden_ids) and len(h_orden):
+        maximo = int(max(orden_ids.max(), h_orden.max()))
+        if 0 <= orden_ids.min() and maximo <= 4 * (len(orden_ids) + len(h_orden)):
+            tabla = np.full(maximo + 1, -1, dtype=np.int64)
+            tabla[orden_ids] = orden_equipos
+            validos = h_orden >= 0
+            resultado[validos] = tabla[h_orden[validos]]
+        else:
+            orden = np.argsort(orden_ids, kind="stable")
+            ids_ordenados = orden_ids[orden]
+            pos = np.minimum(np.searchsorted(ids_ordenados, h_orden), len(ids_ordenados) - 1)
+            encontrado = ids_ordenados[pos] == h_orden
+            resultado[encontrado] = orden_equipos[orden[pos[encontrado]]]
+
+    pendientes = np.flatnonzero(resultado < 0)
+    if len(pendientes):
+        por_nombre = {e["nombre"]: e["id"] for e in gm.equipos}
+        for i in pendientes:
+            resultado[i] = por_nombre.get(historial[i].get("equipo_nombre"), -1)
+    return resultado
+
+
+def calcular_indicadores(ordenes=None, historial=None, incluir_archivadas=False):
+    """Calcula los indicadores de confiabilidad por equipo y globales.
+
+    Con incluir_archivadas (y sin 'ordenes') también se leen las órdenes del
+    archivo histórico (Archivado_Mantenimiento), para que el MTTR cubra el
+    mismo período que el historial.
+    Devuelve {"equipos": [fila por equipo], "global": {...}, "segundos": float}.
+    Los valores no definidos (p. ej. MTBF con menos de dos fallas) son None.
+    """
+    inicio_calculo = time.perf_counter()
+    if ordenes is None and incluir_archivadas:
+        import Archivado_Mantenimiento as archivado
+        ordenes = gm.ordenes_trabajo + list(archivado.ordenes_archivadas())
+    ordenes = gm.ordenes_trabajo if ordenes is None else ordenes
+    historial = gm.historial_mantenimiento if historial is None else historial
+
+    # --- Columnas de las órdenes ---
+    ids, equipos, tipos, estados, inicios, fines = _columnas(
+        ordenes, "id", "equipo_id", "tipo", "estado", "fecha_inicio", "fecha_finalizacion")
+    o_ids = _enteros(ids)
+    o_equipo = _enteros(equipos)
+    o_correctiva = ((_codigos(tipos, CODIGOS_TIPO) == CODIGOS_TIPO["Correctivo"])
+                    & (_codigos(estados, CODIGOS_ESTADO) == CODIGOS_ESTADO["Completada"]))
+    # Solo se convierten las fechas de las órdenes que entran en el MTTR
+    o_inicio = _fechas(inicios, o_correctiva)
+    o_fin = _fechas(fines, o_correctiva)
+
+    # --- Columnas del historial ---
+    h_ordenes, h_tipos, h_fechas = _columnas(historial, "orden_id", "tipo", "fecha")
+    h_equipo = _equipos_del_historial(historial, _enteros(h_ordenes), o_ids, o_equipo)
+    h_tipo = _codigos(h_tipos, CODIGOS_TIPO)
+
+    # --- Universo de equipos y códigos 0..k-1 ---
+    registrados = np.array([e["id"] for e in gm.equipos], dtype=np.int64)
+    h_valido = h_equipo >= 0
+    ids_equipo, codigos = np.unique(
+        np.concatenate([registrados, o_equipo, h_equipo[h_valido]]), return_inverse=True)
+    k = len(ids_equipo)
+    o_codigo = codigos[len(registrados):len(registrados) + len(o_equipo)]
+    h_codigo = np.zeros(len(h_equipo), dtype=np.int64)
+    h_codigo[h_valido] = codigos[len(registrados) + len(o_equipo):]
+
+    # --- MTTR: duración de las reparaciones correctivas ---
+    # Las comparaciones con NaT dan False: quedan fuera las órdenes sin fechas
+    valida = o_fin >= o_inicio
+    horas_rep = _horas(o_fin[valida] - o_inicio[valida])
+    cod_rep = o_codigo[o_correctiva][valida]
+    n_rep = np.bincount(cod_rep, minlength=k)
+    suma_rep = np.bincount(cod_rep, weights=horas_rep, minlength=k)
+    mttr = _promedio(suma_rep, n_rep)
+
+    # --- MTBF: tiempo entre correctivos consecutivos del mismo equipo ---
+    # Solo se convierten las fechas de los correctivos
+    es_correctivo = (h_tipo == CODIGOS_TIPO["Correctivo"]) & h_valido
+    c_tiempo = _fechas(h_fechas, es_correctivo)
+    con_fecha = ~np.isnat(c_tiempo)
+    c_codigo = h_codigo[es_correctivo][con_fecha]
+    c_tiempo = c_tiempo[con_fecha]
+    orden = np.lexsort((c_tiempo, c_codigo))
+    c_codigo, c_tiempo = c_codigo[orden], c_tiempo[orden]
+    mismo_equipo = c_codigo[1:] == c_codigo[:-1]
+    intervalos = _horas(np.diff(c_tiempo))[mismo_equipo]
+    cod_intervalos = c_codigo[1:][mismo_equipo]
+    n_int = np.bincount(cod_intervalos, minlength=k)
+    suma_int = np.bincount(cod_intervalos, weights=intervalos, minlength=k)
+    mtbf = _promedio(suma_int, n_int)
+    fallas = np.bincount(c_codigo, minlength=k)
+
+    # --- Disponibilidad y relación preventivo/correctivo ---
+    with np.errstate(invalid="ignore", divide="ignore"):
+        disponibilidad = mtbf / (mtbf + mttr)
+    por_tipo = {tipo: np.bincount(h_codigo[(h_tipo == codigo) & h_valido], minlength=k)
+                for tipo, codigo in CODIGOS_TIPO.items()}
+    preventivos, predictivos, correctivos = (por_tipo["Preventivo"], por_tipo["Predictivo"],
+                                             por_tipo["Correctivo"])
+    relacion = _promedio(preventivos.astype(np.float64), correctivos)
+
+    # --- Resultado ---
+    nombres = {e["id"]: e["nombre"] for e in gm.equipos}
+    if len(nombres) < k:
+        # Equipos que ya no están registrados: tomar el nombre de sus órdenes
+        nombres = {**dict(zip(equipos, map(itemgetter("equipo_nombre"), ordenes))), **nombres}
+
+    columnas = {
+        "equipo_id": ids_equipo.tolist(),
+        "reparaciones": n_rep.tolist(),
+        "mttr_horas": _valores(mttr),
+        "fallas": fallas.tolist(),
+        "mtbf_horas": _valores(mtbf),
+        "disponibilidad": _valores(disponibilidad, 4),
+        "preventivos": preventivos.tolist(),
+        "predictivos": predictivos.tolist(),
+        "correctivos": correctivos.tolist(),
+        "relacion_prev_corr": _valores(relacion),
+    }
+    columnas["equipo_nombre"] = [nombres.get(i, "") for i in columnas["equipo_id"]]
+    campos = ("equipo_id", "equipo_nombre", "reparaciones", "mttr_horas", "fallas", "mtbf_horas",
+              "disponibilidad", "preventivos", "predictivos", "correctivos", "relacion_prev_corr")
+    filas = [dict(zip(campos, valores)) for valores in zip(*(columnas[c] for c in campos))]
+
+    mttr_global = suma_rep.sum() / n_rep.sum() if n_rep.sum() else np.nan
+    mtbf_global = suma_int.sum() / n_int.sum() if n_int.sum() else np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        disponibilidad_global = mtbf_global / (mtbf_global + mttr_global)
+    total_corr = correctivos.sum()
+    resumen = {
+        "equipos": k,
+        "reparaciones": int(n_rep.sum()),
+        "mttr_horas": _valor(mttr_global),
+        "mtbf_horas": _valor(mtbf_global),
+        "disponibilidad": _valor(disponibilidad_global, 4),
+        "preventivos": int(preventivos.sum()),
+        "predictivos": int(predictivos.sum()),
+        "correctivos": int(total_corr),
+        "relacion_prev_corr": _valor(preventivos.sum() / total_corr) if total_corr else None,
+    }
+    return {"equipos": filas, "global": resumen,
+            "segundos": time.perf_counter() - inicio_calculo}
@@ -1,1560 +1,2891 @@
-"""
-Interfaz Gráfica para Sistema de Gestión de Mantenimiento
-Archivo: Interfaz_Mantenimiento.py
-Autor: Juan Esteban Jaramillo González
-
-Este módulo proporciona una interfaz gráfica usando Tkinter para el sistema
-de gestión de mantenimiento, integrándose con Gestion_Mantenimiento.py
-"""
-
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, simpledialog, filedialog
-from datetime import datetime
-import sys
-import os
-from datetime import datetime
-
-# ---------------- RUTAS Y RECURSOS (compatible con PyInstaller) ----------------
-def get_base_path():
-    """Devuelve la ruta base del proyecto o del ejecutable si está 'frozen'."""
-    if getattr(sys, "frozen", False):
-        # PyInstaller unpackea recursos en sys._MEIPASS
-        return getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
-    return os.path.dirname(os.path.abspath(__file__))
-
-def resource_path(rel_path: str) -> str:
-    """Construye la ruta absoluta para un recurso relativo al proyecto/exe."""
-    return os.path.join(get_base_path(), rel_path)
-
-# Directorio de datos (APPDATA en Windows) para almacenar JSON y exportaciones
-DATA_DIR = os.path.join(os.getenv("APPDATA") or get_base_path(), "Gestion_Mantenimiento")
-os.makedirs(DATA_DIR, exist_ok=True)
-
-# Forzar año a mostrar (usa 2025 como mínimo)
-DEFAULT_YEAR = 2025
-YEAR_DISPLAY = max(datetime.now().year, DEFAULT_YEAR)
-
-# Importar las estructuras de datos y funciones del módulo principal
-try:
-    import Gestion_Mantenimiento as gm
-except ImportError:
-    messagebox.showerror("Error", "No se pudo importar Gestion_Mantenimiento.py\nAsegúrate de que el archivo esté en la misma carpeta.")
-    sys.exit(1)
-
-class SistemaMantenimientoGUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Sistema de Gestión de Mantenimiento v2.0")
-        self.root.geometry("1200x700")
-        self.root.configure(bg="#f8f9fa")
-        
-        # Paleta de colores moderna
-        self.colors = {
-            'primary': '#667eea',      # Púrpura moderno
-            'secondary': '#764ba2',    # Púrpura oscuro
-            'accent': '#f093fb',       # Rosa suave
-            'success': '#4facfe',      # Azul cielo
-            'warning': '#ffd93d',      # Amarillo vibrante
-            'danger': '#ff6b6b',       # Rojo coral
-            'dark': '#2d3748',         # Gris oscuro
-            'light': '#f8f9fa',        # Blanco humo
-            'card_bg': '#ffffff',      # Blanco puro
-            'text': '#2d3748'          # Texto oscuro
-        }
-        
-        # Configurar estilo
-        self.configurar_estilos()
-        
-        # Crear interfaz principal
-        self.crear_interfaz()
-        
-    def configurar_estilos(self):
-        """Configura los estilos de la interfaz con diseño moderno"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Estilo para botones principales con gradiente visual
-        style.configure('Main.TButton', 
-                       font=('Segoe UI', 10, 'bold'),
-                       padding=12,
-                       background=self.colors['primary'],
-                       foreground='white',
-                       borderwidth=0,
-                       relief='flat')
-        style.map('Main.TButton',
-                 background=[('active', self.colors['secondary'])],
-                 foreground=[('active', 'white')])
-        
-        # Estilo para frames con bordes redondeados simulados
-        style.configure('Card.TFrame',
-                       background=self.colors['card_bg'],
-                       relief='flat',
-                       borderwidth=0)
-        
-        # Estilo para labels
-        style.configure('Modern.TLabel',
-                       font=('Segoe UI', 10),
-                       background=self.colors['card_bg'],
-                       foreground=self.colors['text'])
-        
-        # Estilo para pestañas moderno
-        style.configure('TNotebook', 
-                       background=self.colors['light'],
-                       borderwidth=0)
-        style.configure('TNotebook.Tab', 
-                       font=('Segoe UI', 11, 'bold'),
-                       padding=[25, 12],
-                       background=self.colors['light'],
-                       foreground=self.colors['text'])
-        style.map('TNotebook.Tab',
-                 background=[('selected', self.colors['primary'])],
-                 foreground=[('selected', 'white')],
-                 expand=[('selected', [1, 1, 1, 0])])
-        
-        # Estilo para Treeview moderno
-        style.configure('Treeview',
-                       background=self.colors['card_bg'],
-                       foreground=self.colors['text'],
-                       fieldbackground=self.colors['card_bg'],
-                       borderwidth=0,
-                       font=('Segoe UI', 9))
-        style.configure('Treeview.Heading',
-                       font=('Segoe UI', 10, 'bold'),
-                       background=self.colors['primary'],
-                       foreground='white',
-                       borderwidth=0)
-        style.map('Treeview.Heading',
-                 background=[('active', self.colors['secondary'])])
-        style.map('Treeview',
-                 background=[('selected', self.colors['success'])],
-                 foreground=[('selected', 'white')])
-        
-        # Estilo para Entry y Combobox
-        style.configure('Modern.TEntry',
-                       fieldbackground=self.colors['card_bg'],
-                       borderwidth=2,
-                       relief='solid')
-        style.configure('TCombobox',
-                       fieldbackground=self.colors['card_bg'],
-                       background=self.colors['card_bg'],
-                       borderwidth=1)
-        
-        # Estilo para LabelFrame
-        style.configure('Modern.TLabelframe',
-                       background=self.colors['card_bg'],
-                       borderwidth=0,
-                       relief='flat')
-        style.configure('Modern.TLabelframe.Label',
-                       font=('Segoe UI', 12, 'bold'),
-                       background=self.colors['card_bg'],
-                       foreground=self.colors['primary'])
-        
-    def crear_interfaz(self):
-        """Crea la interfaz principal con pestañas"""
-        # Frame superior con título - gradiente simulado con degradado
-        header_frame = tk.Frame(self.root, bg=self.colors['primary'], height=90)
-        header_frame.pack(fill='x', side='top')
-        header_frame.pack_propagate(False)
-        
-        # Contenedor para centrar el título
-        title_container = tk.Frame(header_frame, bg=self.colors['primary'])
-        title_container.pack(expand=True)
-        
-        titulo = tk.Label(title_container, 
-                         text="🔧 SISTEMA DE GESTIÓN DE MANTENIMIENTO",
-                         font=('Segoe UI', 22, 'bold'),
-                         bg=self.colors['primary'],
-                         fg='white')
-        titulo.pack(pady=10)
-        
-        subtitulo = tk.Label(title_container,
-                           text="Versión 2.0 | Gestión Profesional de Equipos",
-                           font=('Segoe UI', 10),
-                           bg=self.colors['primary'],
-                           fg='#e0e7ff')
-        subtitulo.pack()
-        
-        # Crear notebook (pestañas)
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Crear pestañas
-        self.crear_pestana_equipos()
-        self.crear_pestana_ordenes()
-        self.crear_pestana_tecnicos()
-        self.crear_pestana_planificacion()
-        self.crear_pestana_reportes()
-        self.crear_pestana_about()
-        
-        # Cargar datos al iniciar
-        gm.cargar_datos()
-        self.actualizar_todas_las_listas()
-        
-    def actualizar_todas_las_listas(self):
-        """Actualiza todas las listas de la interfaz"""
-        self.actualizar_lista_equipos()
-        self.actualizar_lista_ordenes()
-        self.actualizar_lista_tecnicos()
-    
-    # ==================== PESTAÑA DE PLANIFICACIÓN ====================
-    
-    def crear_pestana_planificacion(self):
-        """Crea la pestaña de planificación de mantenimiento"""
-        tab_plan = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(tab_plan, text='📅 Planificación')
-        
-        # Frame superior - Crear plan
-        frame_form = ttk.LabelFrame(tab_plan, text="Crear Plan de Mantenimiento", 
-                                   padding=20, style='Modern.TLabelframe')
-        frame_form.pack(fill='x', padx=10, pady=10)
-        
-        # Primera fila
-        frame_row1 = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_row1.pack(fill='x', pady=8)
-        
-        ttk.Label(frame_row1, text="Equipo:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_plan_equipo = ttk.Combobox(frame_row1, state='readonly', width=35,
-                                             font=('Segoe UI', 10))
-        self.combo_plan_equipo.pack(side='left', padx=8)
-        
-        ttk.Label(frame_row1, text="Tipo:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_plan_tipo = ttk.Combobox(frame_row1,
-                                           values=["Preventivo", "Correctivo", "Predictivo"],
-                                           state='readonly', width=15,
-                                           font=('Segoe UI', 10))
-        self.combo_plan_tipo.pack(side='left', padx=8)
-        self.combo_plan_tipo.set("Preventivo")
-        
-        ttk.Label(frame_row1, text="Mes:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_plan_mes = ttk.Combobox(frame_row1,
-                                          values=list(range(1, 13)),
-                                          state='readonly', width=8,
-                                          font=('Segoe UI', 10))
-        self.combo_plan_mes.pack(side='left', padx=8)
-        self.combo_plan_mes.set(datetime.now().month)
-        
-        ttk.Label(frame_row1, text="Año:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.entry_plan_anio = ttk.Entry(frame_row1, width=10, font=('Segoe UI', 10))
-        self.entry_plan_anio.pack(side='left', padx=8)
-        self.entry_plan_anio.insert(0, datetime.now().year)
-        
-        # Segunda fila - Descripción
-        frame_row2 = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_row2.pack(fill='x', pady=8)
-        
-        ttk.Label(frame_row2, text="Descripción:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.entry_plan_descripcion = ttk.Entry(frame_row2, width=80, font=('Segoe UI', 10))
-        self.entry_plan_descripcion.pack(side='left', padx=8, fill='x', expand=True)
-        
-        # Botones
-        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_botones.pack(pady=15)
-        
-        btn_crear = tk.Button(frame_botones, text="➕ Crear Plan", 
-                            command=self.crear_plan_mantenimiento,
-                            font=('Segoe UI', 10, 'bold'),
-                            bg=self.colors['success'], fg='white',
-                            padx=20, pady=10, relief='flat', cursor='hand2')
-        btn_crear.pack(side='left', padx=5)
-        btn_crear.bind('<Enter>', lambda e: btn_crear.config(bg=self._darken_color(self.colors['success'])))
-        btn_crear.bind('<Leave>', lambda e: btn_crear.config(bg=self.colors['success']))
-        
-        # Frame medio - Filtro de carga mensual
-        frame_filtro = ttk.LabelFrame(tab_plan, text="Ver Carga de Trabajo Mensual",
-                                     padding=15, style='Modern.TLabelframe')
-        frame_filtro.pack(fill='x', padx=10, pady=10)
-        
-        filtro_container = tk.Frame(frame_filtro, bg=self.colors['card_bg'])
-        filtro_container.pack(fill='x')
-        
-        ttk.Label(filtro_container, text="Mes:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_filtro_mes = ttk.Combobox(filtro_container,
-                                            values=list(range(1, 13)),
-                                            state='readonly', width=8,
-                                            font=('Segoe UI', 10))
-        self.combo_filtro_mes.pack(side='left', padx=8)
-        self.combo_filtro_mes.set(datetime.now().month)
-        
-        ttk.Label(filtro_container, text="Año:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.entry_filtro_anio = ttk.Entry(filtro_container, width=10, font=('Segoe UI', 10))
-        self.entry_filtro_anio.pack(side='left', padx=8)
-        self.entry_filtro_anio.insert(0, datetime.now().year)
-        
-        btn_filtrar = tk.Button(filtro_container, text="🔍 Ver Carga Mensual",
-                              command=self.ver_carga_mensual,
-                              font=('Segoe UI', 9, 'bold'),
-                              bg=self.colors['primary'], fg='white',
-                              padx=20, pady=8, relief='flat', cursor='hand2')
-        btn_filtrar.pack(side='left', padx=8)
-        
-        btn_todos = tk.Button(filtro_container, text="📋 Ver Todos los Planes",
-                            command=self.actualizar_lista_planes,
-                            font=('Segoe UI', 9, 'bold'),
-                            bg=self.colors['dark'], fg='white',
-                            padx=20, pady=8, relief='flat', cursor='hand2')
-        btn_todos.pack(side='left', padx=8)
-        
-        # Frame inferior - Lista de planes
-        frame_lista = ttk.LabelFrame(tab_plan, text="Planes de Mantenimiento",
-                                    padding=20, style='Modern.TLabelframe')
-        frame_lista.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        columnas = ('ID', 'Equipo', 'Tipo', 'Mes', 'Año', 'Estado', 'Descripción')
-        self.tree_planes = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=12)
-        
-        anchos = [50, 150, 120, 60, 60, 100, 300]
-        for col, ancho in zip(columnas, anchos):
-            self.tree_planes.heading(col, text=col)
-            self.tree_planes.column(col, width=ancho)
-        
-        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_planes.yview)
-        self.tree_planes.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree_planes.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-
-        # Botón para eliminar plan seleccionado
-        btn_frame_plan = tk.Frame(frame_lista, bg=self.colors['card_bg'])
-        btn_frame_plan.pack(fill='x', pady=10)
-        btn_eliminar_plan = tk.Button(btn_frame_plan, text="🗑️ Eliminar Plan Seleccionado",
-                                      command=self.eliminar_plan_mantenimiento,
-                                      font=('Segoe UI', 10, 'bold'),
-                                      bg=self.colors['danger'], fg='white',
-                                      padx=20, pady=8, relief='flat', cursor='hand2')
-        btn_eliminar_plan.pack(side='left', padx=5)
-        btn_eliminar_plan.bind('<Enter>', lambda e: btn_eliminar_plan.config(bg=self._darken_color(self.colors['danger'])))
-        btn_eliminar_plan.bind('<Leave>', lambda e: btn_eliminar_plan.config(bg=self.colors['danger']))
-        
-        self.actualizar_lista_planes()
-        self.actualizar_combo_plan_equipos()
-    
-    def crear_plan_mantenimiento(self):
-        """Crea un nuevo plan de mantenimiento"""
-        if len(gm.equipos) == 0:
-            messagebox.showwarning("Advertencia", "Debe registrar equipos antes de crear planes")
-            return
-        
-        equipo_seleccionado = self.combo_plan_equipo.get()
-        if not equipo_seleccionado:
-            messagebox.showwarning("Advertencia", "Seleccione un equipo")
-            return
-        
-        descripcion = self.entry_plan_descripcion.get().strip()
-        if not descripcion:
-            messagebox.showwarning("Advertencia", "Ingrese una descripción")
-            return
-        
-        try:
-            mes = int(self.combo_plan_mes.get())
-            anio = int(self.entry_plan_anio.get())
-            
-            if mes < 1 or mes > 12:
-                messagebox.showwarning("Advertencia", "El mes debe estar entre 1 y 12")
-                return
-            
-            # Obtener ID del equipo
-            id_equipo = int(equipo_seleccionado.split(" - ")[0])
-            equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
-            
-            plan = {
-                "id": len(gm.planes_mantenimiento) + 1,
-                "equipo_id": id_equipo,
-                "equipo_nombre": equipo['nombre'],
-                "tipo": self.combo_plan_tipo.get(),
-                "descripcion": descripcion,
-                "mes": mes,
-                "anio": anio,
-                "estado": "Programado",
-                "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            gm.planes_mantenimiento.append(plan)
-            gm.guardar_datos()
-            
-            messagebox.showinfo("Éxito", f"Plan de mantenimiento #{plan['id']} creado correctamente")
-            self.entry_plan_descripcion.delete(0, tk.END)
-            self.actualizar_lista_planes()
-            
-        except ValueError:
-            messagebox.showerror("Error", "Año inválido")
-    
-    def ver_carga_mensual(self):
-        """Filtra planes por mes y año"""
-        try:
-            mes = int(self.combo_filtro_mes.get())
-            anio = int(self.entry_filtro_anio.get())
-            
-            self.tree_planes.delete(*self.tree_planes.get_children())
-            
-            planes_filtrados = [p for p in gm.planes_mantenimiento 
-                              if p['mes'] == mes and p['anio'] == anio]
-            
-            if len(planes_filtrados) == 0:
-                messagebox.showinfo("Información", 
-                                  f"No hay planes programados para {mes}/{anio}")
-                return
-            
-            for p in planes_filtrados:
-                self.tree_planes.insert('', 'end', values=(
-                    p['id'],
-                    p['equipo_nombre'],
-                    p['tipo'],
-                    p['mes'],
-                    p['anio'],
-                    p['estado'],
-                    p['descripcion']
-                ))
-            
-            messagebox.showinfo("Carga Mensual", 
-                              f"Se encontraron {len(planes_filtrados)} planes para {mes}/{anio}")
-            
-        except ValueError:
-            messagebox.showerror("Error", "Mes o año inválido")
-    
-    def actualizar_lista_planes(self):
-        """Actualiza la lista de planes de mantenimiento"""
-        self.tree_planes.delete(*self.tree_planes.get_children())
-        
-        for p in gm.planes_mantenimiento:
-            self.tree_planes.insert('', 'end', values=(
-                p['id'],
-                p['equipo_nombre'],
-                p['tipo'],
-                p['mes'],
-                p['anio'],
-                p['estado'],
-                p['descripcion']
-            ))
-    
-    def actualizar_combo_plan_equipos(self):
-        """Actualiza el combobox de equipos para planificación"""
-        equipos_lista = [f"{eq['id']} - {eq['nombre']}" for eq in gm.equipos]
-        self.combo_plan_equipo['values'] = equipos_lista
-    
-    # ==================== PESTAÑA ABOUT ====================
-    
-    def crear_pestana_about(self):
-        """Crea la pestaña About con información del proyecto"""
-        tab_about = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(tab_about, text='ℹ️ About')
-        
-        # Contenedor principal centrado
-        main_container = tk.Frame(tab_about, bg=self.colors['card_bg'])
-        main_container.pack(expand=True, fill='both', padx=40, pady=40)
-        
-        # Título
-        title_frame = tk.Frame(main_container, bg=self.colors['primary'], height=80)
-        title_frame.pack(fill='x', pady=(0, 30))
-        title_frame.pack_propagate(False)
-        
-        tk.Label(title_frame, 
-                text="Sistema de Gestión de Mantenimiento",
-                font=('Segoe UI', 20, 'bold'),
-                bg=self.colors['primary'],
-                fg='white').pack(expand=True)
-        
-        # Logos
-        logos_frame = tk.Frame(main_container, bg=self.colors['card_bg'])
-        logos_frame.pack(pady=20)
-        
-        # Intentar cargar logos
-        try:
-            from PIL import Image, ImageTk
-            
-            # Logo universidad
-            logo_uni_frame = tk.Frame(logos_frame, bg=self.colors['card_bg'])
-            logo_uni_frame.pack(side='left', padx=30)
-            
-            if os.path.exists(resource_path("unnamed.png")):
-                img_uni = Image.open(resource_path("unnamed.png"))
-                img_uni = img_uni.resize((150, 150), Image.Resampling.LANCZOS)
-                photo_uni = ImageTk.PhotoImage(img_uni)
-                label_uni = tk.Label(logo_uni_frame, image=photo_uni, bg=self.colors['card_bg'])
-                label_uni.image = photo_uni
-                label_uni.pack()
-            
-            tk.Label(logo_uni_frame, 
-                    text="Fundación Universitaria\nTecnológico Comfenalco",
-                    font=('Segoe UI', 10, 'bold'),
-                    bg=self.colors['card_bg'],
-                    fg=self.colors['text']).pack(pady=10)
-            
-            # Logo empresa
-            logo_emp_frame = tk.Frame(logos_frame, bg=self.colors['card_bg'])
-            logo_emp_frame.pack(side='right', padx=30)
-            
-            if os.path.exists(resource_path("LOGO OSCURO SIN FONDO.png")):
-                img_emp = Image.open(resource_path("LOGO OSCURO SIN FONDO.png"))
-                img_emp = img_emp.resize((150, 150), Image.Resampling.LANCZOS)
-                photo_emp = ImageTk.PhotoImage(img_emp)
-                label_emp = tk.Label(logo_emp_frame, image=photo_emp, bg=self.colors['card_bg'])
-                label_emp.image = photo_emp
-                label_emp.pack()
-            
-            tk.Label(logo_emp_frame,
-                    text="Industrias Mecánicas\nAndinas SAS",
-                    font=('Segoe UI', 10, 'bold'),
-                    bg=self.colors['card_bg'],
-                    fg=self.colors['text']).pack(pady=10)
-                    
-        except ImportError:
-            tk.Label(logos_frame,
-                    text="⚠ Instale Pillow para ver los logos: pip install Pillow",
-                    font=('Segoe UI', 10),
-                    bg=self.colors['card_bg'],
-                    fg=self.colors['warning']).pack()
-        
-        # Información del proyecto (usar ScrolledText para que haga scroll)
-        info_frame = tk.Frame(main_container, bg=self.colors['light'], relief='flat', bd=1)
-        info_frame.pack(fill='both', expand=True, pady=30, padx=50)
-        
-        info_text = f"""
-        
-        👨‍💻 DESARROLLADOR
-        Juan Esteban Jaramillo González
-        
-        🏢 EMPRESA
-        Industrias Mecánicas Andinas SAS
-        
-        🎓 INSTITUCIÓN EDUCATIVA
-        Fundación Universitaria Tecnológico Comfenalco
-        
-        📅 VERSIÓN
-        2.0 - Sistema de Gestión de Mantenimiento
-        
-        📝 DESCRIPCIÓN
-        Sistema desarrollado como proyecto académico para la gestión
-        integral de mantenimiento industrial, incluyendo planificación,
-        órdenes de trabajo, gestión de técnicos y reportes estadísticos.
-        
-        🔧 CARACTERÍSTICAS
-        • Gestión de equipos y órdenes de trabajo
-        • Planificación de mantenimiento preventivo, correctivo y predictivo
-        • Gestión de técnicos y asignaciones
-        • Persistencia de datos en JSON
-        • Exportación a Excel
-        • Reportes y estadísticas
-        
-        © {YEAR_DISPLAY} - Todos los derechos reservados
-        """
-        
-        txt_info = scrolledtext.ScrolledText(info_frame,
-                                            wrap='word',
-                                            font=('Segoe UI', 11),
-                                            bg=self.colors['light'],
-                                            fg=self.colors['text'],
-                                            bd=0,
-                                            highlightthickness=0,
-                                            padx=20,
-                                            pady=20)
-        txt_info.insert('1.0', info_text.strip())
-        txt_info.configure(state='disabled')  # sólo lectura
-        txt_info.pack(fill='both', expand=True)
-        
-        # Botón de cerrar
-        btn_cerrar = tk.Button(main_container, text="✖ Cerrar",
-                              command=lambda: self.notebook.select(0),
-                              font=('Segoe UI', 10, 'bold'),
-                              bg=self.colors['danger'], fg='white',
-                              padx=30, pady=10, relief='flat', cursor='hand2')
-        btn_cerrar.pack(pady=20)
-        self.actualizar_combo_equipos()
-        if hasattr(self, 'tree_planes'):
-            self.actualizar_lista_planes()
-        if hasattr(self, 'tree_historial'):
-            self.actualizar_historial()
-        if hasattr(self, 'label_stats'):
-            self.actualizar_estadisticas()
-        
-    def crear_pestana_equipos(self):
-        """Crea la pestaña de gestión de equipos"""
-        tab_equipos = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(tab_equipos, text='📦 Equipos')
-        
-        # Frame izquierdo - Formulario con estilo moderno
-        frame_form = ttk.LabelFrame(tab_equipos, text="Registrar/Editar Equipo", 
-                                   padding=20, style='Modern.TLabelframe')
-        frame_form.pack(side='left', fill='both', expand=True, padx=10, pady=10)
-        
-        # Campos del formulario con mejor espaciado
-        campos = [
-            ("Nombre:", "entry_equipo_nombre"),
-            ("Ubicación:", "entry_equipo_ubicacion"),
-            ("Descripción:", "entry_equipo_descripcion"),
-            ("Marca:", "entry_equipo_marca"),
-            ("Modelo:", "entry_equipo_modelo"),
-            ("Número de Serie:", "entry_equipo_serie")
-        ]
-        
-        for idx, (label_text, attr_name) in enumerate(campos):
-            label = ttk.Label(frame_form, text=label_text, style='Modern.TLabel')
-            label.grid(row=idx, column=0, sticky='w', pady=8, padx=5)
-            
-            entry = ttk.Entry(frame_form, width=35, font=('Segoe UI', 10))
-            entry.grid(row=idx, column=1, pady=8, padx=5, sticky='ew')
-            setattr(self, attr_name, entry)
-        
-        ttk.Label(frame_form, text="Prioridad:", style='Modern.TLabel').grid(
-            row=6, column=0, sticky='w', pady=8, padx=5)
-        self.combo_equipo_prioridad = ttk.Combobox(frame_form, 
-                                                   values=["Alta", "Media", "Baja"],
-                                                   state='readonly',
-                                                   width=33,
-                                                   font=('Segoe UI', 10))
-        self.combo_equipo_prioridad.grid(row=6, column=1, pady=8, padx=5, sticky='ew')
-        self.combo_equipo_prioridad.set("Media")
-        
-        frame_form.columnconfigure(1, weight=1)
-        
-        # Botones con iconos y colores modernos
-        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_botones.grid(row=7, column=0, columnspan=2, pady=25)
-        
-        botones = [
-            ("➕ Registrar", self.registrar_equipo, self.colors['success']),
-            ("🔄 Actualizar", self.actualizar_equipo, self.colors['primary']),
-            ("🗑️ Eliminar", self.eliminar_equipo, self.colors['danger']),
-            ("🆕 Limpiar", self.limpiar_formulario_equipo, self.colors['dark'])
-        ]
-        
-        for texto, comando, color in botones:
-            btn = tk.Button(frame_botones, text=texto, command=comando,
-                          font=('Segoe UI', 10, 'bold'),
-                          bg=color, fg='white',
-                          padx=15, pady=10,
-                          relief='flat',
-                          cursor='hand2',
-                          activebackground=self.colors['secondary'],
-                          activeforeground='white')
-            btn.pack(side='left', padx=5)
-            
-            # Efecto hover
-            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
-            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
-        
-        # Frame derecho - Lista de equipos
-        frame_lista = ttk.LabelFrame(tab_equipos, text="Lista de Equipos", 
-                                    padding=20, style='Modern.TLabelframe')
-        frame_lista.pack(side='right', fill='both', expand=True, padx=10, pady=10)
-        
-        # Buscador moderno
-        frame_buscar = tk.Frame(frame_lista, bg=self.colors['card_bg'])
-        frame_buscar.pack(fill='x', pady=(0, 15))
-        
-        search_container = tk.Frame(frame_buscar, bg=self.colors['light'], 
-                                   relief='flat', bd=1)
-        search_container.pack(side='left', fill='x', expand=True)
-        
-        ttk.Label(search_container, text="🔍", background=self.colors['light'],
-                 font=('Segoe UI', 12)).pack(side='left', padx=8)
-        self.entry_buscar_equipo = tk.Entry(search_container, 
-                                           font=('Segoe UI', 10),
-                                           bg=self.colors['light'],
-                                           relief='flat',
-                                           bd=0)
-        self.entry_buscar_equipo.pack(side='left', fill='x', expand=True, pady=8)
-        
-        btn_buscar = tk.Button(frame_buscar, text="Buscar", command=self.buscar_equipo,
-                              font=('Segoe UI', 9, 'bold'),
-                              bg=self.colors['primary'], fg='white',
-                              padx=15, pady=6, relief='flat', cursor='hand2')
-        btn_buscar.pack(side='left', padx=5)
-        
-        btn_todos = tk.Button(frame_buscar, text="Mostrar Todos", 
-                            command=self.actualizar_lista_equipos,
-                            font=('Segoe UI', 9, 'bold'),
-                            bg=self.colors['dark'], fg='white',
-                            padx=15, pady=6, relief='flat', cursor='hand2')
-        btn_todos.pack(side='left', padx=5)
-        
-        # Treeview para equipos
-        columnas = ('ID', 'Nombre', 'Ubicación', 'Estado', 'Prioridad')
-        self.tree_equipos = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=20)
-        
-        for col in columnas:
-            self.tree_equipos.heading(col, text=col)
-            self.tree_equipos.column(col, width=120)
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_equipos.yview)
-        self.tree_equipos.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree_equipos.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        # Evento de selección
-        self.tree_equipos.bind('<<TreeviewSelect>>', self.seleccionar_equipo)
-        
-        # Cargar equipos
-        self.actualizar_lista_equipos()
-        
-    def crear_pestana_ordenes(self):
-        """Crea la pestaña de órdenes de trabajo"""
-        tab_ordenes = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(tab_ordenes, text='🔧 Órdenes de Trabajo')
-        
-        # Frame superior - Formulario con estilo moderno
-        frame_form = ttk.LabelFrame(tab_ordenes, text="Nueva Orden de Trabajo", 
-                                   padding=20, style='Modern.TLabelframe')
-        frame_form.pack(fill='x', padx=10, pady=10)
-        
-        # Primera fila con mejor diseño
-        frame_row1 = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_row1.pack(fill='x', pady=8)
-        
-        ttk.Label(frame_row1, text="Equipo:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_ot_equipo = ttk.Combobox(frame_row1, state='readonly', width=35,
-                                           font=('Segoe UI', 10))
-        self.combo_ot_equipo.pack(side='left', padx=8)
-        
-        ttk.Label(frame_row1, text="Tipo:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_ot_tipo = ttk.Combobox(frame_row1, 
-                                         values=["Preventivo", "Correctivo", "Predictivo"],
-                                         state='readonly', width=15,
-                                         font=('Segoe UI', 10))
-        self.combo_ot_tipo.pack(side='left', padx=8)
-        self.combo_ot_tipo.set("Preventivo")
-        
-        ttk.Label(frame_row1, text="Prioridad:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.combo_ot_prioridad = ttk.Combobox(frame_row1,
-                                              values=["Alta", "Media", "Baja"],
-                                              state='readonly', width=12,
-                                              font=('Segoe UI', 10))
-        self.combo_ot_prioridad.pack(side='left', padx=8)
-        self.combo_ot_prioridad.set("Media")
-        
-        # Segunda fila - Descripción
-        frame_row2 = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_row2.pack(fill='x', pady=8)
-        
-        ttk.Label(frame_row2, text="Descripción:", style='Modern.TLabel').pack(side='left', padx=8)
-        self.entry_ot_descripcion = ttk.Entry(frame_row2, width=100, font=('Segoe UI', 10))
-        self.entry_ot_descripcion.pack(side='left', padx=8, fill='x', expand=True)
-        
-        # Botones modernos
-        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_botones.pack(pady=15)
-        
-        botones = [
-            ("➕ Crear Orden", self.crear_orden_trabajo, self.colors['success']),
-            ("✅ Completar Orden", self.completar_orden_trabajo, self.colors['primary']),
-            ("👷 Asignar Técnico", self.asignar_tecnico_orden, self.colors['warning']),
-            ("🔄 Cambiar Estado", self.cambiar_estado_orden, self.colors['dark'])
-        ]
-        # Añadir botón Eliminar Orden al array de botones
-        botones.append(("🗑️ Eliminar Orden", self.eliminar_orden_trabajo, self.colors['danger']))
-        
-        for texto, comando, color in botones:
-            btn = tk.Button(frame_botones, text=texto, command=comando,
-                          font=('Segoe UI', 10, 'bold'),
-                          bg=color, fg='white',
-                          padx=18, pady=10,
-                          relief='flat',
-                          cursor='hand2',
-                          activebackground=self.colors['secondary'],
-                          activeforeground='white')
-            btn.pack(side='left', padx=5)
-            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
-            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
-        
-        # Frame inferior - Lista de órdenes
-        frame_lista = ttk.LabelFrame(tab_ordenes, text="Órdenes de Trabajo", 
-                                    padding=20, style='Modern.TLabelframe')
-        frame_lista.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Filtro por estado moderno
-        frame_filtro = tk.Frame(frame_lista, bg=self.colors['card_bg'])
-        frame_filtro.pack(fill='x', pady=(0, 15))
-        
-        ttk.Label(frame_filtro, text="Filtrar por estado:", 
-                 style='Modern.TLabel', font=('Segoe UI', 10, 'bold')).pack(side='left', padx=8)
-        self.combo_filtro_estado = ttk.Combobox(frame_filtro,
-                                               values=["Todos", "Pendiente", "En progreso", "Pausada", "Completada", "Cancelada"],
-                                               state='readonly', width=18,
-                                               font=('Segoe UI', 10))
-        self.combo_filtro_estado.pack(side='left', padx=8)
-        self.combo_filtro_estado.set("Todos")
-        
-        btn_filtrar = tk.Button(frame_filtro, text="🔍 Filtrar", 
-                              command=self.filtrar_ordenes,
-                              font=('Segoe UI', 9, 'bold'),
-                              bg=self.colors['primary'], fg='white',
-                              padx=20, pady=8, relief='flat', cursor='hand2')
-        btn_filtrar.pack(side='left', padx=5)
-        
-        # Treeview para órdenes
-        columnas = ('ID', 'Equipo', 'Tipo', 'Estado', 'Prioridad', 'Técnico')
-        self.tree_ordenes = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=15)
-        
-        for col in columnas:
-            self.tree_ordenes.heading(col, text=col)
-            self.tree_ordenes.column(col, width=150)
-        
-        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_ordenes.yview)
-        self.tree_ordenes.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree_ordenes.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        # Actualizar listas
-        self.actualizar_combo_equipos()
-        self.actualizar_lista_ordenes()
-        
-    def crear_pestana_tecnicos(self):
-        """Crea la pestaña de gestión de técnicos"""
-        tab_tecnicos = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(tab_tecnicos, text='👷 Técnicos')
-        
-        # Frame izquierdo - Formulario moderno
-        frame_form = ttk.LabelFrame(tab_tecnicos, text="Registrar Técnico", 
-                                   padding=20, style='Modern.TLabelframe')
-        frame_form.pack(side='left', fill='both', expand=True, padx=10, pady=10)
-        
-        # Campos del formulario
-        campos = [
-            ("Nombre Completo:", "entry_tecnico_nombre"),
-            ("Especialidad:", "entry_tecnico_especialidad"),
-            ("Teléfono:", "entry_tecnico_telefono")
-        ]
-        
-        for idx, (label_text, attr_name) in enumerate(campos):
-            label = ttk.Label(frame_form, text=label_text, style='Modern.TLabel')
-            label.grid(row=idx, column=0, sticky='w', pady=12, padx=5)
-            
-            entry = ttk.Entry(frame_form, width=40, font=('Segoe UI', 10))
-            entry.grid(row=idx, column=1, pady=12, padx=5, sticky='ew')
-            setattr(self, attr_name, entry)
-        
-        frame_form.columnconfigure(1, weight=1)
-        
-        # Botones modernos
-        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
-        frame_botones.grid(row=3, column=0, columnspan=2, pady=25)
-        
-        botones = [
-            ("➕ Registrar Técnico", self.registrar_tecnico, self.colors['success']),
-            ("🆕 Limpiar", self.limpiar_formulario_tecnico, self.colors['dark'])
-        ]
-        # Añadir botón eliminar técnico
-        botones.append(("🗑️ Eliminar Técnico", self.eliminar_tecnico, self.colors['danger']))
-        
-        for texto, comando, color in botones:
-            btn = tk.Button(frame_botones, text=texto, command=comando,
-                          font=('Segoe UI', 10, 'bold'),
-                          bg=color, fg='white',
-                          padx=20, pady=10,
-                          relief='flat',
-                          cursor='hand2',
-                          activebackground=self.colors['secondary'],
-                          activeforeground='white')
-            btn.pack(side='left', padx=8)
-            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
-            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
-        
-        # Frame derecho - Lista de técnicos
-        frame_lista = ttk.LabelFrame(tab_tecnicos, text="Lista de Técnicos", 
-                                    padding=20, style='Modern.TLabelframe')
-        frame_lista.pack(side='right', fill='both', expand=True, padx=10, pady=10)
-        
-        columnas = ('ID', 'Nombre', 'Especialidad', 'Teléfono', 'Estado')
-        self.tree_tecnicos = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=20)
-        
-        for col in columnas:
-            self.tree_tecnicos.heading(col, text=col)
-            self.tree_tecnicos.column(col, width=120)
-        
-        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_tecnicos.yview)
-        self.tree_tecnicos.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree_tecnicos.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        self.actualizar_lista_tecnicos()
-        
-    def crear_pestana_reportes(self):
-        """Crea la pestaña de reportes y estadísticas"""
-        tab_reportes = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(tab_reportes, text='📊 Reportes')
-        
-        # Frame superior - Estadísticas con diseño de card moderno
-        frame_stats = ttk.LabelFrame(tab_reportes, text="Estadísticas Generales", 
-                                    padding=25, style='Modern.TLabelframe')
-        frame_stats.pack(fill='x', padx=10, pady=10)
-        
-        # Card de estadísticas con sombra simulada
-        stats_card = tk.Frame(frame_stats, bg=self.colors['light'], relief='flat', bd=0)
-        stats_card.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        self.label_stats = tk.Label(stats_card, 
-                                    text="",
-                                    font=('Segoe UI', 11),
-                                    justify='left',
-                                    bg=self.colors['light'],
-                                    fg=self.colors['text'],
-                                    padx=30,
-                                    pady=25)
-        self.label_stats.pack(fill='both', expand=True)
-        
-        # Botón de actualización moderno
-        btn_actualizar = tk.Button(frame_stats, text="🔄 Actualizar Estadísticas",
-                                  command=self.actualizar_estadisticas,
-                                  font=('Segoe UI', 10, 'bold'),
-                                  bg=self.colors['primary'], fg='white',
-                                  padx=25, pady=12,
-                                  relief='flat',
-                                  cursor='hand2',
-                                  activebackground=self.colors['secondary'],
-                                  activeforeground='white')
-        btn_actualizar.pack(pady=15)
-        btn_actualizar.bind('<Enter>', lambda e: btn_actualizar.config(bg=self._darken_color(self.colors['primary'])))
-        btn_actualizar.bind('<Leave>', lambda e: btn_actualizar.config(bg=self.colors['primary']))
-        
-        # Frame inferior - Historial
-        frame_historial = ttk.LabelFrame(tab_reportes, text="Historial de Mantenimiento", 
-                                        padding=20, style='Modern.TLabelframe')
-        frame_historial.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        columnas = ('ID', 'Equipo', 'Tipo', 'Fecha', 'Técnico')
-        self.tree_historial = ttk.Treeview(frame_historial, columns=columnas, show='headings', height=15)
-        
-        for col in columnas:
-            self.tree_historial.heading(col, text=col)
-            self.tree_historial.column(col, width=180)
-        
-        scrollbar = ttk.Scrollbar(frame_historial, orient='vertical', command=self.tree_historial.yview)
-        self.tree_historial.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree_historial.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        # Botón de exportación
-        btn_frame = tk.Frame(frame_historial, bg=self.colors['card_bg'])
-        btn_frame.pack(pady=15)
-        
-        btn_exportar = tk.Button(btn_frame, text="📊 Exportar Todo a Excel",
-                               command=self.exportar_a_excel,
-                               font=('Segoe UI', 11, 'bold'),
-                               bg=self.colors['success'], fg='white',
-                               padx=30, pady=12, relief='flat', cursor='hand2')
-        btn_exportar.pack(side='left', padx=5)
-        btn_exportar.bind('<Enter>', lambda e: btn_exportar.config(bg=self._darken_color(self.colors['success'])))
-        btn_exportar.bind('<Leave>', lambda e: btn_exportar.config(bg=self.colors['success']))
-        
-        btn_guardar = tk.Button(btn_frame, text="💾 Guardar Datos (JSON)",
-                              command=self.guardar_datos_manual,
-                              font=('Segoe UI', 11, 'bold'),
-                              bg=self.colors['primary'], fg='white',
-                              padx=30, pady=12, relief='flat', cursor='hand2')
-        btn_guardar.pack(side='left', padx=5)
-        btn_guardar.bind('<Enter>', lambda e: btn_guardar.config(bg=self._darken_color(self.colors['primary'])))
-        btn_guardar.bind('<Leave>', lambda e: btn_guardar.config(bg=self.colors['primary']))
-        
-        self.actualizar_estadisticas()
-        self.actualizar_historial()
-    
-    def guardar_datos_manual(self):
-        """Guarda los datos manualmente"""
-        if gm.guardar_datos():
-            messagebox.showinfo("Éxito", "Datos guardados correctamente en datos_mantenimiento.json")
-        else:
-            messagebox.showerror("Error", "No se pudieron guardar los datos")
-    
-    def exportar_a_excel(self):
-        """Exporta historial a Excel (requiere pandas + openpyxl)"""
-        try:
-            import pandas as pd
-        except ImportError:
-            messagebox.showwarning("Exportar", "Instale 'pandas' y 'openpyxl':\n\npip install pandas openpyxl")
-            return
-
-        if not gm.historial_mantenimiento:
-            messagebox.showinfo("Exportar", "No hay datos en el historial para exportar")
-            return
-
-        try:
-            df = pd.DataFrame(gm.historial_mantenimiento)
-            # Guardar por defecto en DATA_DIR; puedes usar filedialog.asksaveasfilename si prefieres elegir ruta
-            salida = os.path.join(DATA_DIR, "historial_mantenimiento.xlsx")
-            df.to_excel(salida, index=False)
-            messagebox.showinfo("Exportar", f"Historial exportado a:\n{salida}")
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo exportar a Excel:\n{e}")
-    
-    # ==================== MÉTODOS DE EQUIPOS ====================
-    
-    def registrar_equipo(self):
-        """Registra un nuevo equipo"""
-        nombre = self.entry_equipo_nombre.get().strip()
-        if not nombre:
-            messagebox.showwarning("Advertencia", "El nombre del equipo es obligatorio")
-            return
-        
-        equipo = {
-            "id": len(gm.equipos) + 1,
-            "nombre": nombre,
-            "ubicacion": self.entry_equipo_ubicacion.get().strip(),
-            "descripcion": self.entry_equipo_descripcion.get().strip(),
-            "marca": self.entry_equipo_marca.get().strip(),
-            "modelo": self.entry_equipo_modelo.get().strip(),
-            "numero_serie": self.entry_equipo_serie.get().strip(),
-            "prioridad": self.combo_equipo_prioridad.get(),
-            "estado": "Operativo",
-            "fecha_registro": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        gm.equipos.append(equipo)
-        messagebox.showinfo("Éxito", f"Equipo '{nombre}' registrado correctamente")
-        gm.guardar_datos()  # Guardar automáticamente
-        self.limpiar_formulario_equipo()
-        self.actualizar_lista_equipos()
-        self.actualizar_combo_equipos()
-        self.actualizar_combo_plan_equipos()  # Actualizar también en planificación
-        
-    def actualizar_equipo(self):
-        """Actualiza un equipo seleccionado"""
-        seleccion = self.tree_equipos.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione un equipo de la lista")
-            return
-        
-        item = self.tree_equipos.item(seleccion[0])
-        id_equipo = int(item['values'][0])
-        
-        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
-        if equipo:
-            equipo['nombre'] = self.entry_equipo_nombre.get().strip()
-            equipo['ubicacion'] = self.entry_equipo_ubicacion.get().strip()
-            equipo['descripcion'] = self.entry_equipo_descripcion.get().strip()
-            equipo['marca'] = self.entry_equipo_marca.get().strip()
-            equipo['modelo'] = self.entry_equipo_modelo.get().strip()
-            equipo['numero_serie'] = self.entry_equipo_serie.get().strip()
-            equipo['prioridad'] = self.combo_equipo_prioridad.get()
-            
-            messagebox.showinfo("Éxito", "Equipo actualizado correctamente")
-            gm.guardar_datos()  # Guardar automáticamente
-            self.actualizar_lista_equipos()
-            self.actualizar_combo_equipos()
-            self.actualizar_combo_plan_equipos()
-        
-    def eliminar_equipo(self):
-        """Elimina un equipo seleccionado"""
-        seleccion = self.tree_equipos.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione un equipo de la lista")
-            return
-        
-        item = self.tree_equipos.item(seleccion[0])
-        id_equipo = int(item['values'][0])
-        nombre_equipo = item['values'][1]
-        
-        if messagebox.askyesno("Confirmar", f"¿Está seguro de eliminar '{nombre_equipo}'?"):
-            equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
-            if equipo:
-                gm.equipos.remove(equipo)
-                messagebox.showinfo("Éxito", "Equipo eliminado correctamente")
-                gm.guardar_datos()  # Guardar automáticamente
-                self.limpiar_formulario_equipo()
-                self.actualizar_lista_equipos()
-                self.actualizar_combo_equipos()
-                self.actualizar_combo_plan_equipos()
-    
-    def buscar_equipo(self):
-        """Busca equipos por nombre o ubicación"""
-        termino = self.entry_buscar_equipo.get().strip().lower()
-        if not termino:
-            self.actualizar_lista_equipos()
-            return
-        
-        self.tree_equipos.delete(*self.tree_equipos.get_children())
-        
-        for eq in gm.equipos:
-            if termino in eq['nombre'].lower() or termino in eq['ubicacion'].lower():
-                self.tree_equipos.insert('', 'end', values=(
-                    eq['id'],
-                    eq['nombre'],
-                    eq['ubicacion'],
-                    eq['estado'],
-                    eq['prioridad']
-                ))
-    
-    def seleccionar_equipo(self, event):
-        """Carga los datos del equipo seleccionado en el formulario"""
-        seleccion = self.tree_equipos.selection()
-        if not seleccion:
-            return
-        
-        item = self.tree_equipos.item(seleccion[0])
-        id_equipo = int(item['values'][0])
-        
-        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
-        if equipo:
-            self.entry_equipo_nombre.delete(0, tk.END)
-            self.entry_equipo_nombre.insert(0, equipo['nombre'])
-            
-            self.entry_equipo_ubicacion.delete(0, tk.END)
-            self.entry_equipo_ubicacion.insert(0, equipo['ubicacion'])
-            
-            self.entry_equipo_descripcion.delete(0, tk.END)
-            self.entry_equipo_descripcion.insert(0, equipo['descripcion'])
-            
-            self.entry_equipo_marca.delete(0, tk.END)
-            self.entry_equipo_marca.insert(0, equipo['marca'])
-            
-            self.entry_equipo_modelo.delete(0, tk.END)
-            self.entry_equipo_modelo.insert(0, equipo['modelo'])
-            
-            self.entry_equipo_serie.delete(0, tk.END)
-            self.entry_equipo_serie.insert(0, equipo['numero_serie'])
-            
-            self.combo_equipo_prioridad.set(equipo['prioridad'])
-    
-    def limpiar_formulario_equipo(self):
-        """Limpia el formulario de equipos"""
-        self.entry_equipo_nombre.delete(0, tk.END)
-        self.entry_equipo_ubicacion.delete(0, tk.END)
-        self.entry_equipo_descripcion.delete(0, tk.END)
-        self.entry_equipo_marca.delete(0, tk.END)
-        self.entry_equipo_modelo.delete(0, tk.END)
-        self.entry_equipo_serie.delete(0, tk.END)
-        self.combo_equipo_prioridad.set("Media")
-    
-    def actualizar_lista_equipos(self):
-        """Actualiza la lista de equipos en el TreeView"""
-        self.tree_equipos.delete(*self.tree_equipos.get_children())
-        
-        for eq in gm.equipos:
-            self.tree_equipos.insert('', 'end', values=(
-                eq['id'],
-                eq['nombre'],
-                eq['ubicacion'],
-                eq['estado'],
-                eq['prioridad']
-            ))
-    
-    # ==================== MÉTODOS DE ÓRDENAS ====================
-    
-    def crear_orden_trabajo(self):
-        """Crea una nueva orden de trabajo"""
-        if len(gm.equipos) == 0:
-            messagebox.showwarning("Advertencia", "Debe registrar equipos antes de crear órdenes")
-            return
-        
-        equipo_seleccionado = self.combo_ot_equipo.get()
-        if not equipo_seleccionado:
-            messagebox.showwarning("Advertencia", "Seleccione un equipo")
-            return
-        
-        descripcion = self.entry_ot_descripcion.get().strip()
-        if not descripcion:
-            messagebox.showwarning("Advertencia", "Ingrese una descripción")
-            return
-        
-        # Obtener ID del equipo
-        id_equipo = int(equipo_seleccionado.split(" - ")[0])
-        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
-        
-        ot = {
-            "id": len(gm.ordenes_trabajo) + 1,
-            "equipo_id": id_equipo,
-            "equipo_nombre": equipo['nombre'],
-            "descripcion": descripcion,
-            "tipo": self.combo_ot_tipo.get(),
-            "prioridad": self.combo_ot_prioridad.get(),
-            "estado": "Pendiente",
-            "tecnico_asignado": None,
-            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "fecha_inicio": None,
-            "fecha_finalizacion": None,
-            "observaciones": ""
-        }
-        
-        gm.ordenes_trabajo.append(ot)
-        messagebox.showinfo("Éxito", f"Orden de trabajo #{ot['id']} creada correctamente")
-        gm.guardar_datos()  # Guardar automáticamente
-        self.entry_ot_descripcion.delete(0, tk.END)
-        self.actualizar_lista_ordenes()
-        self.actualizar_estadisticas()
-        
-    def completar_orden_trabajo(self):
-        """Completa una orden de trabajo seleccionada"""
-        seleccion = self.tree_ordenes.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione una orden de la lista")
-            return
-        
-        item = self.tree_ordenes.item(seleccion[0])
-        id_orden = int(item['values'][0])
-        
-        orden = next((o for o in gm.ordenes_trabajo if o["id"] == id_orden), None)
-        
-        if not orden:
-            messagebox.showwarning("Advertencia", "Orden no encontrada")
-            return
-        
-        if orden['estado'] == "Completada":
-            messagebox.showinfo("Información", "Esta orden ya está completada")
-            return
-        
-        # Diálogo para observaciones
-        observaciones = simpledialog.askstring("Observaciones",
-                                               "Ingrese observaciones finales:",
-                                               parent=self.root)
-        
-        orden['estado'] = "Completada"
-        orden['fecha_finalizacion'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        orden['observaciones'] = observaciones if observaciones else ""
-        
-        # Agregar al historial
-        gm.historial_mantenimiento.append({
-            "orden_id": orden['id'],
-            "equipo_nombre": orden['equipo_nombre'],
-            "tipo": orden['tipo'],
-            "fecha": orden['fecha_finalizacion'],
-            "tecnico": orden['tecnico_asignado'],
-            "observaciones": observaciones if observaciones else ""
-        })
-        
-        # Liberar técnico
-        if orden['tecnico_asignado']:
-            for t in gm.tecnicos:
-                if t['nombre'] == orden['tecnico_asignado']:
-                    t['estado'] = "Disponible"
-                    break
-        
-        messagebox.showinfo("Éxito", f"Orden #{orden['id']} completada exitosamente")
-        gm.guardar_datos()  # Guardar automáticamente
-        self.actualizar_lista_ordenes()
-        self.actualizar_lista_tecnicos()
-        self.actualizar_historial()
-        self.actualizar_estadisticas()
-    
-    def asignar_tecnico_orden(self):
-        """Asigna un técnico a una orden de trabajo"""
-        if len(gm.tecnicos) == 0:
-            messagebox.showwarning("Advertencia", "Debe registrar técnicos primero")
-            return
-        
-        seleccion = self.tree_ordenes.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione una orden de la lista")
-            return
-        
-        item = self.tree_ordenes.item(seleccion[0])
-        id_orden = int(item['values'][0])
-        
-        orden = next((o for o in gm.ordenes_trabajo if o["id"] == id_orden), None)
-        if not orden:
-            return
-        
-        # Ventana para seleccionar técnico
-        ventana = tk.Toplevel(self.root)
-        ventana.title("Asignar Técnico")
-        ventana.geometry("400x300")
-        
-        ttk.Label(ventana, text="Seleccione un técnico:", font=('Arial', 12, 'bold')).pack(pady=10)
-        
-        # Lista de técnicos
-        lista_tecnicos = tk.Listbox(ventana, height=10)
-        lista_tecnicos.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        for t in gm.tecnicos:
-            lista_tecnicos.insert(tk.END, f"{t['id']} - {t['nombre']} ({t['especialidad']}) - {t['estado']}")
-        
-        def asignar():
-            seleccion = lista_tecnicos.curselection()
-            if not seleccion:
-                messagebox.showwarning("Advertencia", "Seleccione un técnico")
-                return
-            
-            idx = seleccion[0]
-            tecnico = gm.tecnicos[idx]
-            
-            orden['tecnico_asignado'] = tecnico['nombre']
-            tecnico['estado'] = "Ocupado"
-            
-            messagebox.showinfo("Éxito", f"Técnico {tecnico['nombre']} asignado correctamente")
-            gm.guardar_datos()  # Guardar automáticamente
-            ventana.destroy()
-            self.actualizar_lista_ordenes()
-            self.actualizar_lista_tecnicos()
-        
-        ttk.Button(ventana, text="Asignar", command=asignar, style='Main.TButton').pack(pady=10)
-    
-    def cambiar_estado_orden(self):
-        """Cambia el estado de una orden de trabajo"""
-        seleccion = self.tree_ordenes.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione una orden de la lista")
-            return
-
-        item = self.tree_ordenes.item(seleccion[0])
-        id_orden = int(item['values'][0])
-
-        orden = next((o for o in gm.ordenes_trabajo if o["id"] == id_orden), None)
-        if not orden:
-            messagebox.showwarning("Advertencia", "Orden no encontrada")
-            return
-
-        # Ventana para cambiar estado
-        ventana = tk.Toplevel(self.root)
-        ventana.title("Cambiar Estado")
-        ventana.geometry("350x200")
-
-        ttk.Label(ventana, text=f"Estado actual: {orden['estado']}",
-                  font=('Arial', 11, 'bold')).pack(pady=15)
-
-        ttk.Label(ventana, text="Nuevo estado:").pack(pady=5)
-        combo_estado = ttk.Combobox(ventana,
-                                    values=["Pendiente", "En progreso", "Pausada", "Completada", "Cancelada"],
-                                    state='readonly', width=20)
-        combo_estado.pack(pady=10)
-        combo_estado.set(orden['estado'])
-
-        def cambiar():
-            nuevo_estado = combo_estado.get()
-            orden['estado'] = nuevo_estado
-
-            if nuevo_estado == "En progreso" and not orden['fecha_inicio']:
-                orden['fecha_inicio'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            messagebox.showinfo("Éxito", f"Estado actualizado a: {nuevo_estado}")
-            gm.guardar_datos()  # Guardar automáticamente
-            ventana.destroy()
-            self.actualizar_lista_ordenes()
-
-        ttk.Button(ventana, text="Cambiar Estado", command=cambiar, style='Main.TButton').pack(pady=15)
-    
-    def filtrar_ordenes(self):
-        """Filtra órdenes por estado"""
-        estado = self.combo_filtro_estado.get()
-        
-        self.tree_ordenes.delete(*self.tree_ordenes.get_children())
-        
-        for o in gm.ordenes_trabajo:
-            if estado == "Todos" or o['estado'] == estado:
-                tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
-                self.tree_ordenes.insert('', 'end', values=(
-                    o['id'],
-                    o['equipo_nombre'],
-                    o['tipo'],
-                    o['estado'],
-                    o['prioridad'],
-                    tecnico
-                ))
-    
-    def actualizar_lista_ordenes(self):
-        """Actualiza la lista de órdenes de trabajo"""
-        self.tree_ordenes.delete(*self.tree_ordenes.get_children())
-        
-        for o in gm.ordenes_trabajo:
-            tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
-            self.tree_ordenes.insert('', 'end', values=(
-                o['id'],
-                o['equipo_nombre'],
-                o['tipo'],
-                o['estado'],
-                o['prioridad'],
-                tecnico
-            ))
-    
-    def actualizar_combo_equipos(self):
-        """Actualiza el combobox de equipos"""
-        equipos_lista = [f"{eq['id']} - {eq['nombre']}" for eq in gm.equipos]
-        self.combo_ot_equipo['values'] = equipos_lista
-    
-    # ==================== MÉTODOS DE TÉCNICOS ====================
-    
-    def registrar_tecnico(self):
-        """Registra un nuevo técnico"""
-        nombre = self.entry_tecnico_nombre.get().strip()
-        if not nombre:
-            messagebox.showwarning("Advertencia", "El nombre del técnico es obligatorio")
-            return
-        
-        tecnico = {
-            "id": len(gm.tecnicos) + 1,
-            "nombre": nombre,
-            "especialidad": self.entry_tecnico_especialidad.get().strip(),
-            "telefono": self.entry_tecnico_telefono.get().strip(),
-            "estado": "Disponible"
-        }
-        
-        gm.tecnicos.append(tecnico)
-        messagebox.showinfo("Éxito", f"Técnico '{nombre}' registrado correctamente")
-        gm.guardar_datos()  # Guardar automáticamente
-        self.limpiar_formulario_tecnico()
-        self.actualizar_lista_tecnicos()
-    
-    def limpiar_formulario_tecnico(self):
-        """Limpia el formulario de técnicos"""
-        self.entry_tecnico_nombre.delete(0, tk.END)
-        self.entry_tecnico_especialidad.delete(0, tk.END)
-        self.entry_tecnico_telefono.delete(0, tk.END)
-    
-    def actualizar_lista_tecnicos(self):
-        """Actualiza la lista de técnicos"""
-        self.tree_tecnicos.delete(*self.tree_tecnicos.get_children())
-        
-        for t in gm.tecnicos:
-            self.tree_tecnicos.insert('', 'end', values=(
-                t['id'],
-                t['nombre'],
-                t['especialidad'],
-                t['telefono'],
-                t['estado']
-            ))
-    
-    # ==================== MÉTODOS DE REPORTES ====================
-    
-    def actualizar_estadisticas(self):
-        """Actualiza las estadísticas generales con diseño moderno"""
-        total_equipos = len(gm.equipos)
-        total_ordenes = len(gm.ordenes_trabajo)
-        total_tecnicos = len(gm.tecnicos)
-        total_completadas = len(gm.historial_mantenimiento)
-        
-        pendientes = sum(1 for o in gm.ordenes_trabajo if o['estado'] == "Pendiente")
-        en_progreso = sum(1 for o in gm.ordenes_trabajo if o['estado'] == "En progreso")
-        completadas = sum(1 for o in gm.ordenes_trabajo if o['estado'] == "Completada")
-        
-        # Texto con mejor formato y emojis
-        texto = f"""
-    📦  EQUIPOS REGISTRADOS
-         {total_equipos} equipos en el sistema
-    
-    🔧  ÓRDENAS DE TRABAJO
-         Total: {total_ordenes}
-         • Pendientes: {pendientes}
-         • En Progreso: {en_progreso}
-         • Completadas: {completadas}
-    
-    👷  TÉCNICOS REGISTRADOS
-         {total_tecnicos} técnicos disponibles
-    
-    ✅  MANTENIMIENTOS COMPLETADOS
-         {total_completadas} trabajos finalizados
-        """
-        
-        self.label_stats.config(text=texto, 
-                               font=('Segoe UI', 11),
-                               bg=self.colors['card_bg'],
-                               fg=self.colors['text'])
-    
-    def _darken_color(self, hex_color):
-        """Oscurece un color hexadecimal para efectos hover"""
-        # Convertir hex a RGB
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        
-        # Oscurecer (reducir cada componente en 20%)
-        r = max(0, int(r * 0.8))
-        g = max(0, int(g * 0.8))
-        b = max(0, int(b * 0.8))
-        
-        # Convertir de vuelta a hex
-        return f'#{r:02x}{g:02x}{b:02x}'
-    
-    def actualizar_historial(self):
-        """Actualiza el historial de mantenimiento"""
-        self.tree_historial.delete(*self.tree_historial.get_children())
-        
-        for h in gm.historial_mantenimiento:
-            tecnico = h['tecnico'] if h['tecnico'] else "Sin asignar"
-            self.tree_historial.insert('', 'end', values=(
-                h['orden_id'],
-                h['equipo_nombre'],
-                h['tipo'],
-                h['fecha'],
-                tecnico
-            ))
-
-    def eliminar_orden_trabajo(self):
-        """Elimina la orden de trabajo seleccionada y libera técnico si aplica"""
-        seleccion = self.tree_ordenes.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione una orden de la lista")
-            return
-
-        item = self.tree_ordenes.item(seleccion[0])
-        id_orden = int(item['values'][0])
-
-        if not messagebox.askyesno("Confirmar", f"¿Eliminar la orden #{id_orden}? Esta acción no se puede deshacer."):
-            return
-
-        orden = next((o for o in gm.ordenes_trabajo if o["id"] == id_orden), None)
-        if orden:
-            # Liberar técnico asignado (si existe)
-            if orden.get('tecnico_asignado'):
-                for t in gm.tecnicos:
-                    if t['nombre'] == orden['tecnico_asignado']:
-                        t['estado'] = "Disponible"
-                        break
-            gm.ordenes_trabajo.remove(orden)
-            gm.guardar_datos()
-            messagebox.showinfo("Éxito", f"Orden #{id_orden} eliminada correctamente")
-            self.actualizar_lista_ordenes()
-            self.actualizar_lista_tecnicos()
-            self.actualizar_estadisticas()
-    
-    def eliminar_tecnico(self):
-        """Elimina el técnico seleccionado. Desasigna en las órdenes si aplica."""
-        seleccion = self.tree_tecnicos.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione un técnico de la lista")
-            return
-
-        item = self.tree_tecnicos.item(seleccion[0])
-        id_tecnico = int(item['values'][0])
-
-        tecnico = next((t for t in gm.tecnicos if t["id"] == id_tecnico), None)
-        if not tecnico:
-            messagebox.showwarning("Advertencia", "Técnico no encontrado")
-            return
-
-        # Buscar órdenes activas asignadas
-        asignadas = [o for o in gm.ordenes_trabajo if o.get('tecnico_asignado') == tecnico['nombre'] and o.get('estado') != "Completada"]
-        if asignadas:
-            if not messagebox.askyesno("Confirmar", f"El técnico está asignado a {len(asignadas)} orden(es) activas.\n¿Desea eliminar y desasignar de esas órdenes?"):
-                return
-
-        # Desasignar en todas las órdenes
-        for o in gm.ordenes_trabajo:
-            if o.get('tecnico_asignado') == tecnico['nombre']:
-                o['tecnico_asignado'] = None
-
-        gm.tecnicos.remove(tecnico)
-        gm.guardar_datos()
-        messagebox.showinfo("Éxito", f"Técnico '{tecnico['nombre']}' eliminado correctamente")
-        self.actualizar_lista_tecnicos()
-        self.actualizar_lista_ordenes()
-        self.actualizar_estadisticas()
-    
-    def eliminar_plan_mantenimiento(self):
-        """Elimina el plan de mantenimiento seleccionado"""
-        seleccion = self.tree_planes.selection()
-        if not seleccion:
-            messagebox.showwarning("Advertencia", "Seleccione un plan de la lista")
-            return
-
-        item = self.tree_planes.item(seleccion[0])
-        id_plan = int(item['values'][0])
-
-        if not messagebox.askyesno("Confirmar", f"¿Eliminar el plan #{id_plan}?"):
-            return
-
-        plan = next((p for p in gm.planes_mantenimiento if p["id"] == id_plan), None)
-        if plan:
-            gm.planes_mantenimiento.remove(plan)
-            gm.guardar_datos()
-            messagebox.showinfo("Éxito", f"Plan #{id_plan} eliminado correctamente")
-            self.actualizar_lista_planes()
-    
-def main():
-    # Debug: descomenta la línea siguiente si quieres ver mensajes en la consola
-    # print("Iniciando GUI de Gestión de Mantenimiento...")
-    root = tk.Tk()
-    app = SistemaMantenimientoGUI(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+"""
+Interfaz Gráfica para Sistema de Gestión de Mantenimiento
+Archivo: Interfaz_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Este módulo proporciona una interfaz gráfica usando Tkinter para el sistema
+de gestión de mantenimiento, integrándose con Gestion_Mantenimiento.py
+"""
+
+# Primero que todo: el perfil de arranque mide desde aquí
+import Arranque_Mantenimiento as arranque
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, simpledialog, filedialog
+import sys
+import os
+import json
+import threading
+import traceback
+from datetime import datetime
+
+# ---------------- RUTAS Y RECURSOS (compatible con PyInstaller) ----------------
+def get_base_path():
+    """Devuelve la ruta base del proyecto o del ejecutable si está 'frozen'."""
+    if getattr(sys, "frozen", False):
+        # PyInstaller unpackea recursos en sys._MEIPASS
+        return getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
+    return os.path.dirname(os.path.abspath(__file__))
+
+def resource_path(rel_path: str) -> str:
+    """Construye la ruta absoluta para un recurso relativo al proyecto/exe."""
+    return os.path.join(get_base_path(), rel_path)
+
+# Directorio de datos (APPDATA en Windows) para almacenar JSON y exportaciones
+# (se crea al guardar por primera vez, no al importar)
+DATA_DIR = os.path.join(os.getenv("APPDATA") or get_base_path(), "Gestion_Mantenimiento")
+
+# Forzar año a mostrar (usa 2025 como mínimo)
+DEFAULT_YEAR = 2025
+YEAR_DISPLAY = max(datetime.now().year, DEFAULT_YEAR)
+
+# Resultados mostrados en la búsqueda de órdenes archivadas
+LIMITE_ARCHIVADAS = 1000
+
+# Importar las estructuras de datos y funciones del módulo principal
+try:
+    import Gestion_Mantenimiento as gm
+except ImportError:
+    messagebox.showerror("Error", "No se pudo importar Gestion_Mantenimiento.py\nAsegúrate de que el archivo esté en la misma carpeta.")
+    sys.exit(1)
+import Metricas_Mantenimiento as metricas
+# El monitor de bloqueos y el diagnóstico de memoria se importan cuando se usan, salvo
+# con GM_TRACEMALLOC=1: así el rastreo empieza antes de cargar los datos
+if os.environ.get("GM_TRACEMALLOC", "") not in ("", "0"):
+    import Memoria_Mantenimiento
+arranque.marcar("importaciones")
+
+# ---------------- ORDENAMIENTO DE TABLAS ----------------
+def _clave_numero(valor):
+    """Clave numérica; los vacíos quedan al final"""
+    try:
+        return (0, int(valor))
+    except (TypeError, ValueError):
+        return (1, 0)
+
+def _clave_texto(valor):
+    return str(valor or "").casefold()
+
+def _clave_fecha(valor):
+    fecha = gm.parsear_fecha(valor)
+    return (0, fecha) if fecha else (1, datetime.min)
+
+def _clave_prioridad(valor):
+    return gm.RANGO_PRIORIDAD.get(valor, len(gm.RANGO_PRIORIDAD))
+
+# ---------------- FILAS DE LAS TABLAS ----------------
+def _fila_equipo(eq):
+    return (eq['id'], eq['nombre'], eq['ubicacion'], eq['estado'], eq['prioridad'])
+
+def _fila_orden(o):
+    tecnico = o['tecnico_asignado'] if o['tecnico_asignado'] else "Sin asignar"
+    return (o['id'], o['equipo_nombre'], o['tipo'], o['estado'], o['prioridad'], tecnico)
+
+def _fila_tecnico(t):
+    return (t['id'], t['nombre'], t['especialidad'], t['telefono'], t['estado'])
+
+def _fila_historial(h):
+    tecnico = h['tecnico'] if h['tecnico'] else "Sin asignar"
+    return (h['orden_id'], h['equipo_nombre'], h['tipo'], h['fecha'], tecnico)
+
+# Colección de gm -> tabla que la muestra (cambios de otras instancias)
+TABLAS_COLECCION = {
+    "equipos": "equipos",
+    "ordenes_trabajo": "ordenes",
+    "tecnicos": "tecnicos",
+    "historial_mantenimiento": "historial",
+}
+
+# Opciones de repetición del formulario de planes -> frecuencia del plan recurrente
+REPETICIONES_PLAN = {
+    "No se repite": None,
+    "Cada N días": "dias",
+    "Cada N semanas": "semanas",
+    "Cada N meses": "meses",
+    "Por uso (horas)": "uso",
+}
+
+# Para cada tabla: encabezado -> (campo del registro, función de clave tipada)
+COLUMNAS_ORDENABLES = {
+    'equipos': {
+        'ID': ('id', _clave_numero),
+        'Nombre': ('nombre', _clave_texto),
+        'Ubicación': ('ubicacion', _clave_texto),
+        'Estado': ('estado', _clave_texto),
+        'Prioridad': ('prioridad', _clave_prioridad),
+    },
+    'ordenes': {
+        'ID': ('id', _clave_numero),
+        'Equipo': ('equipo_nombre', _clave_texto),
+        'Tipo': ('tipo', _clave_texto),
+        'Estado': ('estado', _clave_texto),
+        'Prioridad': ('prioridad', _clave_prioridad),
+        'Técnico': ('tecnico_asignado', _clave_texto),
+    },
+    'tecnicos': {
+        'ID': ('id', _clave_numero),
+        'Nombre': ('nombre', _clave_texto),
+        'Especialidad': ('especialidad', _clave_texto),
+        'Teléfono': ('telefono', _clave_texto),
+        'Estado': ('estado', _clave_texto),
+    },
+    'planes': {
+        'ID': ('id', _clave_numero),
+        'Equipo': ('equipo_nombre', _clave_texto),
+        'Tipo': ('tipo', _clave_texto),
+        'Mes': ('mes', _clave_numero),
+        'Año': ('anio', _clave_numero),
+        'Estado': ('estado', _clave_texto),
+        'Descripción': ('descripcion', _clave_texto),
+    },
+    'historial': {
+        'ID': ('orden_id', _clave_numero),
+        'Equipo': ('equipo_nombre', _clave_texto),
+        'Tipo': ('tipo', _clave_texto),
+        'Fecha': ('fecha', _clave_fecha),
+        'Técnico': ('tecnico', _clave_texto),
+    },
+}
+
+class SistemaMantenimientoGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Sistema de Gestión de Mantenimiento v2.0")
+        self.root.geometry("1200x700")
+        self.root.configure(bg="#f8f9fa")
+        
+        # Paleta de colores moderna
+        self.colors = {
+            'primary': '#667eea',      # Púrpura moderno
+            'secondary': '#764ba2',    # Púrpura oscuro
+            'accent': '#f093fb',       # Rosa suave
+            'success': '#4facfe',      # Azul cielo
+            'warning': '#ffd93d',      # Amarillo vibrante
+            'danger': '#ff6b6b',       # Rojo coral
+            'dark': '#2d3748',         # Gris oscuro
+            'light': '#f8f9fa',        # Blanco humo
+            'card_bg': '#ffffff',      # Blanco puro
+            'text': '#2d3748'          # Texto oscuro
+        }
+
+        # Ordenamiento de tablas: columna activa por tabla y permutaciones en caché
+        self._tablas_ordenables = {}   # nombre -> (treeview, función de refresco)
+        self._orden_tablas = {}        # nombre -> (columna, descendente)
+        self._cache_orden = {}         # (nombre, columna) -> (firma de los datos, permutación)
+        # Filas mostradas: nombre -> (función de valores, filtro, {id(registro): iid})
+        self._filas = {}
+
+        # Configurar estilo
+        with arranque.fase("estilos"):
+            self.configurar_estilos()
+        
+        # Crear interfaz principal
+        self.crear_interfaz()
+        
+        # Panel de diagnóstico oculto (sin botón): métricas de rendimiento
+        self.root.bind_all('<Control-Shift-D>', lambda e: self.abrir_diagnostico())
+        # El monitor de bloqueos y el archivado arrancan cuando la ventana ya se ve
+        self.monitor = None
+        arranque.al_primer_pintado(self.root, self._tras_primer_pintado)
+    
+    def _tras_primer_pintado(self):
+        self._iniciar_monitor()
+        self.root.after_idle(self._archivar_ordenes_antiguas)
+    
+    def _iniciar_monitor(self):
+        """Bloqueos del bucle de eventos: quedan en un registro rotativo en DATA_DIR"""
+        import Monitor_Mantenimiento as monitor
+        self.monitor = monitor.MonitorBucle(self.root, DATA_DIR)
+        self.monitor.iniciar()
+        
+    def configurar_estilos(self):
+        """Configura los estilos de la interfaz con diseño moderno"""
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Estilo para botones principales con gradiente visual
+        style.configure('Main.TButton', 
+                       font=('Segoe UI', 10, 'bold'),
+                       padding=12,
+                       background=self.colors['primary'],
+                       foreground='white',
+                       borderwidth=0,
+                       relief='flat')
+        style.map('Main.TButton',
+                 background=[('active', self.colors['secondary'])],
+                 foreground=[('active', 'white')])
+        
+        # Estilo para frames con bordes redondeados simulados
+        style.configure('Card.TFrame',
+                       background=self.colors['card_bg'],
+                       relief='flat',
+                       borderwidth=0)
+        
+        # Estilo para labels
+        style.configure('Modern.TLabel',
+                       font=('Segoe UI', 10),
+                       background=self.colors['card_bg'],
+                       foreground=self.colors['text'])
+        
+        # Estilo para pestañas moderno
+        style.configure('TNotebook', 
+                       background=self.colors['light'],
+                       borderwidth=0)
+        style.configure('TNotebook.Tab', 
+                       font=('Segoe UI', 11, 'bold'),
+                       padding=[25, 12],
+                       background=self.colors['light'],
+                       foreground=self.colors['text'])
+        style.map('TNotebook.Tab',
+                 background=[('selected', self.colors['primary'])],
+                 foreground=[('selected', 'white')],
+                 expand=[('selected', [1, 1, 1, 0])])
+        
+        # Estilo para Treeview moderno
+        style.configure('Treeview',
+                       background=self.colors['card_bg'],
+                       foreground=self.colors['text'],
+                       fieldbackground=self.colors['card_bg'],
+                       borderwidth=0,
+                       font=('Segoe UI', 9))
+        style.configure('Treeview.Heading',
+                       font=('Segoe UI', 10, 'bold'),
+                       background=self.colors['primary'],
+                       foreground='white',
+                       borderwidth=0)
+        style.map('Treeview.Heading',
+                 background=[('active', self.colors['secondary'])])
+        style.map('Treeview',
+                 background=[('selected', self.colors['success'])],
+                 foreground=[('selected', 'white')])
+        
+        # Estilo para Entry y Combobox
+        style.configure('Modern.TEntry',
+                       fieldbackground=self.colors['card_bg'],
+                       borderwidth=2,
+                       relief='solid')
+        style.configure('TCombobox',
+                       fieldbackground=self.colors['card_bg'],
+                       background=self.colors['card_bg'],
+                       borderwidth=1)
+        
+        # Estilo para LabelFrame
+        style.configure('Modern.TLabelframe',
+                       background=self.colors['card_bg'],
+                       borderwidth=0,
+                       relief='flat')
+        style.configure('Modern.TLabelframe.Label',
+                       font=('Segoe UI', 12, 'bold'),
+                       background=self.colors['card_bg'],
+                       foreground=self.colors['primary'])
+        
+    def crear_interfaz(self):
+        """Crea la interfaz principal con pestañas"""
+        # Frame superior con título - gradiente simulado con degradado
+        header_frame = tk.Frame(self.root, bg=self.colors['primary'], height=90)
+        header_frame.pack(fill='x', side='top')
+        header_frame.pack_propagate(False)
+        
+        # Contenedor para centrar el título
+        title_container = tk.Frame(header_frame, bg=self.colors['primary'])
+        title_container.pack(expand=True)
+        
+        titulo = tk.Label(title_container, 
+                         text="🔧 SISTEMA DE GESTIÓN DE MANTENIMIENTO",
+                         font=('Segoe UI', 22, 'bold'),
+                         bg=self.colors['primary'],
+                         fg='white')
+        titulo.pack(pady=10)
+        
+        subtitulo = tk.Label(title_container,
+                           text="Versión 2.0 | Gestión Profesional de Equipos",
+                           font=('Segoe UI', 10),
+                           bg=self.colors['primary'],
+                           fg='#e0e7ff')
+        subtitulo.pack()
+        
+        # Deshacer / rehacer (también con Ctrl+Z y Ctrl+Y)
+        frame_deshacer = tk.Frame(header_frame, bg=self.colors['primary'])
+        frame_deshacer.place(relx=1.0, rely=0.5, anchor='e', x=-15)
+        self.btn_deshacer = tk.Button(frame_deshacer, text="↶ Deshacer", command=self.deshacer_accion,
+                                      font=('Segoe UI', 9, 'bold'), bg=self.colors['secondary'], fg='white',
+                                      padx=10, pady=4, relief='flat', cursor='hand2', state='disabled')
+        self.btn_deshacer.pack(side='left', padx=3)
+        self.btn_rehacer = tk.Button(frame_deshacer, text="↷ Rehacer", command=self.rehacer_accion,
+                                     font=('Segoe UI', 9, 'bold'), bg=self.colors['secondary'], fg='white',
+                                     padx=10, pady=4, relief='flat', cursor='hand2', state='disabled')
+        self.btn_rehacer.pack(side='left', padx=3)
+        self.root.bind_all('<Control-z>', lambda e: self._atajo_deshacer(self.deshacer_accion))
+        self.root.bind_all('<Control-y>', lambda e: self._atajo_deshacer(self.rehacer_accion))
+        
+        # Crear notebook (pestañas)
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Crear pestañas
+        with arranque.fase("pestaña equipos"):
+            self.crear_pestana_equipos()
+        with arranque.fase("pestaña órdenes"):
+            self.crear_pestana_ordenes()
+        with arranque.fase("pestaña técnicos"):
+            self.crear_pestana_tecnicos()
+        with arranque.fase("pestaña planificación"):
+            self.crear_pestana_planificacion()
+        with arranque.fase("pestaña reportes"):
+            self.crear_pestana_reportes()
+        with arranque.fase("pestaña about"):
+            self.crear_pestana_about()
+        
+        # Cargar datos al iniciar
+        with arranque.fase("carga de datos"):
+            gm.cargar_datos()
+        with arranque.fase("listas"):
+            self.actualizar_todas_las_listas()
+        
+        # Generar las órdenes de los planes que vencen (al iniciar y luego cada hora)
+        self.root.after_idle(self._emitir_planes_programados)
+        # Ver en vivo lo que guardan otras instancias sobre los mismos datos
+        self.root.after(gm.INTERVALO_EVENTOS_MS, self._revisar_cambios_externos)
+        
+    def actualizar_todas_las_listas(self):
+        """Actualiza todas las listas de la interfaz"""
+        self.actualizar_lista_equipos()
+        self.actualizar_lista_ordenes()
+        self.actualizar_lista_tecnicos()
+        self.actualizar_combo_equipos()
+        self.actualizar_combo_plan_equipos()
+        self.actualizar_lista_planes()
+        self.actualizar_historial()
+        self.actualizar_estadisticas()
+
+    # ==================== ORDENAMIENTO DE TABLAS ====================
+
+    def _habilitar_ordenamiento(self, nombre, tree, refrescar):
+        """Permite ordenar la tabla haciendo clic en los encabezados"""
+        self._tablas_ordenables[nombre] = (tree, refrescar)
+        for col in COLUMNAS_ORDENABLES[nombre]:
+            tree.heading(col, command=lambda c=col: self._ordenar_por(nombre, c))
+
+    def _ordenar_por(self, nombre, columna):
+        """Alterna el orden por la columna indicada y redibuja la tabla"""
+        tree, refrescar = self._tablas_ordenables[nombre]
+        actual, descendente = self._orden_tablas.get(nombre, (None, False))
+        descendente = not descendente if actual == columna else False
+        self._orden_tablas[nombre] = (columna, descendente)
+
+        for col in COLUMNAS_ORDENABLES[nombre]:
+            flecha = (" ▼" if descendente else " ▲") if col == columna else ""
+            tree.heading(col, text=col + flecha)
+        refrescar()
+
+    def _registros_ordenados(self, nombre, registros):
+        """Devuelve los registros en el orden elegido para la tabla.
+
+        Las claves tipadas se calculan una sola vez por columna y la permutación
+        resultante se reutiliza hasta que cambian los datos (gm.revision_datos).
+        """
+        if nombre not in self._orden_tablas:
+            return registros
+        columna, descendente = self._orden_tablas[nombre]
+
+        cache = self._cache_orden.get((nombre, columna))
+        firma = (gm.revision_datos, id(registros), len(registros))
+        if cache is None or cache[0] != firma:
+            campo, clave = COLUMNAS_ORDENABLES[nombre][columna]
+            claves = [clave(r.get(campo)) for r in registros]
+            permutacion = sorted(range(len(registros)), key=claves.__getitem__)
+            self._cache_orden[(nombre, columna)] = (firma, permutacion)
+        else:
+            permutacion = cache[1]
+
+        if descendente:
+            permutacion = reversed(permutacion)
+        return [registros[i] for i in permutacion]
+
+    def _llenar_tabla(self, nombre, tree, registros, valores, filtro=None):
+        """Redibuja la tabla y recuerda qué fila muestra cada registro"""
+        tree.delete(*tree.get_children())
+        filas = {}
+        for r in self._registros_ordenados(nombre, registros):
+            if filtro is None or filtro(r):
+                filas[id(r)] = tree.insert('', 'end', values=valores(r))
+        self._filas[nombre] = (valores, filtro, filas)
+
+    # ==================== CAMBIOS DE OTRAS INSTANCIAS ====================
+
+    def _revisar_cambios_externos(self):
+        """Revisión periódica del registro de cambios de gm; solo lee algo si el archivo creció"""
+        try:
+            cambios = gm.aplicar_eventos()
+            if cambios:
+                self._mostrar_cambios_externos(cambios)
+        except (OSError, TimeoutError) as e:
+            print(f"No se pudieron leer los cambios de otras instancias: {e}")
+        except Exception:
+            # Un evento mal formado o un error al mostrarlo no debe apagar la revisión
+            traceback.print_exc()
+        finally:
+            self.root.after(gm.INTERVALO_EVENTOS_MS, self._revisar_cambios_externos)
+
+    # ==================== DESHACER / REHACER ====================
+    
+    def _ejecutar_comando(self, comando):
+        """Aplica una acción que se puede deshacer y actualiza solo las filas que tocó"""
+        import Deshacer_Mantenimiento as deshacer
+        
+        self._mostrar_cambios_externos(deshacer.ejecutar(comando))
+        self._actualizar_botones_deshacer()
+    
+    def deshacer_accion(self):
+        import Deshacer_Mantenimiento as deshacer
+        
+        try:
+            comando, cambios = deshacer.deshacer()
+        except ValueError as e:
+            messagebox.showerror("Deshacer", f"No se pudo deshacer la última acción:\n{e}")
+            comando, cambios = None, None
+        if comando:
+            self._mostrar_cambios_externos(cambios)
+        self._actualizar_botones_deshacer()
+    
+    def rehacer_accion(self):
+        import Deshacer_Mantenimiento as deshacer
+        
+        comando, cambios = deshacer.rehacer()
+        if comando:
+            self._mostrar_cambios_externos(cambios)
+        self._actualizar_botones_deshacer()
+    
+    def _atajo_deshacer(self, accion):
+        # En los campos de texto Ctrl+Z/Ctrl+Y son de la edición del texto, no de los datos
+        if not isinstance(self.root.focus_get(), (tk.Entry, tk.Text)):
+            accion()
+    
+    def _actualizar_botones_deshacer(self):
+        import Deshacer_Mantenimiento as deshacer
+        
+        for boton, texto, descripcion in ((self.btn_deshacer, "↶ Deshacer", deshacer.proximo_deshacer()),
+                                          (self.btn_rehacer, "↷ Rehacer", deshacer.proximo_rehacer())):
+            boton.config(state='normal' if descripcion else 'disabled',
+                         text=f"{texto}: {descripcion}" if descripcion else texto)
+    
+    def _mostrar_cambios_externos(self, cambios):
+        """Actualiza solo las filas y vistas de las colecciones que cambiaron"""
+        for coleccion, nombre in TABLAS_COLECCION.items():
+            if coleccion in cambios:
+                self._aplicar_cambios_tabla(nombre, cambios[coleccion])
+        if "equipos" in cambios:
+            self.actualizar_combo_equipos()
+            self.actualizar_combo_plan_equipos()
+        if "planes_mantenimiento" in cambios or "planes_recurrentes" in cambios:
+            self.actualizar_lista_planes()
+        if "tecnicos" in cambios or "ordenes_trabajo" in cambios:
+            self.actualizar_carga_tecnicos()
+        self.actualizar_estadisticas()
+
+    def _aplicar_cambios_tabla(self, nombre, cambios):
+        """Inserta, modifica o quita solo las filas de los registros tocados.
+
+        Si la colección se recargó completa, o la tabla está ordenada por una
+        columna (las filas nuevas o modificadas pueden cambiar de posición),
+        se redibuja la tabla.
+        """
+        tree, refrescar = self._tablas_ordenables[nombre]
+        if cambios is None or nombre not in self._filas or (nombre in self._orden_tablas
+                                                             and (cambios[0] or cambios[1])):
+            refrescar()
+            return
+        valores, filtro, filas = self._filas[nombre]
+        agregados, modificados, eliminados = cambios
+        for r in eliminados:
+            iid = filas.pop(id(r), None)
+            if iid:
+                tree.delete(iid)
+        for r in modificados + agregados:
+            iid = filas.get(id(r))
+            visible = filtro is None or filtro(r)
+            if iid and visible:
+                tree.item(iid, values=valores(r))
+            elif iid:
+                tree.delete(iid)
+                del filas[id(r)]
+            elif visible:
+                filas[id(r)] = tree.insert('', 'end', values=valores(r))
+
+    # ==================== PESTAÑA DE PLANIFICACIÓN ====================
+    
+    def crear_pestana_planificacion(self):
+        """Crea la pestaña de planificación de mantenimiento"""
+        tab_plan = ttk.Frame(self.notebook, style='Card.TFrame')
+        self.notebook.add(tab_plan, text='📅 Planificación')
+        
+        # Frame superior - Crear plan
+        frame_form = ttk.LabelFrame(tab_plan, text="Crear Plan de Mantenimiento", 
+                                   padding=20, style='Modern.TLabelframe')
+        frame_form.pack(fill='x', padx=10, pady=10)
+        
+        # Primera fila
+        frame_row1 = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_row1.pack(fill='x', pady=8)
+        
+        ttk.Label(frame_row1, text="Equipo:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_plan_equipo = ttk.Combobox(frame_row1, state='readonly', width=35,
+                                             font=('Segoe UI', 10))
+        self.combo_plan_equipo.pack(side='left', padx=8)
+        
+        ttk.Label(frame_row1, text="Tipo:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_plan_tipo = ttk.Combobox(frame_row1,
+                                           values=["Preventivo", "Correctivo", "Predictivo"],
+                                           state='readonly', width=15,
+                                           font=('Segoe UI', 10))
+        self.combo_plan_tipo.pack(side='left', padx=8)
+        self.combo_plan_tipo.set("Preventivo")
+        
+        ttk.Label(frame_row1, text="Mes:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_plan_mes = ttk.Combobox(frame_row1,
+                                          values=list(range(1, 13)),
+                                          state='readonly', width=8,
+                                          font=('Segoe UI', 10))
+        self.combo_plan_mes.pack(side='left', padx=8)
+        self.combo_plan_mes.set(datetime.now().month)
+        
+        ttk.Label(frame_row1, text="Año:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_plan_anio = ttk.Entry(frame_row1, width=10, font=('Segoe UI', 10))
+        self.entry_plan_anio.pack(side='left', padx=8)
+        self.entry_plan_anio.insert(0, datetime.now().year)
+        
+        # Segunda fila - Descripción
+        frame_row2 = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_row2.pack(fill='x', pady=8)
+        
+        ttk.Label(frame_row2, text="Descripción:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_plan_descripcion = ttk.Entry(frame_row2, width=80, font=('Segoe UI', 10))
+        self.entry_plan_descripcion.pack(side='left', padx=8, fill='x', expand=True)
+        
+        # Tercera fila - Recurrencia (si se repite, Mes/Año no se usan)
+        frame_row3 = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_row3.pack(fill='x', pady=8)
+        
+        ttk.Label(frame_row3, text="Repetir:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_plan_repetir = ttk.Combobox(frame_row3, values=list(REPETICIONES_PLAN),
+                                               state='readonly', width=16, font=('Segoe UI', 10))
+        self.combo_plan_repetir.pack(side='left', padx=8)
+        self.combo_plan_repetir.set("No se repite")
+        
+        ttk.Label(frame_row3, text="Cada:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_plan_intervalo = ttk.Entry(frame_row3, width=6, font=('Segoe UI', 10))
+        self.entry_plan_intervalo.pack(side='left', padx=8)
+        self.entry_plan_intervalo.insert(0, "1")
+        
+        ttk.Label(frame_row3, text="Uso diario (h):", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_plan_uso = ttk.Entry(frame_row3, width=6, font=('Segoe UI', 10))
+        self.entry_plan_uso.pack(side='left', padx=8)
+        
+        ttk.Label(frame_row3, text="Desde:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_plan_desde = ttk.Entry(frame_row3, width=12, font=('Segoe UI', 10))
+        self.entry_plan_desde.pack(side='left', padx=8)
+        self.entry_plan_desde.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        
+        ttk.Label(frame_row3, text="Hasta:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_plan_hasta = ttk.Entry(frame_row3, width=12, font=('Segoe UI', 10))
+        self.entry_plan_hasta.pack(side='left', padx=8)
+        
+        # Botones
+        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_botones.pack(pady=15)
+        
+        btn_crear = tk.Button(frame_botones, text="➕ Crear Plan", 
+                            command=self.crear_plan_mantenimiento,
+                            font=('Segoe UI', 10, 'bold'),
+                            bg=self.colors['success'], fg='white',
+                            padx=20, pady=10, relief='flat', cursor='hand2')
+        btn_crear.pack(side='left', padx=5)
+        btn_crear.bind('<Enter>', lambda e: btn_crear.config(bg=self._darken_color(self.colors['success'])))
+        btn_crear.bind('<Leave>', lambda e: btn_crear.config(bg=self.colors['success']))
+        
+        btn_emitir = tk.Button(frame_botones, text="⚙️ Generar Órdenes de Planes Vencidos",
+                             command=self.generar_ordenes_planes,
+                             font=('Segoe UI', 10, 'bold'),
+                             bg=self.colors['primary'], fg='white',
+                             padx=20, pady=10, relief='flat', cursor='hand2')
+        btn_emitir.pack(side='left', padx=5)
+        btn_emitir.bind('<Enter>', lambda e: btn_emitir.config(bg=self._darken_color(self.colors['primary'])))
+        btn_emitir.bind('<Leave>', lambda e: btn_emitir.config(bg=self.colors['primary']))
+        
+        # Frame medio - Filtro de carga mensual
+        frame_filtro = ttk.LabelFrame(tab_plan, text="Ver Carga de Trabajo Mensual",
+                                     padding=15, style='Modern.TLabelframe')
+        frame_filtro.pack(fill='x', padx=10, pady=10)
+        
+        filtro_container = tk.Frame(frame_filtro, bg=self.colors['card_bg'])
+        filtro_container.pack(fill='x')
+        
+        ttk.Label(filtro_container, text="Mes:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_filtro_mes = ttk.Combobox(filtro_container,
+                                            values=list(range(1, 13)),
+                                            state='readonly', width=8,
+                                            font=('Segoe UI', 10))
+        self.combo_filtro_mes.pack(side='left', padx=8)
+        self.combo_filtro_mes.set(datetime.now().month)
+        
+        ttk.Label(filtro_container, text="Año:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_filtro_anio = ttk.Entry(filtro_container, width=10, font=('Segoe UI', 10))
+        self.entry_filtro_anio.pack(side='left', padx=8)
+        self.entry_filtro_anio.insert(0, datetime.now().year)
+        
+        btn_filtrar = tk.Button(filtro_container, text="🔍 Ver Carga Mensual",
+                              command=self.ver_carga_mensual,
+                              font=('Segoe UI', 9, 'bold'),
+                              bg=self.colors['primary'], fg='white',
+                              padx=20, pady=8, relief='flat', cursor='hand2')
+        btn_filtrar.pack(side='left', padx=8)
+        
+        btn_todos = tk.Button(filtro_container, text="📋 Ver Todos los Planes",
+                            command=self.actualizar_lista_planes,
+                            font=('Segoe UI', 9, 'bold'),
+                            bg=self.colors['dark'], fg='white',
+                            padx=20, pady=8, relief='flat', cursor='hand2')
+        btn_todos.pack(side='left', padx=8)
+        
+        # Frame inferior - Lista de planes
+        frame_lista = ttk.LabelFrame(tab_plan, text="Planes de Mantenimiento",
+                                    padding=20, style='Modern.TLabelframe')
+        frame_lista.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        columnas = ('ID', 'Equipo', 'Tipo', 'Mes', 'Año', 'Estado', 'Descripción')
+        self.tree_planes = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=12)
+        
+        anchos = [50, 150, 120, 60, 60, 100, 300]
+        for col, ancho in zip(columnas, anchos):
+            self.tree_planes.heading(col, text=col)
+            self.tree_planes.column(col, width=ancho)
+        self._habilitar_ordenamiento('planes', self.tree_planes, self.actualizar_lista_planes)
+        
+        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_planes.yview)
+        self.tree_planes.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree_planes.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+
+        # Botón para eliminar plan seleccionado
+        btn_frame_plan = tk.Frame(frame_lista, bg=self.colors['card_bg'])
+        btn_frame_plan.pack(fill='x', pady=10)
+        btn_eliminar_plan = tk.Button(btn_frame_plan, text="🗑️ Eliminar Plan Seleccionado",
+                                      command=self.eliminar_plan_mantenimiento,
+                                      font=('Segoe UI', 10, 'bold'),
+                                      bg=self.colors['danger'], fg='white',
+                                      padx=20, pady=8, relief='flat', cursor='hand2')
+        btn_eliminar_plan.pack(side='left', padx=5)
+        btn_eliminar_plan.bind('<Enter>', lambda e: btn_eliminar_plan.config(bg=self._darken_color(self.colors['danger'])))
+        btn_eliminar_plan.bind('<Leave>', lambda e: btn_eliminar_plan.config(bg=self.colors['danger']))
+        
+        self.actualizar_lista_planes()
+        self.actualizar_combo_plan_equipos()
+    
+    def crear_plan_mantenimiento(self):
+        """Crea un nuevo plan de mantenimiento"""
+        if len(gm.equipos) == 0:
+            messagebox.showwarning("Advertencia", "Debe registrar equipos antes de crear planes")
+            return
+        
+        equipo_seleccionado = self.combo_plan_equipo.get()
+        if not equipo_seleccionado:
+            messagebox.showwarning("Advertencia", "Seleccione un equipo")
+            return
+        
+        descripcion = self.entry_plan_descripcion.get().strip()
+        if not descripcion:
+            messagebox.showwarning("Advertencia", "Ingrese una descripción")
+            return
+        
+        frecuencia = REPETICIONES_PLAN[self.combo_plan_repetir.get()]
+        if frecuencia:
+            self.crear_plan_recurrente(equipo_seleccionado, descripcion, frecuencia)
+            return
+        
+        try:
+            mes = int(self.combo_plan_mes.get())
+            anio = int(self.entry_plan_anio.get())
+            
+            if mes < 1 or mes > 12:
+                messagebox.showwarning("Advertencia", "El mes debe estar entre 1 y 12")
+                return
+            
+            # Obtener ID del equipo
+            id_equipo = int(equipo_seleccionado.split(" - ")[0])
+            equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
+            
+            plan = {
+                "id": gm.siguiente_id("planes_mantenimiento"),
+                "equipo_id": id_equipo,
+                "equipo_nombre": equipo['nombre'],
+                "tipo": self.combo_plan_tipo.get(),
+                "descripcion": descripcion,
+                "mes": mes,
+                "anio": anio,
+                "estado": "Programado",
+                "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            
+            gm.planes_mantenimiento.append(plan)
+            gm.guardar_datos()
+            
+            messagebox.showinfo("Éxito", f"Plan de mantenimiento #{plan['id']} creado correctamente")
+            self.entry_plan_descripcion.delete(0, tk.END)
+            self.actualizar_lista_planes()
+            
+        except ValueError:
+            messagebox.showerror("Error", "Año inválido")
+    
+    def crear_plan_recurrente(self, equipo_seleccionado, descripcion, frecuencia):
+        """Crea un plan recurrente con los datos de la tercera fila del formulario"""
+        import Planificacion_Mantenimiento as planificacion
+        
+        id_equipo = int(equipo_seleccionado.split(" - ")[0])
+        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
+        try:
+            regla = planificacion.crear_regla(
+                equipo, self.combo_plan_tipo.get(), descripcion, frecuencia,
+                self.entry_plan_intervalo.get(), self.entry_plan_desde.get(),
+                self.entry_plan_hasta.get(), self.entry_plan_uso.get() or None)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Plan recurrente inválido:\n{e}")
+            return
+        
+        messagebox.showinfo("Éxito", f"Plan recurrente R{regla['id']} creado:\n"
+                                     f"{planificacion.describir_regla(regla)}")
+        self.entry_plan_descripcion.delete(0, tk.END)
+        self.actualizar_lista_planes()
+    
+    def ver_carga_mensual(self):
+        """Filtra planes por mes y año (incluye las fechas de los planes recurrentes)"""
+        import Planificacion_Mantenimiento as planificacion
+        
+        try:
+            mes = int(self.combo_filtro_mes.get())
+            anio = int(self.entry_filtro_anio.get())
+            
+            self.tree_planes.delete(*self.tree_planes.get_children())
+            
+            planes_filtrados = [p for p in self._registros_ordenados('planes', gm.planes_mantenimiento)
+                              if p['mes'] == mes and p['anio'] == anio]
+            recurrentes = planificacion.ocurrencias_mes(mes, anio)
+            
+            if len(planes_filtrados) == 0 and len(recurrentes) == 0:
+                messagebox.showinfo("Información", 
+                                  f"No hay planes programados para {mes}/{anio}")
+                return
+            
+            for p in planes_filtrados:
+                self.tree_planes.insert('', 'end', values=(
+                    p['id'],
+                    p['equipo_nombre'],
+                    p['tipo'],
+                    p['mes'],
+                    p['anio'],
+                    p['estado'],
+                    p['descripcion']
+                ))
+            for o in recurrentes:
+                self.tree_planes.insert('', 'end', values=(
+                    f"R{o['regla_id']}",
+                    o['equipo_nombre'],
+                    o['tipo'],
+                    mes,
+                    anio,
+                    "Recurrente",
+                    f"{o['descripcion']} ({o['fecha']:%d/%m})"
+                ))
+            
+            messagebox.showinfo("Carga Mensual", 
+                              f"Se encontraron {len(planes_filtrados) + len(recurrentes)} "
+                              f"planes para {mes}/{anio}")
+            
+        except ValueError:
+            messagebox.showerror("Error", "Mes o año inválido")
+    
+    def actualizar_lista_planes(self):
+        """Actualiza la lista de planes de mantenimiento"""
+        self.tree_planes.delete(*self.tree_planes.get_children())
+        
+        for p in self._registros_ordenados('planes', gm.planes_mantenimiento):
+            self.tree_planes.insert('', 'end', values=(
+                p['id'],
+                p['equipo_nombre'],
+                p['tipo'],
+                p['mes'],
+                p['anio'],
+                p['estado'],
+                p['descripcion']
+            ))
+        if gm.planes_recurrentes:
+            import Planificacion_Mantenimiento as planificacion
+            # Los planes recurrentes se muestran con su regla, sin expandir fechas
+            for r in gm.planes_recurrentes:
+                self.tree_planes.insert('', 'end', values=(
+                    f"R{r['id']}",
+                    r['equipo_nombre'],
+                    r['tipo'],
+                    "—",
+                    "—",
+                    r['estado'],
+                    f"{r['descripcion']} — {planificacion.describir_regla(r)}"
+                ))
+    
+    def generar_ordenes_planes(self, avisar_sin_cambios=True):
+        """Convierte en órdenes de trabajo los planes que vencen; devuelve cuántas se crearon"""
+        import Planificacion_Mantenimiento as planificacion
+        
+        try:
+            # Lo que hayan guardado otras instancias se aplica y se muestra antes de emitir
+            with gm.bloqueo_datos():
+                cambios = gm.aplicar_eventos()
+                creadas = planificacion.emitir_ordenes()
+        except (OSError, TimeoutError) as e:
+            print(f"No se pudieron emitir las órdenes de los planes: {e}")
+            return 0
+        if cambios and not creadas:
+            self._mostrar_cambios_externos(cambios)
+        if creadas:
+            self.actualizar_todas_las_listas()
+            messagebox.showinfo("Planificación",
+                                f"Se generaron {len(creadas)} órdenes de trabajo a partir de los planes "
+                                f"que vencen en los próximos {planificacion.ANTICIPACION_DIAS} días")
+        elif avisar_sin_cambios:
+            messagebox.showinfo("Planificación", "No hay planes pendientes de emitir")
+        return len(creadas)
+    
+    def _emitir_planes_programados(self):
+        """Revisión periódica de planes; emitir_ordenes es idempotente también entre instancias"""
+        import Planificacion_Mantenimiento as planificacion
+        
+        self.generar_ordenes_planes(avisar_sin_cambios=False)
+        self.root.after(planificacion.INTERVALO_EMISION_MS, self._emitir_planes_programados)
+    
+    def _archivar_ordenes_antiguas(self):
+        """Política de archivado: las órdenes cerradas hace más de N días pasan al archivo histórico"""
+        import Archivado_Mantenimiento as archivado
+        
+        if not archivado.dias_politica():
+            return
+        try:
+            resultado = archivado.archivar_ordenes()
+        except (OSError, ValueError) as e:
+            print(f"No se pudieron archivar las órdenes antiguas: {e}")
+            return
+        if resultado['archivadas']:
+            self.actualizar_todas_las_listas()
+    
+    def actualizar_combo_plan_equipos(self):
+        """Actualiza el combobox de equipos para planificación"""
+        equipos_lista = [f"{eq['id']} - {eq['nombre']}" for eq in gm.equipos]
+        self.combo_plan_equipo['values'] = equipos_lista
+    
+    # ==================== PESTAÑA ABOUT ====================
+    
+    def crear_pestana_about(self):
+        """Crea la pestaña About con información del proyecto"""
+        tab_about = ttk.Frame(self.notebook, style='Card.TFrame')
+        self.notebook.add(tab_about, text='ℹ️ About')
+        # El contenido (con los logos, que necesitan Pillow) se arma la primera vez que se abre
+        self._tab_about = tab_about
+        self.notebook.bind('<<NotebookTabChanged>>', self._al_cambiar_pestana, add='+')
+    
+    def _al_cambiar_pestana(self, event=None):
+        if self._tab_about is not None and self.notebook.select() == str(self._tab_about):
+            tab_about, self._tab_about = self._tab_about, None
+            self._llenar_pestana_about(tab_about)
+    
+    def _llenar_pestana_about(self, tab_about):
+        """Título, logos e información del proyecto en la pestaña About"""
+        # Contenedor principal centrado
+        main_container = tk.Frame(tab_about, bg=self.colors['card_bg'])
+        main_container.pack(expand=True, fill='both', padx=40, pady=40)
+        
+        # Título
+        title_frame = tk.Frame(main_container, bg=self.colors['primary'], height=80)
+        title_frame.pack(fill='x', pady=(0, 30))
+        title_frame.pack_propagate(False)
+        
+        tk.Label(title_frame, 
+                text="Sistema de Gestión de Mantenimiento",
+                font=('Segoe UI', 20, 'bold'),
+                bg=self.colors['primary'],
+                fg='white').pack(expand=True)
+        
+        # Logos
+        logos_frame = tk.Frame(main_container, bg=self.colors['card_bg'])
+        logos_frame.pack(pady=20)
+        
+        # Intentar cargar logos
+        try:
+            from PIL import Image, ImageTk
+            
+            # Logo universidad
+            logo_uni_frame = tk.Frame(logos_frame, bg=self.colors['card_bg'])
+            logo_uni_frame.pack(side='left', padx=30)
+            
+            if os.path.exists(resource_path("unnamed.png")):
+                img_uni = Image.open(resource_path("unnamed.png"))
+                img_uni = img_uni.resize((150, 150), Image.Resampling.LANCZOS)
+                photo_uni = ImageTk.PhotoImage(img_uni)
+                label_uni = tk.Label(logo_uni_frame, image=photo_uni, bg=self.colors['card_bg'])
+                label_uni.image = photo_uni
+                label_uni.pack()
+            
+            tk.Label(logo_uni_frame, 
+                    text="Fundación Universitaria\nTecnológico Comfenalco",
+                    font=('Segoe UI', 10, 'bold'),
+                    bg=self.colors['card_bg'],
+                    fg=self.colors['text']).pack(pady=10)
+            
+            # Logo empresa
+            logo_emp_frame = tk.Frame(logos_frame, bg=self.colors['card_bg'])
+            logo_emp_frame.pack(side='right', padx=30)
+            
+            if os.path.exists(resource_path("LOGO OSCURO SIN FONDO.png")):
+                img_emp = Image.open(resource_path("LOGO OSCURO SIN FONDO.png"))
+                img_emp = img_emp.resize((150, 150), Image.Resampling.LANCZOS)
+                photo_emp = ImageTk.PhotoImage(img_emp)
+                label_emp = tk.Label(logo_emp_frame, image=photo_emp, bg=self.colors['card_bg'])
+                label_emp.image = photo_emp
+                label_emp.pack()
+            
+            tk.Label(logo_emp_frame,
+                    text="Industrias Mecánicas\nAndinas SAS",
+                    font=('Segoe UI', 10, 'bold'),
+                    bg=self.colors['card_bg'],
+                    fg=self.colors['text']).pack(pady=10)
+                    
+        except ImportError:
+            tk.Label(logos_frame,
+                    text="⚠ Instale Pillow para ver los logos: pip install Pillow",
+                    font=('Segoe UI', 10),
+                    bg=self.colors['card_bg'],
+                    fg=self.colors['warning']).pack()
+        
+        # Información del proyecto (usar ScrolledText para que haga scroll)
+        info_frame = tk.Frame(main_container, bg=self.colors['light'], relief='flat', bd=1)
+        info_frame.pack(fill='both', expand=True, pady=30, padx=50)
+        
+        info_text = f"""
+        
+        👨‍💻 DESARROLLADOR
+        Juan Esteban Jaramillo González
+        
+        🏢 EMPRESA
+        Industrias Mecánicas Andinas SAS
+        
+        🎓 INSTITUCIÓN EDUCATIVA
+        Fundación Universitaria Tecnológico Comfenalco
+        
+        📅 VERSIÓN
+        2.0 - Sistema de Gestión de Mantenimiento
+        
+        📝 DESCRIPCIÓN
+        Sistema desarrollado como proyecto académico para la gestión
+        integral de mantenimiento industrial, incluyendo planificación,
+        órdenes de trabajo, gestión de técnicos y reportes estadísticos.
+        
+        🔧 CARACTERÍSTICAS
+        • Gestión de equipos y órdenes de trabajo
+        • Planificación de mantenimiento preventivo, correctivo y predictivo
+        • Gestión de técnicos y asignaciones
+        • Persistencia de datos en JSON
+        • Exportación a Excel
+        • Reportes y estadísticas
+        
+        © {YEAR_DISPLAY} - Todos los derechos reservados
+        """
+        
+        txt_info = scrolledtext.ScrolledText(info_frame,
+                                            wrap='word',
+                                            font=('Segoe UI', 11),
+                                            bg=self.colors['light'],
+                                            fg=self.colors['text'],
+                                            bd=0,
+                                            highlightthickness=0,
+                                            padx=20,
+                                            pady=20)
+        txt_info.insert('1.0', info_text.strip())
+        txt_info.configure(state='disabled')  # sólo lectura
+        txt_info.pack(fill='both', expand=True)
+        
+        # Botón de cerrar
+        btn_cerrar = tk.Button(main_container, text="✖ Cerrar",
+                              command=lambda: self.notebook.select(0),
+                              font=('Segoe UI', 10, 'bold'),
+                              bg=self.colors['danger'], fg='white',
+                              padx=30, pady=10, relief='flat', cursor='hand2')
+        btn_cerrar.pack(pady=20)
+        self.actualizar_combo_equipos()
+        if hasattr(self, 'tree_planes'):
+            self.actualizar_lista_planes()
+        if hasattr(self, 'tree_historial'):
+            self.actualizar_historial()
+        if hasattr(self, 'label_stats'):
+            self.actualizar_estadisticas()
+        
+    def crear_pestana_equipos(self):
+        """Crea la pestaña de gestión de equipos"""
+        tab_equipos = ttk.Frame(self.notebook, style='Card.TFrame')
+        self.notebook.add(tab_equipos, text='📦 Equipos')
+        
+        # Frame izquierdo - Formulario con estilo moderno
+        frame_form = ttk.LabelFrame(tab_equipos, text="Registrar/Editar Equipo", 
+                                   padding=20, style='Modern.TLabelframe')
+        frame_form.pack(side='left', fill='both', expand=True, padx=10, pady=10)
+        
+        # Campos del formulario con mejor espaciado
+        campos = [
+            ("Nombre:", "entry_equipo_nombre"),
+            ("Ubicación:", "entry_equipo_ubicacion"),
+            ("Descripción:", "entry_equipo_descripcion"),
+            ("Marca:", "entry_equipo_marca"),
+            ("Modelo:", "entry_equipo_modelo"),
+            ("Número de Serie:", "entry_equipo_serie")
+        ]
+        
+        for idx, (label_text, attr_name) in enumerate(campos):
+            label = ttk.Label(frame_form, text=label_text, style='Modern.TLabel')
+            label.grid(row=idx, column=0, sticky='w', pady=8, padx=5)
+            
+            entry = ttk.Entry(frame_form, width=35, font=('Segoe UI', 10))
+            entry.grid(row=idx, column=1, pady=8, padx=5, sticky='ew')
+            setattr(self, attr_name, entry)
+        
+        ttk.Label(frame_form, text="Prioridad:", style='Modern.TLabel').grid(
+            row=6, column=0, sticky='w', pady=8, padx=5)
+        self.combo_equipo_prioridad = ttk.Combobox(frame_form, 
+                                                   values=["Alta", "Media", "Baja"],
+                                                   state='readonly',
+                                                   width=33,
+                                                   font=('Segoe UI', 10))
+        self.combo_equipo_prioridad.grid(row=6, column=1, pady=8, padx=5, sticky='ew')
+        self.combo_equipo_prioridad.set("Media")
+        
+        frame_form.columnconfigure(1, weight=1)
+        
+        # Botones con iconos y colores modernos
+        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_botones.grid(row=7, column=0, columnspan=2, pady=25)
+        
+        botones = [
+            ("➕ Registrar", self.registrar_equipo, self.colors['success']),
+            ("🔄 Actualizar", self.actualizar_equipo, self.colors['primary']),
+            ("🗑️ Eliminar", self.eliminar_equipo, self.colors['danger']),
+            ("🆕 Limpiar", self.limpiar_formulario_equipo, self.colors['dark'])
+        ]
+        
+        for texto, comando, color in botones:
+            btn = tk.Button(frame_botones, text=texto, command=comando,
+                          font=('Segoe UI', 10, 'bold'),
+                          bg=color, fg='white',
+                          padx=15, pady=10,
+                          relief='flat',
+                          cursor='hand2',
+                          activebackground=self.colors['secondary'],
+                          activeforeground='white')
+            btn.pack(side='left', padx=5)
+            
+            # Efecto hover
+            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
+            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
+        
+        # Frame derecho - Lista de equipos
+        frame_lista = ttk.LabelFrame(tab_equipos, text="Lista de Equipos", 
+                                    padding=20, style='Modern.TLabelframe')
+        frame_lista.pack(side='right', fill='both', expand=True, padx=10, pady=10)
+        
+        # Buscador moderno
+        frame_buscar = tk.Frame(frame_lista, bg=self.colors['card_bg'])
+        frame_buscar.pack(fill='x', pady=(0, 15))
+        
+        search_container = tk.Frame(frame_buscar, bg=self.colors['light'], 
+                                   relief='flat', bd=1)
+        search_container.pack(side='left', fill='x', expand=True)
+        
+        ttk.Label(search_container, text="🔍", background=self.colors['light'],
+                 font=('Segoe UI', 12)).pack(side='left', padx=8)
+        self.entry_buscar_equipo = tk.Entry(search_container, 
+                                           font=('Segoe UI', 10),
+                                           bg=self.colors['light'],
+                                           relief='flat',
+                                           bd=0)
+        self.entry_buscar_equipo.pack(side='left', fill='x', expand=True, pady=8)
+        
+        btn_buscar = tk.Button(frame_buscar, text="Buscar", command=self.buscar_equipo,
+                              font=('Segoe UI', 9, 'bold'),
+                              bg=self.colors['primary'], fg='white',
+                              padx=15, pady=6, relief='flat', cursor='hand2')
+        btn_buscar.pack(side='left', padx=5)
+        
+        btn_todos = tk.Button(frame_buscar, text="Mostrar Todos", 
+                            command=self.actualizar_lista_equipos,
+                            font=('Segoe UI', 9, 'bold'),
+                            bg=self.colors['dark'], fg='white',
+                            padx=15, pady=6, relief='flat', cursor='hand2')
+        btn_todos.pack(side='left', padx=5)
+        
+        # Treeview para equipos
+        columnas = ('ID', 'Nombre', 'Ubicación', 'Estado', 'Prioridad')
+        self.tree_equipos = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=20)
+        
+        for col in columnas:
+            self.tree_equipos.heading(col, text=col)
+            self.tree_equipos.column(col, width=120)
+        self._habilitar_ordenamiento('equipos', self.tree_equipos, self.buscar_equipo)
+        
+        # Scrollbar
+        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_equipos.yview)
+        self.tree_equipos.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree_equipos.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        # Evento de selección
+        self.tree_equipos.bind('<<TreeviewSelect>>', self.seleccionar_equipo)
+        
+        # Cargar equipos
+        self.actualizar_lista_equipos()
+        
+    def crear_pestana_ordenes(self):
+        """Crea la pestaña de órdenes de trabajo"""
+        tab_ordenes = ttk.Frame(self.notebook, style='Card.TFrame')
+        self.notebook.add(tab_ordenes, text='🔧 Órdenes de Trabajo')
+        
+        # Frame superior - Formulario con estilo moderno
+        frame_form = ttk.LabelFrame(tab_ordenes, text="Nueva Orden de Trabajo", 
+                                   padding=20, style='Modern.TLabelframe')
+        frame_form.pack(fill='x', padx=10, pady=10)
+        
+        # Primera fila con mejor diseño
+        frame_row1 = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_row1.pack(fill='x', pady=8)
+        
+        ttk.Label(frame_row1, text="Equipo:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_ot_equipo = ttk.Combobox(frame_row1, state='readonly', width=35,
+                                           font=('Segoe UI', 10))
+        self.combo_ot_equipo.pack(side='left', padx=8)
+        
+        ttk.Label(frame_row1, text="Tipo:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_ot_tipo = ttk.Combobox(frame_row1, 
+                                         values=["Preventivo", "Correctivo", "Predictivo"],
+                                         state='readonly', width=15,
+                                         font=('Segoe UI', 10))
+        self.combo_ot_tipo.pack(side='left', padx=8)
+        self.combo_ot_tipo.set("Preventivo")
+        
+        ttk.Label(frame_row1, text="Prioridad:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.combo_ot_prioridad = ttk.Combobox(frame_row1,
+                                              values=["Alta", "Media", "Baja"],
+                                              state='readonly', width=12,
+                                              font=('Segoe UI', 10))
+        self.combo_ot_prioridad.pack(side='left', padx=8)
+        self.combo_ot_prioridad.set("Media")
+        
+        # Segunda fila - Descripción
+        frame_row2 = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_row2.pack(fill='x', pady=8)
+        
+        ttk.Label(frame_row2, text="Descripción:", style='Modern.TLabel').pack(side='left', padx=8)
+        self.entry_ot_descripcion = ttk.Entry(frame_row2, width=100, font=('Segoe UI', 10))
+        self.entry_ot_descripcion.pack(side='left', padx=8, fill='x', expand=True)
+        
+        # Botones modernos
+        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_botones.pack(pady=15)
+        
+        botones = [
+            ("➕ Crear Orden", self.crear_orden_trabajo, self.colors['success']),
+            ("✅ Completar Orden", self.completar_orden_trabajo, self.colors['primary']),
+            ("👷 Asignar Técnico", self.asignar_tecnico_orden, self.colors['warning']),
+            ("🤖 Asignación Automática", self.asignacion_automatica, self.colors['accent']),
+            ("🔄 Cambiar Estado", self.cambiar_estado_orden, self.colors['dark'])
+        ]
+        # Añadir botón Eliminar Orden al array de botones
+        botones.append(("🗑️ Eliminar Orden", self.eliminar_orden_trabajo, self.colors['danger']))
+        
+        for texto, comando, color in botones:
+            btn = tk.Button(frame_botones, text=texto, command=comando,
+                          font=('Segoe UI', 10, 'bold'),
+                          bg=color, fg='white',
+                          padx=18, pady=10,
+                          relief='flat',
+                          cursor='hand2',
+                          activebackground=self.colors['secondary'],
+                          activeforeground='white')
+            btn.pack(side='left', padx=5)
+            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
+            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
+        
+        # Frame inferior - Lista de órdenes
+        frame_lista = ttk.LabelFrame(tab_ordenes, text="Órdenes de Trabajo", 
+                                    padding=20, style='Modern.TLabelframe')
+        frame_lista.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Filtro por estado moderno
+        frame_filtro = tk.Frame(frame_lista, bg=self.colors['card_bg'])
+        frame_filtro.pack(fill='x', pady=(0, 15))
+        
+        ttk.Label(frame_filtro, text="Filtrar por estado:", 
+                 style='Modern.TLabel', font=('Segoe UI', 10, 'bold')).pack(side='left', padx=8)
+        self.combo_filtro_estado = ttk.Combobox(frame_filtro,
+                                               values=["Todos"] + gm.ESTADOS_ORDEN,
+                                               state='readonly', width=18,
+                                               font=('Segoe UI', 10))
+        self.combo_filtro_estado.pack(side='left', padx=8)
+        self.combo_filtro_estado.set("Todos")
+        
+        btn_filtrar = tk.Button(frame_filtro, text="🔍 Filtrar", 
+                              command=self.filtrar_ordenes,
+                              font=('Segoe UI', 9, 'bold'),
+                              bg=self.colors['primary'], fg='white',
+                              padx=20, pady=8, relief='flat', cursor='hand2')
+        btn_filtrar.pack(side='left', padx=5)
+        
+        btn_cola = tk.Button(frame_filtro, text="📋 Cola de Despacho",
+                             command=self.ver_cola_despacho,
+                             font=('Segoe UI', 9, 'bold'),
+                             bg=self.colors['accent'], fg='white',
+                             padx=20, pady=8, relief='flat', cursor='hand2')
+        btn_cola.pack(side='left', padx=5)
+        
+        ttk.Label(frame_filtro, text="Ctrl/Shift + clic para seleccionar varias órdenes",
+                 style='Modern.TLabel', foreground='#718096').pack(side='right', padx=8)
+        
+        # Treeview para órdenes
+        columnas = ('ID', 'Equipo', 'Tipo', 'Estado', 'Prioridad', 'Técnico')
+        # selectmode 'extended': Ctrl/Shift + clic para operar sobre varias órdenes a la vez
+        self.tree_ordenes = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=15,
+                                         selectmode='extended')
+        
+        for col in columnas:
+            self.tree_ordenes.heading(col, text=col)
+            self.tree_ordenes.column(col, width=150)
+        self._habilitar_ordenamiento('ordenes', self.tree_ordenes, self.filtrar_ordenes)
+        
+        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_ordenes.yview)
+        self.tree_ordenes.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree_ordenes.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        # Actualizar listas
+        self.actualizar_combo_equipos()
+        self.actualizar_lista_ordenes()
+        
+    def crear_pestana_tecnicos(self):
+        """Crea la pestaña de gestión de técnicos"""
+        tab_tecnicos = ttk.Frame(self.notebook, style='Card.TFrame')
+        self.notebook.add(tab_tecnicos, text='👷 Técnicos')
+        
+        # Frame izquierdo - Formulario moderno
+        frame_form = ttk.LabelFrame(tab_tecnicos, text="Registrar Técnico", 
+                                   padding=20, style='Modern.TLabelframe')
+        frame_form.pack(side='left', fill='both', expand=True, padx=10, pady=10)
+        
+        # Campos del formulario
+        campos = [
+            ("Nombre Completo:", "entry_tecnico_nombre"),
+            ("Especialidad:", "entry_tecnico_especialidad"),
+            ("Teléfono:", "entry_tecnico_telefono")
+        ]
+        
+        for idx, (label_text, attr_name) in enumerate(campos):
+            label = ttk.Label(frame_form, text=label_text, style='Modern.TLabel')
+            label.grid(row=idx, column=0, sticky='w', pady=12, padx=5)
+            
+            entry = ttk.Entry(frame_form, width=40, font=('Segoe UI', 10))
+            entry.grid(row=idx, column=1, pady=12, padx=5, sticky='ew')
+            setattr(self, attr_name, entry)
+        
+        frame_form.columnconfigure(1, weight=1)
+        
+        # Botones modernos
+        frame_botones = tk.Frame(frame_form, bg=self.colors['card_bg'])
+        frame_botones.grid(row=3, column=0, columnspan=2, pady=25)
+        
+        botones = [
+            ("➕ Registrar Técnico", self.registrar_tecnico, self.colors['success']),
+            ("🆕 Limpiar", self.limpiar_formulario_tecnico, self.colors['dark'])
+        ]
+        # Añadir botón eliminar técnico
+        botones.append(("🗑️ Eliminar Técnico", self.eliminar_tecnico, self.colors['danger']))
+        
+        for texto, comando, color in botones:
+            btn = tk.Button(frame_botones, text=texto, command=comando,
+                          font=('Segoe UI', 10, 'bold'),
+                          bg=color, fg='white',
+                          padx=20, pady=10,
+                          relief='flat',
+                          cursor='hand2',
+                          activebackground=self.colors['secondary'],
+                          activeforeground='white')
+            btn.pack(side='left', padx=8)
+            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
+            btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
+        
+        # Carga de trabajo calculada a partir de las fechas de las órdenes
+        frame_carga = ttk.LabelFrame(frame_form, text="Carga de Trabajo", padding=10,
+                                     style='Modern.TLabelframe')
+        frame_carga.grid(row=4, column=0, columnspan=2, sticky='nsew', pady=(10, 0))
+        frame_form.rowconfigure(4, weight=1)
+        
+        frame_ventana = tk.Frame(frame_carga, bg=self.colors['card_bg'])
+        frame_ventana.pack(fill='x', pady=(0, 8))
+        ttk.Label(frame_ventana, text="Ventana:", style='Modern.TLabel').pack(side='left')
+        self.combo_ventana_carga = ttk.Combobox(frame_ventana, state='readonly', width=16,
+                                                values=["Últimos 7 días", "Últimos 30 días",
+                                                        "Últimos 90 días", "Último año", "Personalizada"])
+        self.combo_ventana_carga.set("Últimos 30 días")
+        self.combo_ventana_carga.pack(side='left', padx=5)
+        self.combo_ventana_carga.bind('<<ComboboxSelected>>', lambda e: self.actualizar_carga_tecnicos())
+        ttk.Label(frame_ventana, text="Desde:", style='Modern.TLabel').pack(side='left', padx=(10, 0))
+        self.entry_carga_desde = ttk.Entry(frame_ventana, width=11)
+        self.entry_carga_desde.pack(side='left', padx=3)
+        ttk.Label(frame_ventana, text="Hasta:", style='Modern.TLabel').pack(side='left', padx=(5, 0))
+        self.entry_carga_hasta = ttk.Entry(frame_ventana, width=11)
+        self.entry_carga_hasta.pack(side='left', padx=3)
+        ttk.Button(frame_ventana, text="🔄", width=3,
+                   command=self.actualizar_carga_tecnicos).pack(side='left', padx=5)
+        
+        columnas_carga = ('Técnico', 'Activas', 'Órdenes', 'Horas', 'Utilización')
+        self.tree_carga = ttk.Treeview(frame_carga, columns=columnas_carga, show='headings', height=6)
+        for col in columnas_carga:
+            self.tree_carga.heading(col, text=col)
+            self.tree_carga.column(col, width=160 if col == 'Técnico' else 80)
+        self.tree_carga.pack(fill='both', expand=True)
+        
+        # Frame derecho - Lista de técnicos
+        frame_lista = ttk.LabelFrame(tab_tecnicos, text="Lista de Técnicos", 
+                                    padding=20, style='Modern.TLabelframe')
+        frame_lista.pack(side='right', fill='both', expand=True, padx=10, pady=10)
+        
+        columnas = ('ID', 'Nombre', 'Especialidad', 'Teléfono', 'Estado')
+        self.tree_tecnicos = ttk.Treeview(frame_lista, columns=columnas, show='headings', height=20)
+        
+        for col in columnas:
+            self.tree_tecnicos.heading(col, text=col)
+            self.tree_tecnicos.column(col, width=120)
+        self._habilitar_ordenamiento('tecnicos', self.tree_tecnicos, self.actualizar_lista_tecnicos)
+        
+        scrollbar = ttk.Scrollbar(frame_lista, orient='vertical', command=self.tree_tecnicos.yview)
+        self.tree_tecnicos.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree_tecnicos.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        self.actualizar_lista_tecnicos()
+        
+    def crear_pestana_reportes(self):
+        """Crea la pestaña de reportes y estadísticas"""
+        tab_reportes = ttk.Frame(self.notebook, style='Card.TFrame')
+        self.notebook.add(tab_reportes, text='📊 Reportes')
+        
+        # Frame superior - Estadísticas con diseño de card moderno
+        frame_stats = ttk.LabelFrame(tab_reportes, text="Estadísticas Generales", 
+                                    padding=25, style='Modern.TLabelframe')
+        frame_stats.pack(fill='x', padx=10, pady=10)
+        
+        frame_superior = tk.Frame(frame_stats, bg=self.colors['card_bg'])
+        frame_superior.pack(fill='both', expand=True)
+        
+        # Card de estadísticas con sombra simulada
+        stats_card = tk.Frame(frame_superior, bg=self.colors['light'], relief='flat', bd=0)
+        stats_card.pack(side='left', fill='both', expand=True, padx=5, pady=5)
+        
+        self.label_stats = tk.Label(stats_card, 
+                                    text="",
+                                    font=('Segoe UI', 11),
+                                    justify='left',
+                                    bg=self.colors['light'],
+                                    fg=self.colors['text'],
+                                    padx=30,
+                                    pady=25)
+        self.label_stats.pack(fill='both', expand=True)
+        
+        # Backlog: antigüedad de las órdenes abiertas y evolución de su tamaño
+        frame_backlog = tk.Frame(frame_superior, bg=self.colors['card_bg'])
+        frame_backlog.pack(side='left', fill='both', expand=True, padx=5, pady=5)
+        tk.Label(frame_backlog, text="⏳ Antigüedad del Backlog", font=('Segoe UI', 11, 'bold'),
+                 bg=self.colors['card_bg'], fg=self.colors['text']).pack(anchor='w')
+        
+        columnas = ('Antigüedad', *gm.RANGO_PRIORIDAD, 'Total')
+        self.tree_backlog = ttk.Treeview(frame_backlog, columns=columnas, show='headings', height=5)
+        for col in columnas:
+            self.tree_backlog.heading(col, text=col)
+            self.tree_backlog.column(col, width=120 if col == 'Antigüedad' else 70, anchor='center')
+        self.tree_backlog.pack(fill='x', pady=5)
+        
+        self.canvas_backlog = tk.Canvas(frame_backlog, height=150, bg='white', highlightthickness=0)
+        self.canvas_backlog.pack(fill='both', expand=True)
+        self.canvas_backlog.bind('<Configure>', lambda e: self._dibujar_tendencia_backlog())
+        
+        # Botones de actualización e indicadores
+        frame_botones_stats = tk.Frame(frame_stats, bg=self.colors['card_bg'])
+        frame_botones_stats.pack(pady=15)
+        
+        btn_actualizar = tk.Button(frame_botones_stats, text="🔄 Actualizar Estadísticas",
+                                  command=self.actualizar_estadisticas,
+                                  font=('Segoe UI', 10, 'bold'),
+                                  bg=self.colors['primary'], fg='white',
+                                  padx=25, pady=12,
+                                  relief='flat',
+                                  cursor='hand2',
+                                  activebackground=self.colors['secondary'],
+                                  activeforeground='white')
+        btn_actualizar.pack(side='left', padx=5)
+        btn_actualizar.bind('<Enter>', lambda e: btn_actualizar.config(bg=self._darken_color(self.colors['primary'])))
+        btn_actualizar.bind('<Leave>', lambda e: btn_actualizar.config(bg=self.colors['primary']))
+        
+        btn_indicadores = tk.Button(frame_botones_stats, text="📈 Indicadores de Confiabilidad",
+                                    command=self.ver_indicadores_confiabilidad,
+                                    font=('Segoe UI', 10, 'bold'),
+                                    bg=self.colors['secondary'], fg='white',
+                                    padx=25, pady=12, relief='flat', cursor='hand2',
+                                    activebackground=self.colors['primary'],
+                                    activeforeground='white')
+        btn_indicadores.pack(side='left', padx=5)
+        btn_indicadores.bind('<Enter>', lambda e: btn_indicadores.config(bg=self._darken_color(self.colors['secondary'])))
+        btn_indicadores.bind('<Leave>', lambda e: btn_indicadores.config(bg=self.colors['secondary']))
+        
+        btn_mensual = tk.Button(frame_botones_stats, text="📅 Resumen Mensual",
+                                command=self.ver_resumen_mensual,
+                                font=('Segoe UI', 10, 'bold'),
+                                bg=self.colors['success'], fg='white',
+                                padx=25, pady=12, relief='flat', cursor='hand2',
+                                activebackground=self.colors['primary'],
+                                activeforeground='white')
+        btn_mensual.pack(side='left', padx=5)
+        btn_mensual.bind('<Enter>', lambda e: btn_mensual.config(bg=self._darken_color(self.colors['success'])))
+        btn_mensual.bind('<Leave>', lambda e: btn_mensual.config(bg=self.colors['success']))
+        
+        btn_simulacion = tk.Button(frame_botones_stats, text="🎲 Simulación de Capacidad",
+                                   command=self.ver_simulacion_capacidad,
+                                   font=('Segoe UI', 10, 'bold'),
+                                   bg=self.colors['accent'], fg='white',
+                                   padx=25, pady=12, relief='flat', cursor='hand2',
+                                   activebackground=self.colors['primary'],
+                                   activeforeground='white')
+        btn_simulacion.pack(side='left', padx=5)
+        btn_simulacion.bind('<Enter>', lambda e: btn_simulacion.config(bg=self._darken_color(self.colors['accent'])))
+        btn_simulacion.bind('<Leave>', lambda e: btn_simulacion.config(bg=self.colors['accent']))
+        
+        btn_archivadas = tk.Button(frame_botones_stats, text="📦 Órdenes Archivadas",
+                                   command=self.ver_ordenes_archivadas,
+                                   font=('Segoe UI', 10, 'bold'),
+                                   bg=self.colors['dark'], fg='white',
+                                   padx=25, pady=12, relief='flat', cursor='hand2',
+                                   activebackground=self.colors['primary'],
+                                   activeforeground='white')
+        btn_archivadas.pack(side='left', padx=5)
+        btn_archivadas.bind('<Enter>', lambda e: btn_archivadas.config(bg=self._darken_color(self.colors['dark'])))
+        btn_archivadas.bind('<Leave>', lambda e: btn_archivadas.config(bg=self.colors['dark']))
+        
+        # Frame inferior - Historial
+        frame_historial = ttk.LabelFrame(tab_reportes, text="Historial de Mantenimiento", 
+                                        padding=20, style='Modern.TLabelframe')
+        frame_historial.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        columnas = ('ID', 'Equipo', 'Tipo', 'Fecha', 'Técnico')
+        self.tree_historial = ttk.Treeview(frame_historial, columns=columnas, show='headings', height=15)
+        
+        for col in columnas:
+            self.tree_historial.heading(col, text=col)
+            self.tree_historial.column(col, width=180)
+        self._habilitar_ordenamiento('historial', self.tree_historial, self.actualizar_historial)
+        
+        scrollbar = ttk.Scrollbar(frame_historial, orient='vertical', command=self.tree_historial.yview)
+        self.tree_historial.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree_historial.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        # Botón de exportación
+        btn_frame = tk.Frame(frame_historial, bg=self.colors['card_bg'])
+        btn_frame.pack(pady=15)
+        
+        btn_exportar = tk.Button(btn_frame, text="📊 Exportar Todo a Excel",
+                               command=self.exportar_a_excel,
+                               font=('Segoe UI', 11, 'bold'),
+                               bg=self.colors['success'], fg='white',
+                               padx=30, pady=12, relief='flat', cursor='hand2')
+        btn_exportar.pack(side='left', padx=5)
+        btn_exportar.bind('<Enter>', lambda e: btn_exportar.config(bg=self._darken_color(self.colors['success'])))
+        btn_exportar.bind('<Leave>', lambda e: btn_exportar.config(bg=self.colors['success']))
+        
+        btn_intercambio = tk.Button(btn_frame, text="🔁 CSV / Parquet",
+                                    command=self.abrir_intercambio_datos,
+                                    font=('Segoe UI', 11, 'bold'),
+                                    bg=self.colors['secondary'], fg='white',
+                                    padx=30, pady=12, relief='flat', cursor='hand2')
+        btn_intercambio.pack(side='left', padx=5)
+        btn_intercambio.bind('<Enter>', lambda e: btn_intercambio.config(bg=self._darken_color(self.colors['secondary'])))
+        btn_intercambio.bind('<Leave>', lambda e: btn_intercambio.config(bg=self.colors['secondary']))
+        
+        btn_guardar = tk.Button(btn_frame, text="💾 Guardar Datos (JSON)",
+                              command=self.guardar_datos_manual,
+                              font=('Segoe UI', 11, 'bold'),
+                              bg=self.colors['primary'], fg='white',
+                              padx=30, pady=12, relief='flat', cursor='hand2')
+        btn_guardar.pack(side='left', padx=5)
+        btn_guardar.bind('<Enter>', lambda e: btn_guardar.config(bg=self._darken_color(self.colors['primary'])))
+        btn_guardar.bind('<Leave>', lambda e: btn_guardar.config(bg=self.colors['primary']))
+        
+        self.actualizar_estadisticas()
+        self.actualizar_historial()
+        self.root.after(60000, self._actualizar_backlog_periodico)
+    
+    def guardar_datos_manual(self):
+        """Guarda los datos manualmente"""
+        if gm.guardar_datos():
+            mensaje = "Datos guardados correctamente en datos_mantenimiento.json"
+            if gm.ultimo_guardado_combinado:
+                # Otra instancia guardó antes: se incorporaron sus cambios
+                self.actualizar_todas_las_listas()
+                mensaje += "\n\nSe incorporaron los cambios guardados desde otro equipo."
+                if gm.ultimos_conflictos:
+                    mensaje += (f"\n{len(gm.ultimos_conflictos)} registros se modificaron en ambos lados; "
+                                f"se conservó la versión de este equipo.")
+            messagebox.showinfo("Éxito", mensaje)
+        else:
+            messagebox.showerror("Error", "No se pudieron guardar los datos")
+    
+    def _tarea_con_progreso(self, titulo, trabajo, al_terminar, unidad="filas"):
+        """Ejecuta 'trabajo(progreso, cancelar)' en un hilo mostrando una barra de progreso.
+
+        Tkinter no es seguro entre hilos: el hilo solo escribe en 'estado' y la
+        ventana se actualiza desde el hilo principal con root.after.
+        al_terminar(resultado, error) se llama en el hilo principal.
+        """
+        ventana = tk.Toplevel(self.root)
+        ventana.title(titulo)
+        ventana.geometry("420x160")
+        ventana.transient(self.root)
+        ventana.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        etiqueta = ttk.Label(ventana, text="Preparando...", font=('Segoe UI', 10))
+        etiqueta.pack(pady=(20, 10))
+        barra = ttk.Progressbar(ventana, orient='horizontal', length=360, mode='determinate')
+        barra.pack(pady=5)
+        
+        cancelar = threading.Event()
+        btn_cancelar = ttk.Button(ventana, text="Cancelar", command=cancelar.set)
+        btn_cancelar.pack(pady=10)
+        
+        estado = {'hechas': 0, 'total': 0, 'resultado': None, 'error': None, 'fin': False}
+        
+        def progreso(hechas, total):
+            estado['hechas'], estado['total'] = hechas, total
+        
+        def ejecutar():
+            try:
+                estado['resultado'] = trabajo(progreso, cancelar)
+            except Exception as e:
+                estado['error'] = e
+            estado['fin'] = True
+        
+        def revisar():
+            if estado['total']:
+                barra['maximum'] = estado['total']
+                barra['value'] = estado['hechas']
+                etiqueta.config(text=f"{estado['hechas']:,} de {estado['total']:,} {unidad}")
+            if cancelar.is_set():
+                btn_cancelar.config(state='disabled')
+                etiqueta.config(text="Cancelando...")
+            if estado['fin']:
+                ventana.destroy()
+                al_terminar(estado['resultado'], estado['error'])
+            else:
+                self.root.after(100, revisar)
+        
+        threading.Thread(target=ejecutar, daemon=True).start()
+        self.root.after(100, revisar)
+    
+    def exportar_a_excel(self):
+        """Exporta historial, órdenes, equipos, planes y técnicos a Excel (requiere openpyxl)"""
+        try:
+            import openpyxl  # noqa: F401 - solo verificar que esté instalado
+        except ImportError:
+            messagebox.showwarning("Exportar", "Instale 'openpyxl':\n\npip install openpyxl")
+            return
+        
+        import Exportacion_Mantenimiento as exp
+        
+        datos = exp.instantanea()
+        if not any(datos.values()):
+            messagebox.showinfo("Exportar", "No hay datos para exportar")
+            return
+        
+        salida = filedialog.asksaveasfilename(parent=self.root,
+                                              title="Exportar a Excel",
+                                              initialdir=DATA_DIR,
+                                              initialfile="mantenimiento.xlsx",
+                                              defaultextension=".xlsx",
+                                              filetypes=[("Libro de Excel", "*.xlsx")])
+        if not salida:
+            return
+        
+        def trabajo(progreso, cancelar):
+            return exp.exportar_excel(salida, datos, progreso, cancelar)
+        
+        def al_terminar(filas, error):
+            if isinstance(error, exp.OperacionCancelada):
+                messagebox.showinfo("Exportar", "Exportación cancelada")
+            elif error:
+                messagebox.showerror("Error", f"No se pudo exportar a Excel:\n{error}")
+            else:
+                messagebox.showinfo("Exportar", f"{filas:,} filas exportadas a:\n{salida}")
+        
+        self._tarea_con_progreso("Exportando a Excel", trabajo, al_terminar)
+    
+    def abrir_intercambio_datos(self):
+        """Ventana para exportar/importar colecciones en CSV o Parquet"""
+        import Exportacion_Mantenimiento as exp
+        
+        formatos = ["CSV"] + (["Parquet"] if exp.parquet_disponible() else [])
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Intercambio de Datos")
+        ventana.geometry("420x260")
+        
+        ttk.Label(ventana, text="Colección:", font=('Arial', 11, 'bold')).pack(pady=(15, 5))
+        combo_coleccion = ttk.Combobox(ventana, values=["Todas"] + list(exp.COLECCIONES),
+                                       state='readonly', width=30)
+        combo_coleccion.pack()
+        combo_coleccion.set("Todas")
+        
+        ttk.Label(ventana, text="Formato:", font=('Arial', 11, 'bold')).pack(pady=(15, 5))
+        combo_formato = ttk.Combobox(ventana, values=formatos, state='readonly', width=30)
+        combo_formato.pack()
+        combo_formato.set("CSV")
+        if len(formatos) == 1:
+            ttk.Label(ventana, text="(instale 'pyarrow' para usar Parquet)").pack()
+        
+        def exportar():
+            coleccion = combo_coleccion.get()
+            datos = exp.instantanea(None if coleccion == "Todas" else [coleccion])
+            carpeta = filedialog.askdirectory(parent=ventana, title="Carpeta de destino",
+                                              initialdir=DATA_DIR)
+            if not carpeta:
+                return
+            ventana.destroy()
+            funcion = exp.exportar_parquet if combo_formato.get() == "Parquet" else exp.exportar_csv
+            
+            def al_terminar(rutas, error):
+                if isinstance(error, exp.OperacionCancelada):
+                    messagebox.showinfo("Exportar", "Exportación cancelada")
+                elif error:
+                    messagebox.showerror("Error", f"No se pudo exportar:\n{error}")
+                else:
+                    messagebox.showinfo("Exportar", f"{len(rutas)} archivo(s) exportados en:\n{carpeta}")
+            
+            self._tarea_con_progreso("Exportando datos",
+                                     lambda progreso, cancelar: funcion(carpeta, datos, progreso, cancelar),
+                                     al_terminar)
+        
+        def importar():
+            coleccion = combo_coleccion.get()
+            if coleccion == "Todas":
+                messagebox.showwarning("Importar", "Seleccione la colección a importar", parent=ventana)
+                return
+            extension = ".parquet" if combo_formato.get() == "Parquet" else ".csv"
+            ruta = filedialog.askopenfilename(parent=ventana, title="Archivo a importar",
+                                              initialdir=DATA_DIR,
+                                              filetypes=[(combo_formato.get(), "*" + extension)])
+            if not ruta:
+                return
+            ventana.destroy()
+            
+            def al_terminar(lote, error):
+                if isinstance(error, exp.OperacionCancelada):
+                    messagebox.showinfo("Importar", "Importación cancelada: no se modificó ningún dato")
+                    return
+                if error:
+                    messagebox.showerror("Error", f"No se pudo importar:\n{error}")
+                    return
+                # La inserción modifica gm, por eso se confirma en el hilo principal
+                lote.confirmar()
+                resumen = lote.resumen()
+                texto = (f"Insertados: {resumen['insertadas']:,}\n"
+                         f"Rechazados: {resumen['rechazadas']:,}\n"
+                         f"Tiempo: {resumen['segundos']} s ({resumen['filas_por_segundo']:,} filas/s)")
+                if lote.errores:
+                    texto += "\n\nPrimeros errores:\n" + "\n".join(
+                        f"Fila {fila}: {motivo}" for fila, motivo in lote.errores[:5])
+                messagebox.showinfo("Importar", texto)
+                self.actualizar_todas_las_listas()
+            
+            self._tarea_con_progreso("Importando datos",
+                                     lambda progreso, cancelar: exp.validar_archivo(ruta, coleccion, progreso, cancelar),
+                                     al_terminar)
+        
+        frame_botones = tk.Frame(ventana)
+        frame_botones.pack(pady=20)
+        ttk.Button(frame_botones, text="Exportar", command=exportar, style='Main.TButton').pack(side='left', padx=5)
+        ttk.Button(frame_botones, text="Importar", command=importar, style='Main.TButton').pack(side='left', padx=5)
+    
+    # ==================== MÉTODOS DE EQUIPOS ====================
+    
+    def registrar_equipo(self):
+        """Registra un nuevo equipo"""
+        nombre = self.entry_equipo_nombre.get().strip()
+        if not nombre:
+            messagebox.showwarning("Advertencia", "El nombre del equipo es obligatorio")
+            return
+        
+        equipo = {
+            "id": gm.siguiente_id("equipos"),
+            "nombre": nombre,
+            "ubicacion": self.entry_equipo_ubicacion.get().strip(),
+            "descripcion": self.entry_equipo_descripcion.get().strip(),
+            "marca": self.entry_equipo_marca.get().strip(),
+            "modelo": self.entry_equipo_modelo.get().strip(),
+            "numero_serie": self.entry_equipo_serie.get().strip(),
+            "prioridad": self.combo_equipo_prioridad.get(),
+            "estado": "Operativo",
+            "fecha_registro": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        gm.equipos.append(equipo)
+        messagebox.showinfo("Éxito", f"Equipo '{nombre}' registrado correctamente")
+        gm.guardar_datos()  # Guardar automáticamente
+        self.limpiar_formulario_equipo()
+        self.actualizar_lista_equipos()
+        self.actualizar_combo_equipos()
+        self.actualizar_combo_plan_equipos()  # Actualizar también en planificación
+        
+    def actualizar_equipo(self):
+        """Actualiza un equipo seleccionado"""
+        seleccion = self.tree_equipos.selection()
+        if not seleccion:
+            messagebox.showwarning("Advertencia", "Seleccione un equipo de la lista")
+            return
+        
+        item = self.tree_equipos.item(seleccion[0])
+        id_equipo = int(item['values'][0])
+        
+        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
+        if equipo:
+            equipo['nombre'] = self.entry_equipo_nombre.get().strip()
+            equipo['ubicacion'] = self.entry_equipo_ubicacion.get().strip()
+            equipo['descripcion'] = self.entry_equipo_descripcion.get().strip()
+            equipo['marca'] = self.entry_equipo_marca.get().strip()
+            equipo['modelo'] = self.entry_equipo_modelo.get().strip()
+            equipo['numero_serie'] = self.entry_equipo_serie.get().strip()
+            equipo['prioridad'] = self.combo_equipo_prioridad.get()
+            
+            messagebox.showinfo("Éxito", "Equipo actualizado correctamente")
+            gm.guardar_datos()  # Guardar automáticamente
+            self.actualizar_lista_equipos()
+            self.actualizar_combo_equipos()
+            self.actualizar_combo_plan_equipos()
+        
+    def eliminar_equipo(self):
+        """Elimina un equipo seleccionado"""
+        seleccion = self.tree_equipos.selection()
+        if not seleccion:
+            messagebox.showwarning("Advertencia", "Seleccione un equipo de la lista")
+            return
+        
+        item = self.tree_equipos.item(seleccion[0])
+        id_equipo = int(item['values'][0])
+        nombre_equipo = item['values'][1]
+        
+        if messagebox.askyesno("Confirmar", f"¿Está seguro de eliminar '{nombre_equipo}'?"):
+            import Deshacer_Mantenimiento as deshacer
+            equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
+            if equipo:
+                # Se guarda automáticamente y se puede deshacer
+                self._ejecutar_comando(deshacer.eliminar_equipo(equipo))
+                self.limpiar_formulario_equipo()
+                messagebox.showinfo("Éxito", "Equipo eliminado correctamente (Ctrl+Z para deshacer)")
+    
+    def buscar_equipo(self):
+        """Busca equipos por nombre o ubicación"""
+        termino = self.entry_buscar_equipo.get().strip().lower()
+        if not termino:
+            self.actualizar_lista_equipos()
+            return
+        
+        self._llenar_tabla('equipos', self.tree_equipos, gm.equipos, _fila_equipo,
+                           lambda eq: termino in eq['nombre'].lower() or termino in eq['ubicacion'].lower())
+    
+    def seleccionar_equipo(self, event):
+        """Carga los datos del equipo seleccionado en el formulario"""
+        seleccion = self.tree_equipos.selection()
+        if not seleccion:
+            return
+        
+        item = self.tree_equipos.item(seleccion[0])
+        id_equipo = int(item['values'][0])
+        
+        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
+        if equipo:
+            self.entry_equipo_nombre.delete(0, tk.END)
+            self.entry_equipo_nombre.insert(0, equipo['nombre'])
+            
+            self.entry_equipo_ubicacion.delete(0, tk.END)
+            self.entry_equipo_ubicacion.insert(0, equipo['ubicacion'])
+            
+            self.entry_equipo_descripcion.delete(0, tk.END)
+            self.entry_equipo_descripcion.insert(0, equipo['descripcion'])
+            
+            self.entry_equipo_marca.delete(0, tk.END)
+            self.entry_equipo_marca.insert(0, equipo['marca'])
+            
+            self.entry_equipo_modelo.delete(0, tk.END)
+            self.entry_equipo_modelo.insert(0, equipo['modelo'])
+            
+            self.entry_equipo_serie.delete(0, tk.END)
+            self.entry_equipo_serie.insert(0, equipo['numero_serie'])
+            
+            self.combo_equipo_prioridad.set(equipo['prioridad'])
+    
+    def limpiar_formulario_equipo(self):
+        """Limpia el formulario de equipos"""
+        self.entry_equipo_nombre.delete(0, tk.END)
+        self.entry_equipo_ubicacion.delete(0, tk.END)
+        self.entry_equipo_descripcion.delete(0, tk.END)
+        self.entry_equipo_marca.delete(0, tk.END)
+        self.entry_equipo_modelo.delete(0, tk.END)
+        self.entry_equipo_serie.delete(0, tk.END)
+        self.combo_equipo_prioridad.set("Media")
+    
+    def actualizar_lista_equipos(self):
+        """Actualiza la lista de equipos en el TreeView"""
+        self._llenar_tabla('equipos', self.tree_equipos, gm.equipos, _fila_equipo)
+    
+    # ==================== MÉTODOS DE ÓRDENAS ====================
+    
+    def crear_orden_trabajo(self):
+        """Crea una nueva orden de trabajo"""
+        if len(gm.equipos) == 0:
+            messagebox.showwarning("Advertencia", "Debe registrar equipos antes de crear órdenes")
+            return
+        
+        equipo_seleccionado = self.combo_ot_equipo.get()
+        if not equipo_seleccionado:
+            messagebox.showwarning("Advertencia", "Seleccione un equipo")
+            return
+        
+        descripcion = self.entry_ot_descripcion.get().strip()
+        if not descripcion:
+            messagebox.showwarning("Advertencia", "Ingrese una descripción")
+            return
+        
+        # Obtener ID del equipo
+        id_equipo = int(equipo_seleccionado.split(" - ")[0])
+        equipo = next((e for e in gm.equipos if e["id"] == id_equipo), None)
+        
+        ot = {
+            "id": gm.siguiente_id_orden(),
+            "equipo_id": id_equipo,
+            "equipo_nombre": equipo['nombre'],
+            "descripcion": descripcion,
+            "tipo": self.combo_ot_tipo.get(),
+            "prioridad": self.combo_ot_prioridad.get(),
+            "estado": "Pendiente",
+            "tecnico_asignado": None,
+            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "fecha_inicio": None,
+            "fecha_finalizacion": None,
+            "observaciones": ""
+        }
+        
+        gm.agregar_orden(ot)
+        messagebox.showinfo("Éxito", f"Orden de trabajo #{ot['id']} creada correctamente")
+        gm.guardar_datos()  # Guardar automáticamente
+        self.entry_ot_descripcion.delete(0, tk.END)
+        self.actualizar_lista_ordenes()
+        self.actualizar_estadisticas()
+        
+    def _ids_ordenes_seleccionadas(self):
+        """Devuelve los IDs de todas las órdenes seleccionadas en la tabla"""
+        return [int(self.tree_ordenes.item(iid)['values'][0])
+                for iid in self.tree_ordenes.selection()]
+
+    def completar_orden_trabajo(self):
+        """Completa las órdenes de trabajo seleccionadas"""
+        ids = self._ids_ordenes_seleccionadas()
+        if not ids:
+            messagebox.showwarning("Advertencia", "Seleccione una o más órdenes de la lista")
+            return
+        
+        pendientes = [o for o in gm.ordenes_por_ids(ids) if o['estado'] != "Completada"]
+        if not pendientes:
+            messagebox.showinfo("Información", "Las órdenes seleccionadas ya están completadas")
+            return
+        
+        # Diálogo para observaciones (se aplican a todas las órdenes seleccionadas)
+        observaciones = simpledialog.askstring("Observaciones",
+                                               "Ingrese observaciones finales:",
+                                               parent=self.root)
+        
+        completadas = gm.completar_ordenes([o['id'] for o in pendientes], observaciones)
+        
+        if len(completadas) == 1:
+            messagebox.showinfo("Éxito", f"Orden #{completadas[0]['id']} completada exitosamente")
+        else:
+            messagebox.showinfo("Éxito", f"{len(completadas)} órdenes completadas exitosamente")
+        self.actualizar_lista_ordenes()
+        self.actualizar_lista_tecnicos()
+        self.actualizar_historial()
+        self.actualizar_estadisticas()
+    
+    def asignar_tecnico_orden(self):
+        """Asigna un técnico a las órdenes de trabajo seleccionadas"""
+        if len(gm.tecnicos) == 0:
+            messagebox.showwarning("Advertencia", "Debe registrar técnicos primero")
+            return
+        
+        ids = self._ids_ordenes_seleccionadas()
+        if not ids:
+            messagebox.showwarning("Advertencia", "Seleccione una o más órdenes de la lista")
+            return
+        
+        # Ventana para seleccionar técnico
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Asignar Técnico")
+        ventana.geometry("400x300")
+        
+        texto = "Seleccione un técnico:" if len(ids) == 1 else f"Seleccione un técnico ({len(ids)} órdenes):"
+        ttk.Label(ventana, text=texto, font=('Arial', 12, 'bold')).pack(pady=10)
+        
+        # Lista de técnicos
+        lista_tecnicos = tk.Listbox(ventana, height=10)
+        lista_tecnicos.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        for t in gm.tecnicos:
+            lista_tecnicos.insert(tk.END, f"{t['id']} - {t['nombre']} ({t['especialidad']}) - {t['estado']}")
+        
+        def asignar():
+            seleccion = lista_tecnicos.curselection()
+            if not seleccion:
+                messagebox.showwarning("Advertencia", "Seleccione un técnico")
+                return
+            
+            idx = seleccion[0]
+            tecnico = gm.tecnicos[idx]
+            
+            gm.asignar_tecnico_ordenes(ids, tecnico)
+            
+            messagebox.showinfo("Éxito", f"Técnico {tecnico['nombre']} asignado correctamente")
+            ventana.destroy()
+            self.actualizar_lista_ordenes()
+            self.actualizar_lista_tecnicos()
+        
+        ttk.Button(ventana, text="Asignar", command=asignar, style='Main.TButton').pack(pady=10)
+    
+    def asignacion_automatica(self):
+        """Propone técnicos para las órdenes pendientes sin asignar y los aplica tras revisarlos"""
+        import Despacho_Mantenimiento as despacho
+        
+        if len(gm.tecnicos) == 0:
+            messagebox.showwarning("Advertencia", "Debe registrar técnicos primero")
+            return
+        
+        # Las órdenes seleccionadas o, si no hay selección, todas las pendientes sin técnico
+        resultado = despacho.proponer_asignacion(self._ids_ordenes_seleccionadas() or None)
+        propuestas = resultado['propuestas']
+        if not propuestas and not resultado['sin_asignar']:
+            messagebox.showinfo("Información", "No hay órdenes pendientes sin técnico")
+            return
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Asignación Automática")
+        ventana.geometry("900x500")
+        
+        metodo = "óptimo" if resultado['metodo'] == "optimo" else "rápido"
+        texto = (f"{len(propuestas)} órdenes con técnico propuesto, "
+                 f"{len(resultado['sin_asignar'])} sin cupo disponible "
+                 f"(cálculo {metodo} en {resultado['segundos'] * 1000:.0f} ms)")
+        tk.Label(ventana, text=texto, font=('Segoe UI', 10, 'bold'), justify='left',
+                 padx=15, pady=10).pack(fill='x')
+        
+        frame_tabla = tk.Frame(ventana)
+        frame_tabla.pack(fill='both', expand=True, padx=10)
+        columnas = ('Orden', 'Equipo', 'Descripción', 'Prioridad', 'Técnico', 'Especialidad', 'Carga')
+        tree = ttk.Treeview(frame_tabla, columns=columnas, show='headings')
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=200 if col == 'Descripción' else 60 if col in ('Orden', 'Carga') else 110)
+        scrollbar = ttk.Scrollbar(frame_tabla, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        for p in propuestas:
+            orden, tecnico = p['orden'], p['tecnico']
+            especialidad = tecnico['especialidad'] + (" ✓" if p['coincide_especialidad'] else "")
+            tree.insert('', 'end', values=(orden['id'], orden['equipo_nombre'], orden['descripcion'],
+                                           orden['prioridad'], tecnico['nombre'], especialidad,
+                                           f"{p['carga']}/{despacho.CAPACIDAD_TECNICO}"))
+        for orden in resultado['sin_asignar']:
+            tree.insert('', 'end', values=(orden['id'], orden['equipo_nombre'], orden['descripcion'],
+                                           orden['prioridad'], "— Sin cupo —", "", ""))
+        
+        def aplicar():
+            aplicadas = despacho.aplicar_asignacion(propuestas)
+            messagebox.showinfo("Éxito", f"{aplicadas} órdenes asignadas correctamente", parent=ventana)
+            ventana.destroy()
+            self.actualizar_lista_ordenes()
+            self.actualizar_lista_tecnicos()
+        
+        frame_botones = tk.Frame(ventana)
+        frame_botones.pack(pady=10)
+        boton_aplicar = ttk.Button(frame_botones, text="Aplicar", command=aplicar, style='Main.TButton')
+        boton_aplicar.pack(side='left', padx=5)
+        if not propuestas:
+            boton_aplicar.config(state='disabled')
+        ttk.Button(frame_botones, text="Cancelar", command=ventana.destroy).pack(side='left', padx=5)
+    
+    def ver_cola_despacho(self):
+        """Muestra las próximas órdenes a atender por prioridad, criticidad del equipo y antigüedad"""
+        import Despacho_Mantenimiento as despacho
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Cola de Despacho")
+        ventana.geometry("900x450")
+        
+        frame_filtros = tk.Frame(ventana)
+        frame_filtros.pack(fill='x', padx=10, pady=10)
+        ttk.Label(frame_filtros, text="Mostrar las próximas:").pack(side='left')
+        spin_cantidad = ttk.Spinbox(frame_filtros, from_=1, to=500, width=6)
+        spin_cantidad.set(10)
+        spin_cantidad.pack(side='left', padx=5)
+        ttk.Label(frame_filtros, text="órdenes").pack(side='left')
+        label_total = ttk.Label(frame_filtros, text="")
+        label_total.pack(side='right')
+        
+        frame_tabla = tk.Frame(ventana)
+        frame_tabla.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        columnas = ('#', 'ID', 'Equipo', 'Criticidad', 'Prioridad', 'Estado', 'Días', 'Técnico')
+        tree = ttk.Treeview(frame_tabla, columns=columnas, show='headings')
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=180 if col == 'Equipo' else 50 if col in ('#', 'ID', 'Días') else 110)
+        scrollbar = ttk.Scrollbar(frame_tabla, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        equipos = {}
+        
+        def actualizar(event=None):
+            try:
+                cantidad = max(1, int(spin_cantidad.get()))
+            except ValueError:
+                cantidad = 10
+            if len(equipos) != len(gm.equipos):
+                equipos.clear()
+                equipos.update((e['id'], e) for e in gm.equipos)
+            ahora = datetime.now()
+            tree.delete(*tree.get_children())
+            for posicion, orden in enumerate(despacho.siguientes_ordenes(cantidad), 1):
+                creada = gm.parsear_fecha(orden.get('fecha_creacion'))
+                tree.insert('', 'end', values=(
+                    posicion,
+                    orden['id'],
+                    orden['equipo_nombre'],
+                    equipos.get(orden['equipo_id'], {}).get('prioridad', "—"),
+                    orden['prioridad'],
+                    orden['estado'],
+                    (ahora - creada).days if creada else "—",
+                    orden['tecnico_asignado'] or "Sin asignar"
+                ))
+            label_total.config(text=f"{despacho.tamano_cola()} órdenes en cola")
+        
+        spin_cantidad.config(command=actualizar)
+        spin_cantidad.bind('<Return>', actualizar)
+        ttk.Button(frame_filtros, text="🔄 Actualizar", command=actualizar).pack(side='left', padx=10)
+        actualizar()
+    
+    def cambiar_estado_orden(self):
+        """Cambia el estado de las órdenes de trabajo seleccionadas"""
+        ids = self._ids_ordenes_seleccionadas()
+        if not ids:
+            messagebox.showwarning("Advertencia", "Seleccione una o más órdenes de la lista")
+            return
+
+        ordenes = gm.ordenes_por_ids(ids)
+        if not ordenes:
+            messagebox.showwarning("Advertencia", "Orden no encontrada")
+            return
+
+        # Ventana para cambiar estado
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Cambiar Estado")
+        ventana.geometry("350x200")
+
+        if len(ordenes) == 1:
+            texto = f"Estado actual: {ordenes[0]['estado']}"
+        else:
+            texto = f"{len(ordenes)} órdenes seleccionadas"
+        ttk.Label(ventana, text=texto, font=('Arial', 11, 'bold')).pack(pady=15)
+
+        ttk.Label(ventana, text="Nuevo estado:").pack(pady=5)
+        combo_estado = ttk.Combobox(ventana,
+                                    values=gm.ESTADOS_ORDEN,
+                                    state='readonly', width=20)
+        combo_estado.pack(pady=10)
+        combo_estado.set(ordenes[0]['estado'])
+
+        def cambiar():
+            nuevo_estado = combo_estado.get()
+            gm.cambiar_estado_ordenes([o['id'] for o in ordenes], nuevo_estado)
+
+            messagebox.showinfo("Éxito", f"Estado actualizado a: {nuevo_estado}")
+            ventana.destroy()
+            self.actualizar_lista_ordenes()
+            self.actualizar_estadisticas()
+
+        ttk.Button(ventana, text="Cambiar Estado", command=cambiar, style='Main.TButton').pack(pady=15)
+    
+    def filtrar_ordenes(self):
+        """Filtra órdenes por estado"""
+        estado = self.combo_filtro_estado.get()
+        self._llenar_tabla('ordenes', self.tree_ordenes, gm.ordenes_trabajo, _fila_orden,
+                           None if estado == "Todos" else lambda o: o['estado'] == estado)
+    
+    def actualizar_lista_ordenes(self):
+        """Actualiza la lista de órdenes de trabajo"""
+        self._llenar_tabla('ordenes', self.tree_ordenes, gm.ordenes_trabajo, _fila_orden)
+    
+    def actualizar_combo_equipos(self):
+        """Actualiza el combobox de equipos"""
+        equipos_lista = [f"{eq['id']} - {eq['nombre']}" for eq in gm.equipos]
+        self.combo_ot_equipo['values'] = equipos_lista
+    
+    # ==================== MÉTODOS DE TÉCNICOS ====================
+    
+    def registrar_tecnico(self):
+        """Registra un nuevo técnico"""
+        nombre = self.entry_tecnico_nombre.get().strip()
+        if not nombre:
+            messagebox.showwarning("Advertencia", "El nombre del técnico es obligatorio")
+            return
+        
+        tecnico = {
+            "id": gm.siguiente_id("tecnicos"),
+            "nombre": nombre,
+            "especialidad": self.entry_tecnico_especialidad.get().strip(),
+            "telefono": self.entry_tecnico_telefono.get().strip(),
+            "estado": "Disponible"
+        }
+        
+        gm.tecnicos.append(tecnico)
+        messagebox.showinfo("Éxito", f"Técnico '{nombre}' registrado correctamente")
+        gm.guardar_datos()  # Guardar automáticamente
+        self.limpiar_formulario_tecnico()
+        self.actualizar_lista_tecnicos()
+    
+    def limpiar_formulario_tecnico(self):
+        """Limpia el formulario de técnicos"""
+        self.entry_tecnico_nombre.delete(0, tk.END)
+        self.entry_tecnico_especialidad.delete(0, tk.END)
+        self.entry_tecnico_telefono.delete(0, tk.END)
+    
+    def actualizar_lista_tecnicos(self):
+        """Actualiza la lista de técnicos"""
+        self._llenar_tabla('tecnicos', self.tree_tecnicos, gm.tecnicos, _fila_tecnico)
+        self.actualizar_carga_tecnicos()
+    
+    def actualizar_carga_tecnicos(self):
+        """Llena la tabla de carga de trabajo para la ventana seleccionada"""
+        import Carga_Mantenimiento as carga
+        
+        ventana = self.combo_ventana_carga.get()
+        if ventana == "Personalizada":
+            try:
+                desde, hasta = carga.ventana_personalizada(self.entry_carga_desde.get(),
+                                                           self.entry_carga_hasta.get())
+            except ValueError:
+                messagebox.showerror("Error", "Use fechas con formato AAAA-MM-DD en Desde y Hasta")
+                return
+        else:
+            desde, hasta = carga.ventana_predefinida(ventana)
+            for entry, fecha in ((self.entry_carga_desde, desde), (self.entry_carga_hasta, hasta)):
+                entry.delete(0, tk.END)
+                entry.insert(0, fecha.strftime("%Y-%m-%d"))
+        
+        self.tree_carga.delete(*self.tree_carga.get_children())
+        for fila in carga.carga_tecnicos(desde, hasta):
+            utilizacion = "—" if fila['utilizacion'] is None else f"{fila['utilizacion'] * 100:.1f}%"
+            self.tree_carga.insert('', 'end', values=(
+                fila['tecnico'],
+                fila['activas'],
+                fila['ordenes'],
+                fila['horas'],
+                utilizacion
+            ))
+    
+    # ==================== MÉTODOS DE REPORTES ====================
+    
+    def actualizar_estadisticas(self):
+        """Actualiza las estadísticas generales con diseño moderno"""
+        import Archivado_Mantenimiento as archivado
+        
+        # Los totales salen de los contadores incrementales de gm: no se recorren las órdenes
+        resumen = gm.resumen_estadisticas()
+        # ...y los de las órdenes archivadas, del índice del archivo histórico
+        archivadas = archivado.totales()['ordenes']
+        por_estado = resumen['por_estado']
+        por_tipo = " | ".join(f"{t}: {n}" for t, n in sorted(resumen['por_tipo'].items())) or "—"
+        
+        # Texto con mejor formato y emojis
+        texto = f"""
+    📦  EQUIPOS REGISTRADOS
+         {resumen['equipos']} equipos en el sistema
+    
+    🔧  ÓRDENAS DE TRABAJO
+         Total: {resumen['ordenes']}
+         • Pendientes: {por_estado['Pendiente']}
+         • En Progreso: {por_estado['En progreso']}
+         • Pausadas: {por_estado['Pausada']}
+         • Completadas: {por_estado['Completada']}
+         • Canceladas: {por_estado['Cancelada']}
+         • Por tipo: {por_tipo}
+         • Archivadas (cerradas antiguas): {archivadas}
+    
+    👷  TÉCNICOS REGISTRADOS
+         {resumen['tecnicos']} técnicos disponibles
+    
+    ✅  MANTENIMIENTOS COMPLETADOS
+         {resumen['historial']} trabajos finalizados
+        """
+        
+        self.label_stats.config(text=texto, 
+                               font=('Segoe UI', 11),
+                               bg=self.colors['card_bg'],
+                               fg=self.colors['text'])
+        self.actualizar_backlog()
+    
+    def actualizar_backlog(self):
+        """Refresca el histograma y la tendencia del backlog (lee los índices, no las órdenes)"""
+        import Backlog_Mantenimiento as backlog
+        
+        self.tree_backlog.delete(*self.tree_backlog.get_children())
+        for cubeta, por_prioridad in backlog.histograma_antiguedad().items():
+            self.tree_backlog.insert('', 'end', values=(
+                cubeta,
+                *(por_prioridad.get(p, 0) for p in gm.RANGO_PRIORIDAD),
+                sum(por_prioridad.values())
+            ))
+        self._dibujar_tendencia_backlog()
+    
+    def _actualizar_backlog_periodico(self):
+        """La antigüedad avanza con el reloj: refrescar cada minuto aunque no haya cambios"""
+        self.actualizar_backlog()
+        self.root.after(60000, self._actualizar_backlog_periodico)
+    
+    def _dibujar_tendencia_backlog(self):
+        """Línea del tamaño del backlog en los últimos 90 días"""
+        import Backlog_Mantenimiento as backlog
+        
+        canvas = self.canvas_backlog
+        canvas.delete('all')
+        serie = backlog.tendencia_ultimos_dias(90)
+        ancho, alto = max(canvas.winfo_width(), 200), max(canvas.winfo_height(), 100)
+        margen = 25
+        maximo = max(tamano for _, tamano in serie) or 1
+        paso = (ancho - 2 * margen) / max(len(serie) - 1, 1)
+        puntos = []
+        for i, (_, tamano) in enumerate(serie):
+            puntos += [margen + i * paso, alto - margen - (alto - 2 * margen) * tamano / maximo]
+        canvas.create_line(margen, alto - margen, ancho - margen, alto - margen, fill=self.colors['dark'])
+        canvas.create_line(*puntos, fill=self.colors['primary'], width=2)
+        canvas.create_text(margen, 8, anchor='w', font=('Segoe UI', 8),
+                           text=f"Backlog últimos 90 días (máx. {maximo}, hoy {serie[-1][1]})")
+        canvas.create_text(margen, alto - 10, anchor='w', font=('Segoe UI', 8), text=f"{serie[0][0]:%d/%m}")
+        canvas.create_text(ancho - margen, alto - 10, anchor='e', font=('Segoe UI', 8), text=f"{serie[-1][0]:%d/%m}")
+    
+    def ver_indicadores_confiabilidad(self):
+        """Muestra MTTR, MTBF, disponibilidad y relación preventivo/correctivo por equipo"""
+        try:
+            import Indicadores_Mantenimiento as ind
+        except ImportError:
+            messagebox.showwarning("Advertencia",
+                                   "Instale numpy para calcular los indicadores:\npip install numpy")
+            return
+        
+        resultado = ind.calcular_indicadores(incluir_archivadas=True)
+        resumen = resultado['global']
+        
+        def fmt(valor, sufijo=""):
+            return "—" if valor is None else f"{valor}{sufijo}"
+        
+        def porcentaje(valor):
+            return "—" if valor is None else f"{valor * 100:.2f}%"
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Indicadores de Confiabilidad")
+        ventana.geometry("900x500")
+        
+        texto = (f"MTTR global: {fmt(resumen['mttr_horas'], ' h')}    "
+                 f"MTBF global: {fmt(resumen['mtbf_horas'], ' h')}    "
+                 f"Disponibilidad: {porcentaje(resumen['disponibilidad'])}\n"
+                 f"Preventivos: {resumen['preventivos']}    Predictivos: {resumen['predictivos']}    "
+                 f"Correctivos: {resumen['correctivos']}    "
+                 f"Relación Prev/Corr: {fmt(resumen['relacion_prev_corr'])}")
+        tk.Label(ventana, text=texto, font=('Segoe UI', 10, 'bold'), justify='left',
+                 padx=15, pady=10).pack(fill='x')
+        
+        frame_tabla = tk.Frame(ventana)
+        frame_tabla.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        columnas = ('ID', 'Equipo', 'Reparaciones', 'MTTR (h)', 'Fallas', 'MTBF (h)',
+                    'Disponibilidad', 'Prev/Corr')
+        tree = ttk.Treeview(frame_tabla, columns=columnas, show='headings')
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=180 if col == 'Equipo' else 95)
+        scrollbar = ttk.Scrollbar(frame_tabla, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        for fila in resultado['equipos']:
+            tree.insert('', 'end', values=(
+                fila['equipo_id'],
+                fila['equipo_nombre'],
+                fila['reparaciones'],
+                fmt(fila['mttr_horas']),
+                fila['fallas'],
+                fmt(fila['mtbf_horas']),
+                porcentaje(fila['disponibilidad']),
+                fmt(fila['relacion_prev_corr'])
+            ))
+    
+    def ver_resumen_mensual(self):
+        """Reporte mensual por tipo, técnico o equipo y tendencia de 12 meses (lee los resúmenes)"""
+        dimensiones = {"Tipo": "tipo", "Técnico": "tecnico", "Equipo": "equipo"}
+        colores_tipo = {"Preventivo": self.colors['success'], "Correctivo": self.colors['danger'],
+                        "Predictivo": self.colors['secondary']}
+        hoy = datetime.now()
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Resumen Mensual")
+        ventana.geometry("820x620")
+        
+        frame_filtros = tk.Frame(ventana)
+        frame_filtros.pack(fill='x', padx=10, pady=10)
+        ttk.Label(frame_filtros, text="Agrupar por:").pack(side='left')
+        combo_dimension = ttk.Combobox(frame_filtros, values=list(dimensiones), state='readonly', width=12)
+        combo_dimension.set("Tipo")
+        combo_dimension.pack(side='left', padx=5)
+        ttk.Label(frame_filtros, text="Mes:").pack(side='left', padx=(15, 0))
+        combo_mes = ttk.Combobox(frame_filtros, values=list(range(1, 13)), state='readonly', width=5)
+        combo_mes.set(hoy.month)
+        combo_mes.pack(side='left', padx=5)
+        ttk.Label(frame_filtros, text="Año:").pack(side='left', padx=(15, 0))
+        entry_anio = ttk.Entry(frame_filtros, width=8)
+        entry_anio.insert(0, str(hoy.year))
+        entry_anio.pack(side='left', padx=5)
+        
+        columnas = ('Clave', 'Cantidad', 'Horas', 'Promedio (h)')
+        tree = ttk.Treeview(ventana, columns=columnas, show='headings', height=8)
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=300 if col == 'Clave' else 140)
+        tree.pack(fill='x', padx=10)
+        
+        canvas = tk.Canvas(ventana, height=300, bg='white', highlightthickness=0)
+        canvas.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        def dibujar_tendencia(anio, mes):
+            """Barras apiladas por tipo de los 12 meses que terminan en mes/anio"""
+            canvas.delete('all')
+            serie = gm.tendencia_mensual("tipo", 12, (anio, mes))
+            ancho = max(canvas.winfo_width(), 780)
+            alto = max(canvas.winfo_height(), 300)
+            margen, base = 40, alto - 40
+            maximo = max((sum(c.values()) for _, _, c in serie), default=0) or 1
+            paso = (ancho - 2 * margen) / len(serie)
+            canvas.create_text(margen, 12, anchor='w', font=('Segoe UI', 10, 'bold'),
+                               text="Mantenimientos por mes (últimos 12 meses)")
+            canvas.create_line(margen, base, ancho - margen, base)
+            for i, (a, m, cantidades) in enumerate(serie):
+                x0 = margen + i * paso + paso * 0.15
+                x1 = margen + (i + 1) * paso - paso * 0.15
+                y = base
+                for tipo in gm.TIPOS_MANTENIMIENTO:
+                    altura = (base - 40) * cantidades.get(tipo, 0) / maximo
+                    if altura:
+                        canvas.create_rectangle(x0, y - altura, x1, y, fill=colores_tipo[tipo], outline='')
+                        y -= altura
+                total = sum(cantidades.values())
+                if total:
+                    canvas.create_text((x0 + x1) / 2, y - 8, text=str(total), font=('Segoe UI', 8))
+                canvas.create_text((x0 + x1) / 2, base + 12, text=f"{m:02d}/{a % 100:02d}", font=('Segoe UI', 8))
+            for j, tipo in enumerate(gm.TIPOS_MANTENIMIENTO):
+                x = ancho - margen - 110 * (len(gm.TIPOS_MANTENIMIENTO) - j)
+                canvas.create_rectangle(x, 6, x + 12, 18, fill=colores_tipo[tipo], outline='')
+                canvas.create_text(x + 16, 12, anchor='w', text=tipo, font=('Segoe UI', 8))
+        
+        def actualizar():
+            try:
+                anio = int(entry_anio.get())
+                mes = int(combo_mes.get())
+            except ValueError:
+                messagebox.showerror("Error", "Mes o año inválido", parent=ventana)
+                return
+            tree.delete(*tree.get_children())
+            for fila in gm.resumen_mensual(dimensiones[combo_dimension.get()], anio, mes):
+                tree.insert('', 'end', values=(
+                    fila['clave'],
+                    fila['cantidad'],
+                    fila['horas'],
+                    "—" if fila['horas_promedio'] is None else fila['horas_promedio']
+                ))
+            dibujar_tendencia(anio, mes)
+        
+        ttk.Button(frame_filtros, text="Ver", command=actualizar, style='Main.TButton').pack(side='left', padx=15)
+        combo_dimension.bind('<<ComboboxSelected>>', lambda e: actualizar())
+        combo_mes.bind('<<ComboboxSelected>>', lambda e: actualizar())
+        ventana.after_idle(actualizar)
+    
+    def ver_ordenes_archivadas(self):
+        """Busca en el archivo histórico de órdenes cerradas (los segmentos se leen solo al buscar)"""
+        import Archivado_Mantenimiento as archivado
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Órdenes Archivadas")
+        ventana.geometry("1100x600")
+        
+        label_resumen = tk.Label(ventana, font=('Segoe UI', 10, 'bold'), justify='left', padx=15, pady=10)
+        label_resumen.pack(fill='x')
+        
+        frame_busqueda = tk.Frame(ventana)
+        frame_busqueda.pack(fill='x', padx=10)
+        ttk.Label(frame_busqueda, text="Buscar (texto o ID):").pack(side='left', padx=5)
+        entry_buscar = ttk.Entry(frame_busqueda, width=30)
+        entry_buscar.pack(side='left', padx=5)
+        ttk.Label(frame_busqueda, text="Cerradas desde (AAAA-MM):").pack(side='left', padx=5)
+        entry_desde = ttk.Entry(frame_busqueda, width=9)
+        entry_desde.pack(side='left', padx=5)
+        ttk.Label(frame_busqueda, text="hasta:").pack(side='left', padx=5)
+        entry_hasta = ttk.Entry(frame_busqueda, width=9)
+        entry_hasta.pack(side='left', padx=5)
+        
+        frame_tabla = tk.Frame(ventana)
+        frame_tabla.pack(fill='both', expand=True, padx=10, pady=10)
+        columnas = ('ID', 'Equipo', 'Tipo', 'Prioridad', 'Estado', 'Cierre', 'Técnico', 'Descripción')
+        tree = ttk.Treeview(frame_tabla, columns=columnas, show='headings')
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=250 if col == 'Descripción' else 160 if col == 'Equipo' else 95)
+        scrollbar = ttk.Scrollbar(frame_tabla, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        def mostrar_resumen(mensaje=""):
+            totales = archivado.totales()
+            dias = archivado.dias_politica()
+            politica = f"cerradas hace más de {dias} días" if dias else "desactivada"
+            label_resumen.config(text=f"{totales['ordenes']:,} órdenes en {totales['segmentos']} segmentos "
+                                      f"({totales['bytes'] / 1024 / 1024:.1f} MB comprimidos)  |  "
+                                      f"Política de archivado: {politica}" + (f"\n{mensaje}" if mensaje else ""))
+        
+        def mes(entry):
+            texto = entry.get().strip()
+            if texto:
+                datetime.strptime(texto, "%Y-%m")
+            return texto or None
+        
+        def buscar():
+            try:
+                desde, hasta = mes(entry_desde), mes(entry_hasta)
+            except ValueError:
+                messagebox.showerror("Error", "Use el formato AAAA-MM para los meses", parent=ventana)
+                return
+            ventana.config(cursor='watch')
+            ventana.update_idletasks()
+            try:
+                encontradas = archivado.buscar_ordenes_archivadas(entry_buscar.get(), desde, hasta,
+                                                                  limite=LIMITE_ARCHIVADAS + 1)
+            finally:
+                ventana.config(cursor='')
+            tree.delete(*tree.get_children())
+            for orden in encontradas[:LIMITE_ARCHIVADAS]:
+                tree.insert('', 'end', values=(
+                    orden['id'], orden.get('equipo_nombre'), orden.get('tipo'), orden.get('prioridad'),
+                    orden.get('estado'), orden.get('fecha_finalizacion') or '—',
+                    orden.get('tecnico_asignado') or 'Sin asignar', orden.get('descripcion')))
+            if len(encontradas) > LIMITE_ARCHIVADAS:
+                mostrar_resumen(f"Se muestran las primeras {LIMITE_ARCHIVADAS:,}: refine la búsqueda")
+            else:
+                mostrar_resumen(f"{len(encontradas):,} órdenes encontradas")
+        
+        def archivar_ahora():
+            dias = archivado.dias_politica() or archivado.DIAS_ARCHIVO
+            if not messagebox.askyesno("Confirmar", f"¿Archivar las órdenes cerradas hace más de {dias} días?",
+                                       parent=ventana):
+                return
+            try:
+                resultado = archivado.archivar_ordenes(dias)
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Error", f"No se pudieron archivar las órdenes:\n{e}", parent=ventana)
+                return
+            if resultado['archivadas']:
+                self.actualizar_todas_las_listas()
+            mostrar_resumen(f"Se archivaron {resultado['archivadas']:,} órdenes")
+        
+        ttk.Button(frame_busqueda, text="🔍 Buscar", command=buscar).pack(side='left', padx=5)
+        ttk.Button(frame_busqueda, text="📦 Archivar ahora", command=archivar_ahora).pack(side='right', padx=5)
+        entry_buscar.bind('<Return>', lambda e: buscar())
+        mostrar_resumen()
+    
+    def ver_simulacion_capacidad(self):
+        """Simula la demanda de horas frente a la capacidad de los técnicos para los próximos 12 meses"""
+        try:
+            import Simulacion_Mantenimiento as sim
+        except ImportError:
+            messagebox.showwarning("Advertencia",
+                                   "Instale numpy para ejecutar la simulación:\npip install numpy")
+            return
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Simulación de Capacidad")
+        ventana.geometry("900x680")
+        
+        frame_filtros = tk.Frame(ventana)
+        frame_filtros.pack(fill='x', padx=10, pady=10)
+        ttk.Label(frame_filtros, text="Escenarios:").pack(side='left')
+        entry_escenarios = ttk.Entry(frame_filtros, width=8)
+        entry_escenarios.insert(0, str(sim.ESCENARIOS))
+        entry_escenarios.pack(side='left', padx=5)
+        label_parametros = ttk.Label(frame_filtros, text="")
+        label_parametros.pack(side='right')
+        
+        columnas = ('Mes', 'Demanda P10 (h)', 'Demanda P50 (h)', 'Demanda P90 (h)',
+                    'Capacidad P50 (h)', 'Utilización P50', 'Utilización P90', 'Prob. sobrecarga')
+        tree = ttk.Treeview(ventana, columns=columnas, show='headings', height=12)
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=70 if col == 'Mes' else 105)
+        tree.pack(fill='x', padx=10)
+        
+        canvas = tk.Canvas(ventana, height=280, bg='white', highlightthickness=0)
+        canvas.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        def porcentaje(valor):
+            return "—" if valor is None else f"{valor * 100:.0f}%"
+        
+        def dibujar(resultado):
+            """Banda P10-P90 de la demanda, su mediana y la capacidad mediana por mes"""
+            canvas.delete('all')
+            bajo, medio, superior = (resultado['demanda'][p] for p in sim.PERCENTILES)
+            capacidad = resultado['capacidad'][50]
+            ancho = max(canvas.winfo_width(), 860)
+            alto = max(canvas.winfo_height(), 280)
+            margen, base = 50, alto - 40
+            maximo = max(superior + capacidad) or 1
+            paso = (ancho - 2 * margen) / max(len(medio) - 1, 1)
+            
+            def punto(i, valor):
+                return margen + i * paso, base - (base - 40) * valor / maximo
+            
+            canvas.create_text(margen, 12, anchor='w', font=('Segoe UI', 10, 'bold'),
+                               text="Horas de trabajo por mes (banda P10-P90 de la demanda)")
+            canvas.create_line(margen, base, ancho - margen, base)
+            banda = [punto(i, v) for i, v in enumerate(superior)] + \
+                    [punto(i, v) for i, v in reversed(list(enumerate(bajo)))]
+            canvas.create_polygon(*[c for xy in banda for c in xy], fill='#fed7d7', outline='')
+            canvas.create_line(*[c for i, v in enumerate(medio) for c in punto(i, v)],
+                               fill=self.colors['danger'], width=2)
+            canvas.create_line(*[c for i, v in enumerate(capacidad) for c in punto(i, v)],
+                               fill=self.colors['success'], width=2, dash=(6, 3))
+            for i, (anio, mes) in enumerate(resultado['periodos']):
+                x, _ = punto(i, 0)
+                canvas.create_text(x, base + 12, text=f"{mes:02d}/{anio % 100:02d}", font=('Segoe UI', 8))
+            canvas.create_text(margen - 5, 40, anchor='e', text=f"{maximo:,.0f} h", font=('Segoe UI', 8))
+            for j, (texto, color) in enumerate((("Demanda (mediana)", self.colors['danger']),
+                                                ("Capacidad (mediana)", self.colors['success']))):
+                x = ancho - margen - 150 * (2 - j)
+                canvas.create_rectangle(x, 6, x + 12, 18, fill=color, outline='')
+                canvas.create_text(x + 16, 12, anchor='w', text=texto, font=('Segoe UI', 8))
+        
+        def mostrar(resultado, error):
+            if error:
+                messagebox.showerror("Error", f"No se pudo simular:\n{error}", parent=ventana)
+                return
+            if resultado is None or not ventana.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for i, (anio, mes) in enumerate(resultado['periodos']):
+                tree.insert('', 'end', values=(
+                    f"{mes:02d}/{anio}",
+                    *(f"{resultado['demanda'][p][i]:,.1f}" for p in sim.PERCENTILES),
+                    f"{resultado['capacidad'][50][i]:,.1f}",
+                    porcentaje(resultado['utilizacion'][50][i]),
+                    porcentaje(resultado['utilizacion'][90][i]),
+                    f"{resultado['prob_sobrecarga'][i] * 100:.1f}%"
+                ))
+            parametros = resultado['parametros']
+            label_parametros.config(text=(
+                f"{parametros['tecnicos']} técnicos | {parametros['tasa_correctivos_mes']} correctivos/mes | "
+                f"{parametros['planificados']} planificados | {parametros['abiertas']} abiertas | "
+                f"{resultado['escenarios']:,} escenarios en {resultado['segundos']:.2f} s"))
+            dibujar(resultado)
+        
+        def simular():
+            try:
+                escenarios = int(entry_escenarios.get())
+                if escenarios <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "Cantidad de escenarios inválida", parent=ventana)
+                return
+            self._tarea_con_progreso(
+                "Simulando",
+                lambda progreso, cancelar: sim.simular(escenarios, progreso=progreso, cancelar=cancelar),
+                mostrar, unidad="escenarios")
+        
+        ttk.Button(frame_filtros, text="Simular", command=simular, style='Main.TButton').pack(side='left', padx=15)
+        ventana.after_idle(simular)
+    
+    def abrir_diagnostico(self):
+        """Panel oculto (Ctrl+Shift+D) con las llamadas y latencias medidas por Metricas_Mantenimiento"""
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Diagnóstico de rendimiento")
+        ventana.geometry("1000x560")
+        
+        frame_botones = tk.Frame(ventana)
+        frame_botones.pack(fill='x', padx=10, pady=10)
+        label_estado = ttk.Label(frame_botones, text="")
+        label_estado.pack(side='left')
+        
+        columnas = ('Operación', 'Llamadas', 'Errores', 'Total (ms)', 'Promedio (ms)',
+                    'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'Máx (ms)')
+        tree = ttk.Treeview(ventana, columns=columnas, show='headings', height=14)
+        for col in columnas:
+            tree.heading(col, text=col)
+            tree.column(col, width=300 if col == 'Operación' else 80, anchor='w' if col == 'Operación' else 'e')
+        tree.pack(fill='both', expand=True, padx=10)
+        
+        ttk.Label(ventana, text=f"Llamadas de más de {metricas.UMBRAL_LENTA_S * 1000:g} ms (las más recientes primero):",
+                  font=('Segoe UI', 10, 'bold')).pack(anchor='w', padx=10, pady=(10, 0))
+        tree_lentas = ttk.Treeview(ventana, columns=('Fecha', 'Operación', 'ms'), show='headings', height=6)
+        for col, ancho in (('Fecha', 160), ('Operación', 500), ('ms', 100)):
+            tree_lentas.heading(col, text=col)
+            tree_lentas.column(col, width=ancho)
+        tree_lentas.pack(fill='x', padx=10, pady=(0, 10))
+        
+        def actualizar():
+            if not ventana.winfo_exists():
+                return
+            datos = metricas.instantanea()
+            tree.delete(*tree.get_children())
+            for nombre, m in datos['metricas'].items():
+                tree.insert('', 'end', values=(nombre, m['llamadas'], m['errores'], f"{m['total_ms']:,.1f}",
+                                               f"{m['promedio_ms']:,.2f}", f"{m['p50_ms']:,.2f}",
+                                               f"{m['p95_ms']:,.2f}", f"{m['p99_ms']:,.2f}",
+                                               f"{m['maximo_ms']:,.1f}"))
+            tree_lentas.delete(*tree_lentas.get_children())
+            for lenta in datos['lentas']:
+                tree_lentas.insert('', 'end', values=(lenta['fecha'], lenta['nombre'], f"{lenta['ms']:,.1f}"))
+            label_estado.config(text=("🟢 Midiendo" if metricas.activas
+                                      else f"⚪ Métricas desactivadas (se activan aquí o con {metricas.VARIABLE_ENTORNO}=1)")
+                                + (f"  |  Bloqueos de la interfaz: {self.monitor.bloqueos} "
+                                   f"(ver {self.monitor.ruta_registro})" if self.monitor else ""))
+            boton_activar.config(text="Desactivar" if metricas.activas else "Activar")
+            ventana.after(1000, actualizar)
+        
+        def alternar():
+            metricas.activar(not metricas.activas)
+        
+        def guardar():
+            try:
+                ruta = metricas.volcar()
+            except OSError as e:
+                messagebox.showerror("Error", f"No se pudieron guardar las métricas:\n{e}", parent=ventana)
+                return
+            messagebox.showinfo("Métricas guardadas", f"Archivo:\n{ruta}", parent=ventana)
+        
+        boton_activar = ttk.Button(frame_botones, text="", command=alternar)
+        boton_activar.pack(side='right', padx=5)
+        ttk.Button(frame_botones, text="🧠 Memoria", command=self.ver_memoria).pack(side='right', padx=5)
+        ttk.Button(frame_botones, text="🚀 Arranque",
+                   command=lambda: messagebox.showinfo("Perfil de arranque", arranque.legible(), parent=ventana)
+                   ).pack(side='right', padx=5)
+        ttk.Button(frame_botones, text="Reiniciar", command=metricas.reiniciar).pack(side='right', padx=5)
+        ttk.Button(frame_botones, text="💾 Guardar en archivo", command=guardar).pack(side='right', padx=5)
+        actualizar()
+    
+    def ver_memoria(self):
+        """Tamaño de los datos, conteos de Tk y asignaciones (tracemalloc), comparables entre instantáneas"""
+        import Memoria_Mantenimiento as memoria
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Diagnóstico de memoria")
+        ventana.geometry("1000x650")
+        
+        frame_botones = tk.Frame(ventana)
+        frame_botones.pack(fill='x', padx=10, pady=10)
+        label_estado = ttk.Label(frame_botones, text="")
+        label_estado.pack(side='left')
+        texto = scrolledtext.ScrolledText(ventana, font=('Consolas', 9), wrap='none')
+        texto.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        
+        def mostrar(contenido):
+            texto.config(state='normal')
+            texto.delete('1.0', tk.END)
+            texto.insert('1.0', contenido)
+            texto.config(state='disabled')
+            label_estado.config(text="tracemalloc activo" if memoria.tracemalloc.is_tracing()
+                                else "tracemalloc inactivo")
+        
+        def instantanea():
+            # La instantánea anterior queda en la ventana principal: se puede comparar tras horas de uso
+            ventana.config(cursor='watch')
+            ventana.update_idletasks()
+            try:
+                actual = memoria.informe(self.root, self)
+                anterior = getattr(self, '_informe_memoria', None)
+                cambios = memoria.comparar(anterior, actual) if anterior else None
+                self._informe_memoria = actual
+                mostrar(memoria.formatear(actual, cambios))
+            finally:
+                ventana.config(cursor='')
+        
+        def alternar_rastreo():
+            if memoria.tracemalloc.is_tracing():
+                memoria.detener_rastreo()
+                self._informe_memoria = None
+            else:
+                memoria.iniciar_rastreo()
+            instantanea()
+        
+        def guardar():
+            if not getattr(self, '_informe_memoria', None):
+                return
+            ruta = filedialog.asksaveasfilename(parent=ventana, defaultextension=".json",
+                                                initialdir=DATA_DIR, initialfile="memoria_mantenimiento.json",
+                                                filetypes=[("JSON", "*.json")])
+            if ruta:
+                with open(ruta, 'w', encoding='utf-8') as archivo:
+                    json.dump(memoria.serializable(self._informe_memoria), archivo, indent=2, ensure_ascii=False)
+        
+        ttk.Button(frame_botones, text="📸 Tomar instantánea (compara con la anterior)",
+                   command=instantanea).pack(side='right', padx=5)
+        ttk.Button(frame_botones, text="Iniciar/detener tracemalloc", command=alternar_rastreo).pack(side='right', padx=5)
+        ttk.Button(frame_botones, text="💾 Guardar JSON", command=guardar).pack(side='right', padx=5)
+        ventana.after_idle(instantanea)
+    
+    def _darken_color(self, hex_color):
+        """Oscurece un color hexadecimal para efectos hover"""
+        # Convertir hex a RGB
+        hex_color = hex_color.lstrip('#')
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        
+        # Oscurecer (reducir cada componente en 20%)
+        r = max(0, int(r * 0.8))
+        g = max(0, int(g * 0.8))
+        b = max(0, int(b * 0.8))
+        
+        # Convertir de vuelta a hex
+        return f'#{r:02x}{g:02x}{b:02x}'
+    
+    def actualizar_historial(self):
+        """Actualiza el historial de mantenimiento"""
+        self._llenar_tabla('historial', self.tree_historial, gm.historial_mantenimiento, _fila_historial)
+
+    def eliminar_orden_trabajo(self):
+        """Elimina las órdenes de trabajo seleccionadas y libera técnicos si aplica"""
+        ids = self._ids_ordenes_seleccionadas()
+        if not ids:
+            messagebox.showwarning("Advertencia", "Seleccione una o más órdenes de la lista")
+            return
+
+        if len(ids) == 1:
+            pregunta = f"¿Eliminar la orden #{ids[0]}?"
+        else:
+            pregunta = f"¿Eliminar {len(ids)} órdenes?"
+        if not messagebox.askyesno("Confirmar", pregunta):
+            return
+
+        import Deshacer_Mantenimiento as deshacer
+        eliminadas = gm.ordenes_por_ids(ids)
+        if eliminadas:
+            self._ejecutar_comando(deshacer.eliminar_ordenes(ids))
+            if len(eliminadas) == 1:
+                messagebox.showinfo("Éxito", f"Orden #{eliminadas[0]['id']} eliminada correctamente "
+                                             f"(Ctrl+Z para deshacer)")
+            else:
+                messagebox.showinfo("Éxito", f"{len(eliminadas)} órdenes eliminadas correctamente "
+                                             f"(Ctrl+Z para deshacer)")
+    
+    def eliminar_tecnico(self):
+        """Elimina el técnico seleccionado. Desasigna en las órdenes si aplica."""
+        seleccion = self.tree_tecnicos.selection()
+        if not seleccion:
+            messagebox.showwarning("Advertencia", "Seleccione un técnico de la lista")
+            return
+
+        item = self.tree_tecnicos.item(seleccion[0])
+        id_tecnico = int(item['values'][0])
+
+        tecnico = next((t for t in gm.tecnicos if t["id"] == id_tecnico), None)
+        if not tecnico:
+            messagebox.showwarning("Advertencia", "Técnico no encontrado")
+            return
+
+        # Buscar órdenes activas asignadas
+        asignadas = [o for o in gm.ordenes_trabajo if o.get('tecnico_asignado') == tecnico['nombre'] and o.get('estado') != "Completada"]
+        if asignadas:
+            if not messagebox.askyesno("Confirmar", f"El técnico está asignado a {len(asignadas)} orden(es) activas.\n¿Desea eliminar y desasignar de esas órdenes?"):
+                return
+
+        # Desasigna en todas las órdenes y elimina, como una sola acción que se puede deshacer
+        import Deshacer_Mantenimiento as deshacer
+        self._ejecutar_comando(deshacer.eliminar_tecnico(tecnico))
+        messagebox.showinfo("Éxito", f"Técnico '{tecnico['nombre']}' eliminado correctamente (Ctrl+Z para deshacer)")
+    
+    def eliminar_plan_mantenimiento(self):
+        """Elimina el plan de mantenimiento seleccionado"""
+        seleccion = self.tree_planes.selection()
+        if not seleccion:
+            messagebox.showwarning("Advertencia", "Seleccione un plan de la lista")
+            return
+
+        item = self.tree_planes.item(seleccion[0])
+        if str(item['values'][0]).startswith("R"):
+            self.eliminar_plan_recurrente(int(str(item['values'][0])[1:]))
+            return
+        id_plan = int(item['values'][0])
+
+        if not messagebox.askyesno("Confirmar", f"¿Eliminar el plan #{id_plan}?"):
+            return
+
+        plan = next((p for p in gm.planes_mantenimiento if p["id"] == id_plan), None)
+        if plan:
+            gm.planes_mantenimiento.remove(plan)
+            gm.guardar_datos()
+            messagebox.showinfo("Éxito", f"Plan #{id_plan} eliminado correctamente")
+            self.actualizar_lista_planes()
+    
+    def eliminar_plan_recurrente(self, id_regla):
+        """Elimina un plan recurrente (todas sus fechas futuras)"""
+        import Planificacion_Mantenimiento as planificacion
+        
+        if not messagebox.askyesno("Confirmar", f"¿Eliminar el plan recurrente R{id_regla} "
+                                                "y todas sus fechas programadas?"):
+            return
+        if planificacion.eliminar_regla(id_regla):
+            messagebox.showinfo("Éxito", f"Plan recurrente R{id_regla} eliminado correctamente")
+            self.actualizar_lista_planes()
+
+# Todos los métodos (manejadores de botones y refrescos) quedan medidos cuando las métricas están activas
+metricas.instrumentar(SistemaMantenimientoGUI, "gui", excluir=("_darken_color", "abrir_diagnostico", "ver_memoria"))
+    
+def main():
+    # Debug: descomenta la línea siguiente si quieres ver mensajes en la consola
+    # print("Iniciando GUI de Gestión de Mantenimiento...")
+    gm.configurar_consola()
+    with arranque.fase("ventana"):
+        root = tk.Tk()
+    app = SistemaMantenimientoGUI(root)
+    root.mainloop()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,312 @@
+"""
+Diagnóstico de memoria del Sistema de Gestión de Mantenimiento
+Archivo: Memoria_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Reúne los números para confirmar (o descartar) fugas de memoria en sesiones
+largas de la interfaz:
+
+  • tamaño en memoria de cada colección de gm y de los índices auxiliares
+    de los módulos cargados (los objetos compartidos se cuentan una vez),
+  • widgets de Tk por clase, ventanas Toplevel abiertas, filas de cada
+    Treeview, comandos Tcl registrados y callbacks de after pendientes, y
+    los objetos de tkinter que siguen vivos en Python,
+  • con tracemalloc activo, las líneas que más memoria asignaron y el
+    crecimiento entre dos instantáneas.
+
+Comparar dos informes (comparar()) muestra qué creció entre ellos: si tras
+abrir y cerrar diálogos o redibujar tablas crecen los Toplevel, los comandos
+Tcl o las asignaciones de una línea, ahí está la fuga. tracemalloc solo ve lo
+asignado después de iniciarlo; con GM_TRACEMALLOC=N (marcos por asignación)
+se inicia al importar este módulo.
+"""
+
+import gc
+import os
+import sys
+import linecache
+import tracemalloc
+from collections import Counter
+
+VARIABLE_ENTORNO = "GM_TRACEMALLOC"
+PRINCIPALES = 15
+
+# (módulo, atributo, descripción) de los índices y cachés de cada módulo
+ESTRUCTURAS_AUXILIARES = [
+    ("Gestion_Mantenimiento", "_ordenes_por_id", "índice de órdenes por ID"),
+    ("Gestion_Mantenimiento", "contadores_ordenes", "contadores de órdenes"),
+    ("Gestion_Mantenimiento", "resumenes_mensuales", "resúmenes mensuales"),
+    ("Gestion_Mantenimiento", "_huellas_base", "huellas de sincronización"),
+    ("Backlog_Mantenimiento", "_abiertas_por_dia", "backlog: abiertas por día"),
+    ("Backlog_Mantenimiento", "_variacion_diaria", "backlog: variación diaria"),
+    ("Despacho_Mantenimiento", "_cola", "despacho: cola"),
+    ("Despacho_Mantenimiento", "_en_cola", "despacho: órdenes en cola"),
+    ("Despacho_Mantenimiento", "_por_equipo", "despacho: órdenes por equipo"),
+    ("Carga_Mantenimiento", "_ordenes_por_tecnico", "carga: órdenes por técnico"),
+    ("Carga_Mantenimiento", "_indices", "carga: índices de intervalos"),
+    ("Servidor_Mantenimiento", "_ordenes_por_campo", "servidor: órdenes por campo"),
+    ("Servidor_Mantenimiento", "_mapas_id", "servidor: mapas por ID"),
+]
+# Atributos de la ventana principal que crecen con las tablas
+ESTRUCTURAS_INTERFAZ = [
+    ("_filas", "interfaz: filas mostradas"),
+    ("_cache_orden", "interfaz: ordenamientos en caché"),
+]
+
+
+def tamano_profundo(objeto, vistos=None):
+    """Bytes aproximados de 'objeto' y todo lo que contiene (listas, tuplas, conjuntos y diccionarios).
+
+    Los contenedores y las claves de diccionario cuyo id ya está en 'vistos'
+    no se vuelven a contar: con un mismo conjunto para varias estructuras, los
+    registros compartidos (p. ej. una orden y su entrada en un índice) se
+    cuentan una vez. Los valores sueltos (textos, números) se cuentan donde
+    aparecen sin recordar su id: recordar millones de ids costaría más
+    memoria que la que se quiere medir.
+    """
+    vistos = set() if vistos is None else vistos
+    total = 0
+    pendientes = [objeto]
+    while pendientes:
+        actual = pendientes.pop()
+        if isinstance(actual, (dict, list, tuple, set, frozenset)):
+            if id(actual) in vistos:
+                continue
+            vistos.add(id(actual))
+            total += sys.getsizeof(actual)
+            if isinstance(actual, dict):
+                for clave in actual:
+                    if id(clave) not in vistos:
+                        vistos.add(id(clave))
+                        total += sys.getsizeof(clave)
+                pendientes.extend(actual.values())
+            else:
+                pendientes.extend(actual)
+        elif actual is None or isinstance(actual, bool) or (type(actual) is int and -5 <= actual <= 256):
+            # Objetos únicos del intérprete: no ocupan memoria por registro
+            continue
+        else:
+            total += sys.getsizeof(actual)
+    return total
+
+
+def tamanos_datos(app=None):
+    """[{"nombre", "registros", "bytes"}] de las colecciones de gm, los índices y (con 'app') la interfaz"""
+    import Gestion_Mantenimiento as gm
+    vistos = set()
+    filas = []
+    for coleccion in gm.COLECCIONES_DATOS:
+        lista = getattr(gm, coleccion)
+        filas.append({"nombre": coleccion, "registros": len(lista), "bytes": tamano_profundo(lista, vistos)})
+    for modulo, atributo, descripcion in ESTRUCTURAS_AUXILIARES:
+        if modulo in sys.modules and hasattr(sys.modules[modulo], atributo):
+            valor = getattr(sys.modules[modulo], atributo)
+            filas.append({"nombre": descripcion, "registros": len(valor) if hasattr(valor, "__len__") else None,
+                          "bytes": tamano_profundo(valor, vistos)})
+    for atributo, descripcion in ESTRUCTURAS_INTERFAZ if app is not None else ():
+        valor = getattr(app, atributo, None)
+        if valor is not None:
+            filas.append({"nombre": descripcion, "registros": len(valor), "bytes": tamano_profundo(valor, vistos)})
+    return filas
+
+
+def conteo_tk(root):
+    """Widgets por clase, Toplevel abiertos, filas por Treeview, comandos Tcl y callbacks pendientes"""
+    widgets = Counter()
+    filas_treeview = {}
+    pendientes = [root]
+    while pendientes:
+        widget = pendientes.pop()
+        clase = widget.winfo_class()
+        widgets[clase] += 1
+        if clase == "Treeview":
+            filas = 0
+            niveles = [""]
+            while niveles:
+                hijos = widget.get_children(niveles.pop())
+                filas += len(hijos)
+                niveles.extend(hijos)
+            filas_treeview[str(widget)] = filas
+        pendientes.extend(widget.winfo_children())
+    return {
+        "widgets": sum(widgets.values()),
+        "por_clase": dict(widgets.most_common()),
+        "toplevel": widgets.get("Toplevel", 0),
+        "filas_treeview": filas_treeview,
+        "comandos_tcl": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+        "after_pendientes": len(root.tk.splitlist(root.tk.call("after", "info"))),
+    }
+
+
+def objetos_tkinter_vivos():
+    """{clase: cantidad} de los objetos de tkinter que Python aún tiene (destruidos o no en Tk)"""
+    import tkinter
+    conteo = Counter(type(o).__name__ for o in gc.get_objects() if isinstance(o, tkinter.Misc))
+    return dict(conteo.most_common())
+
+
+# ==================== TRACEMALLOC ====================
+
+def iniciar_rastreo(marcos=1):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(marcos)
+
+
+def detener_rastreo():
+    tracemalloc.stop()
+
+
+def instantanea_memoria():
+    return tracemalloc.take_snapshot()
+
+
+# Asignaciones que no interesan: el propio tracemalloc, este módulo (el informe
+# anterior sigue vivo para compararlo), linecache y la importación de módulos.
+# Se descartan al agrupar (filter_traces recorre cada asignación en Python y con
+# millones de registros en memoria tarda más de un minuto).
+_EXCLUIDOS = {tracemalloc.__file__, __file__, linecache.__file__, "<frozen importlib._bootstrap>",
+              "<frozen importlib._bootstrap_external>", "<unknown>"}
+
+
+def _lugar(traza):
+    marco = traza[0]
+    codigo = linecache.getline(marco.filename, marco.lineno).strip()
+    return f"{os.path.basename(marco.filename)}:{marco.lineno}", codigo
+
+
+def _relevantes(estadisticas, cantidad):
+    return [e for e in estadisticas if e.traceback[0].filename not in _EXCLUIDOS][:cantidad]
+
+
+def principales(instantanea, cantidad=PRINCIPALES):
+    """Las 'cantidad' líneas con más memoria asignada viva"""
+    filas = []
+    for estadistica in _relevantes(instantanea.statistics("lineno"), cantidad):
+        lugar, codigo = _lugar(estadistica.traceback)
+        filas.append({"lugar": lugar, "codigo": codigo, "bytes": estadistica.size,
+                      "bloques": estadistica.count})
+    return filas
+
+
+def crecimiento(antes, despues, cantidad=PRINCIPALES):
+    """Las 'cantidad' líneas cuya memoria viva más cambió entre dos instantáneas"""
+    filas = []
+    for diferencia in _relevantes(despues.compare_to(antes, "lineno"), cantidad):
+        lugar, codigo = _lugar(diferencia.traceback)
+        filas.append({"lugar": lugar, "codigo": codigo, "bytes": diferencia.size,
+                      "diferencia": diferencia.size_diff, "bloques": diferencia.count,
+                      "diferencia_bloques": diferencia.count_diff})
+    return filas
+
+
+# ==================== INFORME ====================
+
+def informe(root=None, app=None, cantidad=PRINCIPALES):
+    """Informe completo. Con tracemalloc activo incluye la instantánea en "_instantanea" (no serializable)"""
+    datos = {"rastreo": tracemalloc.is_tracing()}
+    if datos["rastreo"]:
+        # Primero la instantánea: así no incluye lo que asignan las mediciones siguientes
+        actual, pico = tracemalloc.get_traced_memory()
+        instantanea = instantanea_memoria()
+        datos["memoria_rastreada"] = {"actual": actual, "pico": pico}
+        datos["principales"] = principales(instantanea, cantidad)
+        datos["_instantanea"] = instantanea
+    datos["datos"] = tamanos_datos(app)
+    if root is not None:
+        datos["tk"] = conteo_tk(root)
+        datos["objetos_tkinter"] = objetos_tkinter_vivos()
+    return datos
+
+
+def comparar(antes, despues, cantidad=PRINCIPALES):
+    """Diferencias de 'despues' respecto de 'antes' (dos informes)"""
+    cambios = {"datos": []}
+    previos = {fila["nombre"]: fila for fila in antes["datos"]}
+    for fila in despues["datos"]:
+        previa = previos.get(fila["nombre"], {"registros": 0, "bytes": 0})
+        cambios["datos"].append({"nombre": fila["nombre"],
+                                 "registros": (fila["registros"] or 0) - (previa["registros"] or 0),
+                                 "bytes": fila["bytes"] - previa["bytes"]})
+    if "tk" in antes and "tk" in despues:
+        cambios["tk"] = {clave: despues["tk"][clave] - antes["tk"][clave]
+                         for clave in ("widgets", "toplevel", "comandos_tcl", "after_pendientes")}
+        clases = set(antes["objetos_tkinter"]) | set(despues["objetos_tkinter"])
+        cambios["objetos_tkinter"] = {clase: despues["objetos_tkinter"].get(clase, 0)
+                                      - antes["objetos_tkinter"].get(clase, 0) for clase in sorted(clases)}
+    if "_instantanea" in antes and "_instantanea" in despues:
+        cambios["crecimiento"] = crecimiento(antes["_instantanea"], despues["_instantanea"], cantidad)
+    return cambios
+
+
+def serializable(datos):
+    """El informe sin la instantánea de tracemalloc (para JSON)"""
+    return {clave: valor for clave, valor in datos.items() if not clave.startswith("_")}
+
+
+def legible(cantidad):
+    """Bytes en B/KB/MB/GB (con signo si es una diferencia negativa)"""
+    signo = "-" if cantidad < 0 else ""
+    cantidad = abs(cantidad)
+    for unidad in ("B", "KB", "MB"):
+        if cantidad < 1024:
+            return f"{signo}{cantidad:.0f} {unidad}" if unidad == "B" else f"{signo}{cantidad:.1f} {unidad}"
+        cantidad /= 1024
+    return f"{signo}{cantidad:.2f} GB"
+
+
+def formatear(datos, cambios=None):
+    """Texto del informe (y de las diferencias con el anterior, si se dan)"""
+    lineas = ["DATOS EN MEMORIA"]
+    delta_datos = {fila["nombre"]: fila for fila in cambios["datos"]} if cambios else {}
+    for fila in datos["datos"]:
+        registros = "" if fila["registros"] is None else f"{fila['registros']:>10,}"
+        texto = f"  {fila['nombre']:<34}{registros:>11}  {legible(fila['bytes']):>11}"
+        delta = delta_datos.get(fila["nombre"])
+        if delta and (delta["bytes"] or delta["registros"]):
+            texto += f"   ({delta['registros']:+,} / {'+' if delta['bytes'] >= 0 else ''}{legible(delta['bytes'])})"
+        lineas.append(texto)
+    lineas.append(f"  {'Total':<45}{legible(sum(f['bytes'] for f in datos['datos'])):>11}")
+
+    if "tk" in datos:
+        tk_datos = datos["tk"]
+        delta_tk = cambios.get("tk", {}) if cambios else {}
+
+        def con_delta(clave):
+            delta = delta_tk.get(clave)
+            return f"{tk_datos[clave]:,}" + (f" ({delta:+,})" if delta else "")
+
+        lineas += ["", "INTERFAZ (TK)",
+                   f"  Widgets: {con_delta('widgets')} | Toplevel abiertas: {con_delta('toplevel')} | "
+                   f"Comandos Tcl: {con_delta('comandos_tcl')} | after pendientes: {con_delta('after_pendientes')}",
+                   "  Por clase: " + ", ".join(f"{c} {n}" for c, n in list(tk_datos["por_clase"].items())[:12])]
+        for ruta, filas in tk_datos["filas_treeview"].items():
+            if filas:
+                lineas.append(f"  Filas en {ruta}: {filas:,}")
+        vivos = ", ".join(f"{c} {n}" for c, n in list(datos["objetos_tkinter"].items())[:12])
+        lineas.append(f"  Objetos tkinter vivos en Python: {vivos}")
+        crecidos = {c: d for c, d in (cambios or {}).get("objetos_tkinter", {}).items() if d}
+        if crecidos:
+            lineas.append("  Cambio desde la instantánea anterior: "
+                          + ", ".join(f"{c} {d:+,}" for c, d in crecidos.items()))
+
+    lineas.append("")
+    if not datos["rastreo"]:
+        lineas.append(f"tracemalloc inactivo (inícielo para ver qué líneas asignan memoria, o use {VARIABLE_ENTORNO}=1)")
+        return "\n".join(lineas)
+    memoria = datos["memoria_rastreada"]
+    lineas.append(f"TRACEMALLOC: {legible(memoria['actual'])} rastreados (pico {legible(memoria['pico'])})")
+    lineas.append("  Principales asignaciones vivas:")
+    for fila in datos["principales"]:
+        lineas.append(f"  {legible(fila['bytes']):>11} {fila['bloques']:>9,} bloques  {fila['lugar']}  {fila['codigo']}")
+    if cambios and "crecimiento" in cambios:
+        lineas.append("")
+        lineas.append("  Crecimiento desde la instantánea anterior:")
+        for fila in cambios["crecimiento"]:
+            lineas.append(f"  {'+' if fila['diferencia'] >= 0 else ''}{legible(fila['diferencia']):>10} "
+                          f"{fila['diferencia_bloques']:>+9,} bloques  {fila['lugar']}  {fila['codigo']}")
+    return "\n".join(lineas)
+
+
+if os.environ.get(VARIABLE_ENTORNO, "") not in ("", "0"):
+    _marcos = os.environ[VARIABLE_ENTORNO]
+    iniciar_rastreo(int(_marcos) if _marcos.isdigit() else 1)
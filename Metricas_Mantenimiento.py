@@ -0,0 +1,217 @@
+"""
+Métricas de rendimiento del Sistema de Gestión de Mantenimiento
+Archivo: Metricas_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Cuenta las llamadas y mide la latencia de las operaciones instrumentadas
+(persistencia de gm, manejadores y refrescos de la interfaz) para poder ver
+en el PC del usuario qué clic es lento sin conectar un profiler:
+
+    @metricas.medido
+    def guardar_datos(): ...
+
+    with metricas.medir("exportar.excel"):
+        ...
+
+    metricas.instrumentar(SistemaMantenimientoGUI, "gui")   # todos los métodos
+
+Desactivadas (lo normal) cada llamada instrumentada solo consulta un booleano.
+Se activan con la variable de entorno GM_METRICAS=1 o en tiempo de ejecución
+con activar() (el panel oculto de diagnóstico de la interfaz, Ctrl+Shift+D).
+Con las métricas activas se vuelcan a ARCHIVO_METRICAS, en la carpeta de
+datos, al salir del programa o cuando se pida.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import bisect
+import threading
+import functools
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime
+
+VARIABLE_ENTORNO = "GM_METRICAS"
+ARCHIVO_METRICAS = "metricas_mantenimiento.json"
+# Límites superiores (segundos) de las cubetas del histograma; la última cubeta es "más de 10 s"
+LIMITES_HISTOGRAMA = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                      0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Las llamadas más lentas que esto se anotan una por una (las últimas MAXIMO_LENTAS)
+UMBRAL_LENTA_S = 0.5
+MAXIMO_LENTAS = 100
+
+activas = False
+_estadisticas = {}      # nombre -> [llamadas, errores, total, máximo, cubetas]
+_lentas = deque(maxlen=MAXIMO_LENTAS)
+_candado = threading.Lock()
+_volcado_registrado = False
+_NULO = nullcontext()
+
+
+def activar(valor=True):
+    """Activa o desactiva la medición; al activarla se programa el volcado al salir"""
+    global activas, _volcado_registrado
+    activas = bool(valor)
+    if activas and not _volcado_registrado:
+        atexit.register(_volcar_al_salir)
+        _volcado_registrado = True
+
+
+def registrar(nombre, segundos, error=False):
+    """Anota una llamada de 'nombre' que tardó 'segundos'"""
+    cubeta = bisect.bisect_left(LIMITES_HISTOGRAMA, segundos)
+    with _candado:
+        estadistica = _estadisticas.get(nombre)
+        if estadistica is None:
+            estadistica = _estadisticas[nombre] = [0, 0, 0.0, 0.0, [0] * (len(LIMITES_HISTOGRAMA) + 1)]
+        estadistica[0] += 1
+        estadistica[1] += error
+        estadistica[2] += segundos
+        estadistica[3] = max(estadistica[3], segundos)
+        estadistica[4][cubeta] += 1
+        if segundos >= UMBRAL_LENTA_S:
+            _lentas.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S"), nombre, segundos))
+
+
+def _nombre(funcion):
+    modulo = funcion.__module__
+    if modulo == "__main__":
+        # Módulo ejecutado como script (python Gestion_Mantenimiento.py)
+        modulo = os.path.splitext(os.path.basename(getattr(sys.modules["__main__"], "__file__", "")))[0] or modulo
+    modulo = modulo.replace("_Mantenimiento", "")
+    return f"{modulo}.{funcion.__qualname__}"
+
+
+def medido(funcion=None, *, nombre=None):
+    """Decorador: mide cada llamada a la función (con @medido o @medido(nombre="..."))"""
+    if funcion is None:
+        return lambda f: medido(f, nombre=nombre)
+    nombre = nombre or _nombre(funcion)
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not activas:
+            return funcion(*args, **kwargs)
+        inicio = time.perf_counter()
+        try:
+            resultado = funcion(*args, **kwargs)
+        except BaseException:
+            registrar(nombre, time.perf_counter() - inicio, error=True)
+            raise
+        registrar(nombre, time.perf_counter() - inicio)
+        return resultado
+
+    envoltura.__medido__ = nombre
+    return envoltura
+
+
+class _Medicion:
+    __slots__ = ("nombre", "inicio")
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        registrar(self.nombre, time.perf_counter() - self.inicio, error=tipo is not None)
+        return False
+
+
+def medir(nombre):
+    """Administrador de contexto que mide el bloque: with medir("nombre"): ..."""
+    return _Medicion(nombre) if activas else _NULO
+
+
+def instrumentar(objeto, prefijo, excluir=()):
+    """Envuelve con medido() todas las funciones de una clase o módulo (menos las especiales).
+
+    Para una clase conviene hacerlo antes de crear instancias: los métodos
+    enlazados a botones se toman al construir la ventana.
+    """
+    for nombre, valor in list(vars(objeto).items()):
+        if (callable(valor) and not isinstance(valor, type) and not nombre.startswith("__")
+                and nombre not in excluir and not hasattr(valor, "__medido__")):
+            setattr(objeto, nombre, medido(valor, nombre=f"{prefijo}.{nombre}"))
+
+
+def reiniciar():
+    """Borra lo medido hasta ahora"""
+    with _candado:
+        _estadisticas.clear()
+        _lentas.clear()
+
+
+def _percentil(cubetas, llamadas, maximo, p):
+    """Límite superior de la cubeta donde cae el percentil p (acotado por el máximo)"""
+    objetivo = llamadas * p / 100
+    acumulado = 0
+    for limite, cantidad in zip(LIMITES_HISTOGRAMA, cubetas):
+        acumulado += cantidad
+        if acumulado >= objetivo:
+            return min(limite, maximo)
+    return maximo
+
+
+def _etiqueta_cubeta(indice):
+    if indice == len(LIMITES_HISTOGRAMA):
+        return f"> {LIMITES_HISTOGRAMA[-1] * 1000:g} ms"
+    return f"≤ {LIMITES_HISTOGRAMA[indice] * 1000:g} ms"
+
+
+def instantanea():
+    """{"metricas": {nombre: {...}}, "lentas": [...]} ordenado por tiempo total (tiempos en ms)"""
+    with _candado:
+        copia = {nombre: (e[0], e[1], e[2], e[3], list(e[4])) for nombre, e in _estadisticas.items()}
+        lentas = list(_lentas)
+    metricas = {}
+    for nombre, (llamadas, errores, total, maximo, cubetas) in sorted(copia.items(), key=lambda par: -par[1][2]):
+        metricas[nombre] = {
+            "llamadas": llamadas,
+            "errores": errores,
+            "total_ms": round(total * 1000, 3),
+            "promedio_ms": round(total / llamadas * 1000, 3),
+            "p50_ms": round(_percentil(cubetas, llamadas, maximo, 50) * 1000, 3),
+            "p95_ms": round(_percentil(cubetas, llamadas, maximo, 95) * 1000, 3),
+            "p99_ms": round(_percentil(cubetas, llamadas, maximo, 99) * 1000, 3),
+            "maximo_ms": round(maximo * 1000, 3),
+            "histograma": {_etiqueta_cubeta(i): n for i, n in enumerate(cubetas) if n},
+        }
+    return {
+        "metricas": metricas,
+        "lentas": [{"fecha": fecha, "nombre": nombre, "ms": round(segundos * 1000, 1)}
+                   for fecha, nombre, segundos in reversed(lentas)],
+    }
+
+
+def ruta_volcado():
+    import Gestion_Mantenimiento as gm
+    return os.path.join(os.path.dirname(gm.ARCHIVO_DATOS), ARCHIVO_METRICAS)
+
+
+def volcar(ruta=None):
+    """Escribe la instantánea en un archivo JSON (por defecto en la carpeta de datos); devuelve la ruta"""
+    ruta = ruta or ruta_volcado()
+    datos = {"fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "pid": os.getpid(),
+             "activas": activas, **instantanea()}
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=2, ensure_ascii=False)
+    return ruta
+
+
+def _volcar_al_salir():
+    if _estadisticas:
+        try:
+            volcar()
+        except OSError as e:
+            print(f"No se pudieron guardar las métricas: {e}")
+
+
+if os.environ.get(VARIABLE_ENTORNO, "") not in ("", "0"):
+    activar()
@@ -0,0 +1,192 @@
+"""
+Detector de bloqueos de la interfaz del Sistema de Gestión de Mantenimiento
+Archivo: Monitor_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Cuando un manejador de la interfaz tarda, Tk no procesa eventos y la ventana
+"se congela". Para saber cuál fue:
+
+  • un latido con root.after cada INTERVALO_LATIDO_MS mide cuánto se atrasó
+    el bucle de eventos (con las métricas activas el retraso queda en el
+    histograma "tk.retraso_bucle"),
+  • un hilo vigilante revisa el último latido y, si el bucle lleva más de
+    UMBRAL_BLOQUEO_S sin atender, captura la pila del hilo principal (y la
+    vuelve a capturar cada INTERVALO_CAPTURAS_S mientras siga bloqueado),
+  • al terminar el bloqueo se anota cuánto duró y qué manejador lo causó.
+
+Una suspensión del equipo también detiene el bucle, pero no es culpa de la
+interfaz: se reconoce porque un reloj que cuenta el tiempo suspendido avanza
+más que uno que no lo cuenta (ver _relojes) y ese bloqueo no se anota. Si el
+vigilante tampoco corrió pero los relojes no lo confirman (el hilo principal
+retuvo el GIL en una llamada larga en C, como json.load o list.sort, o la
+plataforma no distingue la suspensión), el bloqueo se anota marcado como
+"posible suspensión".
+
+Todo va a un registro rotativo (ARCHIVO_REGISTRO) en la carpeta de datos.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+import traceback
+from logging.handlers import RotatingFileHandler
+
+import Metricas_Mantenimiento as metricas
+
+INTERVALO_LATIDO_MS = 100
+UMBRAL_BLOQUEO_S = 0.5
+INTERVALO_CAPTURAS_S = 5.0
+ARCHIVO_REGISTRO = "bloqueos_interfaz.log"
+TAMANO_REGISTRO = 1024 * 1024
+COPIAS_REGISTRO = 3
+
+_CARPETA_PROYECTO = os.path.dirname(os.path.abspath(__file__))
+# Marcos del proyecto que no son manejadores: el monitor y las envolturas de las métricas
+_ARCHIVOS_AJENOS = {os.path.abspath(__file__), os.path.abspath(metricas.__file__)}
+
+
+def _registro(carpeta):
+    """Logger con el archivo rotativo de la carpeta de datos (se crea una sola vez)"""
+    registro = logging.getLogger("Gestion_Mantenimiento.bloqueos")
+    registro.setLevel(logging.INFO)
+    registro.propagate = False
+    ruta = os.path.join(carpeta, ARCHIVO_REGISTRO)
+    if not any(getattr(h, "baseFilename", None) == os.path.abspath(ruta) for h in registro.handlers):
+        os.makedirs(carpeta, exist_ok=True)
+        manejador = RotatingFileHandler(ruta, maxBytes=TAMANO_REGISTRO, backupCount=COPIAS_REGISTRO,
+                                        encoding="utf-8")
+        manejador.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        registro.addHandler(manejador)
+    return registro
+
+
+def _es_propio(marco):
+    ruta = os.path.abspath(marco.filename)
+    return os.path.dirname(ruta) == _CARPETA_PROYECTO and ruta not in _ARCHIVOS_AJENOS
+
+
+def _lugar(marco):
+    return f"{marco.name} ({os.path.basename(marco.filename)}:{marco.lineno})"
+
+
+def describir_pila(pila):
+    """'manejador (archivo:línea) → función más interna del proyecto (archivo:línea)'
+
+    El manejador es el primer marco del proyecto después de la última
+    llamada de Tk (CallWrapper.__call__), es decir el callback en curso.
+    """
+    inicio = 0
+    for i, marco in enumerate(pila):
+        if marco.name == "__call__" and os.path.basename(os.path.dirname(marco.filename)) == "tkinter":
+            inicio = i + 1
+    propios = [m for m in pila[inicio:] if _es_propio(m)]
+    if not propios:
+        return _lugar(pila[-1]) if pila else "desconocido"
+    if len(propios) == 1:
+        return _lugar(propios[0])
+    return f"{_lugar(propios[0])} → {_lugar(propios[-1])}"
+
+
+def _relojes():
+    """(reloj que cuenta el tiempo suspendido, reloj que no lo cuenta), en segundos"""
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        # Linux: CLOCK_MONOTONIC se detiene durante la suspensión, CLOCK_BOOTTIME no
+        return (lambda: time.clock_gettime(time.CLOCK_BOOTTIME)), time.monotonic
+    if os.name == "nt":
+        try:
+            import ctypes
+            consultar = ctypes.windll.kernel32.QueryUnbiasedInterruptTime
+            valor = ctypes.c_ulonglong()
+
+            def sin_suspension():
+                consultar(ctypes.byref(valor))
+                return valor.value / 1e7        # unidades de 100 ns, sin el tiempo suspendido
+            sin_suspension()
+            return time.monotonic, sin_suspension
+        except (AttributeError, OSError):
+            return time.monotonic, time.monotonic
+    # macOS: el reloj monótono tampoco avanza durante la suspensión
+    return time.time, time.monotonic
+
+
+class MonitorBucle:
+    """Latido del bucle de eventos de Tk con un hilo vigilante que captura la pila en los bloqueos"""
+
+    def __init__(self, root, carpeta, intervalo_ms=INTERVALO_LATIDO_MS, umbral_s=UMBRAL_BLOQUEO_S):
+        self.root = root
+        self.intervalo_s = intervalo_ms / 1000
+        self.umbral_s = umbral_s
+        self.ruta_registro = os.path.join(carpeta, ARCHIVO_REGISTRO)
+        self.registro = _registro(carpeta)
+        self.bloqueos = 0
+        self._intervalo_ms = intervalo_ms
+        self._hilo_principal = None
+        self._ultimo_latido = time.monotonic()
+        self._captura = None        # manejador capturado durante el bloqueo en curso
+        self._suspendido = False    # el proceso entero estuvo detenido (suspensión del equipo)
+        self._posible_suspension = False    # el vigilante tampoco corrió, sin suspensión confirmada
+        self._detener = threading.Event()
+
+    def iniciar(self):
+        """Arranca el latido y el vigilante; se llama desde el hilo de Tk"""
+        self._hilo_principal = threading.get_ident()
+        self._ultimo_latido = time.monotonic()
+        self.root.after(self._intervalo_ms, self._latido)
+        threading.Thread(target=self._vigilar, name="vigilante-interfaz", daemon=True).start()
+
+    def detener(self):
+        self._detener.set()
+
+    def _latido(self):
+        ahora = time.monotonic()
+        retraso = max(ahora - self._ultimo_latido - self.intervalo_s, 0.0)
+        self._ultimo_latido = ahora
+        captura, self._captura = self._captura, None
+        posible, self._posible_suspension = self._posible_suspension, False
+        if metricas.activas:
+            metricas.registrar("tk.retraso_bucle", retraso)
+        if self._suspendido:
+            self._suspendido = False
+        elif retraso >= self.umbral_s:
+            self.bloqueos += 1
+            self.registro.warning("Bucle de eventos bloqueado %.2f s%s; manejador: %s", retraso,
+                                  " (posible suspensión: el vigilante tampoco corrió)" if posible else "",
+                                  captura or "desconocido (no se alcanzó a capturar la pila)")
+        if not self._detener.is_set():
+            self.root.after(self._intervalo_ms, self._latido)
+
+    def _vigilar(self):
+        paso = min(self.umbral_s / 5, 0.1)
+        con_suspension, sin_suspension = _relojes()
+        ultimo_paso = time.monotonic()
+        ultimos_relojes = con_suspension(), sin_suspension()
+        proxima_captura = None
+        while not self._detener.wait(paso):
+            ahora = time.monotonic()
+            relojes = con_suspension(), sin_suspension()
+            suspendido = (relojes[0] - ultimos_relojes[0]) - (relojes[1] - ultimos_relojes[1])
+            if suspendido > self.umbral_s:
+                # El equipo se suspendió: la interfaz no tiene la culpa
+                self._suspendido = True
+            elif ahora - ultimo_paso > self.umbral_s:
+                # Tampoco este hilo corrió, pero sin suspensión: suele ser el GIL retenido en C
+                self._posible_suspension = True
+            ultimo_paso, ultimos_relojes = ahora, relojes
+            bloqueado = ahora - self._ultimo_latido - self.intervalo_s
+            if bloqueado < self.umbral_s or self._suspendido:
+                proxima_captura = None
+                continue
+            if proxima_captura is None or bloqueado >= proxima_captura:
+                self._capturar(bloqueado)
+                proxima_captura = bloqueado + INTERVALO_CAPTURAS_S
+
+    def _capturar(self, bloqueado):
+        marco = sys._current_frames().get(self._hilo_principal)
+        if marco is None:
+            return
+        pila = traceback.extract_stack(marco)
+        self._captura = describir_pila(pila)
+        self.registro.warning("Bucle de eventos bloqueado desde hace %.2f s en %s; pila del hilo principal:\n%s",
+                              bloqueado, self._captura, "".join(traceback.format_list(pila)).rstrip())
@@ -0,0 +1,287 @@
+"""
+Planes de mantenimiento recurrentes del Sistema de Gestión de Mantenimiento
+Archivo: Planificacion_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Un plan recurrente (gm.planes_recurrentes) se guarda una sola vez como regla:
+"cada N días / semanas / meses desde una fecha" o "cada N horas de uso" con un
+uso diario estimado. Las fechas concretas (ocurrencias) no se guardan: se
+generan bajo demanda solo para la ventana de calendario que se consulta
+(p. ej. el mes de ver_carga_mensual) y las ventanas ya expandidas quedan en
+caché hasta que cambian los datos (gm.revision_datos).
+
+emitir_ordenes() convierte en órdenes de trabajo los planes que vencen (planes
+"Programado" de un mes y ocurrencias de planes recurrentes) en un solo lote y
+los marca como emitidos, de modo que ejecutarla varias veces no duplica nada.
+"""
+
+import math
+from bisect import bisect_right
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import Gestion_Mantenimiento as gm
+
+# Frecuencia -> (texto en singular, texto en plural) para mostrar
+FRECUENCIAS = {
+    "dias": ("día", "días"),
+    "semanas": ("semana", "semanas"),
+    "meses": ("mes", "meses"),
+    "uso": ("hora de uso", "horas de uso"),
+}
+
+
+def _fecha(texto):
+    return date.fromisoformat(texto[:10]) if texto else None
+
+
+def _sumar_meses(inicio, meses):
+    """Misma fecha 'meses' meses después; si el día no existe se usa el último del mes"""
+    total = inicio.year * 12 + inicio.month - 1 + meses
+    anio, mes = divmod(total, 12)
+    mes += 1
+    return date(anio, mes, min(inicio.day, monthrange(anio, mes)[1]))
+
+
+def dias_entre_ocurrencias(regla):
+    """Separación en días de una regla por días, semanas o uso (None si es mensual)"""
+    intervalo = regla['intervalo']
+    if regla['frecuencia'] == "dias":
+        return intervalo
+    if regla['frecuencia'] == "semanas":
+        return 7 * intervalo
+    if regla['frecuencia'] == "uso":
+        return intervalo / regla['uso_diario']
+    return None
+
+
+def ocurrencias(regla, desde, hasta):
+    """Generador de las fechas (date) de una regla dentro de [desde, hasta].
+
+    No recorre las ocurrencias anteriores a 'desde': calcula directamente la
+    primera que cae en la ventana.
+    """
+    inicio = _fecha(regla['fecha_inicio'])
+    fin = _fecha(regla.get('fecha_fin'))
+    if fin is not None and fin < hasta:
+        hasta = fin
+    if hasta < inicio or hasta < desde:
+        return
+
+    paso = dias_entre_ocurrencias(regla)
+    if paso is None:
+        meses = (desde.year - inicio.year) * 12 + desde.month - inicio.month
+        k = max(0, meses // regla['intervalo'])
+        fecha = _sumar_meses(inicio, k * regla['intervalo'])
+        while fecha <= hasta:
+            if fecha >= desde:
+                yield fecha
+            k += 1
+            fecha = _sumar_meses(inicio, k * regla['intervalo'])
+        return
+
+    base = inicio.toordinal()
+    k = max(0, math.ceil((desde.toordinal() - base) / paso))
+    while base + math.floor(k * paso) < desde.toordinal():
+        k += 1
+    while True:
+        dia = base + math.floor(k * paso)
+        if dia > hasta.toordinal():
+            return
+        yield date.fromordinal(dia)
+        k += 1
+
+
+@lru_cache(maxsize=64)
+def _expandir(desde, hasta, revision):
+    """Ocurrencias de todas las reglas activas en la ventana (ordenadas por fecha).
+
+    'revision' (gm.revision_datos) forma parte de la clave de la caché: al
+    cambiar los datos las ventanas anteriores dejan de usarse.
+    """
+    resultado = []
+    for regla in gm.planes_recurrentes:
+        if regla.get('estado', "Activo") != "Activo":
+            continue
+        for fecha in ocurrencias(regla, desde, hasta):
+            resultado.append({
+                "regla_id": regla['id'],
+                "equipo_id": regla['equipo_id'],
+                "equipo_nombre": regla['equipo_nombre'],
+                "tipo": regla['tipo'],
+                "descripcion": regla['descripcion'],
+                "fecha": fecha,
+            })
+    resultado.sort(key=lambda o: (o['fecha'], o['regla_id']))
+    return tuple(resultado)
+
+
+def ocurrencias_ventana(desde, hasta):
+    """Ocurrencias de los planes recurrentes entre dos fechas (date), ambas incluidas"""
+    return _expandir(desde, hasta, gm.revision_datos)
+
+
+def ocurrencias_mes(mes, anio):
+    """Ocurrencias de los planes recurrentes en un mes"""
+    return ocurrencias_ventana(date(anio, mes, 1), date(anio, mes, monthrange(anio, mes)[1]))
+
+
+def describir_regla(regla):
+    """Texto corto de la recurrencia, p. ej. 'Cada 2 semanas desde 2026-01-05'"""
+    singular, plural = FRECUENCIAS[regla['frecuencia']]
+    texto = f"Cada {singular}" if regla['intervalo'] == 1 else f"Cada {regla['intervalo']} {plural}"
+    if regla['frecuencia'] == "uso":
+        texto += f" ({regla['uso_diario']} h/día)"
+    texto += f" desde {regla['fecha_inicio'][:10]}"
+    if regla.get('fecha_fin'):
+        texto += f" hasta {regla['fecha_fin'][:10]}"
+    return texto
+
+
+def crear_regla(equipo, tipo, descripcion, frecuencia, intervalo, fecha_inicio,
+                fecha_fin=None, uso_diario=None):
+    """Valida y guarda un plan recurrente; lanza ValueError si algún dato es inválido.
+
+    'fecha_inicio' y 'fecha_fin' son textos AAAA-MM-DD; 'uso_diario' (horas de
+    uso por día) solo se usa con la frecuencia 'uso'.
+    """
+    fila = {
+        "equipo_id": equipo['id'],
+        "tipo": tipo,
+        "descripcion": descripcion,
+        "frecuencia": frecuencia,
+        "intervalo": intervalo,
+        "uso_diario": uso_diario,
+        "fecha_inicio": fecha_inicio,
+        "fecha_fin": fecha_fin,
+    }
+    # Misma validación y asignación de ID que una importación de una sola fila
+    lote = gm.LoteImportacion("planes_recurrentes")
+    lote.validar([fila])
+    if lote.errores:
+        raise ValueError(lote.errores[0][1])
+    lote.confirmar()
+    return lote.registros[0]
+
+
+def eliminar_regla(id_regla):
+    """Elimina un plan recurrente; devuelve la regla eliminada (o None si no existe)"""
+    regla = next((r for r in gm.planes_recurrentes if r['id'] == id_regla), None)
+    if regla:
+        gm.planes_recurrentes.remove(regla)
+        gm.guardar_datos()
+    return regla
+
+
+# ==================== EMISIÓN DE ÓRDENES ====================
+
+# Se emiten las órdenes de los planes que vencen hasta estos días en el futuro
+ANTICIPACION_DIAS = 7
+# Cada cuánto la interfaz vuelve a revisar los planes (milisegundos)
+INTERVALO_EMISION_MS = 60 * 60 * 1000
+
+# Índice por fecha de los planes "Programado": (revisión, claves (anio, mes), planes)
+_indice_planes = (None, [], [])
+
+
+def _indice_fechas_planes():
+    """Planes programados ordenados por (anio, mes); se reconstruye solo si cambiaron los datos"""
+    global _indice_planes
+    revision, claves, planes = _indice_planes
+    if revision != gm.revision_datos:
+        planes = sorted((p for p in gm.planes_mantenimiento if p['estado'] == "Programado"),
+                        key=lambda p: (p['anio'], p['mes'], p['id']))
+        claves = [(p['anio'], p['mes']) for p in planes]
+        _indice_planes = (gm.revision_datos, claves, planes)
+    return claves, planes
+
+
+def planes_vencidos(hasta):
+    """Planes programados cuyo mes empieza a más tardar en 'hasta' (incluye los atrasados)"""
+    claves, planes = _indice_fechas_planes()
+    return planes[:bisect_right(claves, (hasta.year, hasta.month))]
+
+
+def ocurrencias_por_emitir(hasta):
+    """Pares (regla, fecha) de los planes recurrentes activos aún no emitidos hasta 'hasta'.
+
+    Cada regla recuerda en 'emitida_hasta' la última fecha ya convertida en
+    orden; las fechas anteriores a la creación de la regla no se emiten.
+    """
+    for regla in gm.planes_recurrentes:
+        if regla.get('estado', "Activo") != "Activo":
+            continue
+        desde = max(_fecha(regla['fecha_inicio']), _fecha(regla.get('fecha_creacion')) or date.min)
+        if regla.get('emitida_hasta'):
+            desde = max(desde, _fecha(regla['emitida_hasta']) + timedelta(days=1))
+        for fecha in ocurrencias(regla, desde, hasta):
+            yield regla, fecha
+
+
+def emitir_ordenes(hasta=None):
+    """Crea las órdenes de trabajo de los planes que vencen y las guarda en una sola escritura.
+
+    'hasta' (date) es el último día a emitir; por defecto hoy más
+    ANTICIPACION_DIAS. Es idempotente: los planes quedan en estado "Emitido"
+    (con su orden_id) y las reglas recurrentes avanzan su 'emitida_hasta'.
+
+    También entre instancias: todo se hace con bloqueo_datos() tomado,
+    partiendo de lo último que haya en disco (gm.sincronizar) y guardando
+    antes de soltarlo, así otra instancia que emita después ya ve los planes
+    emitidos. Dentro de una transacción más amplia (un lote de Comandos) la
+    escritura queda para quien la abrió, que debe retener bloqueo_datos()
+    hasta guardar. Lanza TimeoutError si no obtiene el bloqueo. Devuelve la
+    lista de órdenes creadas.
+    """
+    hasta = hasta or date.today() + timedelta(days=ANTICIPACION_DIAS)
+    with gm.bloqueo_datos():
+        gm.sincronizar()
+        return _emitir(hasta)
+
+
+def _emitir(hasta):
+    equipos = {e['id']: e for e in gm.equipos}
+    ahora = datetime.now().strftime(gm.FORMATO_FECHA)
+    siguiente_id = gm.siguiente_id_orden()
+    creadas = []
+
+    def crear_orden(plan, equipo, observaciones):
+        orden = {
+            "id": siguiente_id + len(creadas),
+            "equipo_id": equipo['id'],
+            "equipo_nombre": equipo['nombre'],
+            "descripcion": plan['descripcion'],
+            "tipo": plan['tipo'],
+            "prioridad": equipo.get('prioridad') or "Media",
+            "estado": "Pendiente",
+            "tecnico_asignado": None,
+            "fecha_creacion": ahora,
+            "fecha_inicio": None,
+            "fecha_finalizacion": None,
+            "observaciones": observaciones
+        }
+        creadas.append(gm.agregar_orden(orden))
+        return orden
+
+    with gm.transaccion():
+        for plan in planes_vencidos(hasta):
+            equipo = equipos.get(plan['equipo_id'])
+            if equipo is None:
+                continue
+            orden = crear_orden(plan, equipo, f"Generada del plan #{plan['id']} "
+                                              f"({plan['mes']:02d}/{plan['anio']})")
+            plan['estado'] = "Emitido"
+            plan['orden_id'] = orden['id']
+
+        for regla, fecha in list(ocurrencias_por_emitir(hasta)):
+            equipo = equipos.get(regla['equipo_id'])
+            if equipo is None:
+                continue
+            crear_orden(regla, equipo, f"Generada del plan recurrente R{regla['id']} "
+                                       f"para el {fecha:%Y-%m-%d}")
+            regla['emitida_hasta'] = fecha.isoformat()
+
+        if creadas:
+            gm.guardar_datos()
+    return creadas
@@ -0,0 +1,622 @@
+"""
+Servicio sin interfaz del Sistema de Gestión de Mantenimiento
+Archivo: Servidor_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+API REST con JSON sobre asyncio (solo biblioteca estándar), para que tabletas
+y otros sistemas creen, asignen y cierren órdenes sin abrir la interfaz:
+
+    python Gestion_Mantenimiento.py --serve [--host 0.0.0.0] [--puerto 8080]
+
+Recursos: equipos, ordenes, tecnicos, planes, planes_recurrentes e historial
+(solo lectura).
+
+    GET    /api                               totales y estadísticas
+    GET    /api/<recurso>?pagina=1&por_pagina=50&campo=valor&q=texto
+    GET    /api/<recurso>/<id>
+    POST   /api/<recurso>                     crea (mismas validaciones que la importación)
+    PATCH  /api/<recurso>/<id>                modifica los campos enviados
+    DELETE /api/<recurso>/<id>
+    POST   /api/ordenes/<id>/completar        {"observaciones": "..."}
+    GET    /api/cola?n=10                     próximas órdenes de la cola de despacho
+
+Los datos viven en memoria: las órdenes se filtran con índices por estado,
+prioridad, tipo, equipo y técnico que se mantienen con
+gm.registrar_indice_ordenes. Las modificaciones se hacen una a la vez y
+responden apenas quedan en memoria; el servidor mantiene abierta una
+transacción (gm.transaccion) y escribe a disco por el camino habitual
+(gm.guardar_pendiente: bloqueo, combinación con otras instancias, archivo
+JSON) poco después de cada modificación, agrupando todo lo que llegó
+entretanto en una sola escritura. Lo que guardan otras instancias (p. ej. la
+interfaz de la oficina) se incorpora cada gm.INTERVALO_EVENTOS_MS con
+gm.sincronizar.
+"""
+
+import argparse
+import asyncio
+import threading
+import heapq
+import json
+import math
+import time
+import traceback
+from datetime import datetime
+from http import HTTPStatus
+from operator import itemgetter
+from types import SimpleNamespace
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import Gestion_Mantenimiento as gm
+
+HOST = "127.0.0.1"
+PUERTO = 8080
+POR_PAGINA = 50
+MAXIMO_POR_PAGINA = 500
+MAXIMO_CUERPO = 1024 * 1024
+# Segundos que una conexión puede quedar abierta sin enviar peticiones
+ESPERA_INACTIVA_S = 30
+# Conexiones nuevas que el sistema operativo retiene mientras se aceptan
+# (cuando muchas tabletas se conectan a la vez)
+CONEXIONES_EN_ESPERA = 512
+# Espera mínima entre una modificación y su escritura a disco
+INTERVALO_GUARDADO_S = 0.2
+# Con datos grandes la escritura tarda y las modificaciones esperan a que
+# termine: entre dos escrituras se deja al menos esta cantidad de veces lo que
+# tardó la anterior, para que estén bloqueadas como mucho ~1/(1 + factor) del tiempo
+FACTOR_ESPERA_GUARDADO = 4
+
+# Recurso de la URL -> colección de gm
+RECURSOS = {
+    "equipos": "equipos",
+    "ordenes": "ordenes_trabajo",
+    "tecnicos": "tecnicos",
+    "planes": "planes_mantenimiento",
+    "planes_recurrentes": "planes_recurrentes",
+    "historial": "historial_mantenimiento",
+}
+
+# Campos donde busca el parámetro 'q'
+CAMPOS_TEXTO = {
+    "equipos": ("nombre", "ubicacion", "descripcion", "marca", "modelo", "numero_serie"),
+    "ordenes_trabajo": ("descripcion", "equipo_nombre", "tecnico_asignado", "observaciones"),
+    "tecnicos": ("nombre", "especialidad"),
+    "planes_mantenimiento": ("descripcion", "equipo_nombre"),
+    "planes_recurrentes": ("descripcion", "equipo_nombre"),
+    "historial_mantenimiento": ("equipo_nombre", "tecnico", "observaciones"),
+}
+
+# Campos de una orden que se cambian con PATCH directamente; el estado y el
+# técnico pasan por las operaciones de gm (fechas, historial, estado del técnico)
+CAMPOS_EDITABLES_ORDEN = ("equipo_id", "descripcion", "tipo", "prioridad", "observaciones")
+
+
+class ErrorAPI(Exception):
+    """Error que se responde al cliente con su código HTTP"""
+
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+# ==================== ÍNDICES ====================
+
+# Campo de la orden -> {valor: {id(orden): orden}}
+CAMPOS_INDEXADOS = ("estado", "prioridad", "tipo", "equipo_id", "tecnico_asignado")
+_ordenes_por_campo = {campo: {} for campo in CAMPOS_INDEXADOS}
+_maximo_id_orden = 0
+
+
+def _clave(valor):
+    """Valor de un campo tal como llega en la URL (None es el texto vacío)"""
+    return "" if valor is None else str(valor)
+
+
+def _actualizar(orden, delta):
+    global _maximo_id_orden
+    clave = id(orden)
+    if delta > 0:
+        for campo, grupos in _ordenes_por_campo.items():
+            valor = orden.get(campo)
+            grupo = grupos.get(valor)
+            if grupo is None:
+                grupos[valor] = {clave: orden}
+            else:
+                grupo[clave] = orden
+        if isinstance(orden.get('id'), int) and orden['id'] > _maximo_id_orden:
+            _maximo_id_orden = orden['id']
+        return
+    for campo, grupos in _ordenes_por_campo.items():
+        valor = orden.get(campo)
+        grupo = grupos.get(valor)
+        if grupo is not None:
+            grupo.pop(clave, None)
+            if not grupo:
+                del grupos[valor]
+
+
+def _reiniciar():
+    global _maximo_id_orden
+    for grupos in _ordenes_por_campo.values():
+        grupos.clear()
+    _maximo_id_orden = 0
+
+
+gm.registrar_indice_ordenes(_actualizar, _reiniciar)
+
+# Colección -> (firma, {id: registro}) de las colecciones pequeñas
+_mapas_id = {}
+
+
+def _por_id(coleccion):
+    """{id: registro} de una colección; se reconstruye solo si cambiaron los datos"""
+    lista = getattr(gm, coleccion)
+    firma = (gm.revision_datos, id(lista), len(lista))
+    guardado = _mapas_id.get(coleccion)
+    if guardado is None or guardado[0] != firma:
+        guardado = (firma, {r['id']: r for r in lista})
+        _mapas_id[coleccion] = guardado
+    return guardado[1]
+
+
+def _buscar(coleccion, id_registro):
+    if coleccion == "ordenes_trabajo":
+        registro = gm.orden_por_id(id_registro)
+    else:
+        registro = _por_id(coleccion).get(id_registro)
+    if registro is None:
+        raise ErrorAPI(404, f"No existe el registro {id_registro} en {coleccion}")
+    return registro
+
+
+def _grupo(campo, texto):
+    """Órdenes indexadas cuyo campo, escrito como texto, es 'texto'"""
+    grupos = _ordenes_por_campo[campo]
+    valores = [texto]
+    if texto == "":
+        valores.append(None)
+    elif texto.lstrip("-").isdigit():
+        valores.append(int(texto))
+    encontrados = [grupos[v] for v in valores if v in grupos]
+    if len(encontrados) == 1:
+        return encontrados[0]
+    return {k: o for grupo in encontrados for k, o in grupo.items()}
+
+
+def _coincide(registro, filtros):
+    return all(_clave(registro.get(campo)) == valor for campo, valor in filtros.items())
+
+
+def filtrar(coleccion, filtros):
+    """Registros de la colección cuyos campos coinciden con los filtros {campo: texto}.
+
+    Sin filtros devuelve la lista misma (sin copiarla). En órdenes parte del
+    grupo indexado más pequeño, cuyo orden no es el de la lista: listar()
+    ordena por ID solo la página que devuelve.
+    """
+    lista = getattr(gm, coleccion)
+    if not filtros:
+        return lista
+    if coleccion != "ordenes_trabajo":
+        return [r for r in lista if _coincide(r, filtros)]
+
+    indexados = [campo for campo in filtros if campo in _ordenes_por_campo]
+    if not indexados:
+        return [o for o in lista if _coincide(o, filtros)]
+    grupos = {campo: _grupo(campo, filtros[campo]) for campo in indexados}
+    campo = min(grupos, key=lambda c: len(grupos[c]))
+    grupo = grupos[campo]
+    resto = {c: v for c, v in filtros.items() if c != campo}
+    if not resto:
+        return list(grupo.values())
+    return [o for o in grupo.values() if _coincide(o, resto)]
+
+
+# ==================== OPERACIONES ====================
+
+def _contexto(registro=None, cambios=()):
+    """Lo que los normalizadores de gm esperan de un lote de importación.
+
+    Al modificar un registro que no cambia de equipo solo se conoce su propio
+    equipo: así no se rechaza por un equipo que ya fue eliminado.
+    """
+    ahora = datetime.now().strftime(gm.FORMATO_FECHA)
+    if registro is not None and "equipo_id" in registro and "equipo_id" not in cambios:
+        equipo = {"id": registro['equipo_id'], "nombre": registro.get('equipo_nombre')}
+        return SimpleNamespace(equipos={equipo['id']: equipo}, ahora=ahora)
+    return SimpleNamespace(equipos=_por_id("equipos"), ahora=ahora)
+
+
+def _normalizar(coleccion, fila, registro=None, cambios=()):
+    try:
+        return gm.NORMALIZADORES[coleccion](fila, _contexto(registro, cambios))
+    except ValueError as e:
+        raise ErrorAPI(400, str(e))
+
+
+def _tecnico_por_nombre(nombre):
+    tecnico = next((t for t in gm.tecnicos if t['nombre'] == nombre), None)
+    if tecnico is None:
+        raise ErrorAPI(400, f"El técnico '{nombre}' no existe")
+    return tecnico
+
+
+def _siguiente_id(coleccion):
+    if coleccion == "ordenes_trabajo":
+        return max(_maximo_id_orden, gm.piso_ids(coleccion)) + 1
+    return gm.siguiente_id(coleccion)
+
+
+def listar(coleccion, consulta):
+    """Página de registros: {"datos", "total", "pagina", "por_pagina", "paginas"}"""
+    consulta = dict(consulta)
+    try:
+        pagina = max(int(consulta.pop("pagina", 1)), 1)
+        por_pagina = min(max(int(consulta.pop("por_pagina", POR_PAGINA)), 1), MAXIMO_POR_PAGINA)
+    except ValueError:
+        raise ErrorAPI(400, "'pagina' y 'por_pagina' deben ser números enteros")
+    texto = consulta.pop("q", "").strip().lower()
+
+    registros = filtrar(coleccion, consulta)
+    if texto:
+        campos = CAMPOS_TEXTO[coleccion]
+        registros = [r for r in registros
+                     if any(texto in _clave(r.get(campo)).lower() for campo in campos)]
+    inicio = (pagina - 1) * por_pagina
+    if coleccion == "ordenes_trabajo" and consulta:
+        # Solo se ordenan las órdenes hasta el final de la página pedida
+        datos = heapq.nsmallest(inicio + por_pagina, registros, key=itemgetter('id'))[inicio:]
+    else:
+        datos = registros[inicio:inicio + por_pagina]
+    return {
+        "datos": datos,
+        "total": len(registros),
+        "pagina": pagina,
+        "por_pagina": por_pagina,
+        "paginas": math.ceil(len(registros) / por_pagina),
+    }
+
+
+def crear(coleccion, cuerpo):
+    """Valida y agrega un registro; el ID lo asigna el servidor"""
+    tecnico = None
+    if coleccion == "ordenes_trabajo" and cuerpo.get("tecnico_asignado"):
+        tecnico = _tecnico_por_nombre(cuerpo["tecnico_asignado"])
+        cuerpo = {**cuerpo, "tecnico_asignado": None}
+    registro = {"id": _siguiente_id(coleccion), **_normalizar(coleccion, cuerpo)}
+
+    if coleccion == "ordenes_trabajo":
+        gm.agregar_orden(registro)
+        if tecnico:
+            gm.asignar_tecnico_ordenes([registro['id']], tecnico)
+    else:
+        getattr(gm, coleccion).append(registro)
+    gm.guardar_datos()
+    return registro
+
+
+def modificar(coleccion, id_registro, cuerpo):
+    """Cambia los campos enviados de un registro, validándolo completo antes de aplicar nada"""
+    registro = _buscar(coleccion, id_registro)
+    cambios = {campo: valor for campo, valor in cuerpo.items() if campo != "id"}
+    if coleccion == "ordenes_trabajo":
+        return _modificar_orden(registro, cambios)
+
+    normalizado = _normalizar(coleccion, {**registro, **cambios}, registro, cambios)
+    registro.update(normalizado)
+    gm.guardar_datos()
+    return registro
+
+
+def _modificar_orden(orden, cambios):
+    estado = cambios.pop("estado", None)
+    if estado is not None:
+        try:
+            estado = gm._opcion(estado, gm.ESTADOS_ORDEN, "estado")
+        except ValueError as e:
+            raise ErrorAPI(400, str(e))
+    asignar = "tecnico_asignado" in cambios
+    nombre = cambios.pop("tecnico_asignado", None)
+    tecnico = _tecnico_por_nombre(nombre) if nombre else None
+    no_editables = set(cambios) - set(CAMPOS_EDITABLES_ORDEN)
+    if no_editables:
+        raise ErrorAPI(400, f"Campos que no se pueden modificar: {', '.join(sorted(no_editables))}")
+    normalizado = _normalizar("ordenes_trabajo", {**orden, **cambios}, orden, cambios)
+
+    with gm.modificando_orden(orden):
+        for campo in cambios:
+            orden[campo] = normalizado[campo]
+        if "equipo_id" in cambios:
+            orden['equipo_nombre'] = normalizado['equipo_nombre']
+        if asignar and tecnico is None:
+            orden['tecnico_asignado'] = None
+    if tecnico:
+        gm.asignar_tecnico_ordenes([orden['id']], tecnico)
+    if estado == "Completada":
+        gm.completar_ordenes([orden['id']], orden['observaciones'])
+    elif estado is not None:
+        gm.cambiar_estado_ordenes([orden['id']], estado)
+    gm.guardar_datos()
+    return orden
+
+
+def eliminar(coleccion, id_registro):
+    registro = _buscar(coleccion, id_registro)
+    if coleccion == "ordenes_trabajo":
+        gm.eliminar_ordenes([id_registro])
+    else:
+        gm.quitar_registros(coleccion, [id_registro])
+        gm.guardar_datos()
+    return registro
+
+
+def completar(id_orden, cuerpo):
+    orden = _buscar("ordenes_trabajo", id_orden)
+    if orden['estado'] == "Completada":
+        raise ErrorAPI(409, f"La orden {id_orden} ya está completada")
+    gm.completar_ordenes([id_orden], gm._texto(cuerpo.get("observaciones")))
+    return orden
+
+
+def resumen():
+    return {
+        "recursos": {recurso: len(getattr(gm, coleccion)) for recurso, coleccion in RECURSOS.items()},
+        "estadisticas": gm.resumen_estadisticas(),
+        "version": gm.version_datos,
+    }
+
+
+def cola(consulta):
+    import Despacho_Mantenimiento as despacho
+    try:
+        n = min(max(int(consulta.get("n", 10)), 1), MAXIMO_POR_PAGINA)
+    except ValueError:
+        raise ErrorAPI(400, "'n' debe ser un número entero")
+    return {"datos": despacho.siguientes_ordenes(n), "total": despacho.tamano_cola()}
+
+
+# ==================== SERVIDOR HTTP ====================
+
+class ServidorMantenimiento:
+    """HTTP/1.1 mínimo (conexiones persistentes, cuerpo con Content-Length) sobre asyncio.
+
+    Las lecturas se atienden de inmediato en el bucle de eventos; las
+    modificaciones se ejecutan una a la vez con un asyncio.Lock, que también
+    toman la escritura a disco y la incorporación de cambios de otras
+    instancias. La escritura corre en otro hilo y solo lee los datos; lo que
+    los modifica (la combinación con otras instancias) se hace en el hilo del
+    bucle, así ninguna lectura ve las listas o los índices a medio cambiar.
+    """
+
+    def __init__(self):
+        self._candado = asyncio.Lock()
+        self._guardado = None
+        self._duracion_guardado = 0.0
+        self._revision = None
+        self._bucle = None
+        self._hilo_bucle = None
+        self._transaccion = None
+        self._servidor = None
+        self._conexiones = {}
+
+    async def iniciar(self, host=HOST, puerto=PUERTO):
+        """Empieza a escuchar; devuelve el asyncio.Server (puerto=0 elige uno libre)"""
+        self._bucle = asyncio.get_running_loop()
+        self._hilo_bucle = threading.get_ident()
+        self._transaccion = gm.transaccion()
+        self._transaccion.__enter__()
+        self._servidor = await asyncio.start_server(self.atender, host, puerto, backlog=CONEXIONES_EN_ESPERA)
+        self._revision = self._bucle.create_task(self._revisar_cambios_externos())
+        return self._servidor
+
+    async def detener(self):
+        """Deja de aceptar conexiones y escribe lo pendiente"""
+        if self._servidor:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        # Las conexiones persistentes inactivas terminan al cerrarles el socket
+        for escritor in self._conexiones.values():
+            escritor.close()
+        await asyncio.gather(*self._conexiones, return_exceptions=True)
+        if self._revision:
+            self._revision.cancel()
+            await asyncio.gather(self._revision, return_exceptions=True)
+        if self._guardado:
+            await asyncio.gather(self._guardado, return_exceptions=True)
+        if self._transaccion:
+            # Al cerrar la transacción gm escribe lo que quede pendiente
+            self._transaccion.__exit__(None, None, None)
+            self._transaccion = None
+
+    def _programar_guardado(self):
+        if self._guardado is None or self._guardado.done():
+            self._guardado = asyncio.get_running_loop().create_task(self._guardar_luego())
+
+    async def _guardar_luego(self):
+        await asyncio.sleep(max(INTERVALO_GUARDADO_S, FACTOR_ESPERA_GUARDADO * self._duracion_guardado))
+        async with self._candado:
+            inicio = time.perf_counter()
+            await self._bucle.run_in_executor(None, gm.guardar_pendiente, self._en_el_bucle)
+            self._duracion_guardado = time.perf_counter() - inicio
+
+    def _en_el_bucle(self, funcion):
+        """Corre 'funcion' en el hilo del bucle de eventos y espera su resultado (desde el hilo del guardado)"""
+        if self._bucle is None or threading.get_ident() == self._hilo_bucle:
+            return funcion()
+        return asyncio.run_coroutine_threadsafe(self._llamar(funcion), self._bucle).result()
+
+    @staticmethod
+    async def _llamar(funcion):
+        return funcion()
+
+    async def _revisar_cambios_externos(self):
+        """Incorpora lo que guardan otras instancias; solo lee algo si el registro de cambios creció"""
+        while True:
+            await asyncio.sleep(gm.INTERVALO_EVENTOS_MS / 1000)
+            if not gm.hay_eventos_nuevos():
+                continue
+            async with self._candado:
+                try:
+                    gm.sincronizar()
+                except (OSError, TimeoutError) as e:
+                    print(f"No se pudieron leer los cambios de otras instancias: {e}")
+                except Exception:
+                    # Un evento mal formado no debe terminar la revisión
+                    traceback.print_exc()
+
+    async def _modificacion(self, funcion, *args):
+        async with self._candado:
+            resultado = funcion(*args)
+        self._programar_guardado()
+        return resultado
+
+    async def despachar(self, metodo, destino, cuerpo):
+        """(código HTTP, datos) de una petición"""
+        url = urlsplit(destino)
+        partes = [unquote(p) for p in url.path.split("/") if p]
+        consulta = dict(parse_qsl(url.query, keep_blank_values=True))
+        if not partes or partes[0] != "api":
+            raise ErrorAPI(404, "Ruta no encontrada")
+        partes = partes[1:]
+        if metodo == "OPTIONS":
+            return 204, None
+        if not partes or partes == ["cola"]:
+            if metodo != "GET":
+                raise ErrorAPI(405, "Método no permitido")
+            return 200, resumen() if not partes else cola(consulta)
+
+        coleccion = RECURSOS.get(partes[0])
+        if coleccion is None or len(partes) > 3:
+            raise ErrorAPI(404, "Ruta no encontrada")
+        id_registro = None
+        if len(partes) > 1:
+            try:
+                id_registro = int(partes[1])
+            except ValueError:
+                raise ErrorAPI(404, f"ID inválido: {partes[1]}")
+        accion = partes[2] if len(partes) > 2 else None
+
+        if metodo == "GET" and accion is None:
+            if id_registro is None:
+                return 200, listar(coleccion, consulta)
+            if coleccion == "historial_mantenimiento":
+                raise ErrorAPI(404, "El historial no tiene IDs; filtre por orden_id")
+            return 200, _buscar(coleccion, id_registro)
+        if coleccion == "historial_mantenimiento":
+            raise ErrorAPI(405, "El historial es de solo lectura")
+
+        datos = self._leer_json(cuerpo) if metodo in ("POST", "PATCH") else {}
+        if metodo == "POST" and id_registro is None:
+            return 201, await self._modificacion(crear, coleccion, datos)
+        if metodo == "POST" and accion == "completar" and coleccion == "ordenes_trabajo":
+            return 200, await self._modificacion(completar, id_registro, datos)
+        if accion is None and id_registro is not None:
+            if metodo == "PATCH":
+                return 200, await self._modificacion(modificar, coleccion, id_registro, datos)
+            if metodo == "DELETE":
+                return 200, await self._modificacion(eliminar, coleccion, id_registro)
+        raise ErrorAPI(405, "Método no permitido")
+
+    @staticmethod
+    def _leer_json(cuerpo):
+        try:
+            datos = json.loads(cuerpo or b"{}")
+        except ValueError:
+            raise ErrorAPI(400, "El cuerpo no es JSON válido")
+        if not isinstance(datos, dict):
+            raise ErrorAPI(400, "El cuerpo debe ser un objeto JSON")
+        return datos
+
+    async def atender(self, lector, escritor):
+        """Atiende las peticiones de una conexión hasta que el cliente la cierra"""
+        tarea = asyncio.current_task()
+        self._conexiones[tarea] = escritor
+        try:
+            while True:
+                try:
+                    linea = await asyncio.wait_for(lector.readline(), ESPERA_INACTIVA_S)
+                except asyncio.TimeoutError:
+                    break
+                if not linea.strip():
+                    break
+                try:
+                    metodo, destino, version = linea.decode("latin-1").split()
+                except ValueError:
+                    await self._responder(escritor, 400, {"error": "Petición inválida"}, False)
+                    break
+                cabeceras = {}
+                while True:
+                    linea = await lector.readline()
+                    if linea in (b"\r\n", b"\n", b""):
+                        break
+                    nombre, _, valor = linea.decode("latin-1").partition(":")
+                    cabeceras[nombre.strip().lower()] = valor.strip()
+                seguir = version == "HTTP/1.1" and cabeceras.get("connection", "").lower() != "close"
+
+                largo = int(cabeceras.get("content-length") or 0)
+                if largo > MAXIMO_CUERPO:
+                    await self._responder(escritor, 413, {"error": "Cuerpo demasiado grande"}, False)
+                    break
+                cuerpo = await lector.readexactly(largo) if largo else b""
+
+                try:
+                    estado, datos = await self.despachar(metodo.upper(), destino, cuerpo)
+                except ErrorAPI as e:
+                    estado, datos = e.estado, {"error": str(e)}
+                except Exception as e:
+                    estado, datos = 500, {"error": f"Error interno: {e}"}
+                await self._responder(escritor, estado, datos, seguir)
+                if not seguir:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            del self._conexiones[tarea]
+            escritor.close()
+
+    @staticmethod
+    async def _responder(escritor, estado, datos, seguir):
+        cuerpo = b"" if datos is None else json.dumps(datos, ensure_ascii=False).encode("utf-8")
+        cabeceras = [
+            f"HTTP/1.1 {estado} {HTTPStatus(estado).phrase}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(cuerpo)}",
+            # Para aplicaciones web en tabletas servidas desde otro origen
+            "Access-Control-Allow-Origin: *",
+            "Access-Control-Allow-Methods: GET, POST, PATCH, DELETE, OPTIONS",
+            "Access-Control-Allow-Headers: Content-Type",
+            "Connection: " + ("keep-alive" if seguir else "close"),
+        ]
+        escritor.write(("\r\n".join(cabeceras) + "\r\n\r\n").encode("latin-1") + cuerpo)
+        await escritor.drain()
+
+
+async def servir(host=HOST, puerto=PUERTO):
+    """Atiende peticiones hasta que se interrumpe el proceso"""
+    servidor = ServidorMantenimiento()
+    escucha = await servidor.iniciar(host, puerto)
+    direccion = escucha.sockets[0].getsockname()
+    print(f"Servidor de mantenimiento en http://{direccion[0]}:{direccion[1]}/api (Ctrl+C para detener)")
+    try:
+        await escucha.serve_forever()
+    finally:
+        await servidor.detener()
+
+
+def ejecutar(argv=None):
+    """Punto de entrada de 'python Gestion_Mantenimiento.py --serve'"""
+    parser = argparse.ArgumentParser(prog="Gestion_Mantenimiento.py --serve",
+                                     description="API REST del sistema de gestión de mantenimiento")
+    parser.add_argument("--host", default=HOST, help=f"interfaz donde escuchar (por defecto {HOST})")
+    parser.add_argument("--puerto", "--port", type=int, default=PUERTO,
+                        help=f"puerto (por defecto {PUERTO})")
+    args = parser.parse_args(argv)
+
+    gm.cargar_datos()
+    try:
+        asyncio.run(servir(args.host, args.puerto))
+    except KeyboardInterrupt:
+        print("\nServidor detenido; datos guardados.")
+
+
+if __name__ == "__main__":
+    ejecutar()
@@ -0,0 +1,266 @@
+"""
+Simulación de capacidad del Sistema de Gestión de Mantenimiento
+Archivo: Simulacion_Mantenimiento.py
+Autor: Juan Esteban Jaramillo González
+
+Estima, para los próximos meses, cuántas horas de trabajo habrá que atender
+frente a las horas que pueden dar los técnicos, con escenarios Monte Carlo:
+
+  • trabajo planificado: planes "Programado" y ocurrencias de planes
+    recurrentes aún no emitidas, más las órdenes abiertas hoy (en el primer
+    mes); la duración de cada trabajo se toma al azar de las duraciones
+    reales de órdenes preventivas/predictivas del historial,
+  • correctivos: la tasa mensual de fallas sale del historial (con su
+    incertidumbre: una tasa distinta por escenario, distribución gamma) y la
+    cantidad de fallas de cada mes es Poisson; la duración se toma de las
+    órdenes correctivas reales,
+  • capacidad: técnicos registrados × días hábiles × HORAS_JORNADA, con cada
+    día-técnico disponible con probabilidad DISPONIBILIDAD_TECNICO.
+
+Todos los escenarios de un bloque se calculan a la vez con numpy; los bloques
+pueden repartirse entre varios procesos. Como cada bloque tiene su propia
+semilla derivada de la semilla principal, el resultado es el mismo con o sin
+procesos. Requiere numpy (pip install numpy).
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+import numpy as np
+
+import Gestion_Mantenimiento as gm
+import Carga_Mantenimiento as carga
+import Planificacion_Mantenimiento as planificacion
+
+MESES_HORIZONTE = 12
+ESCENARIOS = 5000
+PERCENTILES = (10, 50, 90)
+# Probabilidad de que un técnico trabaje un día hábil (vacaciones, incapacidades, capacitación)
+DISPONIBILIDAD_TECNICO = 0.9
+# Duración usada cuando el historial no tiene órdenes con fechas de inicio y fin
+DURACION_POR_DEFECTO_HORAS = 2.0
+# Escenarios por bloque (unidad de trabajo de cada proceso y del progreso)
+TAMANO_BLOQUE = 1000
+# Desde esta cantidad de trabajos en un mes la suma de sus duraciones se toma
+# de la aproximación normal (teorema central del límite) en lugar de sortear
+# cada duración; así el costo no crece con el volumen de órdenes
+MINIMO_APROX_NORMAL = 30
+
+
+def _meses(desde, meses):
+    """[(anio, mes)] de 'meses' meses a partir del mes de 'desde'"""
+    total = desde.year * 12 + desde.month - 1
+    return [divmod(total + i, 12) for i in range(meses)]
+
+
+def _primer_dia(anio, mes0):
+    return date(anio, mes0 + 1, 1)
+
+
+def _periodo(texto):
+    """(anio, mes) de una fecha 'AAAA-MM-DD ...' (None si no es válida)"""
+    try:
+        fecha = date.fromisoformat(texto[:10])
+    except (TypeError, ValueError):
+        return None
+    return fecha.year, fecha.month
+
+
+def _duracion(orden):
+    # fromisoformat es mucho más rápido que strptime para el formato AAAA-MM-DD HH:MM:SS
+    try:
+        horas = (datetime.fromisoformat(orden['fecha_finalizacion'])
+                 - datetime.fromisoformat(orden['fecha_inicio'])).total_seconds() / 3600
+    except (TypeError, ValueError, KeyError):
+        return gm.duracion_horas(orden)
+    return horas if horas >= 0 else None
+
+
+def preparar_parametros(hoy=None, meses=MESES_HORIZONTE):
+    """Lee los datos actuales y arma los parámetros (solo números y arreglos) de la simulación.
+
+    El resultado puede enviarse a otros procesos: no hace referencia a los
+    datos de gm.
+    """
+    hoy = hoy or date.today()
+    periodos = _meses(hoy, meses)
+    primeros = [_primer_dia(anio, mes0) for anio, mes0 in periodos]
+    siguiente = divmod(hoy.year * 12 + hoy.month - 1 + meses, 12)
+    limites = np.array(primeros[1:] + [_primer_dia(*siguiente)], dtype='datetime64[D]')
+    inicios = np.array([hoy] + primeros[1:], dtype='datetime64[D]')
+    dias_habiles = np.busday_count(inicios, limites)
+    # Fracción del primer mes que queda por delante (los correctivos se escalan con ella)
+    fraccion = np.ones(meses)
+    fraccion[0] = (limites[0] - inicios[0]) / (limites[0] - np.datetime64(primeros[0], 'D'))
+
+    def mes_de(anio, mes):
+        # Lo atrasado cuenta en el primer mes; lo que cae después del horizonte no cuenta
+        indice = (anio * 12 + mes - 1) - (hoy.year * 12 + hoy.month - 1)
+        return max(indice, 0) if indice < meses else None
+
+    planificados = np.zeros(meses, dtype=np.int64)
+    for plan in gm.planes_mantenimiento:
+        if plan.get('estado') == "Programado":
+            indice = mes_de(plan['anio'], plan['mes'])
+            if indice is not None:
+                planificados[indice] += 1
+    for _, fecha in planificacion.ocurrencias_por_emitir((limites[-1] - 1).item()):
+        indice = mes_de(fecha.year, fecha.month)
+        if indice is not None:
+            planificados[indice] += 1
+
+    # Duraciones reales y fallas correctivas del historial
+    por_id = {o['id']: o for o in gm.ordenes_trabajo}
+    duraciones = {"Correctivo": [], "Planificado": []}
+    correctivos = 0
+    primer_periodo = None
+    for entrada in gm.historial_mantenimiento:
+        periodo = _periodo(entrada.get('fecha'))
+        if periodo is None:
+            continue
+        primer_periodo = min(primer_periodo or periodo, periodo)
+        clase = "Correctivo" if entrada.get('tipo') == "Correctivo" else "Planificado"
+        correctivos += clase == "Correctivo"
+        # Las órdenes archivadas ya no están en memoria: su duración quedó en la entrada
+        orden = por_id.get(entrada.get('orden_id'))
+        horas = _duracion(orden) if orden else entrada.get('duracion_horas')
+        if horas is not None:
+            duraciones[clase].append(horas)
+    if primer_periodo is None:
+        meses_observados = 1
+    else:
+        meses_observados = max(hoy.year * 12 + hoy.month - primer_periodo[0] * 12 - primer_periodo[1] + 1, 1)
+
+    todas = duraciones["Correctivo"] + duraciones["Planificado"]
+    for clase, lista in duraciones.items():
+        if not lista:
+            lista.extend(todas or [DURACION_POR_DEFECTO_HORAS])
+
+    abiertas = sum(gm.contadores_ordenes["estado"].get(estado, 0) for estado in carga.ESTADOS_ABIERTOS)
+
+    return {
+        "periodos": [(anio, mes0 + 1) for anio, mes0 in periodos],
+        "dias_habiles": dias_habiles,
+        "fraccion_primer_mes": fraccion,
+        "planificados": planificados,
+        "abiertas": abiertas,
+        "correctivos": correctivos,
+        "meses_observados": meses_observados,
+        "duracion_correctivos": np.array(duraciones["Correctivo"], dtype=np.float64),
+        "duracion_planificados": np.array(duraciones["Planificado"], dtype=np.float64),
+        "tecnicos": len(gm.tecnicos),
+        "horas_jornada": carga.HORAS_JORNADA,
+        "disponibilidad": DISPONIBILIDAD_TECNICO,
+    }
+
+
+def _horas(rng, cantidades, duraciones):
+    """Suma, para cada celda de 'cantidades', esa cantidad de duraciones tomadas al azar.
+
+    Las celdas con pocos trabajos suman duraciones reales sorteadas; las
+    demás usan N·media + √N·desviación·Z.
+    """
+    forma = cantidades.shape
+    cantidades = cantidades.ravel()
+    horas = (cantidades * duraciones.mean()
+             + np.sqrt(cantidades) * duraciones.std() * rng.standard_normal(cantidades.size))
+    np.maximum(horas, 0.0, out=horas)
+
+    pocas = np.flatnonzero(cantidades < MINIMO_APROX_NORMAL)
+    repeticiones = cantidades[pocas]
+    muestras = duraciones[rng.integers(0, len(duraciones), size=int(repeticiones.sum()))]
+    celdas = np.repeat(np.arange(pocas.size), repeticiones)
+    horas[pocas] = np.bincount(celdas, weights=muestras, minlength=pocas.size)
+    return horas.reshape(forma)
+
+
+def simular_bloque(parametros, escenarios, semilla):
+    """Demanda y capacidad en horas de 'escenarios' escenarios: dos arreglos (escenarios × meses)"""
+    rng = np.random.default_rng(semilla)
+    meses = len(parametros["periodos"])
+
+    # Tasa mensual de correctivos con su incertidumbre (posterior gamma con previa de Jeffreys)
+    tasa = rng.gamma(parametros["correctivos"] + 0.5, 1 / parametros["meses_observados"], size=escenarios)
+    fallas = rng.poisson(tasa[:, None] * parametros["fraccion_primer_mes"][None, :])
+    demanda = _horas(rng, fallas, parametros["duracion_correctivos"])
+
+    planificados = np.broadcast_to(parametros["planificados"], (escenarios, meses)).copy()
+    planificados[:, 0] += parametros["abiertas"]
+    demanda += _horas(rng, planificados, parametros["duracion_planificados"])
+
+    dias_tecnico = parametros["tecnicos"] * parametros["dias_habiles"]
+    capacidad = rng.binomial(np.broadcast_to(dias_tecnico, (escenarios, meses)),
+                             parametros["disponibilidad"]) * float(parametros["horas_jornada"])
+    return demanda, capacidad
+
+
+def simular(escenarios=ESCENARIOS, meses=MESES_HORIZONTE, semilla=None, procesos=None,
+            percentiles=PERCENTILES, progreso=None, cancelar=None, hoy=None):
+    """Corre la simulación y resume cada mes en bandas de percentiles.
+
+    'procesos' > 1 reparte los bloques en un ProcessPoolExecutor.
+    'progreso(hechos, total)' y 'cancelar' (threading.Event) permiten usarla
+    desde la interfaz; si se cancela devuelve None.
+
+    Devuelve {"periodos", "percentiles", "demanda", "capacidad", "utilizacion"
+    (cada uno {percentil: [valor por mes]}; la utilización es None en los
+    meses sin capacidad), "prob_sobrecarga" [por mes], "parametros",
+    "escenarios", "segundos"}. Lanza ValueError si 'escenarios' no es positivo.
+    """
+    if escenarios <= 0:
+        raise ValueError("La cantidad de escenarios debe ser mayor que cero")
+    inicio = time.perf_counter()
+    parametros = preparar_parametros(hoy, meses)
+    tamanos = [TAMANO_BLOQUE] * (escenarios // TAMANO_BLOQUE)
+    if escenarios % TAMANO_BLOQUE:
+        tamanos.append(escenarios % TAMANO_BLOQUE)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+
+    bloques = []
+
+    def avanzar(resultado):
+        bloques.append(resultado)
+        if progreso:
+            progreso(sum(len(d) for d, _ in bloques), escenarios)
+        return not (cancelar and cancelar.is_set())
+
+    if procesos and procesos > 1 and len(tamanos) > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [ejecutor.submit(simular_bloque, parametros, n, s) for n, s in zip(tamanos, semillas)]
+            for futuro in futuros:
+                if not avanzar(futuro.result()):
+                    for pendiente in futuros:
+                        pendiente.cancel()
+                    return None
+    else:
+        for n, s in zip(tamanos, semillas):
+            if not avanzar(simular_bloque(parametros, n, s)):
+                return None
+
+    demanda = np.concatenate([d for d, _ in bloques])
+    capacidad = np.concatenate([c for _, c in bloques])
+    utilizacion = np.divide(demanda, capacidad, out=np.full_like(demanda, np.inf), where=capacidad > 0)
+
+    def bandas(valores):
+        # Sin técnicos la utilización es infinita: esos meses quedan en None
+        with np.errstate(invalid='ignore'):
+            return {p: [round(float(v), 2) if np.isfinite(v) else None
+                        for v in np.percentile(valores, p, axis=0)] for p in percentiles}
+
+    return {
+        "periodos": parametros["periodos"],
+        "percentiles": tuple(percentiles),
+        "demanda": bandas(demanda),
+        "capacidad": bandas(capacidad),
+        "utilizacion": bandas(utilizacion),
+        "prob_sobrecarga": (demanda > capacidad).mean(axis=0).round(4).tolist(),
+        "parametros": {
+            "tecnicos": parametros["tecnicos"],
+            "tasa_correctivos_mes": round(parametros["correctivos"] / parametros["meses_observados"], 2),
+            "planificados": int(parametros["planificados"].sum()),
+            "abiertas": parametros["abiertas"],
+        },
+        "escenarios": escenarios,
+        "segundos": time.perf_counter() - inicio,
+    }
@@ -0,0 +1,6 @@
+"""
+Benchmarks del Sistema de Gestión de Mantenimiento
+
+Cada módulo se ejecuta como script desde la carpeta del proyecto, por ejemplo:
+    python -m benchmarks.bench_indicadores
+"""
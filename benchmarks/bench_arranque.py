@@ -0,0 +1,116 @@
+"""
+Benchmark del arranque de la interfaz contra su presupuesto
+
+Lanza la interfaz en un proceso nuevo (python Interfaz_Mantenimiento.py o el
+ejecutable de PyInstaller con --ejecutable) con datos sintéticos, la deja
+cerrarse sola después del primer pintado (GM_SALIR_TRAS_ARRANQUE) y lee el
+perfil de arranque que escribe (GM_PERFIL_ARRANQUE, ver
+Arranque_Mantenimiento.py). Compara el mejor tiempo con el presupuesto y
+termina con código 1 si lo excede.
+
+Necesita pantalla (o Xvfb para una pantalla virtual).
+Uso: python -m benchmarks.bench_arranque [--ejecutable dist/Interfaz_Mantenimiento.exe]
+     [--equipos N] [--ordenes N] [--historial N] [--repeticiones N]
+     [--presupuesto S] [--presupuesto-importaciones S]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+import Gestion_Mantenimiento as gm
+import Arranque_Mantenimiento as arranque
+from benchmarks import generador
+from benchmarks.bench_sistema import _pantalla_virtual
+
+INTERFAZ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Interfaz_Mantenimiento.py")
+ESPERA_MAXIMA_S = 120
+
+
+def arrancar(comando, base):
+    """Abre y cierra la interfaz una vez; devuelve (segundos de reloj, perfil)"""
+    ruta_perfil = os.path.join(base, "perfil.json")
+    if os.path.exists(ruta_perfil):
+        os.remove(ruta_perfil)
+    entorno = dict(os.environ, APPDATA=base, **{arranque.VARIABLE_ENTORNO: ruta_perfil,
+                                                arranque.VARIABLE_SALIR: "1"})
+    inicio = time.perf_counter()
+    subprocess.run(comando, env=entorno, check=True, timeout=ESPERA_MAXIMA_S,
+                   stdout=subprocess.DEVNULL)
+    reloj = time.perf_counter() - inicio
+    with open(ruta_perfil, encoding="utf-8") as archivo:
+        return reloj, json.load(archivo)
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_arranque",
+                                     description="Arranque de la interfaz contra su presupuesto")
+    parser.add_argument("--ejecutable", help="ejecutable de PyInstaller (por defecto se usa el intérprete)")
+    parser.add_argument("--equipos", type=int, default=500)
+    parser.add_argument("--ordenes", type=int, default=10_000)
+    parser.add_argument("--historial", type=int, default=20_000)
+    parser.add_argument("--tecnicos", type=int, default=30)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--presupuesto", type=float, default=arranque.PRESUPUESTO_S,
+                        help="segundos hasta el primer pintado (reloj del proceso que lanza)")
+    parser.add_argument("--presupuesto-importaciones", type=float, default=arranque.PRESUPUESTO_IMPORTACIONES_S)
+    return parser
+
+
+def main(argv=None):
+    opciones = crear_parser().parse_args(argv)
+    comando = [opciones.ejecutable] if opciones.ejecutable else [sys.executable, INTERFAZ]
+
+    base = tempfile.mkdtemp(prefix="bench_arranque_")
+    xvfb = _pantalla_virtual()
+    try:
+        generador.usar_carpeta(base)
+        generador.cargar_en_gm(generador.generar(opciones.equipos, opciones.ordenes, opciones.historial,
+                                                 opciones.tecnicos, opciones.semilla))
+        gm.guardar_datos()
+        print(f"{' '.join(comando)}\n{opciones.equipos:,} equipos, {opciones.ordenes:,} órdenes, "
+              f"{opciones.historial:,} entradas de historial\n")
+
+        corridas = []
+        for i in range(opciones.repeticiones):
+            try:
+                reloj, perfil = arrancar(comando, base)
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"No se pudo arrancar la interfaz: {e}")
+                return 2
+            corridas.append((reloj, perfil))
+            print(f"corrida {i + 1}: {reloj * 1000:8.1f} ms de reloj, {perfil['total_s'] * 1000:8.1f} ms "
+                  f"según el perfil")
+    finally:
+        if xvfb:
+            xvfb.terminate()
+        shutil.rmtree(base, ignore_errors=True)
+
+    reloj, perfil = min(corridas, key=lambda corrida: corrida[0])
+    print("\nFases de la corrida más rápida:")
+    for fase in perfil["fases"]:
+        print(f"  {fase['nombre']:<28} {fase['segundos'] * 1000:>9.1f} ms")
+
+    excedidos = []
+    if reloj > opciones.presupuesto:
+        excedidos.append(f"arranque {reloj:.2f} s > {opciones.presupuesto:.2f} s")
+    if perfil["importaciones_s"] > opciones.presupuesto_importaciones:
+        excedidos.append(f"importaciones {perfil['importaciones_s']:.2f} s > "
+                         f"{opciones.presupuesto_importaciones:.2f} s")
+    print(f"\nArranque {reloj * 1000:.1f} ms (presupuesto {opciones.presupuesto * 1000:.0f} ms), importaciones "
+          f"{perfil['importaciones_s'] * 1000:.1f} ms (presupuesto {opciones.presupuesto_importaciones * 1000:.0f} ms)")
+    if excedidos:
+        print("✖ Fuera del presupuesto: " + "; ".join(excedidos))
+        return 1
+    print("✔ Dentro del presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Benchmark de la carga de trabajo por técnico (índices de intervalos)
+
+Genera con benchmarks.generador (semilla fija) órdenes repartidas en cinco
+años y mide la primera consulta (construye los índices) y las consultas
+siguientes sobre ventanas de distinto tamaño.
+Uso: python -m benchmarks.bench_carga [ordenes] [tecnicos]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+import Gestion_Mantenimiento as gm
+import Carga_Mantenimiento as carga
+from benchmarks import generador
+
+
+def main():
+    n_ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    n_tecnicos = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    print(f"Generando {n_ordenes:,} órdenes para {n_tecnicos:,} técnicos...")
+    datos = generador.generar(n_equipos=500, n_ordenes=n_ordenes, n_historial=0, n_tecnicos=n_tecnicos)
+    gm.tecnicos, gm.ordenes_trabajo = datos["tecnicos"], datos["ordenes_trabajo"]
+
+    inicio = time.perf_counter()
+    gm.reconstruir_indices_ordenes()
+    print(f"reconstruir_indices_ordenes: {time.perf_counter() - inicio:.3f} s")
+
+    hasta = datetime.now()
+    inicio = time.perf_counter()
+    carga.carga_tecnicos(hasta - timedelta(days=30), hasta)
+    print(f"primera consulta (construye índices): {time.perf_counter() - inicio:.3f} s")
+
+    for dias in (7, 30, 365, 5 * 365):
+        tiempos = []
+        for _ in range(5):
+            inicio = time.perf_counter()
+            filas = carga.carga_tecnicos(hasta - timedelta(days=dias), hasta)
+            tiempos.append(time.perf_counter() - inicio)
+        horas = sum(f["horas"] for f in filas)
+        print(f"ventana {dias:>5} días: mejor {min(tiempos) * 1000:.1f} ms | "
+              f"horas totales {horas:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark de la asignación automática de técnicos
+
+Genera con benchmarks.generador (semilla fija) órdenes pendientes sin técnico
+y técnicos de varias especialidades y mide la asignación óptima (método húngaro, solo en lotes
+moderados) y la vía rápida voraz, junto con el costo total de cada una.
+Uso: python -m benchmarks.bench_despacho [ordenes] [tecnicos]
+"""
+
+import sys
+
+import Gestion_Mantenimiento as gm
+import Despacho_Mantenimiento as despacho
+from benchmarks import generador
+
+
+def costo_total(resultado):
+    """Costo de la propuesta con la misma fórmula que usa el despacho"""
+    total = 0.0
+    for p in resultado['propuestas']:
+        raices_orden = despacho._raices(" ".join((p['orden']['descripcion'], p['orden']['tipo'],
+                                                  p['orden']['equipo_nombre'])))
+        total += (despacho._penalizacion(despacho._raices(p['tecnico']['especialidad']),
+                                         despacho._es_general(p['tecnico']), raices_orden)
+                  + despacho.PESO_CARGA * (p['carga'] - 1)
+                  - despacho.BONO_PRIORIDAD[p['orden']['prioridad']])
+    return total
+
+
+def main():
+    n_ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    n_tecnicos = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    print(f"Generando {n_ordenes:,} órdenes pendientes para {n_tecnicos:,} técnicos...")
+    datos = generador.generar(n_equipos=50, n_ordenes=n_ordenes, n_historial=0, n_tecnicos=n_tecnicos,
+                              pendientes=True)
+    gm.equipos, gm.tecnicos, gm.ordenes_trabajo = datos["equipos"], datos["tecnicos"], datos["ordenes_trabajo"]
+    gm.reconstruir_indices_ordenes()
+
+    metodos = ["voraz"]
+    # El método húngaro crece como órdenes × cupos²: solo se compara en lotes moderados
+    if n_ordenes * n_tecnicos * despacho.CAPACIDAD_TECNICO <= 10 * despacho.LIMITE_OPTIMO:
+        metodos.insert(0, "optimo")
+    for metodo in metodos:
+        tiempos = []
+        for _ in range(3):
+            resultado = despacho.proponer_asignacion(metodo=metodo)
+            tiempos.append(resultado['segundos'])
+        print(f"{metodo:<7}: mejor {min(tiempos) * 1000:.1f} ms | "
+              f"asignadas {len(resultado['propuestas'])} | sin cupo {len(resultado['sin_asignar'])} | "
+              f"costo {costo_total(resultado):,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark del cálculo de indicadores de confiabilidad (MTTR, MTBF, disponibilidad)
+
+Genera datos con benchmarks.generador (semilla fija) y mide calcular_indicadores().
+Uso: python -m benchmarks.bench_indicadores [ordenes] [historial] [equipos]
+"""
+
+import sys
+import time
+
+import Gestion_Mantenimiento as gm
+import Indicadores_Mantenimiento as ind
+from benchmarks import generador
+
+
+def main():
+    n_ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    n_historial = int(sys.argv[2]) if len(sys.argv) > 2 else 300_000
+    n_equipos = int(sys.argv[3]) if len(sys.argv) > 3 else 2_000
+
+    print(f"Generando {n_ordenes:,} órdenes, {n_historial:,} entradas de historial, "
+          f"{n_equipos:,} equipos...")
+    datos = generador.generar(n_equipos=n_equipos, n_ordenes=n_ordenes, n_historial=n_historial, n_tecnicos=300)
+    gm.equipos, ordenes, historial = datos["equipos"], datos["ordenes_trabajo"], datos["historial_mantenimiento"]
+
+    tiempos = []
+    for _ in range(5):
+        inicio = time.perf_counter()
+        resultado = ind.calcular_indicadores(ordenes, historial)
+        tiempos.append(time.perf_counter() - inicio)
+
+    print(f"calcular_indicadores: mejor {min(tiempos):.3f} s | "
+          f"promedio {sum(tiempos) / len(tiempos):.3f} s")
+    print("Global:", resultado["global"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark del costo de la instrumentación (Metricas_Mantenimiento)
+
+Mide el costo por llamada de una función vacía sin decorar, decorada con
+las métricas desactivadas y decorada con las métricas activas, y lo mismo
+para el administrador de contexto medir().
+Uso: python -m benchmarks.bench_metricas [llamadas]
+"""
+
+import sys
+import time
+
+import Metricas_Mantenimiento as metricas
+
+
+def vacia():
+    return None
+
+
+def por_llamada(funcion, llamadas):
+    inicio = time.perf_counter()
+    for _ in range(llamadas):
+        funcion()
+    return (time.perf_counter() - inicio) / llamadas * 1e9
+
+
+def bloque_medido():
+    with metricas.medir("bench.bloque"):
+        pass
+
+
+def main():
+    llamadas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    decorada = metricas.medido(vacia, nombre="bench.vacia")
+
+    metricas.activar(False)
+    sin_decorar = por_llamada(vacia, llamadas)
+    desactivada = por_llamada(decorada, llamadas)
+    contexto_desactivado = por_llamada(bloque_medido, llamadas)
+    metricas.activar(True)
+    activa = por_llamada(decorada, llamadas)
+    contexto_activo = por_llamada(bloque_medido, llamadas)
+    metricas.activar(False)
+
+    print(f"{llamadas:,} llamadas (ns por llamada)")
+    print(f"sin decorar:                {sin_decorar:7.0f}")
+    print(f"decorada, desactivada:      {desactivada:7.0f}  (+{desactivada - sin_decorar:.0f})")
+    print(f"decorada, activa:           {activa:7.0f}  (+{activa - sin_decorar:.0f})")
+    print(f"medir(), desactivado:       {contexto_desactivado:7.0f}")
+    print(f"medir(), activo:            {contexto_activo:7.0f}")
+    m = metricas.instantanea()["metricas"]["bench.vacia"]
+    print(f"Registradas: {m['llamadas']:,} llamadas | p50 {m['p50_ms']} ms | p99 {m['p99_ms']} ms")
+    # Sin mediciones pendientes el volcado al salir no escribe en la carpeta de datos real
+    metricas.reiniciar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark del servicio REST con clientes por la interfaz local
+
+Levanta el servidor en 127.0.0.1 (puerto libre) con datos generados con
+semilla fija en una carpeta temporal (no toca los datos reales) y simula
+tabletas concurrentes: cada una crea órdenes, las completa y consulta listas
+filtradas por conexiones persistentes. Informa la latencia por operación.
+Uso: python -m benchmarks.bench_servidor [ordenes] [tabletas] [operaciones por tableta]
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import asyncio
+import tempfile
+
+import Gestion_Mantenimiento as gm
+import Servidor_Mantenimiento as servidor
+from benchmarks import generador
+
+
+def preparar(n_ordenes, semilla=42):
+    azar = random.Random(semilla)
+    gm.equipos = [{"id": i, "nombre": f"Equipo {i}", "prioridad": azar.choice(list(gm.RANGO_PRIORIDAD))}
+                  for i in range(1, 501)]
+    gm.tecnicos = [{"id": i, "nombre": f"Técnico {i}", "especialidad": "General",
+                    "telefono": "", "estado": "Disponible"} for i in range(1, 51)]
+    gm.ordenes_trabajo = []
+    for i in range(1, n_ordenes + 1):
+        equipo = azar.choice(gm.equipos)
+        gm.ordenes_trabajo.append({
+            "id": i, "equipo_id": equipo['id'], "equipo_nombre": equipo['nombre'],
+            "descripcion": "Revisión", "tipo": azar.choice(gm.TIPOS_MANTENIMIENTO),
+            "prioridad": equipo['prioridad'], "estado": azar.choice(gm.ESTADOS_ORDEN),
+            "tecnico_asignado": None, "fecha_creacion": "2026-01-01 08:00:00",
+            "fecha_inicio": None, "fecha_finalizacion": None, "observaciones": ""})
+    gm.reconstruir_indices_ordenes()
+
+
+async def pedir(conexion, metodo, ruta, datos=None):
+    lector, escritor = conexion
+    cuerpo = b"" if datos is None else json.dumps(datos).encode("utf-8")
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: local\r\nContent-Type: application/json\r\n"
+                   f"Content-Length: {len(cuerpo)}\r\n\r\n".encode("latin-1") + cuerpo)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    largo = 0
+    while (linea := await lector.readline()) != b"\r\n":
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        if nombre.lower() == "content-length":
+            largo = int(valor)
+    respuesta = json.loads(await lector.readexactly(largo)) if largo else None
+    return estado, respuesta
+
+
+async def tableta(puerto, numero, operaciones, tiempos):
+    conexion = await asyncio.open_connection("127.0.0.1", puerto)
+    azar = random.Random(numero)
+    for _ in range(operaciones):
+        inicio = time.perf_counter()
+        _, orden = await pedir(conexion, "POST", "/api/ordenes",
+                               {"equipo_id": azar.randint(1, 500), "descripcion": "Falla reportada en campo",
+                                "tipo": "Correctivo", "tecnico_asignado": f"Técnico {azar.randint(1, 50)}"})
+        tiempos["crear"].append(time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        await pedir(conexion, "POST", f"/api/ordenes/{orden['id']}/completar", {"observaciones": "Listo"})
+        tiempos["completar"].append(time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        await pedir(conexion, "GET", f"/api/ordenes?estado=Pendiente&equipo_id={azar.randint(1, 500)}")
+        tiempos["listar"].append(time.perf_counter() - inicio)
+    conexion[1].close()
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(int(len(valores) * p / 100), len(valores) - 1)]
+
+
+async def correr(n_tabletas, operaciones):
+    instancia = servidor.ServidorMantenimiento()
+    escucha = await instancia.iniciar("127.0.0.1", 0)
+    puerto = escucha.sockets[0].getsockname()[1]
+    tiempos = {"crear": [], "completar": [], "listar": []}
+    inicio = time.perf_counter()
+    await asyncio.gather(*(tableta(puerto, i, operaciones, tiempos) for i in range(n_tabletas)))
+    total = time.perf_counter() - inicio
+    await instancia.detener()
+    return tiempos, total
+
+
+def main():
+    n_ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    n_tabletas = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    operaciones = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    # Archivos de datos en una carpeta temporal
+    base = tempfile.mkdtemp(prefix="bench_servidor_")
+    generador.usar_carpeta(base)
+    try:
+        print(f"Generando {n_ordenes:,} órdenes; {n_tabletas} tabletas × {operaciones} operaciones...")
+        preparar(n_ordenes)
+        tiempos, total = asyncio.run(correr(n_tabletas, operaciones))
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+    peticiones = sum(len(t) for t in tiempos.values())
+    for operacion, valores in tiempos.items():
+        print(f"{operacion:<10}: p50 {percentil(valores, 50) * 1000:.2f} ms | "
+              f"p95 {percentil(valores, 95) * 1000:.2f} ms | máx {max(valores) * 1000:.2f} ms")
+    print(f"Total: {peticiones:,} peticiones en {total:.2f} s ({peticiones / total:,.0f}/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark de la simulación de capacidad (Monte Carlo)
+
+Genera órdenes e historial con benchmarks.generador (semilla fija) y mide la simulación de 12 meses con
+distintas cantidades de escenarios, en un solo proceso y repartida entre
+varios procesos.
+Uso: python -m benchmarks.bench_simulacion [historial] [tecnicos]
+"""
+
+import os
+import sys
+import time
+
+import Gestion_Mantenimiento as gm
+import Simulacion_Mantenimiento as sim
+from benchmarks import generador
+
+
+def main():
+    n_historial = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_tecnicos = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    print(f"Generando {n_historial:,} registros de historial para {n_tecnicos:,} técnicos...")
+    generador.cargar_en_gm(generador.generar(n_equipos=500, n_ordenes=n_historial, n_historial=n_historial,
+                                             n_tecnicos=n_tecnicos))
+
+    inicio = time.perf_counter()
+    sim.preparar_parametros()
+    print(f"preparar_parametros: {time.perf_counter() - inicio:.3f} s")
+
+    procesos = os.cpu_count() or 1
+    for escenarios in (1_000, 10_000, 50_000):
+        for usar in (None, procesos):
+            resultado = sim.simular(escenarios, semilla=1, procesos=usar)
+            print(f"{escenarios:>7,} escenarios, {usar or 1:>2} proceso(s): {resultado['segundos']:.3f} s | "
+                  f"demanda P50 primer mes {resultado['demanda'][50][0]:,.0f} h | "
+                  f"sobrecarga máx. {max(resultado['prob_sobrecarga']) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Benchmark del sistema completo a escala de planta
+
+Genera datos con semilla fija (benchmarks/generador.py) en una carpeta
+temporal y mide las operaciones que el usuario nota: guardar y cargar el
+archivo de datos, buscar equipos, filtrar órdenes, estadísticas e
+indicadores, el archivado de órdenes cerradas y, si hay pantalla (o Xvfb para una pantalla virtual), el
+arranque de la interfaz y el llenado de sus tablas.
+
+Los resultados se escriben en JSON (por defecto en benchmarks/resultados/)
+con la versión del código, así se pueden comparar corridas de distintas
+versiones con --comparar. El arranque en un proceso nuevo, contra su presupuesto, se
+mide con benchmarks/bench_arranque.py.
+Uso: python -m benchmarks.bench_sistema [--equipos N] [--ordenes N] [--historial N]
+     [--tecnicos N] [--repeticiones N] [--sin-interfaz] [--salida archivo.json]
+     [--comparar anterior.json]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+
+import Gestion_Mantenimiento as gm
+import Archivado_Mantenimiento as archivado
+import Indicadores_Mantenimiento as ind
+import Backlog_Mantenimiento as backlog
+import Servidor_Mantenimiento as servidor
+from benchmarks import generador
+
+CARPETA_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resultados")
+# Diferencia relativa desde la que --comparar marca una medición como regresión
+UMBRAL_REGRESION = 0.2
+# ...y la diferencia absoluta mínima (por debajo es ruido de medición)
+MINIMO_REGRESION_S = 0.001
+
+
+def medir(tiempos, nombre, funcion, repeticiones=1):
+    """Corre 'funcion' varias veces y anota el mejor tiempo y el promedio en segundos"""
+    valores = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        valores.append(time.perf_counter() - inicio)
+    tiempos[nombre] = {"mejor": min(valores), "promedio": sum(valores) / len(valores),
+                       "repeticiones": repeticiones}
+    print(f"{nombre:<40} mejor {min(valores) * 1000:>10.1f} ms")
+    return resultado
+
+
+def medir_datos(tiempos, repeticiones):
+    medir(tiempos, "guardar_datos", gm.guardar_datos)
+    medir(tiempos, "cargar_datos", gm.cargar_datos)
+
+    medir(tiempos, "buscar_equipos (nombre)", lambda: gm.buscar_equipos("equipo 12"), repeticiones)
+    medir(tiempos, "buscar_equipos (ubicación)", lambda: gm.buscar_equipos("taller"), repeticiones)
+    medir(tiempos, "filtrar órdenes (lista completa)",
+          lambda: [o for o in gm.ordenes_trabajo if o['estado'] == "Pendiente"], repeticiones)
+    medir(tiempos, "filtrar órdenes (índices)",
+          lambda: servidor.filtrar("ordenes_trabajo", {"estado": "Pendiente", "prioridad": "Alta"}),
+          repeticiones)
+
+    medir(tiempos, "reconstruir_indices_ordenes", gm.reconstruir_indices_ordenes, repeticiones)
+    medir(tiempos, "reconstruir_resumenes", gm.reconstruir_resumenes, repeticiones)
+    medir(tiempos, "resumen_estadisticas", gm.resumen_estadisticas, repeticiones)
+    medir(tiempos, "tendencia_mensual", gm.tendencia_mensual, repeticiones)
+    medir(tiempos, "histograma_antiguedad", backlog.histograma_antiguedad, repeticiones)
+    medir(tiempos, "calcular_indicadores", ind.calcular_indicadores, repeticiones)
+
+
+def medir_archivado(tiempos):
+    """Archivado de las órdenes cerradas antiguas y consultas sobre el archivo (va al final: cambia los datos)"""
+    resultado = medir(tiempos, "archivar_ordenes", archivado.archivar_ordenes)
+    print(f"{'':<40} {resultado['archivadas']:,} órdenes en {len(resultado['segmentos'])} segmentos")
+    medir(tiempos, "cargar_datos (tras archivar)", gm.cargar_datos)
+    medir(tiempos, "recorrer órdenes archivadas", lambda: sum(1 for _ in archivado.ordenes_archivadas()))
+    medir(tiempos, "buscar órdenes archivadas", lambda: archivado.buscar_ordenes_archivadas("taller", limite=1000))
+
+
+def _pantalla_virtual():
+    """Inicia Xvfb si no hay pantalla y está instalado; devuelve el proceso (o None)"""
+    if os.name == "nt" or os.environ.get("DISPLAY") or not shutil.which("Xvfb"):
+        return None
+    pantalla = f":{90 + os.getpid() % 100}"
+    proceso = subprocess.Popen(["Xvfb", pantalla, "-screen", "0", "1280x800x24"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(1)
+    os.environ["DISPLAY"] = pantalla
+    return proceso
+
+
+def medir_interfaz(tiempos, repeticiones):
+    """Tiempos de la interfaz; devuelve el motivo si no se pudo abrir una ventana"""
+    xvfb = _pantalla_virtual()
+    try:
+        import tkinter as tk
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            return f"No hay pantalla disponible: {e}"
+        import Interfaz_Mantenimiento as interfaz
+
+        def dibujar(funcion):
+            # update() incluye el redibujo de la ventana en la medición
+            def medida():
+                resultado = funcion()
+                root.update()
+                return resultado
+            return medida
+
+        # El constructor carga los datos y llena todas las tablas
+        app = medir(tiempos, "interfaz: arranque", dibujar(lambda: interfaz.SistemaMantenimientoGUI(root)))
+        # Desglose del arranque (Arranque_Mantenimiento); las importaciones ya estaban hechas
+        for fase in interfaz.arranque.perfil()["fases"]:
+            if fase["nombre"] not in ("antes de Python", "importaciones"):
+                tiempos[f"arranque: {fase['nombre']}"] = {"mejor": fase["segundos"], "promedio": fase["segundos"],
+                                                          "repeticiones": 1}
+        medir(tiempos, "interfaz: actualizar_lista_equipos", dibujar(app.actualizar_lista_equipos), repeticiones)
+        medir(tiempos, "interfaz: actualizar_lista_ordenes", dibujar(app.actualizar_lista_ordenes), repeticiones)
+        medir(tiempos, "interfaz: actualizar_lista_tecnicos", dibujar(app.actualizar_lista_tecnicos), repeticiones)
+        medir(tiempos, "interfaz: actualizar_historial", dibujar(app.actualizar_historial), repeticiones)
+        medir(tiempos, "interfaz: actualizar_estadisticas", dibujar(app.actualizar_estadisticas), repeticiones)
+
+        app.entry_buscar_equipo.delete(0, tk.END)
+        app.entry_buscar_equipo.insert(0, "taller")
+        medir(tiempos, "interfaz: buscar_equipo", dibujar(app.buscar_equipo), repeticiones)
+        app.combo_filtro_estado.set("Pendiente")
+        medir(tiempos, "interfaz: filtrar_ordenes", dibujar(app.filtrar_ordenes), repeticiones)
+
+        app._orden_tablas['ordenes'] = ('Prioridad', False)
+        medir(tiempos, "interfaz: ordenes ordenadas por prioridad",
+              dibujar(app.actualizar_lista_ordenes), repeticiones)
+        root.destroy()
+        return None
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+
+def version_codigo():
+    """Commit actual (con '+cambios' si hay cambios sin confirmar) o None fuera de git"""
+    carpeta = os.path.dirname(os.path.abspath(gm.__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=carpeta,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        cambios = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=carpeta,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+cambios" if cambios else "")
+
+
+def comparar(actual, ruta_anterior):
+    """Imprime la variación de cada medición respecto de una corrida anterior"""
+    with open(ruta_anterior, encoding="utf-8") as archivo:
+        anterior = json.load(archivo)
+    print(f"\nComparación con {anterior.get('version')} ({anterior.get('fecha')}):")
+    regresiones = 0
+    for nombre, medida in actual["tiempos"].items():
+        previa = anterior.get("tiempos", {}).get(nombre)
+        if not previa or not previa["mejor"]:
+            continue
+        variacion = medida["mejor"] / previa["mejor"] - 1
+        marca = ""
+        if variacion > UMBRAL_REGRESION and medida["mejor"] - previa["mejor"] > MINIMO_REGRESION_S:
+            marca = "  ← regresión"
+            regresiones += 1
+        print(f"{nombre:<40} {previa['mejor'] * 1000:>10.1f} → {medida['mejor'] * 1000:>10.1f} ms "
+              f"({variacion:+.0%}){marca}")
+    if anterior.get("parametros") != actual["parametros"]:
+        print("⚠ Las corridas usaron datos de distinto tamaño: la comparación es solo orientativa.")
+    return regresiones
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_sistema",
+                                     description="Benchmark del sistema completo con datos sintéticos")
+    parser.add_argument("--equipos", type=int, default=20_000)
+    parser.add_argument("--ordenes", type=int, default=500_000)
+    parser.add_argument("--historial", type=int, default=1_000_000)
+    parser.add_argument("--tecnicos", type=int, default=300)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=3,
+                        help="repeticiones de las mediciones rápidas (guardar, cargar y arrancar se miden una vez)")
+    parser.add_argument("--sin-interfaz", action="store_true", help="no medir la interfaz gráfica")
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", metavar="ANTERIOR", help="JSON de una corrida anterior")
+    return parser
+
+
+def main(argv=None):
+    opciones = crear_parser().parse_args(argv)
+    parametros = {"equipos": opciones.equipos, "ordenes": opciones.ordenes, "historial": opciones.historial,
+                  "tecnicos": opciones.tecnicos, "semilla": opciones.semilla}
+
+    base = tempfile.mkdtemp(prefix="bench_sistema_")
+    generador.usar_carpeta(base)
+    print(f"Generando {opciones.equipos:,} equipos, {opciones.ordenes:,} órdenes, "
+          f"{opciones.historial:,} entradas de historial y {opciones.tecnicos:,} técnicos...")
+    inicio = time.perf_counter()
+    generador.cargar_en_gm(generador.generar(opciones.equipos, opciones.ordenes, opciones.historial,
+                                             opciones.tecnicos, opciones.semilla))
+    print(f"Datos generados en {time.perf_counter() - inicio:.1f} s\n")
+
+    tiempos = {}
+    try:
+        medir_datos(tiempos, opciones.repeticiones)
+        interfaz_omitida = "Omitida con --sin-interfaz" if opciones.sin_interfaz \
+            else medir_interfaz(tiempos, opciones.repeticiones)
+        if interfaz_omitida:
+            print(f"Interfaz: {interfaz_omitida}")
+        medir_archivado(tiempos)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    resultado = {
+        "fecha": datetime.now().strftime(gm.FORMATO_FECHA),
+        "version": version_codigo(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": parametros,
+        "interfaz_omitida": interfaz_omitida,
+        "tiempos": tiempos,
+    }
+    salida = opciones.salida or os.path.join(
+        CARPETA_RESULTADOS, f"{datetime.now():%Y%m%d_%H%M%S}_{resultado['version'] or 'sin_version'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as archivo:
+        json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados en {salida}")
+
+    if opciones.comparar:
+        return 1 if comparar(resultado, opciones.comparar) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Generador de datos sintéticos para los benchmarks
+
+Arma todas las colecciones de gm con semilla fija (mismos datos en cada
+corrida y en cada versión del programa) y con una forma parecida a la de una
+planta real: órdenes repartidas en cinco años hasta hoy, casi todas las viejas
+cerradas y las abiertas concentradas en los últimos meses, y un historial con
+una entrada por cada orden completada (más retrabajos si se piden más entradas).
+
+También permite redirigir los archivos de gm a una carpeta temporal para no
+tocar los datos reales.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+
+import Gestion_Mantenimiento as gm
+
+FORMATO = gm.FORMATO_FECHA
+ANIOS = 5
+# Órdenes creadas en los últimos DIAS_RECIENTES días que pueden seguir abiertas
+DIAS_RECIENTES = 60
+ESPECIALIDADES = ["Mecánica", "Eléctrica", "Instrumentación", "Hidráulica", "General"]
+UBICACIONES = ["Planta A", "Planta B", "Bodega", "Taller", "Línea 1", "Línea 2", "Línea 3", "Calderas"]
+MARCAS = ["Siemens", "ABB", "WEG", "Atlas Copco", "Caterpillar", "Schneider"]
+DESCRIPCIONES = ["Revisión general", "Cambio de rodamientos", "Fuga de aceite", "Ruido anormal",
+                 "Lubricación", "Calibración", "Vibración alta", "Cambio de filtros"]
+
+
+def generar(n_equipos=20_000, n_ordenes=500_000, n_historial=1_000_000, n_tecnicos=300, semilla=42,
+            pendientes=False):
+    """{colección: registros} con las colecciones de gm (planes vacíos).
+
+    Con pendientes=True todas las órdenes son recientes, están pendientes y
+    no tienen técnico (la cola que reparte el despacho); no hay historial.
+    """
+    azar = random.Random(semilla)
+    ahora = datetime.now().replace(microsecond=0)
+    base = ahora - timedelta(days=ANIOS * 365)
+    minutos_totales = ANIOS * 365 * 24 * 60
+    prioridades = list(gm.RANGO_PRIORIDAD)
+
+    equipos = [{
+        "id": i, "nombre": f"Equipo {i}", "ubicacion": azar.choice(UBICACIONES),
+        "descripcion": "", "marca": azar.choice(MARCAS), "modelo": f"M-{azar.randint(100, 999)}",
+        "numero_serie": f"SN{semilla}{i:07d}", "prioridad": azar.choice(prioridades),
+        "estado": "Operativo", "fecha_registro": base.strftime(FORMATO),
+    } for i in range(1, n_equipos + 1)]
+
+    tecnicos = [{
+        "id": i, "nombre": f"Técnico {i}", "especialidad": azar.choice(ESPECIALIDADES),
+        "telefono": f"300{i:07d}", "estado": "Disponible",
+    } for i in range(1, n_tecnicos + 1)]
+
+    ordenes = []
+    completadas = []
+    reciente = minutos_totales - DIAS_RECIENTES * 24 * 60
+    for i, minuto in enumerate(sorted(azar.randrange(minutos_totales) for _ in range(n_ordenes)), 1):
+        equipo = equipos[azar.randrange(n_equipos)]
+        creada = base + timedelta(minutes=minuto)
+        if pendientes:
+            creada = ahora - timedelta(minutes=minuto % (DIAS_RECIENTES * 24 * 60))
+            estado = "Pendiente"
+        elif minuto >= reciente:
+            estado = azar.choices(gm.ESTADOS_ORDEN, weights=(35, 20, 5, 35, 5))[0]
+        else:
+            estado = "Completada" if azar.random() < 0.97 else "Cancelada"
+        tecnico = None if pendientes or (estado in ("Pendiente", "Cancelada") and azar.random() < 0.7) \
+            else f"Técnico {azar.randint(1, n_tecnicos)}"
+        inicio = fin = None
+        if estado in ("En progreso", "Pausada", "Completada"):
+            inicio = min(creada + timedelta(minutes=azar.randint(10, 3 * 24 * 60)), ahora)
+            if estado == "Completada":
+                fin = min(inicio + timedelta(minutes=azar.randint(20, 16 * 60)), ahora)
+        orden = {
+            "id": i, "equipo_id": equipo['id'], "equipo_nombre": equipo['nombre'],
+            "descripcion": azar.choice(DESCRIPCIONES), "tipo": azar.choice(gm.TIPOS_MANTENIMIENTO),
+            "prioridad": equipo['prioridad'], "estado": estado, "tecnico_asignado": tecnico,
+            "fecha_creacion": creada.strftime(FORMATO),
+            "fecha_inicio": inicio.strftime(FORMATO) if inicio else None,
+            "fecha_finalizacion": fin.strftime(FORMATO) if fin else None,
+            "observaciones": "",
+        }
+        ordenes.append(orden)
+        if estado == "Completada":
+            completadas.append(orden)
+
+    historial = []
+    for i in range(n_historial if completadas else 0):
+        # Primero una entrada por orden completada; el resto son retrabajos al azar
+        orden = completadas[i] if i < len(completadas) else completadas[azar.randrange(len(completadas))]
+        historial.append({
+            "orden_id": orden['id'], "equipo_nombre": orden['equipo_nombre'], "tipo": orden['tipo'],
+            "fecha": orden['fecha_finalizacion'], "tecnico": orden['tecnico_asignado'],
+            "observaciones": "",
+        })
+    historial.sort(key=lambda h: h['fecha'])
+
+    return {
+        "equipos": equipos,
+        "ordenes_trabajo": ordenes,
+        "tecnicos": tecnicos,
+        "historial_mantenimiento": historial,
+        "planes_mantenimiento": [],
+        "planes_recurrentes": [],
+    }
+
+
+def usar_carpeta(base):
+    """Redirige los archivos de datos de gm a base/Gestion_Mantenimiento, como si APPDATA fuera 'base'.
+
+    APPDATA también se cambia para la interfaz, que calcula su carpeta de
+    datos al importarse. Devuelve la carpeta de datos.
+    """
+    carpeta = os.path.join(base, os.path.basename(gm.DATA_DIR))
+    os.makedirs(carpeta, exist_ok=True)
+    for nombre in dir(gm):
+        if nombre.startswith("ARCHIVO_"):
+            setattr(gm, nombre, os.path.join(carpeta, os.path.basename(getattr(gm, nombre))))
+    os.environ["APPDATA"] = base
+    return carpeta
+
+
+def cargar_en_gm(datos):
+    """Pone las colecciones generadas en gm y reconstruye índices y resúmenes"""
+    for coleccion in gm.COLECCIONES_DATOS:
+        setattr(gm, coleccion, datos[coleccion])
+    gm.revision_datos += 1
+    gm.reconstruir_indices_ordenes()
+    gm.reconstruir_resumenes()